@@ -11,15 +11,37 @@ from .base import (
     Message,
     MessageAcknowledgment,
     MessageHandler,
+    BatchMessageHandler,
     MessageStatus,
     DeliveryMode,
     ReliabilityManager
 )
 
+from .codecs import (
+    MessageCodec,
+    JSONCodec,
+    MessagePackCodec,
+    ProtobufCodec,
+    TextCodec,
+    BinaryCodec,
+    CodecRegistry,
+    codec_registry,
+    register_codec,
+    get_codec
+)
+
+from .publisher import (
+    PublishBatchConfig,
+    PublishAccumulator,
+    create_publish_accumulator
+)
+
 from .reliability import (
     DeadLetterQueue,
     DeadLetterMessage,
     MessageDeduplicator,
+    RedisMessageDeduplicator,
+    ScalableBloomFilter,
     MessagingCircuitBreaker,
     MessageMetrics,
     CircuitBreakerState
@@ -46,6 +68,8 @@ try:
         KafkaClient,
         KafkaProducer,
         KafkaConsumer,
+        KafkaConsumerEngine,
+        PartitionOffsetTracker,
         KafkaMessage,
         KafkaClusterConfig,
         KafkaProducerConfig,
@@ -87,14 +111,34 @@ __all__ = [
     "Message",
     "MessageAcknowledgment", 
     "MessageHandler",
+    "BatchMessageHandler",
     "MessageStatus",
     "DeliveryMode",
     "ReliabilityManager",
     
+    # Payload codecs
+    "MessageCodec",
+    "JSONCodec",
+    "MessagePackCodec",
+    "ProtobufCodec",
+    "TextCodec",
+    "BinaryCodec",
+    "CodecRegistry",
+    "codec_registry",
+    "register_codec",
+    "get_codec",
+    
+    # Batched publishing
+    "PublishBatchConfig",
+    "PublishAccumulator",
+    "create_publish_accumulator",
+    
     # Reliability patterns
     "DeadLetterQueue",
     "DeadLetterMessage",
     "MessageDeduplicator",
+    "RedisMessageDeduplicator",
+    "ScalableBloomFilter",
     "MessagingCircuitBreaker",
     "MessageMetrics",
     "CircuitBreakerState"
@@ -118,6 +162,8 @@ if _KAFKA_AVAILABLE:
         "KafkaClient",
         "KafkaProducer",
         "KafkaConsumer",
+        "KafkaConsumerEngine",
+        "PartitionOffsetTracker",
         "KafkaMessage",
         "KafkaClusterConfig",
         "KafkaProducerConfig",
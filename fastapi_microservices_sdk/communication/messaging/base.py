@@ -6,11 +6,10 @@ message broker implementations, along with reliability patterns and utilities.
 """
 
 import asyncio
-import json
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable, Union, AsyncGenerator
+from typing import Dict, List, Optional, Any, Callable, Union, AsyncGenerator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -24,6 +23,10 @@ from ..exceptions import (
     DeadLetterQueueError
 )
 from ..logging import CommunicationLogger, CommunicationEventType
+from .codecs import (
+    BytesLike, get_codec, infer_content_type, encode_payload, decode_payload, compress_payload,
+    decompress_payload
+)
 
 
 class MessageStatus(str, Enum):
@@ -43,6 +46,21 @@ class DeliveryMode(str, Enum):
     EXACTLY_ONCE = "exactly_once"      # Guaranteed delivery, no duplicates
 
 
+# Broker headers carrying the message envelope next to the encoded payload
+ENVELOPE_HEADERS = {
+    'id': 'x-message-id',
+    'correlation_id': 'x-correlation-id',
+    'reply_to': 'x-reply-to',
+    'timestamp': 'x-timestamp',
+    'content_type': 'content-type',
+    'delivery_mode': 'x-delivery-mode',
+    'ttl': 'x-ttl',
+    'priority': 'x-priority',
+    'retry_count': 'x-retry-count',
+    'max_retries': 'x-max-retries',
+}
+
+
 @dataclass
 class Message:
     """Base message class for all message brokers."""
@@ -54,7 +72,7 @@ class Message:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     correlation_id: Optional[str] = None
     reply_to: Optional[str] = None
-    content_type: str = "application/json"
+    content_type: Optional[str] = None  # Inferred from the payload when encoded
     delivery_mode: DeliveryMode = DeliveryMode.AT_LEAST_ONCE
     ttl: Optional[int] = None  # Time to live in seconds
     priority: int = 0
@@ -93,7 +111,7 @@ class Message:
         
         message.correlation_id = data.get('correlation_id')
         message.reply_to = data.get('reply_to')
-        message.content_type = data.get('content_type', 'application/json')
+        message.content_type = data.get('content_type')
         message.delivery_mode = DeliveryMode(data.get('delivery_mode', DeliveryMode.AT_LEAST_ONCE.value))
         message.ttl = data.get('ttl')
         message.priority = data.get('priority', 0)
@@ -102,38 +120,116 @@ class Message:
         
         return message
     
-    def serialize(self) -> bytes:
-        """Serialize message to bytes."""
+    def serialize(self) -> BytesLike:
+        """
+        Serialize message to bytes with the codec for its content type.
+        
+        Structured codecs (JSON, MessagePack) carry the whole message; other
+        content types carry only the payload, and bytes-like payloads are
+        returned without a copy.
+        """
         try:
-            if self.content_type == 'application/json':
-                return json.dumps(self.to_dict(), default=str).encode('utf-8')
-            elif self.content_type == 'text/plain':
-                return str(self.payload).encode('utf-8')
-            else:
-                # For binary data, assume payload is already bytes
-                return self.payload if isinstance(self.payload, bytes) else str(self.payload).encode('utf-8')
+            codec = get_codec(self.content_type or infer_content_type(self.payload))
+            if codec.structured:
+                return codec.encode(self.to_dict())
+            body, _ = encode_payload(self.payload, self.content_type)
+            return body
+        except MessageSerializationError:
+            raise
         except Exception as e:
             raise MessageSerializationError(f"Failed to serialize message: {e}")
     
     @classmethod
-    def deserialize(cls, data: bytes, content_type: str = 'application/json') -> 'Message':
-        """Deserialize message from bytes."""
+    def deserialize(cls, data: BytesLike, content_type: str = 'application/json') -> 'Message':
+        """Deserialize message from bytes produced by serialize()."""
         try:
-            if content_type == 'application/json':
-                message_dict = json.loads(data.decode('utf-8'))
-                return cls.from_dict(message_dict)
-            elif content_type == 'text/plain':
-                message = cls()
-                message.payload = data.decode('utf-8')
-                message.content_type = content_type
-                return message
-            else:
-                message = cls()
-                message.payload = data
-                message.content_type = content_type
-                return message
+            codec = get_codec(content_type)
+            if codec.structured:
+                return cls.from_dict(codec.decode(data))
+            message = cls()
+            message.payload = codec.decode(data)
+            message.content_type = content_type
+            return message
+        except MessageSerializationError:
+            raise
         except Exception as e:
             raise MessageSerializationError(f"Failed to deserialize message: {e}")
+    
+    def to_wire(self, compression: Optional[str] = None) -> Tuple[BytesLike, Dict[str, str]]:
+        """
+        Encode message for a broker as (body, headers).
+        
+        Only the payload is encoded; the envelope is sent as headers, so a
+        bytes-like payload becomes the body as it is unless ``compression``
+        (a content encoding such as 'gzip') is given.
+        """
+        body, content_type = encode_payload(self.payload, self.content_type)
+        headers = dict(self.headers)
+        if compression:
+            body = compress_payload(body, compression)
+            headers['content-encoding'] = compression
+        headers.update({
+            'x-message-id': self.id,
+            'x-timestamp': self.timestamp.isoformat(),
+            'content-type': content_type,
+            'x-delivery-mode': self.delivery_mode.value,
+            'x-priority': str(self.priority),
+            'x-retry-count': str(self.retry_count),
+            'x-max-retries': str(self.max_retries),
+        })
+        if self.correlation_id:
+            headers['x-correlation-id'] = self.correlation_id
+        if self.reply_to:
+            headers['x-reply-to'] = self.reply_to
+        if self.ttl is not None:
+            headers['x-ttl'] = str(self.ttl)
+        return body, headers
+    
+    @classmethod
+    def from_wire(
+        cls,
+        body: Optional[BytesLike],
+        headers: Optional[Dict[str, Any]] = None,
+        topic: str = ""
+    ) -> 'Message':
+        """Create message from a broker body and the headers written by to_wire()."""
+        headers = {
+            k: v.decode('utf-8') if isinstance(v, (bytes, bytearray)) else v
+            for k, v in (headers or {}).items()
+        }
+        envelope = {
+            field_name: headers.pop(header)
+            for field_name, header in ENVELOPE_HEADERS.items()
+            if header in headers
+        }
+        
+        try:
+            message = cls()
+            message.topic = topic
+            message.headers = headers
+            body = decompress_payload(body, headers.pop('content-encoding', None))
+            message.payload = decode_payload(body, envelope.get('content_type'))
+            
+            if 'id' in envelope:
+                message.id = envelope['id']
+            if 'timestamp' in envelope:
+                message.timestamp = datetime.fromisoformat(envelope['timestamp'].replace('Z', '+00:00'))
+            message.correlation_id = envelope.get('correlation_id')
+            message.reply_to = envelope.get('reply_to')
+            if 'content_type' in envelope:
+                message.content_type = envelope['content_type']
+            if 'delivery_mode' in envelope:
+                message.delivery_mode = DeliveryMode(envelope['delivery_mode'])
+            if 'ttl' in envelope:
+                message.ttl = int(envelope['ttl'])
+            message.priority = int(envelope.get('priority', 0))
+            message.retry_count = int(envelope.get('retry_count', 0))
+            message.max_retries = int(envelope.get('max_retries', 3))
+            return message
+        except MessageSerializationError:
+            raise
+        except Exception as e:
+            raise MessageSerializationError(f"Failed to decode message envelope: {e}")
 
 
 @dataclass
@@ -194,6 +290,40 @@ class MessageHandler(ABC):
         )
 
 
+class BatchMessageHandler(MessageHandler):
+    """
+    Base class for handlers that process messages in batches.
+    
+    Brokers deliver up to ``max_batch_size`` messages per call, waiting at
+    most ``max_wait_seconds`` for a batch to fill where the broker pushes
+    messages. A handler returns one acknowledgment per message, in order,
+    so one bulk write can still succeed or fail per message: messages
+    acknowledged with ``ACKNOWLEDGED`` are acked on the broker, the others
+    go through the usual retry and dead letter handling.
+    """
+    
+    max_batch_size: int = 100
+    max_wait_seconds: float = 0.05
+    
+    @abstractmethod
+    async def handle_batch(self, messages: List[Message]) -> List[MessageAcknowledgment]:
+        """
+        Handle a batch of received messages.
+        
+        Args:
+            messages: The messages to handle, in delivery order
+            
+        Returns:
+            One MessageAcknowledgment per message, in the same order
+        """
+        pass
+    
+    async def handle_message(self, message: Message) -> MessageAcknowledgment:
+        """Handle a single message as a batch of one."""
+        acks = await self.handle_batch([message])
+        return acks[0]
+
+
 class ReliabilityManager:
     """
     Manager for reliability patterns including retry logic, exponential backoff,
@@ -408,6 +538,16 @@ class ReliabilityManager:
             )
 
 
+def _publish_acknowledgment(message: Any, result: Any = None) -> MessageAcknowledgment:
+    """Build the acknowledgment for one message of a publish_many() call."""
+    message_id = message.id if isinstance(message, Message) else ""
+    if isinstance(result, str):
+        message_id = result
+    if isinstance(result, BaseException):
+        return MessageAcknowledgment(message_id=message_id, status=MessageStatus.FAILED, error=str(result))
+    return MessageAcknowledgment(message_id=message_id, status=MessageStatus.ACKNOWLEDGED)
+
+
 class MessageBroker(ABC):
     """
     Abstract base class for message brokers.
@@ -470,6 +610,43 @@ class MessageBroker(ABC):
         """
         pass
     
+    async def publish_many(
+        self,
+        topic: str,
+        messages: List[Union[Message, Dict[str, Any], str, bytes]],
+        **kwargs
+    ) -> List[MessageAcknowledgment]:
+        """
+        Publish several messages to a topic.
+        
+        Brokers override this to send the messages in one native batch.
+        This default publishes them concurrently, one publish() each, and
+        ignores ``compression``.
+        
+        Native batches bypass the broker's ``reliability_manager``: a
+        message that fails is reported in its acknowledgment rather than
+        retried, and the caller (e.g. PublishAccumulator) decides what to
+        do with it.
+        
+        Args:
+            topic: Topic to publish to
+            messages: Messages to publish, in order
+            **kwargs: Additional broker-specific options
+            
+        Returns:
+            One MessageAcknowledgment per message, in the same order;
+            failed messages have status FAILED and the error
+        """
+        kwargs.pop('compression', None)
+        results = await asyncio.gather(
+            *(self.publish(topic, message, **kwargs) for message in messages),
+            return_exceptions=True
+        )
+        return [
+            _publish_acknowledgment(message, result)
+            for message, result in zip(messages, results)
+        ]
+    
     @abstractmethod
     async def subscribe(
         self,
@@ -5,6 +5,7 @@ This module provides a comprehensive Kafka client with enterprise features inclu
 - Producer/Consumer with exactly-once semantics
 - Transaction support and idempotent producers
 - Advanced partition and consumer group management
+- Concurrent per-partition processing with batched offset commits
 - Dead letter topics integration
 - Schema registry support
 - SSL/TLS security and SASL authentication
@@ -20,15 +21,17 @@ import json
 import logging
 import ssl
 import time
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable, Union, Set, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Union, Set, Tuple
 from urllib.parse import urlparse
 import uuid
 
 try:
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
+    from aiokafka.abc import ConsumerRebalanceListener
     from aiokafka.errors import KafkaError, KafkaTimeoutError, CommitFailedError
     from aiokafka.structs import TopicPartition, ConsumerRecord, RecordMetadata
     from kafka.admin import KafkaAdminClient, ConfigResource, ConfigResourceType
@@ -40,8 +43,11 @@ except ImportError as e:
         "Kafka dependencies not installed. Install with: pip install aiokafka kafka-python"
     ) from e
 
-from .base import MessageBroker, Message, MessageHandler, MessageAcknowledgment, MessageStatus, DeliveryMode
-from .reliability import ReliabilityManager
+from .base import (
+    MessageBroker, Message, MessageHandler, BatchMessageHandler, MessageAcknowledgment,
+    MessageStatus, DeliveryMode, ReliabilityManager
+)
+from .codecs import infer_content_type, encode_payload, decode_payload
 from ..config import CommunicationConfig
 from ..exceptions import CommunicationError, MessageBrokerError
 from ..logging import CommunicationLogger
@@ -179,6 +185,11 @@ class KafkaConsumerConfig:
     max_partition_fetch_bytes: int = 1048576
     isolation_level: KafkaIsolationLevel = KafkaIsolationLevel.READ_COMMITTED
     check_crcs: bool = True
+    # Concurrent processing (1 = strict per-partition order; >1 keeps order per key)
+    max_in_flight_per_partition: int = 1
+    max_buffered_per_partition: int = 2000  # Partition is paused above this
+    commit_interval_ms: int = 1000
+    commit_batch_size: int = 1000  # Commit early after this many processed messages
 
 
 @dataclass
@@ -249,12 +260,21 @@ class KafkaMessage(Message):
         timestamp: Optional[int] = None,
         **kwargs
     ):
-        super().__init__(content, headers or {}, **kwargs)
-        self.topic = topic
+        kwargs.setdefault('content_type', infer_content_type(content))
+        super().__init__(topic=topic, payload=content, headers=headers or {}, **kwargs)
         self.key = key
         self.partition = partition
         self.timestamp = timestamp or int(time.time() * 1000)
         self.offset: Optional[int] = None
+    
+    @property
+    def content(self) -> Any:
+        """Message payload."""
+        return self.payload
+    
+    @content.setter
+    def content(self, value: Any) -> None:
+        self.payload = value
         
     @classmethod
     def from_consumer_record(cls, record: ConsumerRecord) -> "KafkaMessage":
@@ -264,16 +284,9 @@ class KafkaMessage(Message):
             headers = {k: v.decode('utf-8') if isinstance(v, bytes) else v 
                       for k, v in record.headers}
         
-        # Deserialize content
-        content = record.value
-        if isinstance(content, bytes):
-            try:
-                content = content.decode('utf-8')
-                # Try to parse as JSON
-                content = json.loads(content)
-            except (UnicodeDecodeError, json.JSONDecodeError):
-                # Keep as bytes if can't decode/parse
-                pass
+        # Decode content with the codec named by the content-type header
+        content_type = headers.pop('content-type', None)
+        content = decode_payload(record.value, content_type)
         
         message = cls(
             content=content,
@@ -281,7 +294,8 @@ class KafkaMessage(Message):
             key=record.key.decode('utf-8') if record.key else None,
             partition=record.partition,
             headers=headers,
-            timestamp=record.timestamp
+            timestamp=record.timestamp,
+            **({'content_type': content_type} if content_type else {})
         )
         message.offset = record.offset
         return message
@@ -437,6 +451,40 @@ class KafkaProducer:
             self.logger.error(f"Failed to abort transaction: {e}")
             raise KafkaTransactionError(f"Failed to abort transaction: {e}") from e
     
+    async def _enqueue(
+        self,
+        topic: str,
+        value: Any,
+        key: Optional[str] = None,
+        partition: Optional[int] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timestamp_ms: Optional[int] = None,
+        content_type: Optional[str] = None
+    ) -> "asyncio.Future[RecordMetadata]":
+        """Serialize a record and add it to the producer's batch; returns its delivery future."""
+        # Serialize value
+        serialized_value, content_type = encode_payload(value, content_type)
+        
+        # Serialize key
+        serialized_key = key.encode('utf-8') if key else None
+        
+        # Serialize headers
+        headers = {**(headers or {}), 'content-type': content_type}
+        serialized_headers = [
+            (k, json.dumps(v).encode('utf-8') if not isinstance(v, (str, bytes)) else 
+             v.encode('utf-8') if isinstance(v, str) else v)
+            for k, v in headers.items()
+        ]
+        
+        return await self._producer.send(
+            topic=topic,
+            value=serialized_value,
+            key=serialized_key,
+            partition=partition,
+            headers=serialized_headers,
+            timestamp_ms=timestamp_ms
+        )
+    
     async def send(
         self,
         topic: str,
@@ -444,61 +492,89 @@ class KafkaProducer:
         key: Optional[str] = None,
         partition: Optional[int] = None,
         headers: Optional[Dict[str, Any]] = None,
-        timestamp_ms: Optional[int] = None
+        timestamp_ms: Optional[int] = None,
+        content_type: Optional[str] = None
     ) -> RecordMetadata:
-        """Send a message to Kafka topic."""
+        """
+        Send a message to Kafka topic.
+        
+        The value is encoded with the codec for ``content_type`` (inferred
+        from the value if not given), which is sent as a ``content-type``
+        header; bytes-like values are sent without being copied.
+        """
         if not self._is_connected:
             raise KafkaConnectionError("Producer not connected")
         
         try:
-            # Serialize value
-            if isinstance(value, (dict, list)):
-                serialized_value = json.dumps(value).encode('utf-8')
-            elif isinstance(value, str):
-                serialized_value = value.encode('utf-8')
-            elif isinstance(value, bytes):
-                serialized_value = value
-            else:
-                serialized_value = str(value).encode('utf-8')
-            
-            # Serialize key
-            serialized_key = key.encode('utf-8') if key else None
-            
-            # Serialize headers
-            serialized_headers = None
-            if headers:
-                serialized_headers = [
-                    (k, json.dumps(v).encode('utf-8') if not isinstance(v, (str, bytes)) else 
-                     v.encode('utf-8') if isinstance(v, str) else v)
-                    for k, v in headers.items()
-                ]
-            
-            # Send message
-            future = await self._producer.send(
-                topic=topic,
-                value=serialized_value,
-                key=serialized_key,
-                partition=partition,
-                headers=serialized_headers,
-                timestamp_ms=timestamp_ms
-            )
+            # Send message and wait for the broker to acknowledge it
+            future = await self._enqueue(topic, value, key, partition, headers, timestamp_ms, content_type)
+            record_metadata = await future
             
             self.logger.debug(
                 f"Message sent to topic {topic}",
                 extra={
                     "topic": topic,
-                    "partition": future.partition,
-                    "offset": future.offset,
+                    "partition": record_metadata.partition,
+                    "offset": record_metadata.offset,
                     "key": key
                 }
             )
             
-            return future
+            return record_metadata
             
         except Exception as e:
             self.logger.error(f"Failed to send message to topic {topic}: {e}")
             raise KafkaProducerError(f"Failed to send message: {e}") from e
     
+    async def send_many(
+        self,
+        topic: str,
+        messages: List["KafkaMessage"]
+    ) -> List[Union[RecordMetadata, Exception]]:
+        """
+        Send several messages and wait for all of them once.
+        
+        Every record is added to the producer's accumulator before any
+        delivery is awaited, so the producer packs them into record batches
+        (compressed with ``compression_type``) per partition instead of
+        sending one request per message.
+        
+        Returns:
+            RecordMetadata, or the exception for a failed message, per message
+        """
+        if not self._is_connected:
+            raise KafkaConnectionError("Producer not connected")
+        
+        futures = []
+        for message in messages:
+            try:
+                futures.append(await self._enqueue(
+                    topic,
+                    message.payload,
+                    key=message.key,
+                    partition=message.partition,
+                    headers=message.headers,
+                    timestamp_ms=message.timestamp,
+                    content_type=message.content_type
+                ))
+            except Exception as e:
+                failed = asyncio.get_running_loop().create_future()
+                failed.set_exception(KafkaProducerError(f"Failed to send message: {e}"))
+                futures.append(failed)
+        
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        
+        self.logger.debug(
+            f"Batch of {len(messages)} messages sent to topic {topic}",
+            extra={
+                "topic": topic,
+                "messages": len(messages),
+                "failed": sum(1 for result in results if isinstance(result, Exception))
+            }
+        )
+        
+        return results
+    
     async def flush(self) -> None:
         """Flush all buffered messages."""
         if self._producer:
@@ -612,8 +688,12 @@ class KafkaConsumer:
                 self.logger.error(f"Error disconnecting Kafka consumer: {e}")
                 raise KafkaConnectionError(f"Failed to disconnect from Kafka: {e}") from e
     
-    async def subscribe(self, topics: Union[str, List[str]]) -> None:
-        """Subscribe to topics."""
+    async def subscribe(
+        self,
+        topics: Union[str, List[str]],
+        listener: Optional[ConsumerRebalanceListener] = None
+    ) -> None:
+        """Subscribe to topics, replacing the current subscription."""
         if not self._is_connected:
             raise KafkaConnectionError("Consumer not connected")
         
@@ -621,8 +701,11 @@ class KafkaConsumer:
             topics = [topics]
         
         try:
-            self._consumer.subscribe(topics)
-            self._subscribed_topics.update(topics)
+            if listener:
+                self._consumer.subscribe(topics, listener=listener)
+            else:
+                self._consumer.subscribe(topics)
+            self._subscribed_topics = set(topics)
             self.logger.info(f"Subscribed to topics: {topics}")
         except Exception as e:
             self.logger.error(f"Failed to subscribe to topics {topics}: {e}")
@@ -681,6 +764,29 @@ class KafkaConsumer:
             self.logger.error(f"Failed to consume message batch: {e}")
             raise KafkaConsumerError(f"Failed to consume message batch: {e}") from e
     
+    async def fetch(
+        self,
+        max_records: int = 500,
+        timeout_ms: int = 1000
+    ) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        """Fetch raw records grouped by partition, in offset order."""
+        if not self._is_connected:
+            raise KafkaConnectionError("Consumer not connected")
+        
+        try:
+            return await self._consumer.getmany(timeout_ms=timeout_ms, max_records=max_records)
+        except Exception as e:
+            self.logger.error(f"Failed to fetch records: {e}")
+            raise KafkaConsumerError(f"Failed to fetch records: {e}") from e
+    
+    def pause(self, *partitions: TopicPartition) -> None:
+        """Stop fetching from partitions until they are resumed."""
+        self._consumer.pause(*partitions)
+    
+    def resume(self, *partitions: TopicPartition) -> None:
+        """Resume fetching from paused partitions."""
+        self._consumer.resume(*partitions)
+    
     async def commit(self, offsets: Optional[Dict[TopicPartition, int]] = None) -> None:
         """Commit offsets."""
         if not self._is_connected:
@@ -730,6 +836,418 @@ class KafkaConsumer:
         return self._subscribed_topics.copy()
 
 
+class PartitionOffsetTracker:
+    """
+    Tracks fetched and completed offsets of one partition.
+    
+    Offsets are registered in fetch order. The commit position only moves
+    past an offset once it and every offset fetched before it have
+    completed, so a commit never skips a message that is still in flight.
+    """
+    
+    def __init__(self):
+        self._pending: deque = deque()
+        self._completed: Set[int] = set()
+        self.position: Optional[int] = None  # Next offset to commit
+        self.committed: Optional[int] = None
+    
+    def start(self, offset: int) -> None:
+        """Register a fetched offset."""
+        self._pending.append(offset)
+    
+    def complete(self, offset: int) -> None:
+        """Mark an offset done and advance the contiguous commit position."""
+        pending = self._pending
+        if pending and pending[0] == offset:
+            pending.popleft()
+            self.position = offset + 1
+            if not self._completed:
+                return
+        else:
+            self._completed.add(offset)
+        
+        while pending and pending[0] in self._completed:
+            done = pending.popleft()
+            self._completed.discard(done)
+            self.position = done + 1
+    
+    @property
+    def in_flight(self) -> int:
+        """Offsets fetched but not yet committable."""
+        return len(self._pending)
+    
+    @property
+    def first_pending(self) -> Optional[int]:
+        """Lowest fetched offset that has not completed."""
+        return self._pending[0] if self._pending else None
+    
+    @property
+    def needs_commit(self) -> bool:
+        """Check if the position moved since the last commit."""
+        return self.position is not None and self.position != self.committed
+
+
+class _PartitionState:
+    """Queue, offset tracker and worker of one assigned partition."""
+    
+    def __init__(self, partition: TopicPartition, max_in_flight: int):
+        self.partition = partition
+        self.records: asyncio.Queue = asyncio.Queue()
+        self.tracker = PartitionOffsetTracker()
+        self.window = asyncio.Semaphore(max_in_flight)
+        self.key_tails: Dict[Any, asyncio.Task] = {}
+        self.tasks: Set[asyncio.Task] = set()
+        self.paused = False
+        self.rewinding = False
+        self.worker: Optional[asyncio.Task] = None
+        self.rewind_task: Optional[asyncio.Task] = None
+
+
+class KafkaConsumerEngine:
+    """
+    Concurrent, partition-aware consumer loop.
+    
+    One fetch loop pulls records for all assigned partitions and hands them
+    to a worker per partition, so partitions are processed concurrently
+    while each keeps its order. With ``max_in_flight_per_partition`` above 1
+    a partition processes that many records at once and only records with
+    the same key wait for each other. A partition is paused once
+    ``max_buffered_per_partition`` records are outstanding and resumed when
+    half of them are done. Offsets are committed for all partitions in one
+    request every ``commit_interval_ms`` or ``commit_batch_size`` messages,
+    at the highest contiguous completed offset (at-least-once delivery).
+    
+    ``process_message`` returns True once a record may be committed
+    (processed or dead-lettered). When it returns False or raises, the
+    partition stops, commits what completed before the failed record and,
+    after ``retry_delay`` seconds, seeks back to it so it is fetched again.
+    
+    Topics for which ``batch_size`` returns more than 1 are handed to
+    ``process_batch`` as runs of queued records of one partition, in order.
+    """
+    
+    def __init__(
+        self,
+        consumer: KafkaConsumer,
+        process_message: Callable[[KafkaMessage], Awaitable[bool]],
+        consumer_config: KafkaConsumerConfig,
+        logger: Optional[CommunicationLogger] = None,
+        process_batch: Optional[Callable[[List[KafkaMessage]], Awaitable[List[bool]]]] = None,
+        batch_size: Optional[Callable[[str], int]] = None,
+        retry_delay: float = 1.0
+    ):
+        self.consumer = consumer
+        self.process_message = process_message
+        self.process_batch = process_batch
+        self.batch_size = batch_size or (lambda topic: 1)
+        self.consumer_config = consumer_config
+        self.logger = logger or CommunicationLogger(__name__)
+        self.retry_delay = retry_delay
+        
+        self.max_in_flight = max(1, consumer_config.max_in_flight_per_partition)
+        self.max_buffered = max(self.max_in_flight, consumer_config.max_buffered_per_partition)
+        self.resume_threshold = self.max_buffered // 2
+        self.commit_interval = consumer_config.commit_interval_ms / 1000.0
+        
+        self._partitions: Dict[TopicPartition, _PartitionState] = {}
+        self._running = False
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        
+        # Statistics
+        self._fetched = 0
+        self._processed = 0
+        self._failed = 0
+        self._commits = 0
+        self._failed_commits = 0
+        self._pauses = 0
+        self._rewinds = 0
+        
+        self.rebalance_listener = _EngineRebalanceListener(self)
+    
+    async def run(self) -> None:
+        """Fetch and dispatch records until stopped."""
+        self._running = True
+        timeout_ms = min(self.consumer_config.fetch_max_wait_ms, self.consumer_config.commit_interval_ms)
+        
+        while self._running:
+            try:
+                batch = await self.consumer.fetch(
+                    max_records=self.consumer_config.max_poll_records,
+                    timeout_ms=timeout_ms
+                )
+                if not self._running:
+                    break
+                
+                for partition, records in batch.items():
+                    if records:
+                        self._dispatch(partition, records)
+                
+                if (self._uncommitted >= self.consumer_config.commit_batch_size or
+                        time.monotonic() - self._last_commit >= self.commit_interval):
+                    await self.commit()
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error in Kafka consumer engine: {e}")
+                await asyncio.sleep(1)  # Brief pause before retrying
+    
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop fetching, finish queued records (up to ``timeout``) and commit."""
+        self._running = False
+        
+        pending = [state.records.join() for state in self._partitions.values()]
+        if pending:
+            try:
+                await asyncio.wait_for(asyncio.gather(*pending), timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning("Timed out waiting for in-flight Kafka messages")
+        
+        await self.release_partitions(list(self._partitions))
+    
+    async def commit(self) -> None:
+        """Commit the contiguous completed offset of every partition in one request."""
+        self._last_commit = time.monotonic()
+        self._uncommitted = 0
+        
+        offsets = {
+            partition: state.tracker.position
+            for partition, state in self._partitions.items()
+            if state.tracker.needs_commit
+        }
+        if not offsets:
+            return
+        
+        try:
+            await self.consumer.commit(offsets)
+        except Exception as e:
+            # Positions are kept, so the next commit retries them
+            self._failed_commits += 1
+            self.logger.error(f"Failed to commit offsets for {len(offsets)} partitions: {e}")
+            return
+        
+        self._commits += 1
+        for partition, offset in offsets.items():
+            state = self._partitions.get(partition)
+            if state:
+                state.tracker.committed = offset
+    
+    async def release_partitions(self, partitions: List[TopicPartition]) -> None:
+        """Stop the workers of revoked partitions and commit what they completed."""
+        states = [self._partitions[p] for p in partitions if p in self._partitions]
+        if not states:
+            return
+        
+        tasks = []
+        for state in states:
+            tasks.extend(state.tasks)
+            if state.worker:
+                tasks.append(state.worker)
+            if state.rewind_task:
+                tasks.append(state.rewind_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Unfinished records are redelivered to the next owner of the partition
+        await self.commit()
+        for state in states:
+            self._partitions.pop(state.partition, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get consumer engine statistics."""
+        return {
+            "running": self._running,
+            "partitions": len(self._partitions),
+            "paused_partitions": sum(1 for state in self._partitions.values() if state.paused),
+            "in_flight": sum(state.tracker.in_flight for state in self._partitions.values()),
+            "fetched": self._fetched,
+            "processed": self._processed,
+            "failed": self._failed,
+            "commits": self._commits,
+            "failed_commits": self._failed_commits,
+            "pauses": self._pauses,
+            "rewinds": self._rewinds,
+            "committed_offsets": {
+                f"{partition.topic}-{partition.partition}": state.tracker.committed
+                for partition, state in self._partitions.items()
+            }
+        }
+    
+    def _dispatch(self, partition: TopicPartition, records: List[ConsumerRecord]) -> None:
+        """Queue fetched records on their partition worker, pausing it when full."""
+        state = self._partitions.get(partition)
+        if state is None:
+            state = _PartitionState(partition, self.max_in_flight)
+            state.worker = asyncio.create_task(self._work(state))
+            self._partitions[partition] = state
+        elif state.rewinding:
+            # Fetched before the pause; the partition is refetched after the seek
+            return
+        
+        for record in records:
+            state.tracker.start(record.offset)
+            state.records.put_nowait(record)
+        self._fetched += len(records)
+        
+        if not state.paused and state.tracker.in_flight >= self.max_buffered:
+            self.consumer.pause(partition)
+            state.paused = True
+            self._pauses += 1
+    
+    async def _work(self, state: _PartitionState) -> None:
+        """Process one partition's records in order (or per key when windowed)."""
+        while not state.rewinding:
+            record = await state.records.get()
+            
+            batch_size = self.batch_size(state.partition.topic) if self.process_batch else 1
+            if batch_size > 1:
+                records = [record]
+                while len(records) < batch_size and not state.records.empty():
+                    records.append(state.records.get_nowait())
+                try:
+                    await self._handle_batch(state, records)
+                finally:
+                    for _ in records:
+                        state.records.task_done()
+                continue
+            
+            if self.max_in_flight == 1:
+                try:
+                    await self._handle(state, record)
+                finally:
+                    state.records.task_done()
+                continue
+            
+            try:
+                await state.window.acquire()
+            except asyncio.CancelledError:
+                state.records.task_done()
+                raise
+            previous = state.key_tails.get(record.key) if record.key is not None else None
+            task = asyncio.create_task(self._handle_after(state, record, previous))
+            state.tasks.add(task)
+            if record.key is not None:
+                state.key_tails[record.key] = task
+    
+    async def _handle_after(
+        self,
+        state: _PartitionState,
+        record: ConsumerRecord,
+        previous: Optional[asyncio.Task]
+    ) -> None:
+        """Handle a record once the previous record with the same key is done."""
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            await self._handle(state, record)
+        finally:
+            state.records.task_done()
+            state.window.release()
+            state.tasks.discard(asyncio.current_task())
+            if state.key_tails.get(record.key) is asyncio.current_task():
+                del state.key_tails[record.key]
+    
+    async def _handle(self, state: _PartitionState, record: ConsumerRecord) -> None:
+        """Process one record; mark its offset complete or rewind the partition."""
+        try:
+            done = await self.process_message(KafkaMessage.from_consumer_record(record))
+        except Exception as e:
+            self.logger.debug(f"Kafka message at offset {record.offset} of {state.partition} failed: {e}")
+            done = False
+        
+        if done:
+            self._processed += 1
+            self._complete(state, [record])
+        else:
+            self._failed += 1
+            self._start_rewind(state)
+    
+    async def _handle_batch(self, state: _PartitionState, records: List[ConsumerRecord]) -> None:
+        """Process consecutive records of a partition as one batch."""
+        try:
+            results = await self.process_batch([KafkaMessage.from_consumer_record(r) for r in records])
+        except Exception as e:
+            self.logger.debug(f"Kafka batch of {len(records)} messages from {state.partition} failed: {e}")
+            results = [False] * len(records)
+        
+        done = [record for record, result in zip(records, results) if result]
+        self._processed += len(done)
+        self._failed += len(records) - len(done)
+        self._complete(state, done)
+        if len(done) < len(records):
+            self._start_rewind(state)
+    
+    def _complete(self, state: _PartitionState, records: List[ConsumerRecord]) -> None:
+        """Mark processed records complete and resume the partition if it drained."""
+        for record in records:
+            state.tracker.complete(record.offset)
+        self._uncommitted += len(records)
+        
+        if state.paused and not state.rewinding and state.tracker.in_flight <= self.resume_threshold:
+            state.paused = False
+            try:
+                self.consumer.resume(state.partition)
+            except Exception as e:
+                self.logger.debug(f"Could not resume {state.partition}: {e}")
+    
+    def _start_rewind(self, state: _PartitionState) -> None:
+        """Stop a partition after a failed record; its queued records are dropped."""
+        if state.rewinding:
+            return
+        state.rewinding = True
+        self._rewinds += 1
+        if not state.paused:
+            try:
+                self.consumer.pause(state.partition)
+                state.paused = True
+            except Exception as e:
+                self.logger.debug(f"Could not pause {state.partition}: {e}")
+        state.rewind_task = asyncio.create_task(self._rewind(state))
+    
+    async def _rewind(self, state: _PartitionState) -> None:
+        """Commit what completed, then refetch the partition from its first unfinished record."""
+        tasks = [task for task in state.tasks if task is not asyncio.current_task()]
+        if state.worker:
+            tasks.append(state.worker)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        while not state.records.empty():
+            state.records.get_nowait()
+            state.records.task_done()
+        
+        offset = state.tracker.first_pending
+        await self.commit()
+        await asyncio.sleep(self.retry_delay)
+        
+        if self._partitions.get(state.partition) is not state:
+            return  # Revoked meanwhile
+        del self._partitions[state.partition]
+        try:
+            if offset is not None:
+                await self.consumer.seek(state.partition, offset)
+            self.consumer.resume(state.partition)
+        except Exception as e:
+            self.logger.error(f"Failed to rewind {state.partition} to offset {offset}: {e}")
+
+
+class _EngineRebalanceListener(ConsumerRebalanceListener):
+    """Commits completed offsets before partitions move to another consumer."""
+    
+    def __init__(self, engine: KafkaConsumerEngine):
+        self.engine = engine
+    
+    async def on_partitions_revoked(self, revoked) -> None:
+        await self.engine.release_partitions(list(revoked))
+    
+    async def on_partitions_assigned(self, assigned) -> None:
+        pass
+
+
 class KafkaClient(MessageBroker):
     """
     Enterprise-grade Kafka client with comprehensive features.
@@ -738,6 +1256,7 @@ class KafkaClient(MessageBroker):
     - Producer/Consumer with exactly-once semantics
     - Transaction support and idempotent producers
     - Advanced partition and consumer group management
+    - Concurrent per-partition processing with batched offset commits
     - Dead letter topics integration
     - SSL/TLS security and SASL authentication
     - Comprehensive monitoring and health checks
@@ -754,7 +1273,12 @@ class KafkaClient(MessageBroker):
         reliability_manager: Optional[ReliabilityManager] = None,
         logger: Optional[CommunicationLogger] = None
     ):
-        super().__init__(reliability_manager, logger)
+        # Configured with the Kafka dataclasses instead of a MessageBrokerConfig
+        self.reliability_manager = reliability_manager
+        self.logger = logger or CommunicationLogger(__name__)
+        self._connected = False
+        self._subscribers: Dict[str, List[MessageHandler]] = {}
+        self._dead_letter_handlers: Dict[str, Callable] = {}
         
         self.cluster_config = cluster_config
         self.producer_config = producer_config or KafkaProducerConfig()
@@ -764,10 +1288,12 @@ class KafkaClient(MessageBroker):
         
         self._producer: Optional[KafkaProducer] = None
         self._consumer: Optional[KafkaConsumer] = None
+        self._consumer_engine: Optional[KafkaConsumerEngine] = None
         self._admin_client: Optional[KafkaAdminClient] = None
         self._is_connected = False
         self._message_handlers: Dict[str, MessageHandler] = {}
         self._consumer_tasks: Dict[str, asyncio.Task] = {}
+        self._delivery_attempts: Dict[Tuple[str, Optional[int], Optional[int]], int] = {}
         
         # Initialize admin client for topic management
         self._init_admin_client()
@@ -849,6 +1375,11 @@ class KafkaClient(MessageBroker):
     async def disconnect(self) -> None:
         """Disconnect from Kafka cluster."""
         try:
+            # Finish in-flight messages and commit their offsets
+            if self._consumer_engine:
+                await self._consumer_engine.stop()
+                self._consumer_engine = None
+            
             # Stop all consumer tasks
             for task_name, task in self._consumer_tasks.items():
                 if not task.done():
@@ -927,7 +1458,8 @@ class KafkaClient(MessageBroker):
                     key=kafka_message.key,
                     partition=kafka_message.partition,
                     headers=kafka_message.headers,
-                    timestamp_ms=kafka_message.timestamp
+                    timestamp_ms=kafka_message.timestamp,
+                    content_type=kafka_message.content_type
                 )
                 
                 # Update message with metadata
@@ -970,6 +1502,73 @@ class KafkaClient(MessageBroker):
         else:
             return await _publish_operation()
     
+    async def publish_many(
+        self,
+        topic: str,
+        messages: List[Union[Message, Any]],
+        key: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[MessageAcknowledgment]:
+        """
+        Publish several messages to a Kafka topic in native record batches.
+        
+        Compression is done per record batch by the producer, using
+        ``KafkaProducerConfig.compression_type``; a ``compression`` option
+        is ignored. Failed records are reported, not retried through
+        ``reliability_manager``.
+        """
+        if not self._is_connected or not self._producer:
+            raise KafkaConnectionError("Producer not connected")
+        
+        kafka_messages = [self._to_kafka_message(topic, message, key, headers) for message in messages]
+        results = await self._producer.send_many(topic, kafka_messages)
+        
+        acks = []
+        for kafka_message, result in zip(kafka_messages, results):
+            if isinstance(result, Exception):
+                if self.dead_letter_config.enabled:
+                    await self._send_to_dead_letter_topic(kafka_message, str(result))
+                acks.append(MessageAcknowledgment(
+                    message_id=kafka_message.id, status=MessageStatus.FAILED, error=str(result)
+                ))
+            else:
+                kafka_message.partition = result.partition
+                kafka_message.offset = result.offset
+                acks.append(MessageAcknowledgment(message_id=kafka_message.id, status=MessageStatus.ACKNOWLEDGED))
+        return acks
+    
+    @staticmethod
+    def _to_kafka_message(
+        topic: str,
+        message: Union[Message, Any],
+        key: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None
+    ) -> KafkaMessage:
+        """Wrap a payload or SDK Message as a KafkaMessage for a topic."""
+        if isinstance(message, KafkaMessage):
+            kafka_message = message
+        elif isinstance(message, Message):
+            kafka_message = KafkaMessage(
+                content=message.payload,
+                topic=topic,
+                headers=dict(message.headers),
+                timestamp=int(message.timestamp.timestamp() * 1000),
+                id=message.id,
+                content_type=message.content_type,
+                correlation_id=message.correlation_id,
+                reply_to=message.reply_to
+            )
+        else:
+            kafka_message = KafkaMessage(content=message, topic=topic)
+        
+        kafka_message.topic = topic
+        if key and not kafka_message.key:
+            kafka_message.key = key
+        if headers:
+            kafka_message.headers.update(headers)
+        return kafka_message
+    
     async def subscribe(
         self,
         topic: str,
@@ -980,16 +1579,29 @@ class KafkaClient(MessageBroker):
         if not self._is_connected or not self._consumer:
             raise KafkaConnectionError("Consumer not connected")
         
-        # Subscribe to topic
-        await self._consumer.subscribe([topic])
-        
         # Store handler
         self._message_handlers[topic] = handler
         
+        # One engine consumes every subscribed topic of the consumer group
+        if self._consumer_engine is None:
+            self._consumer_engine = KafkaConsumerEngine(
+                self._consumer,
+                self._consume_message,
+                self.consumer_config,
+                self.logger,
+                process_batch=self._consume_batch,
+                batch_size=self._handler_batch_size,
+                retry_delay=self.dead_letter_config.retry_delay_ms / 1000
+            )
+        await self._consumer.subscribe(
+            list(self._message_handlers),
+            listener=self._consumer_engine.rebalance_listener
+        )
+        
         # Start consumer task
-        task_name = f"consumer_{topic}_{uuid.uuid4().hex[:8]}"
-        task = asyncio.create_task(self._consume_messages(topic, handler))
-        self._consumer_tasks[task_name] = task
+        task = self._consumer_tasks.get("consumer_engine")
+        if task is None or task.done():
+            self._consumer_tasks["consumer_engine"] = asyncio.create_task(self._consumer_engine.run())
         
         self.logger.info(f"Subscribed to topic {topic} with handler {handler.__class__.__name__}")
     
@@ -998,122 +1610,133 @@ class KafkaClient(MessageBroker):
         if topic in self._message_handlers:
             del self._message_handlers[topic]
         
-        # Stop consumer tasks for this topic
-        tasks_to_remove = []
-        for task_name, task in self._consumer_tasks.items():
-            if topic in task_name:
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                tasks_to_remove.append(task_name)
+        if self._message_handlers and self._consumer and self._consumer_engine:
+            # Keep consuming the remaining topics
+            await self._consumer.subscribe(
+                list(self._message_handlers),
+                listener=self._consumer_engine.rebalance_listener
+            )
+        else:
+            # Stop the consumer engine when no topics are left
+            if self._consumer_engine:
+                await self._consumer_engine.stop()
+                self._consumer_engine = None
+            
+            task = self._consumer_tasks.pop("consumer_engine", None)
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            
+            if self._consumer:
+                await self._consumer.unsubscribe()
         
-        for task_name in tasks_to_remove:
-            del self._consumer_tasks[task_name]
+        self.logger.info(f"Unsubscribed from topic {topic}")
+    
+    async def _consume_message(self, kafka_message: KafkaMessage) -> bool:
+        """
+        Process one consumed message with its topic handler.
         
-        # Unsubscribe from consumer
-        if self._consumer:
-            await self._consumer.unsubscribe()
+        Returns True once the offset may be committed: the handler
+        acknowledged the message, or it failed more than
+        ``dead_letter_config.max_retries`` times and was dead-lettered.
+        """
+        topic = kafka_message.topic
+        handler = self._message_handlers.get(topic)
+        if handler is None:
+            # Unsubscribed while the message was queued
+            return False
         
-        self.logger.info(f"Unsubscribed from topic {topic}")
+        ack = MessageAcknowledgment(message_id=kafka_message.id, status=MessageStatus.PROCESSING)
+        try:
+            if self.reliability_manager:
+                ack = await self.reliability_manager.execute_with_retry(handler.handle_message, kafka_message)
+            else:
+                ack = await handler.handle_message(kafka_message)
+        except Exception as e:
+            ack.status = MessageStatus.FAILED
+            ack.error = str(e)
+        
+        if ack.status == MessageStatus.ACKNOWLEDGED:
+            self._delivery_attempts.pop(self._delivery_key(kafka_message), None)
+            return True
+        return await self._handle_failed_delivery(kafka_message, ack.error or f"Message {ack.status.value}")
     
-    async def _consume_messages(self, topic: str, handler: MessageHandler) -> None:
-        """Internal method to consume messages from topic."""
+    def _handler_batch_size(self, topic: str) -> int:
+        """Get the batch size of a topic's handler (1 for per-message handlers)."""
+        handler = self._message_handlers.get(topic)
+        if isinstance(handler, BatchMessageHandler):
+            return max(1, handler.max_batch_size)
+        return 1
+    
+    async def _consume_batch(self, kafka_messages: List[KafkaMessage]) -> List[bool]:
+        """Process messages of one partition with a BatchMessageHandler."""
+        topic = kafka_messages[0].topic
+        handler = self._message_handlers.get(topic)
+        if not isinstance(handler, BatchMessageHandler):
+            return [await self._consume_message(message) for message in kafka_messages]
+        
         try:
-            while True:
-                try:
-                    # Consume batch of messages
-                    messages = await self._consumer.consume_batch(
-                        max_records=self.consumer_config.max_poll_records,
-                        timeout_ms=1000
-                    )
-                    
-                    if not messages:
-                        continue
-                    
-                    # Process messages
-                    for kafka_message in messages:
-                        if kafka_message.topic != topic:
-                            continue
-                        
-                        # Apply reliability patterns
-                        async def _process_message():
-                            try:
-                                # Create acknowledgment
-                                ack = MessageAcknowledgment(
-                                    message_id=kafka_message.message_id,
-                                    status=MessageStatus.PROCESSING
-                                )
-                                
-                                # Process message with handler
-                                await handler.handle(kafka_message, ack)
-                                
-                                # Commit offset if processing succeeded
-                                if ack.status == MessageStatus.SUCCESS:
-                                    tp = TopicPartition(kafka_message.topic, kafka_message.partition)
-                                    await self._consumer.commit({tp: kafka_message.offset + 1})
-                                    
-                                    # Update metrics
-                                    if self.reliability_manager:
-                                        self.reliability_manager.metrics.record_message_processed(topic)
-                                
-                                return ack.status == MessageStatus.SUCCESS
-                                
-                            except Exception as e:
-                                ack.status = MessageStatus.FAILED
-                                ack.error_message = str(e)
-                                
-                                # Handle dead letter topic
-                                if self.dead_letter_config.enabled:
-                                    await self._send_to_dead_letter_topic(kafka_message, str(e))
-                                
-                                # Update metrics
-                                if self.reliability_manager:
-                                    self.reliability_manager.metrics.record_message_error(topic, str(e))
-                                
-                                self.logger.error(
-                                    f"Error processing message from topic {topic}: {e}",
-                                    extra={
-                                        "topic": topic,
-                                        "partition": kafka_message.partition,
-                                        "offset": kafka_message.offset,
-                                        "message_id": kafka_message.message_id
-                                    }
-                                )
-                                
-                                raise
-                        
-                        # Apply reliability patterns if available
-                        if self.reliability_manager:
-                            await self.reliability_manager.execute_with_reliability(
-                                _process_message,
-                                context={
-                                    "topic": topic,
-                                    "message_id": kafka_message.message_id,
-                                    "partition": kafka_message.partition,
-                                    "offset": kafka_message.offset
-                                }
-                            )
-                        else:
-                            await _process_message()
-                
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error in consumer loop for topic {topic}: {e}")
-                    await asyncio.sleep(1)  # Brief pause before retrying
-                    
-        except asyncio.CancelledError:
-            self.logger.debug(f"Consumer task for topic {topic} cancelled")
+            if self.reliability_manager:
+                acks = await self.reliability_manager.execute_with_retry(handler.handle_batch, kafka_messages)
+            else:
+                acks = await handler.handle_batch(kafka_messages)
+            if len(acks) != len(kafka_messages):
+                raise KafkaConsumerError(
+                    f"Batch handler returned {len(acks)} acknowledgments for {len(kafka_messages)} messages"
+                )
         except Exception as e:
-            self.logger.error(f"Fatal error in consumer task for topic {topic}: {e}")
+            acks = [
+                MessageAcknowledgment(message_id=message.id, status=MessageStatus.FAILED, error=str(e))
+                for message in kafka_messages
+            ]
+        
+        results = []
+        for message, ack in zip(kafka_messages, acks):
+            if ack.status == MessageStatus.ACKNOWLEDGED:
+                self._delivery_attempts.pop(self._delivery_key(message), None)
+                results.append(True)
+            else:
+                results.append(await self._handle_failed_delivery(
+                    message, ack.error or "Message failed in batch"
+                ))
+        return results
     
-    async def _send_to_dead_letter_topic(self, message: KafkaMessage, error: str) -> None:
-        """Send message to dead letter topic."""
-        if not self.dead_letter_config.enabled:
-            return
+    @staticmethod
+    def _delivery_key(message: KafkaMessage) -> Tuple[str, Optional[int], Optional[int]]:
+        """Identify a consumed record across redeliveries."""
+        return (message.topic, message.partition, message.offset)
+    
+    async def _handle_failed_delivery(self, message: KafkaMessage, error: str) -> bool:
+        """Count a failed delivery; dead-letter the message once its retries are used up."""
+        key = self._delivery_key(message)
+        attempts = self._delivery_attempts.get(key, 0) + 1
+        self._delivery_attempts[key] = attempts
+        
+        self.logger.error(
+            f"Error processing message from topic {message.topic}: {error}",
+            extra={
+                "topic": message.topic,
+                "partition": message.partition,
+                "offset": message.offset,
+                "message_id": message.id,
+                "attempt": attempts
+            }
+        )
+        
+        if not self.dead_letter_config.enabled or attempts <= self.dead_letter_config.max_retries:
+            return False
+        if not await self._send_to_dead_letter_topic(message, error):
+            return False
+        del self._delivery_attempts[key]
+        return True
+    
+    async def _send_to_dead_letter_topic(self, message: KafkaMessage, error: str) -> bool:
+        """Send message to dead letter topic; returns whether it was delivered."""
+        if not self.dead_letter_config.enabled or not self._producer:
+            return False
         
         try:
             dead_letter_topic = f"{message.topic}{self.dead_letter_config.topic_suffix}"
@@ -1123,8 +1746,8 @@ class KafkaClient(MessageBroker):
             if self.dead_letter_config.include_headers:
                 dead_letter_headers.update({
                     "x-original-topic": message.topic,
-                    "x-original-partition": str(message.partition) if message.partition else "",
-                    "x-original-offset": str(message.offset) if message.offset else "",
+                    "x-original-partition": str(message.partition) if message.partition is not None else "",
+                    "x-original-offset": str(message.offset) if message.offset is not None else "",
                     "x-original-key": message.key or "",
                     "x-failure-timestamp": str(int(time.time() * 1000)),
                     "x-failure-reason": error[:1000]  # Limit error message length
@@ -1138,7 +1761,8 @@ class KafkaClient(MessageBroker):
                 topic=dead_letter_topic,
                 value=message.content,
                 key=message.key,
-                headers=dead_letter_headers
+                headers=dead_letter_headers,
+                content_type=message.content_type
             )
             
             self.logger.warning(
@@ -1146,13 +1770,15 @@ class KafkaClient(MessageBroker):
                 extra={
                     "original_topic": message.topic,
                     "dead_letter_topic": dead_letter_topic,
-                    "message_id": message.message_id,
+                    "message_id": message.id,
                     "error": error
                 }
             )
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to send message to dead letter topic: {e}")
+            return False
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on Kafka client."""
@@ -1185,6 +1811,8 @@ class KafkaClient(MessageBroker):
                     "subscribed_topics": list(self._consumer.subscribed_topics),
                     "active_tasks": len(self._consumer_tasks)
                 }
+                if self._consumer_engine:
+                    health_status["checks"]["consumer"]["engine"] = self._consumer_engine.get_stats()
             
             # Check admin client
             if self._admin_client:
@@ -1481,6 +2109,8 @@ __all__ = [
     # Producer and Consumer
     "KafkaProducer",
     "KafkaConsumer",
+    "KafkaConsumerEngine",
+    "PartitionOffsetTracker",
     
     # Message class
     "KafkaMessage",
@@ -0,0 +1,233 @@
+"""
+Batched Message Publishing for FastAPI Microservices SDK.
+
+This module provides an opt-in accumulator that sits in front of a message
+broker. Calls to ``publish()`` return as soon as the message is queued and
+hand back a future for its delivery result; messages for the same topic
+are collected for up to ``linger_ms`` (or until a batch reaches its size
+or byte limit) and sent with one ``publish_many()`` call, which each
+broker implements with its native batching.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .base import Message, MessageBroker, MessageStatus
+from .codecs import encode_payload, infer_content_type
+from ..exceptions import MessagePublishError
+from ..logging import CommunicationLogger
+
+
+@dataclass
+class PublishBatchConfig:
+    """Configuration for batched publishing."""
+    linger_ms: int = 5  # Longest time a message waits for its batch to fill
+    max_batch_size: int = 500
+    max_batch_bytes: int = 1048576
+    max_pending: int = 10000  # publish() waits while this many messages are undelivered
+    compression: Optional[str] = None  # Content encoding for batches, e.g. 'gzip'
+    publish_options: Dict[str, Any] = field(default_factory=dict)  # Passed to publish_many()
+
+
+class _PendingBatch:
+    """Messages collected for one topic."""
+
+    __slots__ = ('topic', 'deadline', 'messages', 'futures', 'size_bytes')
+
+    def __init__(self, topic: str, deadline: float):
+        self.topic = topic
+        self.deadline = deadline
+        self.messages: List[Message] = []
+        self.futures: List[asyncio.Future] = []
+        self.size_bytes = 0
+
+
+class PublishAccumulator:
+    """
+    Collects published messages into per-topic batches.
+
+    Payloads are encoded when they are published, so the byte limit is
+    exact and the flush does no encoding; a Message passed in has its
+    payload replaced by the encoded bytes. Batches for one topic are sent
+    one at a time, in the order they were filled, and each broker writes a
+    batch in message order. Ordering is not kept across failures: a failed
+    message is not retried, so callers that retry it publish it after
+    later messages.
+
+    Example:
+        async with PublishAccumulator(broker, PublishBatchConfig(linger_ms=10)) as publisher:
+            futures = [await publisher.publish("events", event) for event in events]
+            message_ids = await asyncio.gather(*futures)
+    """
+
+    def __init__(self, broker: MessageBroker, config: Optional[PublishBatchConfig] = None):
+        self.broker = broker
+        self.config = config or PublishBatchConfig()
+        self.logger = CommunicationLogger("publish_accumulator")
+
+        self._batches: Dict[str, _PendingBatch] = {}
+        self._topic_locks: Dict[str, asyncio.Lock] = {}
+        self._sending: set = set()
+        self._capacity = asyncio.Semaphore(self.config.max_pending)
+        self._wakeup = asyncio.Event()
+        self._linger_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._stats = {
+            'messages_published': 0,
+            'messages_failed': 0,
+            'batches_sent': 0,
+            'bytes_sent': 0,
+        }
+
+    async def start(self) -> None:
+        """Start the linger timer task."""
+        if self._linger_task is None:
+            self._closed = False
+            self._linger_task = asyncio.create_task(self._linger_loop())
+
+    async def stop(self) -> None:
+        """Send every pending batch and stop."""
+        self._closed = True
+        await self.flush()
+        if self._linger_task:
+            self._linger_task.cancel()
+            try:
+                await self._linger_task
+            except asyncio.CancelledError:
+                pass
+            self._linger_task = None
+
+    async def __aenter__(self) -> "PublishAccumulator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    async def publish(self, topic: str, message: Any) -> asyncio.Future:
+        """
+        Queue a message for publishing.
+
+        Waits only while ``max_pending`` messages are undelivered.
+
+        Returns:
+            Future resolved with the message ID once the broker accepted
+            the message, or failed with MessagePublishError
+        """
+        if self._closed:
+            raise MessagePublishError("Publish accumulator is stopped")
+        if self._linger_task is None:
+            await self.start()
+
+        if not isinstance(message, Message):
+            message = Message(payload=message, content_type=infer_content_type(message))
+        message.topic = topic
+        message.payload, message.content_type = encode_payload(message.payload, message.content_type)
+        size = memoryview(message.payload).nbytes
+
+        await self._capacity.acquire()
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: self._capacity.release())
+
+        batch = self._batches.get(topic)
+        if batch is not None and batch.size_bytes + size > self.config.max_batch_bytes:
+            self._dispatch(self._batches.pop(topic))
+            batch = None
+        if batch is None:
+            batch = _PendingBatch(topic, time.monotonic() + self.config.linger_ms / 1000)
+            self._batches[topic] = batch
+            self._wakeup.set()
+
+        batch.messages.append(message)
+        batch.futures.append(future)
+        batch.size_bytes += size
+        if len(batch.messages) >= self.config.max_batch_size or batch.size_bytes >= self.config.max_batch_bytes:
+            self._dispatch(self._batches.pop(topic))
+
+        return future
+
+    async def flush(self) -> None:
+        """Send every pending batch now and wait until all sent batches complete."""
+        for topic in list(self._batches):
+            self._dispatch(self._batches.pop(topic))
+        while self._sending:
+            await asyncio.gather(*list(self._sending), return_exceptions=True)
+
+    def _dispatch(self, batch: _PendingBatch) -> None:
+        """Start sending a batch in the background."""
+        task = asyncio.create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _linger_loop(self) -> None:
+        """Send batches whose linger time has passed."""
+        while True:
+            now = time.monotonic()
+            for topic, batch in list(self._batches.items()):
+                if batch.deadline <= now:
+                    self._dispatch(self._batches.pop(topic))
+
+            self._wakeup.clear()
+            deadlines = [batch.deadline for batch in self._batches.values()]
+            timeout = min(deadlines) - now if deadlines else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _send(self, batch: _PendingBatch) -> None:
+        """Publish one batch and resolve its futures."""
+        options = dict(self.config.publish_options)
+        if self.config.compression:
+            options['compression'] = self.config.compression
+
+        lock = self._topic_locks.setdefault(batch.topic, asyncio.Lock())
+        async with lock:
+            try:
+                acks = await self.broker.publish_many(batch.topic, batch.messages, **options)
+                errors = [None if ack.status == MessageStatus.ACKNOWLEDGED else ack.error for ack in acks]
+                # Fail messages the broker did not acknowledge, so their futures (and max_pending slots) are released
+                errors.extend(["No acknowledgment from broker"] * (len(batch.messages) - len(errors)))
+            except Exception as e:
+                self.logger.error(f"Failed to publish batch to {batch.topic}: {e}")
+                errors = [str(e)] * len(batch.messages)
+
+        self._stats['batches_sent'] += 1
+        self._stats['bytes_sent'] += batch.size_bytes
+        for message, future, error in zip(batch.messages, batch.futures, errors):
+            if error is None:
+                self._stats['messages_published'] += 1
+                if not future.done():
+                    future.set_result(message.id)
+            else:
+                self._stats['messages_failed'] += 1
+                if not future.done():
+                    future.set_exception(MessagePublishError(f"Failed to publish message to {batch.topic}: {error}"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get accumulator statistics."""
+        batches = self._stats['batches_sent']
+        sent = self._stats['messages_published'] + self._stats['messages_failed']
+        return {
+            **self._stats,
+            'average_batch_size': sent / batches if batches else 0.0,
+            'pending_messages': sum(len(batch.messages) for batch in self._batches.values()),
+            'batches_in_flight': len(self._sending),
+            'linger_ms': self.config.linger_ms,
+            'compression': self.config.compression,
+        }
+
+
+def create_publish_accumulator(broker: MessageBroker, **kwargs) -> PublishAccumulator:
+    """Create publish accumulator for a broker with PublishBatchConfig options."""
+    return PublishAccumulator(broker, PublishBatchConfig(**kwargs))
+
+
+__all__ = [
+    'PublishBatchConfig',
+    'PublishAccumulator',
+    'create_publish_accumulator',
+]
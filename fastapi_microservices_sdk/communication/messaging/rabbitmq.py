@@ -5,13 +5,13 @@ This module provides a comprehensive RabbitMQ client with advanced features incl
 - Exchange and queue management with automatic declaration
 - Dead letter queue setup and handling
 - Publisher confirms and consumer acknowledgments
+- Batch consumption with prefetch-sized batches and multiple-acks
 - Routing key patterns and message routing logic
 - Integration with security system for authentication
 - Full integration with reliability patterns (retry, circuit breaker, deduplication, metrics)
 """
 
 import asyncio
-import json
 import logging
 from typing import Dict, List, Optional, Any, Callable, Union, Set
 from datetime import datetime, timedelta
@@ -43,11 +43,13 @@ from .base import (
     MessageBroker, 
     Message, 
     MessageHandler, 
+    BatchMessageHandler,
     MessageAcknowledgment, 
     MessageStatus,
     DeliveryMode as SDKDeliveryMode,
     ReliabilityManager
 )
+from .codecs import infer_content_type
 
 
 class RabbitMQExchangeType(str, Enum):
@@ -133,6 +135,52 @@ class RabbitMQBindingConfig:
     arguments: Dict[str, Any] = field(default_factory=dict)
 
 
+class _RabbitMQBatchCollector:
+    """
+    Collects deliveries of one consumer into batches.
+    
+    The consumer's channel has a prefetch of ``max_batch_size``, so the
+    broker never has more than one batch of unacknowledged deliveries
+    outstanding. A batch is processed when full or ``max_wait_seconds``
+    after its first delivery; batches are processed one at a time, so
+    delivery tags of a batch are always below those of the next one.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_wait_seconds: float,
+        process_batch: Callable[[List[AioPikaMessage]], Any]
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.process_batch = process_batch
+        self._pending: List[AioPikaMessage] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+    
+    async def add(self, aio_pika_message: AioPikaMessage) -> None:
+        """Consumer callback: queue a delivery and flush full batches."""
+        self._pending.append(aio_pika_message)
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_wait_seconds, lambda: asyncio.ensure_future(self.flush())
+            )
+    
+    async def flush(self) -> None:
+        """Process the deliveries collected so far."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if batch:
+                await self.process_batch(batch)
+
+
 class RabbitMQClient(MessageBroker):
     """
     Advanced RabbitMQ client with enterprise features.
@@ -142,6 +190,7 @@ class RabbitMQClient(MessageBroker):
     - Exchange and queue declaration with full configuration
     - Dead letter queue setup and handling
     - Publisher confirms and consumer acknowledgments
+    - Batch consumption for BatchMessageHandler subscribers
     - Message routing with patterns
     - Integration with reliability patterns
     - Security integration for authentication
@@ -187,6 +236,12 @@ class RabbitMQClient(MessageBroker):
         # Consumer management
         self.consumers: Dict[str, Any] = {}  # queue_name -> consumer_tag
         self.consumer_handlers: Dict[str, MessageHandler] = {}
+        self.batch_channels: Dict[str, AbstractChannel] = {}  # Dedicated channels of batch consumers
+        self.batch_collectors: Dict[str, _RabbitMQBatchCollector] = {}
+        
+        # Optional reliability components
+        self.deduplicator: Optional[Any] = None
+        self.metrics: Optional[Any] = None
         
         # Dead letter queue management
         self.dlq_exchanges: Dict[str, AbstractExchange] = {}
@@ -336,6 +391,17 @@ class RabbitMQClient(MessageBroker):
             self.consumers.clear()
             self.consumer_handlers.clear()
             
+            # Close batch consumer channels
+            for topic, channel in self.batch_channels.items():
+                try:
+                    if not channel.is_closed:
+                        await channel.close()
+                except Exception as e:
+                    self.logger.warning(f"Failed to close batch channel for topic {topic}: {e}")
+            
+            self.batch_channels.clear()
+            self.batch_collectors.clear()
+            
             # Close channel
             if self.channel and not self.channel.is_closed:
                 await self.channel.close()
@@ -606,14 +672,14 @@ class RabbitMQClient(MessageBroker):
         # Convert message to SDK Message format
         if not isinstance(message, Message):
             sdk_message = Message(
-                content=message,
+                payload=message,
                 topic=topic,
-                routing_key=routing_key
+                content_type=infer_content_type(message)
             )
         else:
             sdk_message = message
             sdk_message.topic = topic
-            sdk_message.routing_key = routing_key
+        sdk_message.routing_key = routing_key
         
         # Apply reliability patterns
         async def _publish_operation():
@@ -628,57 +694,124 @@ class RabbitMQClient(MessageBroker):
         else:
             await _publish_operation()
     
+    def _get_exchange(self, exchange_name: str = "") -> Any:
+        """Get a declared exchange (the default exchange if no name is given)."""
+        if exchange_name:
+            if exchange_name not in self.exchanges:
+                raise MessageBrokerError(f"Exchange {exchange_name} not declared")
+            return self.exchanges[exchange_name]
+        return self.channel.default_exchange
+    
+    def _build_aio_pika_message(
+        self,
+        message: Message,
+        compression: Optional[str] = None,
+        **kwargs
+    ) -> AioPikaMessage:
+        """Encode an SDK message as an aio_pika message."""
+        # Convert SDK delivery mode to aio_pika delivery mode
+        delivery_mode = DeliveryMode.PERSISTENT
+        if message.delivery_mode == SDKDeliveryMode.AT_MOST_ONCE:
+            delivery_mode = DeliveryMode.NOT_PERSISTENT
+        
+        # Encode payload with the codec for its content type; the envelope travels in headers
+        body, headers = message.to_wire(compression)
+        content_type = headers.pop('content-type')
+        content_encoding = headers.pop('content-encoding', None)
+        
+        return AioPikaMessage(
+            body=body,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            delivery_mode=delivery_mode,
+            message_id=message.id,
+            correlation_id=message.correlation_id,
+            timestamp=message.timestamp,
+            **kwargs
+        )
+    
+    async def publish_many(
+        self,
+        topic: str,
+        messages: List[Union[Message, dict, str, bytes]],
+        routing_key: str = "",
+        exchange_name: str = "",
+        compression: Optional[str] = None,
+        **kwargs
+    ) -> List[MessageAcknowledgment]:
+        """
+        Publish several messages to a RabbitMQ exchange.
+        
+        Messages are written to the channel one after another, in order,
+        and only then are their publisher confirms awaited together, so the
+        broker confirms them in runs (one ``multiple`` ack for several
+        delivery tags) instead of one round trip per message. With
+        ``compression`` each body is compressed and sent with that content
+        encoding. The batch is not run through ``reliability_manager``; see
+        MessageBroker.publish_many.
+        """
+        await self.ensure_connected()
+        routing_key = routing_key or topic
+        exchange = self._get_exchange(exchange_name)
+        start_time = datetime.now()
+        
+        async def _publish_one(message: Union[Message, dict, str, bytes]) -> Message:
+            if not isinstance(message, Message):
+                message = Message(payload=message, topic=topic, content_type=infer_content_type(message))
+            message.topic = topic
+            await exchange.publish(
+                message=self._build_aio_pika_message(message, compression, **kwargs),
+                routing_key=routing_key
+            )
+            return message
+        
+        publishes = []
+        for message in messages:
+            publishes.append(asyncio.ensure_future(_publish_one(message)))
+            # Let the publish write its frames (or queue on the channel lock) before the next one starts
+            await asyncio.sleep(0)
+        results = await asyncio.gather(*publishes, return_exceptions=True)
+        
+        acks = []
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                if self.metrics:
+                    self.metrics.record_message_publish_error(topic, str(result))
+                acks.append(MessageAcknowledgment(
+                    message_id=message.id if isinstance(message, Message) else "",
+                    status=MessageStatus.FAILED,
+                    error=str(result)
+                ))
+            else:
+                acks.append(MessageAcknowledgment(message_id=result.id, status=MessageStatus.ACKNOWLEDGED))
+        
+        latency = (datetime.now() - start_time).total_seconds()
+        if self.metrics:
+            for ack in acks:
+                if ack.status == MessageStatus.ACKNOWLEDGED:
+                    self.metrics.record_message_published(topic, latency)
+        
+        self.logger.debug(
+            "Message batch published",
+            extra={
+                "topic": topic,
+                "routing_key": routing_key,
+                "exchange": exchange_name or "default",
+                "messages": len(acks),
+                "latency_ms": latency * 1000
+            }
+        )
+        
+        return acks
+    
     async def _do_publish(self, message: Message, exchange_name: str = "", **kwargs) -> None:
         """Internal method to publish message."""
         try:
             start_time = datetime.now()
             
-            # Get exchange (use default exchange if not specified)
-            if exchange_name:
-                if exchange_name not in self.exchanges:
-                    raise MessageBrokerError(f"Exchange {exchange_name} not declared")
-                exchange = self.exchanges[exchange_name]
-            else:
-                exchange = self.channel.default_exchange
-            
-            # Convert SDK delivery mode to aio_pika delivery mode
-            delivery_mode = DeliveryMode.PERSISTENT
-            if message.delivery_mode == SDKDeliveryMode.AT_MOST_ONCE:
-                delivery_mode = DeliveryMode.NOT_PERSISTENT
-            
-            # Serialize message content
-            if isinstance(message.content, (dict, list)):
-                body = json.dumps(message.content).encode('utf-8')
-                content_type = "application/json"
-            elif isinstance(message.content, str):
-                body = message.content.encode('utf-8')
-                content_type = "text/plain"
-            elif isinstance(message.content, bytes):
-                body = message.content
-                content_type = "application/octet-stream"
-            else:
-                body = str(message.content).encode('utf-8')
-                content_type = "text/plain"
-            
-            # Build message headers
-            headers = message.metadata.copy()
-            headers.update({
-                "message_id": message.id,
-                "timestamp": message.timestamp.isoformat(),
-                "correlation_id": message.correlation_id
-            })
-            
-            # Create aio_pika message
-            aio_pika_message = AioPikaMessage(
-                body=body,
-                headers=headers,
-                content_type=content_type,
-                delivery_mode=delivery_mode,
-                message_id=message.id,
-                correlation_id=message.correlation_id,
-                timestamp=message.timestamp,
-                **kwargs
-            )
+            exchange = self._get_exchange(exchange_name)
+            aio_pika_message = self._build_aio_pika_message(message, **kwargs)
             
             # Publish message
             await exchange.publish(
@@ -767,16 +900,19 @@ class RabbitMQClient(MessageBroker):
                     )
                     await self.bind_queue(default_binding)
             
-            # Create message processor with reliability patterns
-            async def message_processor(aio_pika_message: AioPikaMessage):
-                await self._process_message(aio_pika_message, handler, topic)
-            
-            # Start consuming
-            consumer_tag = await queue.consume(
-                callback=message_processor,
-                no_ack=False,  # Always use manual acknowledgments
-                **kwargs
-            )
+            if isinstance(handler, BatchMessageHandler):
+                consumer_tag = await self._consume_batches(queue_config.name, handler, topic, **kwargs)
+            else:
+                # Create message processor with reliability patterns
+                async def message_processor(aio_pika_message: AioPikaMessage):
+                    await self._process_message(aio_pika_message, handler, topic)
+                
+                # Start consuming
+                consumer_tag = await queue.consume(
+                    callback=message_processor,
+                    no_ack=False,  # Always use manual acknowledgments
+                    **kwargs
+                )
             
             # Store consumer information
             self.consumers[topic] = consumer_tag
@@ -810,6 +946,7 @@ class RabbitMQClient(MessageBroker):
         """Process incoming message with reliability patterns."""
         start_time = datetime.now()
         message_id = aio_pika_message.message_id or f"msg_{datetime.now().timestamp()}"
+        claimed = None
         
         try:
             # Convert aio_pika message to SDK Message
@@ -826,6 +963,7 @@ class RabbitMQClient(MessageBroker):
                     return
                 
                 await self.deduplicator.track_message(sdk_message)
+                claimed = sdk_message
             
             # Process message with reliability patterns
             async def _process_operation():
@@ -863,6 +1001,10 @@ class RabbitMQClient(MessageBroker):
                 # Message processing failed
                 error_msg = acknowledgment.error_message if acknowledgment else "Unknown error"
                 
+                # Let the redelivery through deduplication
+                if claimed is not None:
+                    await self.deduplicator.release_message(claimed)
+                
                 # Check if we should retry or send to DLQ
                 if self._should_retry_message(aio_pika_message):
                     await aio_pika_message.nack(requeue=True)
@@ -902,6 +1044,8 @@ class RabbitMQClient(MessageBroker):
             
             # Nack message without requeue on unexpected errors
             try:
+                if claimed is not None:
+                    await self.deduplicator.release_message(claimed)
                 await aio_pika_message.nack(requeue=False)
             except Exception as nack_error:
                 self.logger.error(f"Failed to nack message: {nack_error}")
@@ -910,34 +1054,142 @@ class RabbitMQClient(MessageBroker):
             if self.metrics:
                 self.metrics.record_message_consume_error(topic, str(e))
     
-    async def _convert_aio_pika_message(self, aio_pika_message: AioPikaMessage, topic: str) -> Message:
-        """Convert aio_pika message to SDK Message."""
+    async def _consume_batches(
+        self,
+        queue_name: str,
+        handler: BatchMessageHandler,
+        topic: str,
+        **kwargs
+    ) -> str:
+        """Consume a queue in batches on a dedicated channel with prefetch = batch size."""
+        channel = await self.connection.channel()
+        await channel.set_qos(prefetch_count=handler.max_batch_size)
+        queue = await channel.get_queue(queue_name, ensure=False)
+        
+        async def batch_processor(aio_pika_messages: List[AioPikaMessage]):
+            await self._process_batch_messages(aio_pika_messages, handler, topic)
+        
+        collector = _RabbitMQBatchCollector(handler.max_batch_size, handler.max_wait_seconds, batch_processor)
+        consumer_tag = await queue.consume(
+            callback=collector.add,
+            no_ack=False,  # Always use manual acknowledgments
+            **kwargs
+        )
+        
+        self.batch_channels[topic] = channel
+        self.batch_collectors[topic] = collector
+        return consumer_tag
+    
+    async def _process_batch_messages(
+        self,
+        aio_pika_messages: List[AioPikaMessage],
+        handler: BatchMessageHandler,
+        topic: str
+    ) -> None:
+        """Process a batch of deliveries and acknowledge them, with one multiple-ack if all succeeded."""
+        start_time = datetime.now()
+        deliveries: List[AioPikaMessage] = []
+        sdk_messages: List[Message] = []
+        
+        for aio_pika_message in aio_pika_messages:
+            try:
+                sdk_message = await self._convert_aio_pika_message(aio_pika_message, topic)
+                
+                # Apply deduplication if available
+                if self.deduplicator:
+                    if await self.deduplicator.is_duplicate(sdk_message):
+                        await aio_pika_message.ack()
+                        continue
+                    await self.deduplicator.track_message(sdk_message)
+            except Exception as e:
+                # Unreadable deliveries go to the DLQ without failing the batch
+                await aio_pika_message.nack(requeue=False)
+                if self.metrics:
+                    self.metrics.record_message_consume_error(topic, str(e))
+                continue
+            
+            deliveries.append(aio_pika_message)
+            sdk_messages.append(sdk_message)
+        
+        if not sdk_messages:
+            return
+        
+        async def _process_operation():
+            return await handler.handle_batch(sdk_messages)
+        
         try:
-            # Deserialize content based on content type
-            content_type = aio_pika_message.content_type or "application/octet-stream"
-            body = aio_pika_message.body
-            
-            if content_type == "application/json":
-                content = json.loads(body.decode('utf-8'))
-            elif content_type == "text/plain":
-                content = body.decode('utf-8')
+            if self.reliability_manager:
+                acknowledgments = await self.reliability_manager.execute_with_reliability(
+                    operation=_process_operation,
+                    operation_type="consume",
+                    context={"topic": topic, "batch_size": len(sdk_messages)}
+                )
             else:
-                content = body
-            
-            # Extract metadata from headers
-            metadata = {}
-            if aio_pika_message.headers:
-                metadata.update(aio_pika_message.headers)
-            
-            # Create SDK message
-            sdk_message = Message(
-                id=aio_pika_message.message_id or f"msg_{datetime.now().timestamp()}",
-                content=content,
-                topic=topic,
-                metadata=metadata,
-                correlation_id=aio_pika_message.correlation_id,
-                timestamp=aio_pika_message.timestamp or datetime.now()
+                acknowledgments = await _process_operation()
+            if len(acknowledgments) != len(sdk_messages):
+                raise MessageConsumptionError(
+                    f"Batch handler returned {len(acknowledgments)} acknowledgments for {len(sdk_messages)} messages"
+                )
+        except Exception as e:
+            self.logger.error(
+                "Batch processing failed",
+                extra={"topic": topic, "batch_size": len(sdk_messages), "error": str(e)},
+                exc_info=True
             )
+            acknowledgments = [
+                MessageAcknowledgment(message_id=message.id, status=MessageStatus.FAILED, error=str(e))
+                for message in sdk_messages
+            ]
+        
+        try:
+            succeeded = [ack.status == MessageStatus.ACKNOWLEDGED for ack in acknowledgments]
+            if all(succeeded):
+                # One ack covers every delivery of the batch on this channel
+                await deliveries[-1].ack(multiple=True)
+            else:
+                for delivery, message, ok in zip(deliveries, sdk_messages, succeeded):
+                    if ok:
+                        await delivery.ack()
+                    else:
+                        if self.deduplicator:
+                            await self.deduplicator.release_message(message)
+                        await delivery.nack(requeue=self._should_retry_message(delivery))
+        except Exception as e:
+            self.logger.error(f"Failed to acknowledge batch for topic {topic}: {e}")
+        
+        # Update metrics
+        if self.metrics:
+            latency = (datetime.now() - start_time).total_seconds()
+            for ok, ack in zip(succeeded, acknowledgments):
+                if ok:
+                    self.metrics.record_message_consumed(topic, latency)
+                else:
+                    self.metrics.record_message_consume_error(topic, ack.error or "Unknown error")
+        
+        self.logger.debug(
+            "Message batch processed",
+            extra={
+                "topic": topic,
+                "batch_size": len(sdk_messages),
+                "acknowledged": sum(succeeded)
+            }
+        )
+    
+    async def _convert_aio_pika_message(self, aio_pika_message: AioPikaMessage, topic: str) -> Message:
+        """Convert aio_pika message to SDK Message."""
+        try:
+            headers = dict(aio_pika_message.headers or {})
+            if aio_pika_message.content_type:
+                headers['content-type'] = aio_pika_message.content_type
+            if aio_pika_message.content_encoding:
+                headers['content-encoding'] = aio_pika_message.content_encoding
+            
+            # Decode payload by content type and restore the envelope from headers
+            sdk_message = Message.from_wire(aio_pika_message.body, headers, topic)
+            if aio_pika_message.message_id and 'x-message-id' not in (aio_pika_message.headers or {}):
+                sdk_message.id = aio_pika_message.message_id
+            if aio_pika_message.correlation_id:
+                sdk_message.correlation_id = aio_pika_message.correlation_id
             
             return sdk_message
         
@@ -969,7 +1221,15 @@ class RabbitMQClient(MessageBroker):
             if topic in self.consumers:
                 consumer_tag = self.consumers[topic]
                 
-                if self.channel and not self.channel.is_closed:
+                if topic in self.batch_channels:
+                    # Process collected deliveries before closing the batch channel
+                    collector = self.batch_collectors.pop(topic, None)
+                    if collector:
+                        await collector.flush()
+                    channel = self.batch_channels.pop(topic)
+                    if not channel.is_closed:
+                        await channel.close()
+                elif self.channel and not self.channel.is_closed:
                     await self.channel.basic_cancel(consumer_tag)
                 
                 del self.consumers[topic]
@@ -15,7 +15,6 @@ Version: 1.0.0
 """
 
 import asyncio
-import json
 import logging
 import ssl
 import time
@@ -50,11 +49,15 @@ except ImportError:
     ClusterError = Exception
     SentinelManagedConnection = None
 
-from .base import MessageBroker, Message, MessageHandler, MessageAcknowledgment, MessageStatus, DeliveryMode
+from .base import (
+    MessageBroker, Message, MessageHandler, BatchMessageHandler, MessageAcknowledgment,
+    MessageStatus, DeliveryMode
+)
 try:
     from .reliability import ReliabilityManager
 except ImportError:
     ReliabilityManager = None
+from .codecs import JSON_CONTENT_TYPE, infer_content_type, encode_payload, decode_payload
 from ..config import CommunicationConfig
 from ..exceptions import CommunicationError, MessageBrokerError
 from ..logging import CommunicationLogger
@@ -183,6 +186,10 @@ class RedisStreamConfig:
     count: int = 10
     auto_claim_min_idle_time: int = 60000  # milliseconds
     auto_claim_count: int = 10
+    # Failed entries of batch consumers are retried this often, then moved to the dead letter stream
+    max_retries: int = 3
+    retry_delay_ms: int = 1000
+    dead_letter_suffix: Optional[str] = ".DLQ"  # None keeps retrying failed entries
 
 
 @dataclass
@@ -198,24 +205,28 @@ class RedisMessage(Message):
         headers: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
+        kwargs.setdefault('content_type', infer_content_type(content))
         super().__init__(payload=content, headers=headers or {}, **kwargs)
         self.channel = channel
         self.pattern = pattern
         self.stream_id = stream_id
         self.redis_type: Optional[str] = None  # 'pubsub', 'stream', etc.
+        self.stream_fields: Optional[Dict[str, Any]] = None  # Raw fields of a stream entry
+    
+    @property
+    def content(self) -> Any:
+        """Message payload."""
+        return self.payload
+    
+    @content.setter
+    def content(self, value: Any) -> None:
+        self.payload = value
         
     @classmethod
     def from_pubsub_message(cls, message: Dict[str, Any]) -> "RedisMessage":
         """Create RedisMessage from Redis pub/sub message."""
-        content = message.get('data')
-        if isinstance(content, bytes):
-            try:
-                content = content.decode('utf-8')
-                # Try to parse as JSON
-                content = json.loads(content)
-            except (UnicodeDecodeError, json.JSONDecodeError):
-                # Keep as string if can't decode/parse
-                pass
+        # Pub/sub carries no headers, so the payload format is detected
+        content = decode_payload(message.get('data'))
         
         redis_msg = cls(
             content=content,
@@ -230,23 +241,37 @@ class RedisMessage(Message):
         """Create RedisMessage from Redis stream message."""
         # Convert fields to content
         content = dict(fields)
+        headers = {}
+        kwargs = {}
         
-        # Try to parse JSON content if it's a single field
-        if len(fields) == 1 and 'data' in fields:
-            try:
-                content = json.loads(fields['data'])
-            except (json.JSONDecodeError, TypeError):
-                pass
+        # A 'data' field alone or with a 'content-type' field is an encoded payload
+        content_type = fields.get('content-type')
+        if 'data' in fields and (len(fields) == 1 or content_type):
+            content = decode_payload(fields['data'], content_type)
+            headers = {k: v for k, v in fields.items() if k not in ('data', 'content-type')}
+            if content_type:
+                kwargs['content_type'] = content_type
         
         redis_msg = cls(
             content=content,
             channel=stream_name,
-            stream_id=message_id
+            stream_id=message_id,
+            headers=headers,
+            **kwargs
         )
         redis_msg.redis_type = 'stream'
+        redis_msg.stream_fields = dict(fields)
         return redis_msg
 
 
+async def _publish_pipelined(redis_client: Any, channel: str, bodies: List[Any]) -> List[Union[int, Exception]]:
+    """PUBLISH several bodies in one round trip; returns subscriber counts or errors."""
+    pipe = redis_client.pipeline(transaction=False)
+    for body in bodies:
+        pipe.publish(channel, body)
+    return await pipe.execute(raise_on_error=False)
+
+
 class RedisPubSubClient:
     """Enterprise Redis Pub/Sub client with advanced features."""
     
@@ -349,19 +374,14 @@ class RedisPubSubClient:
             self.logger.error(f"Error disconnecting Redis Pub/Sub client: {e}")
             raise RedisConnectionError(f"Failed to disconnect from Redis: {e}") from e
     
-    async def publish(self, channel: str, message: Any) -> int:
+    async def publish(self, channel: str, message: Any, content_type: Optional[str] = None) -> int:
         """Publish message to Redis channel."""
         if not self._is_connected or not self._redis:
             raise RedisConnectionError("Redis client not connected")
         
         try:
-            # Serialize message
-            if isinstance(message, (dict, list)):
-                serialized_message = json.dumps(message)
-            elif isinstance(message, str):
-                serialized_message = message
-            else:
-                serialized_message = str(message)
+            # Serialize message; bytes-like messages are sent as they are
+            serialized_message, _ = encode_payload(message, content_type)
             
             # Publish message
             result = await self._redis.publish(channel, serialized_message)
@@ -380,6 +400,24 @@ class RedisPubSubClient:
             self.logger.error(f"Failed to publish message to channel {channel}: {e}")
             raise RedisPublishError(f"Failed to publish message: {e}") from e
     
+    async def publish_many(
+        self,
+        channel: str,
+        messages: List[Any],
+        content_types: Optional[List[Optional[str]]] = None
+    ) -> List[Union[int, Exception]]:
+        """Publish several messages to a channel in one pipeline."""
+        if not self._is_connected or not self._redis:
+            raise RedisConnectionError("Redis client not connected")
+        
+        content_types = content_types or [None] * len(messages)
+        bodies = [encode_payload(message, content_type)[0] for message, content_type in zip(messages, content_types)]
+        try:
+            return await _publish_pipelined(self._redis, channel, bodies)
+        except Exception as e:
+            self.logger.error(f"Failed to publish messages to channel {channel}: {e}")
+            raise RedisPublishError(f"Failed to publish messages: {e}") from e
+    
     async def subscribe(self, *channels: str) -> None:
         """Subscribe to Redis channels."""
         if not self._is_connected or not self._pubsub:
@@ -613,18 +651,10 @@ class RedisStreamClient:
             raise RedisConnectionError("Redis Streams client not connected")
         
         try:
-            # Serialize complex fields
-            serialized_fields = {}
-            for key, value in fields.items():
-                if isinstance(value, (dict, list)):
-                    serialized_fields[key] = json.dumps(value)
-                else:
-                    serialized_fields[key] = str(value)
-            
             # Add to stream
             result_id = await self._redis.xadd(
                 stream_name,
-                serialized_fields,
+                self._serialize_fields(fields),
                 id=message_id,
                 maxlen=maxlen or self.stream_config.stream_maxlen,
                 approximate=approximate
@@ -644,6 +674,52 @@ class RedisStreamClient:
             self.logger.error(f"Failed to add message to stream {stream_name}: {e}")
             raise RedisStreamError(f"Failed to add message to stream: {e}") from e
     
+    async def add_many_to_stream(
+        self,
+        stream_name: str,
+        entries: List[Dict[str, Any]],
+        maxlen: Optional[int] = None,
+        approximate: bool = True
+    ) -> List[Union[str, Exception]]:
+        """Add several entries to a Redis stream with one pipeline of XADD commands."""
+        if not self._is_connected or not self._redis:
+            raise RedisConnectionError("Redis Streams client not connected")
+        
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for fields in entries:
+                pipe.xadd(
+                    stream_name,
+                    self._serialize_fields(fields),
+                    maxlen=maxlen or self.stream_config.stream_maxlen,
+                    approximate=approximate
+                )
+            results = await pipe.execute(raise_on_error=False)
+            
+            self.logger.debug(
+                f"{len(entries)} messages added to stream {stream_name}",
+                extra={"stream": stream_name, "messages": len(entries)}
+            )
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Failed to add messages to stream {stream_name}: {e}")
+            raise RedisStreamError(f"Failed to add messages to stream: {e}") from e
+    
+    @staticmethod
+    def _serialize_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize complex fields; bytes-like values are stored as they are."""
+        serialized_fields = {}
+        for key, value in fields.items():
+            if isinstance(value, (dict, list)):
+                serialized_fields[key], _ = encode_payload(value, JSON_CONTENT_TYPE)
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                serialized_fields[key] = value
+            else:
+                serialized_fields[key] = str(value)
+        return serialized_fields
+    
     async def read_from_stream(
         self,
         stream_name: str,
@@ -668,6 +744,9 @@ class RedisStreamClient:
             redis_messages = []
             for stream, msgs in messages:
                 for msg_id, fields in msgs:
+                    if fields is None:
+                        # Pending entry that was deleted from the stream
+                        continue
                     redis_message = RedisMessage.from_stream_message(stream, msg_id, fields)
                     redis_messages.append(redis_message)
             
@@ -704,6 +783,70 @@ class RedisStreamClient:
             self.logger.error(f"Failed to acknowledge message {message_id}: {e}")
             raise RedisStreamError(f"Failed to acknowledge message: {e}") from e
     
+    async def acknowledge_messages(self, stream_name: str, message_ids: List[str]) -> int:
+        """Acknowledge several messages with a single XACK."""
+        if not message_ids:
+            return 0
+        if not self._is_connected or not self._redis:
+            raise RedisConnectionError("Redis Streams client not connected")
+        
+        try:
+            result = await self._redis.xack(
+                stream_name,
+                self.stream_config.consumer_group,
+                *message_ids
+            )
+            
+            self.logger.debug(
+                f"Acknowledged {len(message_ids)} messages from stream {stream_name}"
+            )
+            
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Failed to acknowledge {len(message_ids)} messages: {e}")
+            raise RedisStreamError(f"Failed to acknowledge messages: {e}") from e
+    
+    async def dead_letter_messages(
+        self,
+        stream_name: str,
+        messages: List[RedisMessage],
+        errors: List[str]
+    ) -> None:
+        """Move failed entries to the dead letter stream and acknowledge them, atomically."""
+        if not messages:
+            return
+        if not self._is_connected or not self._redis:
+            raise RedisConnectionError("Redis Streams client not connected")
+        
+        dead_letter_stream = f"{stream_name}{self.stream_config.dead_letter_suffix}"
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            for message, error in zip(messages, errors):
+                fields = dict(message.stream_fields or {})
+                fields.update({
+                    'x-original-stream': stream_name,
+                    'x-original-id': message.stream_id,
+                    'x-failure-reason': (error or '')[:1000],
+                    'x-failure-timestamp': str(int(time.time() * 1000)),
+                })
+                pipe.xadd(
+                    dead_letter_stream,
+                    self._serialize_fields(fields),
+                    maxlen=self.stream_config.stream_maxlen,
+                    approximate=self.stream_config.stream_approximate
+                )
+            pipe.xack(stream_name, self.stream_config.consumer_group, *[m.stream_id for m in messages])
+            await pipe.execute()
+            
+            self.logger.warning(
+                f"Moved {len(messages)} messages from stream {stream_name} to {dead_letter_stream}"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to dead-letter {len(messages)} messages: {e}")
+            raise RedisStreamError(f"Failed to dead-letter messages: {e}") from e
+    
     async def claim_pending_messages(
         self,
         stream_name: str,
@@ -799,7 +942,12 @@ class RedisClient(MessageBroker):
         reliability_manager: Optional[Any] = None,
         logger: Optional[CommunicationLogger] = None
     ):
-        super().__init__(reliability_manager, logger)
+        # Configured with the Redis dataclasses instead of a MessageBrokerConfig
+        self.reliability_manager = reliability_manager
+        self.logger = logger or CommunicationLogger(__name__)
+        self._connected = False
+        self._subscribers: Dict[str, List[MessageHandler]] = {}
+        self._dead_letter_handlers: Dict[str, Callable] = {}
         
         self.connection_config = connection_config
         self.pubsub_config = pubsub_config or RedisPubSubConfig()
@@ -1027,13 +1175,12 @@ class RedisClient(MessageBroker):
             try:
                 if self._pubsub_client:
                     # Use Pub/Sub client
-                    subscribers = await self._pubsub_client.publish(channel, redis_message.content)
+                    subscribers = await self._pubsub_client.publish(
+                        channel, redis_message.content, redis_message.content_type
+                    )
                 elif self._redis:
                     # Use main Redis client
-                    if isinstance(redis_message.content, (dict, list)):
-                        serialized_content = json.dumps(redis_message.content)
-                    else:
-                        serialized_content = str(redis_message.content)
+                    serialized_content, _ = encode_payload(redis_message.content, redis_message.content_type)
                     
                     subscribers = await self._redis.publish(channel, serialized_content)
                 else:
@@ -1070,6 +1217,67 @@ class RedisClient(MessageBroker):
         else:
             return await _publish_operation()
     
+    async def publish_many(
+        self,
+        channel: str,
+        messages: List[Union[Message, Any]],
+        **kwargs
+    ) -> List[MessageAcknowledgment]:
+        """
+        Publish several messages to a Redis channel in one pipeline.
+        
+        Pub/sub messages carry no headers to announce a content encoding,
+        so a ``compression`` option is ignored. Like the other native
+        batches this does not use ``reliability_manager``.
+        """
+        if not self._is_connected:
+            raise RedisConnectionError("Redis client not connected")
+        
+        redis_messages = []
+        for message in messages:
+            if isinstance(message, RedisMessage):
+                redis_message = message
+            elif isinstance(message, Message):
+                redis_message = RedisMessage(
+                    content=message.payload,
+                    channel=channel,
+                    id=message.id,
+                    content_type=message.content_type
+                )
+            else:
+                redis_message = RedisMessage(content=message, channel=channel)
+            redis_message.channel = channel
+            redis_messages.append(redis_message)
+        
+        payloads = [redis_message.content for redis_message in redis_messages]
+        content_types = [redis_message.content_type for redis_message in redis_messages]
+        try:
+            if self._pubsub_client:
+                results = await self._pubsub_client.publish_many(channel, payloads, content_types)
+            elif self._redis:
+                bodies = [encode_payload(payload, content_type)[0] for payload, content_type in zip(payloads, content_types)]
+                results = await _publish_pipelined(self._redis, channel, bodies)
+            else:
+                raise RedisConnectionError("No Redis client available")
+        except Exception as e:
+            results = [e] * len(redis_messages)
+        
+        acks = []
+        for redis_message, result in zip(redis_messages, results):
+            if isinstance(result, Exception):
+                acks.append(MessageAcknowledgment(
+                    message_id=redis_message.id, status=MessageStatus.FAILED, error=str(result)
+                ))
+            else:
+                acks.append(MessageAcknowledgment(message_id=redis_message.id, status=MessageStatus.ACKNOWLEDGED))
+        
+        self.logger.debug(
+            f"{len(acks)} messages published to channel {channel}",
+            extra={"channel": channel, "messages": len(acks)}
+        )
+        
+        return acks
+    
     async def subscribe(
         self,
         channel: str,
@@ -1134,7 +1342,10 @@ class RedisClient(MessageBroker):
         
         # Start consumer task
         task_name = f"stream_consumer_{stream_name}_{uuid.uuid4().hex[:8]}"
-        task = asyncio.create_task(self._consume_stream_messages(stream_name, handler))
+        if isinstance(handler, BatchMessageHandler):
+            task = asyncio.create_task(self._consume_stream_batches(stream_name, handler))
+        else:
+            task = asyncio.create_task(self._consume_stream_messages(stream_name, handler))
         self._consumer_tasks[task_name] = task
         
         self.logger.info(f"Subscribed to stream {stream_name} with handler {handler.__class__.__name__}")
@@ -1362,6 +1573,87 @@ class RedisClient(MessageBroker):
         except Exception as e:
             self.logger.error(f"Fatal error in stream consumer task for {stream_name}: {e}")
     
+    async def _consume_stream_batches(self, stream_name: str, handler: BatchMessageHandler) -> None:
+        """
+        Internal method to consume stream messages in batches (XREADGROUP COUNT, multi-ID XACK).
+        
+        Entries a batch failed stay pending for this consumer. They are read
+        again (XREADGROUP from ID 0) before new entries, after
+        ``retry_delay_ms``, and moved to the dead letter stream once they
+        failed ``max_retries`` more times.
+        """
+        config = self._stream_client.stream_config
+        attempts: Dict[str, int] = {}
+        # Start with entries left pending by an earlier run of this consumer
+        read_pending = True
+        try:
+            while True:
+                try:
+                    # Read up to one batch: pending retries first, then new entries
+                    start_id = (RedisStreamReadMode.EARLIEST if read_pending else RedisStreamReadMode.NEW_MESSAGES).value
+                    messages = await self._stream_client.read_from_stream(
+                        stream_name, start_id=start_id, count=handler.max_batch_size
+                    )
+                    
+                    if not messages:
+                        read_pending = False
+                        continue
+                    
+                    try:
+                        if self.reliability_manager:
+                            acks = await self.reliability_manager.execute_with_retry(handler.handle_batch, messages)
+                        else:
+                            acks = await handler.handle_batch(messages)
+                        if len(acks) != len(messages):
+                            raise RedisStreamError(
+                                f"Batch handler returned {len(acks)} acknowledgments for {len(messages)} messages"
+                            )
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error processing batch of {len(messages)} stream messages from {stream_name}: {e}",
+                            extra={"stream": stream_name}
+                        )
+                        acks = [
+                            MessageAcknowledgment(message_id=message.id, status=MessageStatus.FAILED, error=str(e))
+                            for message in messages
+                        ]
+                    
+                    # Acknowledge the successful messages together; failed ones stay pending
+                    acknowledged = []
+                    exhausted, errors = [], []
+                    for message, ack in zip(messages, acks):
+                        if ack.status == MessageStatus.ACKNOWLEDGED:
+                            acknowledged.append(message.stream_id)
+                            attempts.pop(message.stream_id, None)
+                            continue
+                        failures = attempts.get(message.stream_id, 0) + 1
+                        if config.dead_letter_suffix is not None and failures > config.max_retries:
+                            exhausted.append(message)
+                            errors.append(ack.error or "Message failed in batch")
+                            attempts.pop(message.stream_id, None)
+                        else:
+                            attempts[message.stream_id] = failures
+                    
+                    await self._stream_client.acknowledge_messages(stream_name, acknowledged)
+                    await self._stream_client.dead_letter_messages(stream_name, exhausted, errors)
+                    
+                    # Retry what is still pending after a pause; otherwise drain the pending list
+                    retrying = len(messages) - len(acknowledged) - len(exhausted)
+                    if retrying:
+                        read_pending = True
+                        await asyncio.sleep(config.retry_delay_ms / 1000)
+                
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error in stream batch consumer loop for {stream_name}: {e}")
+                    await asyncio.sleep(1)  # Brief pause before retrying
+                    
+        except asyncio.CancelledError:
+            self.logger.debug(f"Stream batch consumer task for {stream_name} cancelled")
+        except Exception as e:
+            self.logger.error(f"Fatal error in stream batch consumer task for {stream_name}: {e}")
+    
     async def add_to_stream(
         self,
         stream_name: str,
@@ -1374,6 +1666,18 @@ class RedisClient(MessageBroker):
         
         return await self._stream_client.add_to_stream(stream_name, fields, **kwargs)
     
+    async def add_many_to_stream(
+        self,
+        stream_name: str,
+        entries: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[Union[str, Exception]]:
+        """Add several entries to a Redis stream in one pipeline."""
+        if not self._is_connected or not self._stream_client:
+            raise RedisConnectionError("Redis Streams client not connected")
+        
+        return await self._stream_client.add_many_to_stream(stream_name, entries, **kwargs)
+    
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on Redis client."""
         health_status = {
@@ -7,15 +7,18 @@ message deduplication, circuit breakers for messaging, and monitoring utilities.
 
 import asyncio
 import hashlib
+import logging
+import math
 import time
-from typing import Dict, List, Optional, Set, Callable, Any
+from typing import Dict, List, Optional, Set, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict, deque
 from enum import Enum
 
 from .base import Message, MessageAcknowledgment, MessageStatus
-from ..exceptions import DeadLetterQueueError, MessageBrokerError
+from .codecs import encode_payload
+from ..exceptions import DeadLetterQueueError, MessageBrokerError, MessageSerializationError
 from ..logging import CommunicationLogger, CommunicationEventType
 
 
@@ -286,26 +289,168 @@ class DeadLetterQueue:
         return cleaned_count
 
 
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys."""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: False positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    @staticmethod
+    def hash_key(key: str) -> Tuple[int, int]:
+        """Hash a key once for any number of filters (double hashing)."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+    
+    def add_hashed(self, hashed: Tuple[int, int]) -> None:
+        """Add a key hashed with hash_key()."""
+        h1, h2 = hashed
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def contains_hashed(self, hashed: Tuple[int, int]) -> bool:
+        """Check a key hashed with hash_key()."""
+        h1, h2 = hashed
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def add(self, key: str) -> None:
+        """Add a key."""
+        self.add_hashed(self.hash_key(key))
+    
+    def __contains__(self, key: str) -> bool:
+        return self.contains_hashed(self.hash_key(key))
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by adding larger slices as it fills.
+    
+    Each new slice has twice the capacity and half the error rate of the
+    previous one, so the overall false positive rate stays below twice the
+    initial ``error_rate`` however many keys are added.
+    """
+    
+    def __init__(self, initial_capacity: int = 10000, error_rate: float = 0.001):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = [BloomFilter(initial_capacity, error_rate / 2)]
+    
+    def add_hashed(self, hashed: Tuple[int, int]) -> None:
+        """Add a key hashed with BloomFilter.hash_key()."""
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * 2, current.error_rate / 2)
+            self.filters.append(current)
+        current.add_hashed(hashed)
+    
+    def contains_hashed(self, hashed: Tuple[int, int]) -> bool:
+        """Check a key hashed with BloomFilter.hash_key()."""
+        return any(bloom.contains_hashed(hashed) for bloom in reversed(self.filters))
+    
+    def add(self, key: str) -> None:
+        """Add a key."""
+        self.add_hashed(BloomFilter.hash_key(key))
+    
+    def __contains__(self, key: str) -> bool:
+        return self.contains_hashed(BloomFilter.hash_key(key))
+    
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+    
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the bit arrays."""
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+
+class _DedupBucket:
+    """Hashes first seen during one time bucket."""
+    
+    __slots__ = ('sequence', 'number', 'entries')
+    
+    def __init__(self, sequence: int, number: int, entries: Any):
+        self.sequence = sequence
+        self.number = number
+        self.entries = entries
+
+
 class MessageDeduplicator:
     """
     Message deduplication utility to prevent processing duplicate messages.
     
     Uses message IDs and content hashes to detect duplicates within a time window.
+    The window is split into ``bucket_count`` time buckets; hashes are kept
+    in one index and listed in the bucket of the time they were seen, and a
+    whole bucket is expired at once when it leaves the window. A check is a
+    dict lookup however many messages are tracked, and a message is
+    remembered for between ``window_minutes`` and one bucket longer.
+    
+    With ``use_bloom_filter`` each bucket is a scalable Bloom filter instead
+    of exact hashes. Memory then stays a few bytes per message for very
+    large windows, at the cost of dropping about ``bloom_error_rate`` of new
+    messages as false duplicates; ``max_entries`` only limits exact tracking.
+    
+    A consumer calls ``release_message`` when processing a message failed,
+    so its redelivery is not dropped as a duplicate.
     """
     
-    def __init__(self, window_minutes: int = 60, max_entries: int = 100000):
+    def __init__(
+        self,
+        window_minutes: int = 60,
+        max_entries: int = 100000,
+        bucket_count: int = 12,
+        use_bloom_filter: bool = False,
+        bloom_error_rate: float = 0.001
+    ):
         """
         Initialize message deduplicator.
         
         Args:
             window_minutes: Deduplication window in minutes
-            max_entries: Maximum number of entries to track
+            max_entries: Maximum number of entries to track (oldest buckets are dropped above it)
+            bucket_count: Number of time buckets the window is split into
+            use_bloom_filter: Track hashes in Bloom filters instead of exactly
+            bloom_error_rate: False positive rate of the Bloom filters
         """
         self.window_minutes = window_minutes
         self.max_entries = max_entries
-        self.message_hashes: Dict[str, datetime] = {}
+        self.bucket_count = bucket_count
+        self.use_bloom_filter = use_bloom_filter
+        self.bloom_error_rate = bloom_error_rate
+        self.bucket_seconds = window_minutes * 60 / bucket_count
         self.logger = CommunicationLogger("message_deduplicator")
-        self._lock = asyncio.Lock()
+        
+        # Exact mode: hash -> sequence of the bucket listing it
+        self._index: Dict[str, int] = {}
+        # Oldest first; a bucket also closes early once it holds its share of max_entries
+        self._buckets: deque = deque()
+        self._bucket_capacity = max(1, max_entries // bucket_count)
+        # Hashes released after a failed delivery -> bucket number (Bloom filters cannot forget)
+        self._released: Dict[str, int] = {}
+        self._sequence = 0
+        self._tracked = 0
+        self._duplicates = 0
+        self._released_count = 0
+        self._expired_buckets = 0
     
     def _calculate_message_hash(self, message: Message) -> str:
         """
@@ -321,13 +466,73 @@ class MessageDeduplicator:
         if message.id:
             return f"id:{message.id}"
         
-        # Otherwise, hash the content
-        content = f"{message.topic}:{message.payload}:{message.correlation_id}"
-        return f"hash:{hashlib.sha256(content.encode()).hexdigest()}"
+        # Otherwise, hash the encoded content
+        try:
+            body, _ = encode_payload(message.payload, message.content_type)
+        except MessageSerializationError:
+            body = str(message.payload).encode('utf-8')
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{message.topic}\0{message.correlation_id}\0".encode('utf-8'))
+        digest.update(body)
+        return f"hash:{digest.hexdigest()}"
+    
+    def _current_bucket(self) -> "_DedupBucket":
+        """Expire buckets that left the window and return the bucket to record into."""
+        number = int(time.monotonic() // self.bucket_seconds)
+        buckets = self._buckets
+        
+        oldest = number - self.bucket_count
+        if buckets and buckets[0].number < oldest:
+            while buckets and buckets[0].number < oldest:
+                self._expire(buckets.popleft())
+            if self._released:
+                self._released = {h: n for h, n in self._released.items() if n >= oldest}
+        
+        if (
+            not buckets
+            or buckets[-1].number != number
+            or (not self.use_bloom_filter and len(buckets[-1].entries) >= self._bucket_capacity)
+        ):
+            self._sequence += 1
+            entries = ScalableBloomFilter(error_rate=self.bloom_error_rate) if self.use_bloom_filter else []
+            buckets.append(_DedupBucket(self._sequence, number, entries))
+            
+            # Drop the oldest buckets above max_entries
+            while not self.use_bloom_filter and self._tracked > self.max_entries and len(buckets) > 1:
+                self._expire(buckets.popleft())
+        return buckets[-1]
+    
+    def _expire(self, bucket: "_DedupBucket") -> None:
+        """Forget the hashes of an expired bucket."""
+        self._tracked -= len(bucket.entries)
+        self._expired_buckets += 1
+        if not self.use_bloom_filter:
+            index = self._index
+            sequence = bucket.sequence
+            for message_hash in bucket.entries:
+                # Skip hashes recorded again in a newer bucket
+                if index.get(message_hash) == sequence:
+                    del index[message_hash]
+    
+    def _seen(self, message_hash: str) -> bool:
+        if not self.use_bloom_filter:
+            return message_hash in self._index
+        if self._released.pop(message_hash, None) is not None:
+            return False
+        hashed = BloomFilter.hash_key(message_hash)
+        return any(bucket.entries.contains_hashed(hashed) for bucket in reversed(self._buckets))
+    
+    def _record(self, message_hash: str, bucket: "_DedupBucket") -> None:
+        if self.use_bloom_filter:
+            bucket.entries.add_hashed(BloomFilter.hash_key(message_hash))
+        else:
+            self._index[message_hash] = bucket.sequence
+            bucket.entries.append(message_hash)
+        self._tracked += 1
     
     async def is_duplicate(self, message: Message) -> bool:
         """
-        Check if message is a duplicate.
+        Check if message is a duplicate, and remember it if it is not.
         
         Args:
             message: Message to check
@@ -335,15 +540,12 @@ class MessageDeduplicator:
         Returns:
             True if message is a duplicate
         """
-        async with self._lock:
-            message_hash = self._calculate_message_hash(message)
-            current_time = datetime.now(timezone.utc)
-            
-            # Clean up old entries
-            await self._cleanup_old_entries(current_time)
-            
-            # Check if message hash exists
-            if message_hash in self.message_hashes:
+        message_hash = self._calculate_message_hash(message)
+        bucket = self._current_bucket()
+        
+        if self._seen(message_hash):
+            self._duplicates += 1
+            if self.logger.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     f"Duplicate message detected",
                     metadata={
@@ -352,44 +554,158 @@ class MessageDeduplicator:
                         'topic': message.topic
                     }
                 )
-                return True
-            
-            # Add message hash
-            self.message_hashes[message_hash] = current_time
-            
-            # Limit memory usage
-            if len(self.message_hashes) > self.max_entries:
-                # Remove oldest entries
-                sorted_entries = sorted(
-                    self.message_hashes.items(),
-                    key=lambda x: x[1]
-                )
-                entries_to_remove = len(self.message_hashes) - self.max_entries + 1000
-                for hash_key, _ in sorted_entries[:entries_to_remove]:
-                    del self.message_hashes[hash_key]
-            
-            return False
+            return True
+        
+        self._record(message_hash, bucket)
+        return False
     
-    async def _cleanup_old_entries(self, current_time: datetime) -> None:
-        """Clean up entries outside the deduplication window."""
-        cutoff_time = current_time - timedelta(minutes=self.window_minutes)
+    async def track_message(self, message: Message) -> None:
+        """Remember a message without checking it."""
+        message_hash = self._calculate_message_hash(message)
+        bucket = self._current_bucket()
+        if not self._seen(message_hash):
+            self._record(message_hash, bucket)
+    
+    async def release_message(self, message: Message) -> None:
+        """Forget a message whose processing failed, so its redelivery is processed."""
+        self._forget(self._calculate_message_hash(message))
+    
+    def _forget(self, message_hash: str) -> None:
+        if self.use_bloom_filter:
+            self._released[message_hash] = int(time.monotonic() // self.bucket_seconds)
+        elif self._index.pop(message_hash, None) is None:
+            return
+        self._released_count += 1
+    
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get deduplicator statistics."""
+        stats = {
+            'tracked_messages': self._tracked,
+            'max_entries': self.max_entries,
+            'window_minutes': self.window_minutes,
+            'buckets': len(self._buckets),
+            'bucket_seconds': self.bucket_seconds,
+            'expired_buckets': self._expired_buckets,
+            'duplicates_detected': self._duplicates,
+            'released_messages': self._released_count,
+            'bloom_filter': self.use_bloom_filter
+        }
+        if self.use_bloom_filter:
+            stats['bloom_filter_bytes'] = sum(bucket.entries.size_bytes for bucket in self._buckets)
+        return stats
+
+
+class RedisMessageDeduplicator(MessageDeduplicator):
+    """
+    Message deduplicator shared by consumer replicas through Redis.
+    
+    Each message hash is claimed with ``SET key NX EX window``, so exactly
+    one replica sees a message as new and Redis expires the keys itself.
+    Hashes seen by this replica are also kept locally (in time buckets, as
+    in MessageDeduplicator), which answers redeliveries to the same replica
+    without a round trip. If Redis fails, the local result is used.
+    
+    ``release_message`` deletes the claim after a failed delivery. A
+    replica that dies while processing leaves its claim until the window
+    ends, so a redelivery of that message is then seen as a duplicate.
+    """
+    
+    def __init__(
+        self,
+        redis_client: Any,
+        window_minutes: int = 60,
+        key_prefix: str = "dedup",
+        local_max_entries: int = 10000,
+        **kwargs
+    ):
+        """
+        Initialize Redis-backed message deduplicator.
         
-        entries_to_remove = [
-            hash_key for hash_key, timestamp in self.message_hashes.items()
-            if timestamp < cutoff_time
-        ]
+        Args:
+            redis_client: redis.asyncio client (or cluster client)
+            window_minutes: Deduplication window in minutes
+            key_prefix: Prefix of the Redis keys
+            local_max_entries: Maximum number of hashes kept locally
+            **kwargs: Other MessageDeduplicator options for the local cache
+        """
+        super().__init__(window_minutes=window_minutes, max_entries=local_max_entries, **kwargs)
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.window_seconds = window_minutes * 60
+        self._redis_errors = 0
+    
+    async def is_duplicate(self, message: Message) -> bool:
+        """
+        Check if any replica has seen the message, and claim it if not.
         
-        for hash_key in entries_to_remove:
-            del self.message_hashes[hash_key]
+        Args:
+            message: Message to check
+            
+        Returns:
+            True if message is a duplicate
+        """
+        message_hash = self._calculate_message_hash(message)
+        bucket = self._current_bucket()
+        if self._seen(message_hash):
+            self._duplicates += 1
+            return True
+        
+        try:
+            claimed = await self.redis.set(
+                f"{self.key_prefix}:{message_hash}", 1, nx=True, ex=self.window_seconds
+            )
+        except Exception as e:
+            self._redis_errors += 1
+            self.logger.warning(f"Redis deduplication failed, using local state: {e}")
+            claimed = True
+        
+        self._record(message_hash, bucket)
+        if not claimed:
+            self._duplicates += 1
+            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Duplicate message detected by another replica",
+                    metadata={
+                        'message_id': message.id,
+                        'message_hash': message_hash,
+                        'topic': message.topic
+                    }
+                )
+            return True
+        return False
+    
+    async def track_message(self, message: Message) -> None:
+        """Remember a message without checking it."""
+        message_hash = self._calculate_message_hash(message)
+        bucket = self._current_bucket()
+        if self._seen(message_hash):
+            return
+        try:
+            await self.redis.set(f"{self.key_prefix}:{message_hash}", 1, ex=self.window_seconds)
+        except Exception as e:
+            self._redis_errors += 1
+            self.logger.warning(f"Redis deduplication failed, using local state: {e}")
+        self._record(message_hash, bucket)
+    
+    async def release_message(self, message: Message) -> None:
+        """Delete the claim of a message whose processing failed."""
+        message_hash = self._calculate_message_hash(message)
+        self._forget(message_hash)
+        try:
+            await self.redis.delete(f"{self.key_prefix}:{message_hash}")
+        except Exception as e:
+            self._redis_errors += 1
+            self.logger.warning(f"Redis deduplication release failed: {e}")
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Get deduplicator statistics."""
-        async with self._lock:
-            return {
-                'tracked_messages': len(self.message_hashes),
-                'max_entries': self.max_entries,
-                'window_minutes': self.window_minutes
-            }
+        stats = await super().get_statistics()
+        stats.update({
+            'backend': 'redis',
+            'key_prefix': self.key_prefix,
+            'redis_errors': self._redis_errors
+        })
+        return stats
 
 
 class MessagingCircuitBreaker:
@@ -8,9 +8,20 @@ from .load_balancer import LoadBalancerMiddleware
 from .circuit_breaker import CircuitBreakerMiddleware
 from .request_tracing import RequestTracingMiddleware
 
+# The fused pipeline pulls in the metrics module
+try:
+    from .pipeline import ObservabilitySecurityMiddleware
+    PIPELINE_AVAILABLE = True
+except ImportError:
+    PIPELINE_AVAILABLE = False
+
 __all__ = [
     "ServiceDiscoveryMiddleware",
     "LoadBalancerMiddleware", 
     "CircuitBreakerMiddleware",
-    "RequestTracingMiddleware"
-]
\ No newline at end of file
+    "RequestTracingMiddleware",
+    "PIPELINE_AVAILABLE"
+]
+
+if PIPELINE_AVAILABLE:
+    __all__.append("ObservabilitySecurityMiddleware")
\ No newline at end of file
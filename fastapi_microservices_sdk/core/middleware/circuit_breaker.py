@@ -3,17 +3,15 @@
 Circuit Breaker middleware for FastAPI Microservices SDK.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class CircuitBreakerMiddleware(BaseHTTPMiddleware):
+class CircuitBreakerMiddleware:
     """Middleware for circuit breaker pattern."""
     
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Add circuit breaker logic here
-        response = await call_next(request)
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send)
\ No newline at end of file
@@ -0,0 +1,18 @@
+# fastapi-microservices-sdk/fastapi_microservices_sdk/core/middleware/pipeline.py
+"""
+Fused observability middleware pipeline for FastAPI Microservices SDK.
+"""
+
+from ...observability.metrics.middleware import PrometheusASGIMiddleware
+
+
+class ObservabilitySecurityMiddleware(PrometheusASGIMiddleware):
+    """
+    Observability pipeline in a single pure ASGI middleware.
+
+    Serves the metrics endpoint and records request metrics with one
+    ``send`` wrapper, like PrometheusASGIMiddleware. The unified security
+    layers are not part of the pipeline: UnifiedSecurityMiddleware does not
+    yet work with the stock SecurityLogger and AdvancedSecurityConfig, so
+    add security as its own middleware once it does.
+    """
@@ -3,18 +3,16 @@
 Service Discovery middleware for FastAPI Microservices SDK.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class ServiceDiscoveryMiddleware(BaseHTTPMiddleware):
+class ServiceDiscoveryMiddleware:
     """Middleware for service discovery integration."""
     
-    def __init__(self, app, registry=None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, registry=None):
+        self.app = app
         self.registry = registry
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Add service discovery logic here
-        response = await call_next(request)
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send)
\ No newline at end of file
@@ -9,7 +9,9 @@ Author: FastAPI Microservices SDK
 Version: 1.0.0
 """
 
-from .base import DatabaseAdapter, DatabaseConnection, QueryResult, TransactionContext
+from .base import (
+    DatabaseAdapter, DatabaseConnection, QueryResult, QueryStream, BulkLoadResult, TransactionContext
+)
 from .registry import AdapterRegistry
 
 # Import specific adapters (will be available when dependencies are installed)
@@ -45,6 +47,8 @@ __all__ = [
     'DatabaseAdapter',
     'DatabaseConnection', 
     'QueryResult',
+    'QueryStream',
+    'BulkLoadResult',
     'TransactionContext',
     'AdapterRegistry',
     'PostgreSQLAdapter',
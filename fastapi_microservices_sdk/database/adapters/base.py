@@ -13,7 +13,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import (
-    Any, Dict, List, Optional, Union, AsyncGenerator, 
+    Any, Dict, List, Optional, Union, AsyncGenerator, AsyncIterator,
     Tuple, Type, Generic, TypeVar, Protocol
 )
 from datetime import datetime, timezone
@@ -24,6 +24,7 @@ import uuid
 
 from ..config import DatabaseConnectionConfig, DatabaseEngine
 from ..exceptions import DatabaseError, ConnectionError, TransactionError
+from ..connection_pools.pool_manager import ConnectionPool
 
 # Type variables for generic support
 T = TypeVar('T')
@@ -84,6 +85,108 @@ class QueryResult:
             )
 
 
+@dataclass
+class BulkLoadResult:
+    """Progress and outcome of a bulk load."""
+    table_name: str
+    rows_loaded: int = 0
+    chunks_loaded: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def rows_per_second(self) -> float:
+        """Average ingestion throughput."""
+        return self.rows_loaded / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'table_name': self.table_name,
+            'rows_loaded': self.rows_loaded,
+            'chunks_loaded': self.chunks_loaded,
+            'elapsed': self.elapsed,
+            'rows_per_second': self.rows_per_second
+        }
+
+
+class QueryStream:
+    """
+    Async iterator over query results streamed in bounded batches.
+    
+    Rows are pulled from a server-side cursor ``batch_size`` at a time. The
+    underlying generator owns the connection; closing the stream (explicitly,
+    via ``async with`` or by exhausting it) releases the connection even when
+    the consumer stops early::
+    
+        async with manager.stream("SELECT * FROM events") as rows:
+            async for row in rows:
+                ...
+    """
+    
+    def __init__(self, batches: AsyncGenerator[List[Dict[str, Any]], None]):
+        self._batches = batches
+        self._current: List[Dict[str, Any]] = []
+        self._position = 0
+        self._closed = False
+        self.rows_streamed = 0
+    
+    def __aiter__(self) -> 'QueryStream':
+        return self
+    
+    async def __anext__(self) -> Dict[str, Any]:
+        while self._position >= len(self._current):
+            self._current = await self._next_batch()
+            self._position = 0
+        
+        row = self._current[self._position]
+        self._position += 1
+        return row
+    
+    async def batches(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over whole batches instead of single rows."""
+        if self._position < len(self._current):
+            remaining = self._current[self._position:]
+            self._current, self._position = [], 0
+            yield remaining
+        
+        while True:
+            try:
+                batch = await self._next_batch()
+            except StopAsyncIteration:
+                return
+            yield batch
+    
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Pull the next non-empty batch from the cursor."""
+        if self._closed:
+            raise StopAsyncIteration
+        
+        try:
+            while True:
+                batch = await self._batches.__anext__()
+                if batch:
+                    self.rows_streamed += len(batch)
+                    return batch
+        except StopAsyncIteration:
+            self._closed = True
+            raise
+        except BaseException:
+            await self.aclose()
+            raise
+    
+    async def aclose(self) -> None:
+        """Stop streaming and release the cursor and connection."""
+        self._closed = True
+        self._current = []
+        await self._batches.aclose()
+    
+    async def __aenter__(self) -> 'QueryStream':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
 class DatabaseConnection:
     """Represents an active database connection with metadata and lifecycle management."""
     
@@ -213,19 +316,36 @@ class DatabaseAdapter(ABC):
         self.config = config
         self.engine = config.engine
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._connection_pool: Dict[str, DatabaseConnection] = {}
-        self._pool_lock = asyncio.Lock()
         self._is_initialized = False
+        self._pool: Optional[ConnectionPool] = None
     
     @property
     def is_initialized(self) -> bool:
         """Check if adapter is initialized."""
         return self._is_initialized
     
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """Get the adapter connection pool (created on first use)."""
+        # Adapters that skip DatabaseAdapter.__init__ get their pool here too
+        if getattr(self, '_pool', None) is None:
+            pool_config = self.config.pool
+            self._pool = ConnectionPool(
+                factory=self.create_connection,
+                name=f"{self.config.engine.value}:{self.config.database}",
+                min_size=pool_config.min_connections,
+                max_size=pool_config.max_connections,
+                acquire_timeout=pool_config.acquire_timeout,
+                max_lifetime=pool_config.max_lifetime,
+                idle_timeout=pool_config.idle_timeout,
+                logger=self.logger
+            )
+        return self._pool
+    
     @property
     def active_connections(self) -> int:
-        """Get number of active connections."""
-        return len([conn for conn in self._connection_pool.values() if conn.is_active])
+        """Get number of checked out connections."""
+        return self.connection_pool.in_use_count
     
     # Abstract methods that must be implemented by concrete adapters
     
@@ -302,6 +422,62 @@ class DatabaseAdapter(ABC):
         """Fetch all rows from the database."""
         pass
     
+    async def stream_batches(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Stream query results in batches of at most ``batch_size`` rows.
+        
+        Adapters override this with a server-side cursor so memory stays
+        bounded; this default materializes the result once.
+        """
+        rows = await self.fetch_all(connection, query, parameters)
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+    
+    async def bulk_load(
+        self,
+        connection: DatabaseConnection,
+        table_name: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> int:
+        """
+        Load one chunk of rows into a table.
+        
+        Adapters override this with the engine's fastest bulk path; this
+        default runs a parameterized INSERT through execute_many.
+        
+        Args:
+            connection: Database connection
+            table_name: Target table (or collection)
+            columns: Column names, in the order used by sequence rows
+            rows: Rows as dicts keyed by column or sequences in ``columns`` order
+            
+        Returns:
+            Number of rows loaded
+        """
+        names = [f"c{index}" for index in range(len(columns))]
+        query = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + name for name in names)})"
+        )
+        parameters_list = [dict(zip(names, row)) for row in self._rows_as_tuples(rows, columns)]
+        result = await self.execute_many(connection, query, parameters_list, QueryType.INSERT)
+        return len(parameters_list) if result.rows_affected < 0 else result.rows_affected
+    
+    @staticmethod
+    def _rows_as_tuples(rows: List[Any], columns: List[str]) -> List[Tuple[Any, ...]]:
+        """Normalize dict or sequence rows to tuples in column order."""
+        return [
+            tuple(row.get(column) for column in columns) if isinstance(row, dict) else tuple(row)
+            for row in rows
+        ]
+    
     # Transaction management (abstract methods)
     
     @abstractmethod
@@ -341,47 +517,38 @@ class DatabaseAdapter(ABC):
     
     # Concrete methods with default implementations
     
-    async def get_connection(self) -> DatabaseConnection:
-        """Get a database connection from the pool or create a new one."""
-        async with self._pool_lock:
-            # Try to reuse an existing connection
-            for conn in self._connection_pool.values():
-                if conn.is_active and conn.transaction_count == 0:
-                    conn.mark_used()
-                    return conn
-            
-            # Create a new connection if pool is not full
-            if len(self._connection_pool) < self.config.pool.max_connections:
-                connection = await self.create_connection()
-                self._connection_pool[connection.connection_id] = connection
-                return connection
+    async def get_connection(self, timeout: Optional[float] = None) -> DatabaseConnection:
+        """
+        Check out a connection from the pool.
+        
+        Waits in FIFO order when the pool is exhausted.
+        
+        Args:
+            timeout: Maximum seconds to wait (pool ``acquire_timeout`` if None)
             
-            # Pool is full, wait or raise error based on configuration
-            raise ConnectionError(
-                f"Connection pool exhausted (max: {self.config.pool.max_connections})",
-                context={
-                    'database_name': self.config.name,
-                    'engine': self.engine.value,
-                    'operation': 'get_connection',
-                    'pool_size': len(self._connection_pool),
-                    'max_connections': self.config.pool.max_connections
-                }
-            )
+        Returns:
+            Checked out connection
+        
+        Raises:
+            PoolError: If no connection became available in time
+        """
+        return await self.connection_pool.acquire(timeout)
     
     async def return_connection(self, connection: DatabaseConnection) -> None:
-        """Return a connection to the pool."""
-        if connection.transaction_count > 0:
-            self.logger.warning(
-                f"Returning connection {connection.connection_id} with active transactions"
-            )
-        connection.mark_used()
+        """Return a checked out connection to the pool."""
+        await self.connection_pool.release(connection)
     
     async def remove_connection(self, connection_id: str) -> None:
-        """Remove a connection from the pool."""
-        async with self._pool_lock:
-            if connection_id in self._connection_pool:
-                connection = self._connection_pool.pop(connection_id)
-                await connection.close()
+        """Close a connection and remove it from the pool."""
+        connection = self.connection_pool.find(connection_id)
+        if connection is not None:
+            await self.connection_pool.discard(connection)
+    
+    async def close_pool(self) -> None:
+        """Close the connection pool and all pooled connections."""
+        if getattr(self, '_pool', None) is not None:
+            await self._pool.close()
+            self._pool = None
     
     @asynccontextmanager
     async def connection(self) -> AsyncGenerator[DatabaseConnection, None]:
@@ -407,37 +574,12 @@ class DatabaseAdapter(ABC):
                 yield tx
     
     async def get_pool_status(self) -> Dict[str, Any]:
-        """Get connection pool status."""
-        active_connections = sum(1 for conn in self._connection_pool.values() if conn.is_active)
-        total_connections = len(self._connection_pool)
-        
-        return {
-            'total_connections': total_connections,
-            'active_connections': active_connections,
-            'idle_connections': total_connections - active_connections,
-            'max_connections': self.config.pool.max_connections,
-            'min_connections': self.config.pool.min_connections,
-            'pool_utilization': active_connections / self.config.pool.max_connections if self.config.pool.max_connections > 0 else 0
-        }
+        """Get connection pool status and metrics."""
+        return self.connection_pool.get_status()
     
     async def cleanup_idle_connections(self, max_idle_time: float = 300.0) -> int:
-        """Clean up idle connections that exceed the maximum idle time."""
-        cleaned_count = 0
-        current_time = datetime.now(timezone.utc)
-        
-        async with self._pool_lock:
-            connections_to_remove = []
-            
-            for conn_id, conn in self._connection_pool.items():
-                if (conn.transaction_count == 0 and 
-                    (current_time - conn.last_used).total_seconds() > max_idle_time):
-                    connections_to_remove.append(conn_id)
-            
-            for conn_id in connections_to_remove:
-                await self.remove_connection(conn_id)
-                cleaned_count += 1
-        
-        return cleaned_count
+        """Clean up idle connections that exceed the maximum idle time or lifetime."""
+        return await self.connection_pool.prune(max_idle_time)
     
     def _create_connection_id(self) -> str:
         """Create a unique connection ID."""
@@ -23,7 +23,7 @@ Version: 1.0.0
 import asyncio
 import logging
 import ssl
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, AsyncGenerator
 from datetime import datetime, timezone
 from urllib.parse import urlparse, parse_qs
 import json
@@ -89,9 +89,8 @@ class MongoDBAdapter(DatabaseAdapter):
         self.config = config
         self._engine = config.engine
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._connection_pool_dict: Dict[str, DatabaseConnection] = {}
-        self._pool_lock = asyncio.Lock()
         self._is_initialized = False
+        self._pool = None  # Shared ConnectionPool, created by DatabaseAdapter.connection_pool
         
         self._client: Optional[AsyncIOMotorClient] = None
         self._database: Optional[AsyncIOMotorDatabase] = None
@@ -191,6 +190,9 @@ class MongoDBAdapter(DatabaseAdapter):
             
             self.logger.info(f"Connected to MongoDB: {mongodb_version}")
             
+            # Pre-warm the session pool
+            await self.connection_pool.prewarm()
+            
             self._is_initialized = True
             self.logger.info(f"MongoDB adapter initialized for database: {self.config.database}")
             
@@ -214,11 +216,8 @@ class MongoDBAdapter(DatabaseAdapter):
             
             self._change_streams.clear()
             
-            # Close individual connections
-            async with self._pool_lock:
-                for connection in list(self._connection_pool_dict.values()):
-                    await connection.close()
-                self._connection_pool_dict.clear()
+            # Close pooled sessions
+            await self.close_pool()
             
             # Close MongoDB client
             if self._client:
@@ -739,6 +738,59 @@ class MongoDBAdapter(DatabaseAdapter):
         """Fetch all documents from MongoDB."""
         return await self.fetch_many(connection, query, parameters)
     
+    async def stream_batches(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Stream documents from MongoDB in batches using cursor batching."""
+        try:
+            connection.mark_used()
+            operation = self._parse_mongodb_operation(query, parameters)
+            if operation['operation'] != 'find':
+                raise QueryError(
+                    f"Streaming is only supported for find operations, got '{operation['operation']}'",
+                    query=query
+                )
+            
+            database = connection.get_metadata("database")
+            cursor = database[operation['collection']].find(
+                operation['filter'],
+                projection=operation.get('projection'),
+                session=connection.native_connection,
+                batch_size=batch_size
+            )
+            if operation.get('sort'):
+                cursor = cursor.sort(operation['sort'])
+            if operation.get('skip'):
+                cursor = cursor.skip(operation['skip'])
+            if operation.get('limit'):
+                cursor = cursor.limit(operation['limit'])
+            connection.query_count += 1
+            
+            try:
+                while True:
+                    documents = await cursor.to_list(length=batch_size)
+                    if not documents:
+                        break
+                    for doc in documents:
+                        if '_id' in doc and BSON_AVAILABLE and ObjectId and isinstance(doc['_id'], ObjectId):
+                            doc['_id'] = str(doc['_id'])
+                    yield documents
+            finally:
+                await cursor.close()
+                
+        except Exception as e:
+            raise wrap_database_error(
+                e,
+                operation="stream_batches",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                query=query[:100] + "..." if len(query) > 100 else query
+            )
+    
     # Transaction management
     
     async def _begin_transaction(
@@ -1132,6 +1184,43 @@ class MongoDBAdapter(DatabaseAdapter):
                 collection_name=collection_name
             )
     
+    async def bulk_load(
+        self,
+        connection: DatabaseConnection,
+        table_name: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> int:
+        """
+        Load a chunk of documents into a collection with unordered insert_many.
+        
+        Unordered inserts let the server apply the batch in parallel and keep
+        going past individual failures (e.g. duplicate keys); the error then
+        reports how many documents were inserted.
+        """
+        try:
+            connection.mark_used()
+            
+            database = connection.get_metadata("database")
+            session = connection.native_connection
+            documents = [row if isinstance(row, dict) else dict(zip(columns, row)) for row in rows]
+            
+            result = await database[table_name].insert_many(documents, ordered=False, session=session)
+            connection.query_count += 1
+            return len(result.inserted_ids)
+            
+        except Exception as e:
+            details = getattr(e, 'details', None) or {}
+            raise wrap_database_error(
+                e,
+                operation="bulk_load",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                collection_name=table_name,
+                inserted_count=details.get('nInserted'),
+                write_errors=len(details.get('writeErrors', []))
+            )
+    
     async def create_change_stream(
         self,
         connection: DatabaseConnection,
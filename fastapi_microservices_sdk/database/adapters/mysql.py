@@ -23,7 +23,7 @@ Version: 1.0.0
 import asyncio
 import logging
 import ssl
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, AsyncGenerator
 from datetime import datetime, timezone
 from urllib.parse import urlparse, parse_qs
 import json
@@ -38,6 +38,7 @@ from .base import (
     DatabaseAdapter, DatabaseConnection, QueryResult, QueryType,
     TransactionContext, IsolationLevel, QueryMetrics
 )
+from .query_templates import ParamStyle, QueryTemplateCache
 
 # Optional dependency
 try:
@@ -70,15 +71,18 @@ class MySQLAdapter(DatabaseAdapter):
         self.config = config
         self._engine = config.engine  # Use private attribute
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._connection_pool_dict: Dict[str, DatabaseConnection] = {}
-        self._pool_lock = asyncio.Lock()
         self._is_initialized = False
+        self._pool = None  # Shared ConnectionPool, created by DatabaseAdapter.connection_pool
         self._connection_pool: Optional[AiomysqlPool] = None
-        self._connection_options = self._build_connection_options()
+        # The connection options include the SSL context
         self._ssl_context = self._create_ssl_context()
+        self._connection_options = self._build_connection_options()
         self._prepared_statements: Dict[str, str] = {}
         self._query_cache: Dict[str, Any] = {}
+        self._query_templates = QueryTemplateCache(ParamStyle.FORMAT, config.query_template_cache_size)
         self._replication_config = self._parse_replication_config()
+        # Rows per multi-row INSERT statement in bulk_load (bounded by max_allowed_packet)
+        self._bulk_insert_rows = 1000
         
     def _get_database_name(self, config: DatabaseConnectionConfig) -> str:
         """Get database name for error reporting."""
@@ -155,7 +159,9 @@ class MySQLAdapter(DatabaseAdapter):
             # Create connection pool
             self._connection_pool = await aiomysql.create_pool(
                 minsize=self.config.pool.min_connections,
-                maxsize=self.config.pool.max_connections,
+                # One connection more than the SDK pool holds, so health checks
+                # still get a connection while every pooled one is checked out
+                maxsize=self.config.pool.max_connections + 1,
                 **self._connection_options
             )
             
@@ -174,6 +180,9 @@ class MySQLAdapter(DatabaseAdapter):
                     
                     self.logger.info(f"Connected to MySQL: {mysql_version}")
             
+            # Pre-warm the connection pool
+            await self.connection_pool.prewarm()
+            
             self._is_initialized = True
             self.logger.info(f"MySQL adapter initialized with pool size {self.config.pool.min_connections}-{self.config.pool.max_connections}")
             
@@ -188,6 +197,9 @@ class MySQLAdapter(DatabaseAdapter):
     async def shutdown(self) -> None:
         """Shutdown the MySQL adapter."""
         try:
+            # Return pooled connections before closing the aiomysql pool
+            await self.close_pool()
+            
             if self._connection_pool:
                 self._connection_pool.close()
                 await self._connection_pool.wait_closed()
@@ -478,25 +490,8 @@ class MySQLAdapter(DatabaseAdapter):
             )
     
     def _process_parameters(self, query: str, parameters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
-        """Convert named parameters to format expected by aiomysql."""
-        if not parameters:
-            return query, []
-        
-        # Convert :param to %s format for aiomysql
-        param_values = []
-        processed_query = query
-        
-        # Find all :param patterns and replace with %s
-        import re
-        param_pattern = r':(\w+)'
-        matches = re.findall(param_pattern, query)
-        
-        for param_name in matches:
-            if param_name in parameters:
-                processed_query = processed_query.replace(f':{param_name}', '%s', 1)
-                param_values.append(parameters[param_name])
-        
-        return processed_query, param_values
+        """Convert :param named parameters to aiomysql %s placeholders (compiled once per query)."""
+        return self._query_templates.process(query, parameters)
     
     def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement."""
@@ -646,6 +641,45 @@ class MySQLAdapter(DatabaseAdapter):
         """Fetch all rows from MySQL."""
         return await self.fetch_many(connection, query, parameters)
     
+    async def stream_batches(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Stream rows from MySQL in batches using an unbuffered SSDictCursor.
+        
+        Closing the cursor early drains the remaining result set, as the
+        MySQL protocol requires before the connection can be reused.
+        """
+        try:
+            connection.mark_used()
+            processed_query, param_values = self._process_parameters(query, parameters)
+            
+            async with connection.native_connection.cursor(aiomysql.SSDictCursor) as cursor:
+                if param_values:
+                    await cursor.execute(processed_query, param_values)
+                else:
+                    await cursor.execute(processed_query)
+                connection.query_count += 1
+                
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield list(rows)
+                
+        except Exception as e:
+            raise wrap_database_error(
+                e,
+                operation="stream_batches",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                query=query[:100] + "..." if len(query) > 100 else query
+            )
+    
     # Transaction management
     
     async def _begin_transaction(
@@ -934,6 +968,55 @@ class MySQLAdapter(DatabaseAdapter):
                 table_name=table_name
             )
     
+    async def bulk_load(
+        self,
+        connection: DatabaseConnection,
+        table_name: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> int:
+        """
+        Load a chunk of rows with multi-row INSERT statements.
+        
+        Each statement carries up to ``_bulk_insert_rows`` rows, so a chunk
+        costs a handful of round trips; the chunk is committed as one unit.
+        Inside an open transaction the chunk is left to its owner to commit.
+        """
+        native = connection.native_connection
+        own_transaction = connection.transaction_count == 0
+        
+        try:
+            connection.mark_used()
+            quoted_table = '.'.join(f"`{part}`" for part in table_name.split('.'))
+            column_names = ', '.join(f"`{col}`" for col in columns)
+            row_placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+            records = self._rows_as_tuples(rows, columns)
+            
+            async with native.cursor() as cursor:
+                for start in range(0, len(records), self._bulk_insert_rows):
+                    batch = records[start:start + self._bulk_insert_rows]
+                    query = (
+                        f"INSERT INTO {quoted_table} ({column_names}) VALUES "
+                        + ', '.join([row_placeholder] * len(batch))
+                    )
+                    await cursor.execute(query, [value for record in batch for value in record])
+                    connection.query_count += 1
+            
+            if own_transaction:
+                await native.commit()
+            return len(records)
+            
+        except Exception as e:
+            if own_transaction:
+                await native.rollback()
+            raise wrap_database_error(
+                e,
+                operation="bulk_load",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                table_name=table_name
+            )
+    
     async def get_table_info(
         self,
         connection: DatabaseConnection,
@@ -22,7 +22,8 @@ Version: 1.0.0
 import asyncio
 import logging
 import ssl
-from typing import Dict, Any, Optional, List, Union, Tuple
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Union, Tuple, AsyncGenerator
 from datetime import datetime, timezone
 from urllib.parse import urlparse, parse_qs
 import json
@@ -36,6 +37,7 @@ from .base import (
     DatabaseAdapter, DatabaseConnection, QueryResult, QueryType,
     TransactionContext, IsolationLevel, QueryMetrics
 )
+from .query_templates import ParamStyle, QueryTemplateCache
 
 # Optional dependency
 try:
@@ -67,10 +69,13 @@ class PostgreSQLAdapter(DatabaseAdapter):
         super().__init__(config)
         self._connection_pool: Optional[AsyncpgPool] = None
         self._connection_dsn = self._build_connection_dsn()
-        self._connection_options = self._build_connection_options()
+        # The connection options include the SSL context
         self._ssl_context = self._create_ssl_context()
+        self._connection_options = self._build_connection_options()
         self._prepared_statements: Dict[str, str] = {}
         self._query_cache: Dict[str, Any] = {}
+        self._query_templates = QueryTemplateCache(ParamStyle.NUMERIC, config.query_template_cache_size)
+        self._statement_cache_size = config.prepared_statement_cache_size
         
     def _get_database_name(self, config: DatabaseConnectionConfig) -> str:
         """Get database name for error reporting."""
@@ -148,8 +153,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
             self._connection_pool = await asyncpg.create_pool(
                 dsn=self._connection_dsn,
                 min_size=self.config.pool.min_connections,
-                max_size=self.config.pool.max_connections,
-                command_timeout=self.config.pool.connection_timeout,
+                # One connection more than the SDK pool holds, so health checks
+                # still get a connection while every pooled one is checked out
+                max_size=self.config.pool.max_connections + 1,
                 **self._connection_options
             )
             
@@ -161,6 +167,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 version_result = await conn.fetchrow("SELECT version()")
                 self.logger.info(f"Connected to PostgreSQL: {version_result['version']}")
             
+            # Pre-warm the connection pool
+            await self.connection_pool.prewarm()
+            
             self._is_initialized = True
             self.logger.info(f"PostgreSQL adapter initialized with pool size {self.config.pool.min_connections}-{self.config.pool.max_connections}")
             
@@ -175,6 +184,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
     async def shutdown(self) -> None:
         """Shutdown the PostgreSQL adapter."""
         try:
+            # Return pooled connections before closing the asyncpg pool
+            await self.close_pool()
+            
             if self._connection_pool:
                 await self._connection_pool.close()
                 self._connection_pool = None
@@ -183,12 +195,6 @@ class PostgreSQLAdapter(DatabaseAdapter):
             self._prepared_statements.clear()
             self._query_cache.clear()
             
-            # Close individual connections
-            async with self._pool_lock:
-                for connection in list(self._connection_pool.values()):
-                    await connection.close()
-                self._connection_pool.clear()
-            
             self._is_initialized = False
             self.logger.info("PostgreSQL adapter shutdown completed")
             
@@ -391,7 +397,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             # Execute query based on type
             if query_type == QueryType.SELECT or self._is_select_query(processed_query):
                 if param_values:
-                    rows = await connection.native_connection.fetch(processed_query, *param_values)
+                    _, rows = await self._run_prepared(connection, processed_query, param_values, 'fetch')
                 else:
                     rows = await connection.native_connection.fetch(processed_query)
                 
@@ -402,7 +408,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 
             else:
                 # Non-SELECT queries (INSERT, UPDATE, DELETE, DDL)
-                if param_values:
+                if param_values and self._statement_cache_size > 0:
+                    statement, _ = await self._run_prepared(connection, processed_query, param_values, 'fetch')
+                    result = statement.get_statusmsg()
+                elif param_values:
+                    # Preparation disabled: execute() returns the status message directly
                     result = await connection.native_connection.execute(processed_query, *param_values)
                 else:
                     result = await connection.native_connection.execute(processed_query)
@@ -440,21 +450,60 @@ class PostgreSQLAdapter(DatabaseAdapter):
             )
     
     def _process_parameters(self, query: str, parameters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
-        """Convert named parameters to positional for asyncpg."""
-        if not parameters:
-            return query, []
+        """Convert :param named parameters to asyncpg $n placeholders (compiled once per query)."""
+        return self._query_templates.process(query, parameters)
+    
+    async def _get_prepared_statement(self, connection: DatabaseConnection, query: str) -> Any:
+        """
+        Get the asyncpg prepared statement for query on this connection.
         
-        # Simple parameter substitution (for basic cases)
-        # In production, you'd want more sophisticated parameter processing
-        param_values = []
-        processed_query = query
+        Statements live in a per-connection LRU bounded by
+        ``prepared_statement_cache_size`` (0 disables explicit preparation).
+        """
+        if self._statement_cache_size <= 0:
+            return None
+        
+        statements = connection.get_metadata("prepared_statements")
+        if statements is None:
+            statements = OrderedDict()
+            connection.set_metadata("prepared_statements", statements)
         
-        for i, (key, value) in enumerate(parameters.items(), 1):
-            # Replace :key with $1, $2, etc.
-            processed_query = processed_query.replace(f":{key}", f"${i}")
-            param_values.append(value)
+        statement = statements.get(query)
+        if statement is not None:
+            statements.move_to_end(query)
+            return statement
         
-        return processed_query, param_values
+        statement = await connection.native_connection.prepare(query)
+        statements[query] = statement
+        if len(statements) > self._statement_cache_size:
+            statements.popitem(last=False)
+        return statement
+    
+    async def _run_prepared(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        param_values: List[Any],
+        method: str
+    ) -> Tuple[Any, Any]:
+        """
+        Run a prepared statement method (fetch, fetchrow, ...) with arguments.
+        
+        Statements invalidated by schema changes are re-prepared once.
+        
+        Returns:
+            Tuple of (prepared statement or None, result)
+        """
+        statement = await self._get_prepared_statement(connection, query)
+        if statement is None:
+            return None, await getattr(connection.native_connection, method)(query, *param_values)
+        
+        try:
+            return statement, await getattr(statement, method)(*param_values)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            connection.get_metadata("prepared_statements").pop(query, None)
+            statement = await self._get_prepared_statement(connection, query)
+            return statement, await getattr(statement, method)(*param_values)
     
     def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement."""
@@ -500,12 +549,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
                         _, param_values = self._process_parameters(query, params)
                     param_tuples.append(param_values)
                 
-                # Execute batch
-                results = await connection.native_connection.executemany(processed_query, param_tuples)
-                
-                # Sum affected rows from all executions
-                for result in results:
-                    total_affected += self._parse_execute_result(result)
+                # Execute batch (pipelined by asyncpg, which returns no per-row status)
+                await connection.native_connection.executemany(processed_query, param_tuples)
+                total_affected = len(param_tuples)
             
             execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             connection.query_count += len(parameters_list)
@@ -549,7 +595,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             
             # Fetch single row
             if param_values:
-                row = await connection.native_connection.fetchrow(processed_query, *param_values)
+                _, row = await self._run_prepared(connection, processed_query, param_values, 'fetchrow')
             else:
                 row = await connection.native_connection.fetchrow(processed_query)
             
@@ -586,7 +632,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             
             # Fetch rows
             if param_values:
-                rows = await connection.native_connection.fetch(processed_query, *param_values)
+                _, rows = await self._run_prepared(connection, processed_query, param_values, 'fetch')
             else:
                 rows = await connection.native_connection.fetch(processed_query)
             
@@ -612,6 +658,55 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Fetch all rows from PostgreSQL."""
         return await self.fetch_many(connection, query, parameters)
     
+    async def stream_batches(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Stream rows from PostgreSQL in batches using a server-side cursor.
+        
+        asyncpg cursors need a transaction; one is opened (and closed when
+        streaming stops) unless the connection is already in a transaction.
+        """
+        try:
+            connection.mark_used()
+            processed_query, param_values = self._process_parameters(query, parameters)
+            native = connection.native_connection
+            
+            transaction = None
+            if not native.is_in_transaction():
+                transaction = native.transaction()
+                await transaction.start()
+            
+            try:
+                cursor = await native.cursor(processed_query, *param_values)
+                connection.query_count += 1
+                while True:
+                    rows = await cursor.fetch(batch_size)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+            except BaseException:
+                # Errors and early stops (GeneratorExit) close the portal via rollback
+                if transaction is not None:
+                    await transaction.rollback()
+                raise
+            else:
+                if transaction is not None:
+                    await transaction.commit()
+                
+        except Exception as e:
+            raise wrap_database_error(
+                e,
+                operation="stream_batches",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                query=query[:100] + "..." if len(query) > 100 else query
+            )
+    
     # Transaction management
     
     async def _begin_transaction(
@@ -744,16 +839,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
     ) -> QueryResult:
         """Execute a prepared statement for better performance."""
         try:
-            # Prepare statement if not already prepared
-            if statement_name not in self._prepared_statements:
-                await connection.native_connection.prepare(query)
-                self._prepared_statements[statement_name] = query
-            
-            # Execute prepared statement
-            if parameters:
-                result = await connection.native_connection.fetch(query, *parameters)
-            else:
-                result = await connection.native_connection.fetch(query)
+            self._prepared_statements[statement_name] = query
+            
+            # Execute through the per-connection prepared statement cache
+            _, result = await self._run_prepared(connection, query, list(parameters or []), 'fetch')
             
             return QueryResult(
                 data=[dict(row) for row in result],
@@ -777,23 +866,38 @@ class PostgreSQLAdapter(DatabaseAdapter):
         data: List[List[Any]]
     ) -> int:
         """Bulk insert using PostgreSQL COPY for high performance."""
+        return await self.bulk_load(connection, table_name, columns, data)
+    
+    async def bulk_load(
+        self,
+        connection: DatabaseConnection,
+        table_name: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> int:
+        """Load a chunk of rows with COPY ... FROM STDIN (binary protocol)."""
         try:
-            # Use asyncpg's copy_records_to_table for bulk insert
-            records = [tuple(row) for row in data]
-            result = await connection.native_connection.copy_records_to_table(
-                table_name,
+            connection.mark_used()
+            schema_name, _, table = table_name.rpartition('.')
+            records = self._rows_as_tuples(rows, columns)
+            
+            # COPY is atomic per call: a failed chunk leaves earlier chunks loaded
+            await connection.native_connection.copy_records_to_table(
+                table,
                 records=records,
-                columns=columns
+                columns=columns,
+                schema_name=schema_name or None
             )
-            
-            return len(data)
+            connection.query_count += 1
+            return len(records)
             
         except Exception as e:
             raise wrap_database_error(
                 e,
-                operation="copy_from_table",
+                operation="bulk_load",
                 database_name=self._get_database_name(self.config),
-                engine=self.engine
+                engine=self.engine,
+                table_name=table_name
             )
     
     async def listen_notify(
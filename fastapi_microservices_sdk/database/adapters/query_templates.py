@@ -0,0 +1,189 @@
+"""
+Compiled query templates for SQL database adapters.
+
+Queries are written with ``:name`` parameters and every SQL adapter has to
+rewrite them into its driver's placeholder style. This module parses each
+distinct SQL text once into a template (driver SQL plus parameter order) and
+keeps the templates in a bounded LRU cache, so binding a dict of parameters
+on the hot path is a cache lookup and a list comprehension.
+
+The parser skips string literals, quoted identifiers, comments, PostgreSQL
+dollar-quoted bodies and ``::`` casts, and matches whole parameter names, so
+``:id`` and ``:id2`` bind independently.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import re
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from ..exceptions import QueryError
+
+
+class ParamStyle(Enum):
+    """Driver placeholder styles (DB-API ``paramstyle`` names)."""
+    NUMERIC = "numeric"  # $1, $2 (asyncpg)
+    QMARK = "qmark"      # ? (sqlite3 / aiosqlite)
+    FORMAT = "format"    # %s (aiomysql / pymysql)
+
+
+_PARAMETER = r"(?<![:\w]):(?P<name>[A-Za-z_]\w*)"
+_COMMENTS = r"--[^\n]*|/\*.*?\*/"
+_DOUBLE_QUOTED = r'"(?:[^"]|"")*"'
+
+_TOKEN_PATTERNS: Dict[ParamStyle, Pattern] = {
+    # PostgreSQL: standard strings, dollar quoting and :: casts
+    ParamStyle.NUMERIC: re.compile(
+        r"'(?:[^']|'')*'|" + _DOUBLE_QUOTED + "|" + _COMMENTS +
+        r"|(?P<dollar>\$(?:[A-Za-z_]\w*)?\$).*?(?P=dollar)|::|" + _PARAMETER,
+        re.DOTALL
+    ),
+    ParamStyle.QMARK: re.compile(
+        r"'(?:[^']|'')*'|" + _DOUBLE_QUOTED + r"|`[^`]*`|" + _COMMENTS + "|" + _PARAMETER,
+        re.DOTALL
+    ),
+    # MySQL: backslash escapes inside strings
+    ParamStyle.FORMAT: re.compile(
+        r"'(?:[^'\\]|\\.|'')*'|" + r'"(?:[^"\\]|\\.|"")*"' + r"|`[^`]*`|" + _COMMENTS + "|" + _PARAMETER,
+        re.DOTALL
+    ),
+}
+
+
+class QueryTemplate:
+    """A parsed query: driver SQL text plus the parameter names to bind."""
+
+    __slots__ = ('sql', 'text', 'param_names', 'style')
+
+    def __init__(self, sql: str, text: str, param_names: Tuple[str, ...], style: ParamStyle):
+        self.sql = sql
+        self.text = text
+        self.param_names = param_names
+        self.style = style
+
+    @classmethod
+    def compile(cls, sql: str, style: ParamStyle) -> 'QueryTemplate':
+        """
+        Parse SQL with ``:name`` parameters into a template.
+
+        Args:
+            sql: Query text with named parameters
+            style: Placeholder style of the target driver
+
+        Returns:
+            Compiled query template
+        """
+        parts: List[str] = []
+        names: List[str] = []
+        numbers: Dict[str, int] = {}
+        position = 0
+
+        for match in _TOKEN_PATTERNS[style].finditer(sql):
+            name = match.group('name')
+            if name is None:
+                continue
+
+            parts.append(sql[position:match.start()])
+            if style is ParamStyle.NUMERIC:
+                # Repeated names reuse their positional number
+                if name not in numbers:
+                    numbers[name] = len(numbers) + 1
+                    names.append(name)
+                parts.append(f"${numbers[name]}")
+            else:
+                names.append(name)
+                parts.append('?' if style is ParamStyle.QMARK else '%s')
+            position = match.end()
+
+        if not names:
+            return cls(sql, sql, (), style)
+
+        parts.append(sql[position:])
+        if style is ParamStyle.FORMAT:
+            # The driver %-formats the whole query when arguments are passed
+            parts = [part if part == '%s' else part.replace('%', '%%') for part in parts]
+
+        return cls(sql, ''.join(parts), tuple(names), style)
+
+    def bind(self, parameters: Dict[str, Any]) -> List[Any]:
+        """
+        Build the positional argument list for the driver.
+
+        Raises:
+            QueryError: If a parameter used by the query is missing
+        """
+        try:
+            return [parameters[name] for name in self.param_names]
+        except KeyError as e:
+            raise QueryError(
+                f"Missing value for query parameter ':{e.args[0]}'",
+                query=self.sql,
+                parameters=list(parameters)
+            )
+
+
+class QueryTemplateCache:
+    """Bounded LRU cache of compiled query templates for one placeholder style."""
+
+    def __init__(self, style: ParamStyle, max_size: int = 1024):
+        self.style = style
+        self.max_size = max_size
+        self._templates: "OrderedDict[str, QueryTemplate]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, sql: str) -> QueryTemplate:
+        """Get the compiled template for SQL text, compiling it on first use."""
+        template = self._templates.get(sql)
+        if template is not None:
+            self._templates.move_to_end(sql)
+            self.hits += 1
+            return template
+
+        self.misses += 1
+        template = QueryTemplate.compile(sql, self.style)
+        if self.max_size > 0:
+            self._templates[sql] = template
+            if len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+        return template
+
+    def process(self, sql: str, parameters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """
+        Convert a query with named parameters for the driver.
+
+        Queries without parameters are passed through untouched.
+
+        Returns:
+            Tuple of (driver SQL, positional parameter values)
+        """
+        if not parameters:
+            return sql, []
+
+        template = self.get(sql)
+        return template.text, template.bind(parameters)
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        self._templates.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'style': self.style.value,
+            'size': len(self._templates),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -25,7 +25,7 @@ import logging
 import sqlite3
 import shutil
 import os
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, AsyncGenerator
 from datetime import datetime, timezone
 from pathlib import Path
 import json
@@ -40,6 +40,7 @@ from .base import (
     DatabaseAdapter, DatabaseConnection, QueryResult, QueryType,
     TransactionContext, IsolationLevel, QueryMetrics
 )
+from .query_templates import ParamStyle, QueryTemplateCache
 
 # Optional dependency
 try:
@@ -68,23 +69,19 @@ class SQLiteAdapter(DatabaseAdapter):
         self.config = config
         self._engine = config.engine
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._connection_pool_dict: Dict[str, DatabaseConnection] = {}
-        self._pool_lock = asyncio.Lock()
         self._is_initialized = False
+        self._pool = None  # Shared ConnectionPool, created by DatabaseAdapter.connection_pool
         
         self._database_path = self._get_database_path()
         self._connection_options = self._build_connection_options()
         self._extensions_loaded = set()
         self._prepared_statements: Dict[str, str] = {}
+        self._query_templates = QueryTemplateCache(ParamStyle.QMARK, config.query_template_cache_size)
         
     def _get_database_name(self, config: DatabaseConnectionConfig) -> str:
         """Get database name for error reporting."""
         return getattr(config, 'name', config.database)
     
-    def _get_database_name(self) -> str:
-        """Get database name for error reporting."""
-        return getattr(self.config, 'name', self.config.database)
-    
     def _get_database_path(self) -> str:
         """Get the SQLite database file path."""
         if self.config.database == ":memory:":
@@ -140,6 +137,9 @@ class SQLiteAdapter(DatabaseAdapter):
                 
                 self.logger.info(f"Connected to SQLite: {sqlite_version[0] if sqlite_version else 'unknown'}")
             
+            # Pre-warm the connection pool
+            await self.connection_pool.prewarm()
+            
             self._is_initialized = True
             self.logger.info(f"SQLite adapter initialized: {self._database_path}")
             
@@ -205,10 +205,7 @@ class SQLiteAdapter(DatabaseAdapter):
         """Shutdown the SQLite adapter."""
         try:
             # Close all connections
-            async with self._pool_lock:
-                for connection in list(self._connection_pool_dict.values()):
-                    await connection.close()
-                self._connection_pool_dict.clear()
+            await self.close_pool()
             
             # Clear caches
             self._prepared_statements.clear()
@@ -467,24 +464,8 @@ class SQLiteAdapter(DatabaseAdapter):
             )
     
     def _process_parameters(self, query: str, parameters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
-        """Convert named parameters to format expected by SQLite."""
-        if not parameters:
-            return query, []
-        
-        # Convert :param to ? format for SQLite
-        param_values = []
-        processed_query = query
-        
-        # Find all :param patterns and replace with ?
-        param_pattern = r':(\w+)'
-        matches = re.findall(param_pattern, query)
-        
-        for param_name in matches:
-            if param_name in parameters:
-                processed_query = processed_query.replace(f':{param_name}', '?', 1)
-                param_values.append(parameters[param_name])
-        
-        return processed_query, param_values
+        """Convert :param named parameters to SQLite ? placeholders (compiled once per query)."""
+        return self._query_templates.process(query, parameters)
     
     def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement."""
@@ -517,11 +498,10 @@ class SQLiteAdapter(DatabaseAdapter):
                     _, param_values = self._process_parameters(query, params)
                 param_tuples.append(param_values)
             
-            # Execute batch using executemany
+            # Execute batch using executemany in a single transaction
             if param_tuples:
-                cursor = await connection.native_connection.executemany(processed_query, param_tuples)
+                cursor = await self._executemany_in_transaction(connection, processed_query, param_tuples)
                 total_affected = cursor.rowcount
-                await connection.native_connection.commit()
             
             execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             connection.query_count += len(parameters_list)
@@ -551,6 +531,63 @@ class SQLiteAdapter(DatabaseAdapter):
                 query=query[:100] + "..." if len(query) > 100 else query
             )
     
+    async def _executemany_in_transaction(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        param_tuples: List[Any]
+    ):
+        """
+        Run executemany inside one transaction.
+        
+        Connections are in autocommit mode, so without an explicit BEGIN every
+        row would be committed (and synced) separately. An already open
+        transaction is left to its owner.
+        """
+        native = connection.native_connection
+        own_transaction = not native.in_transaction
+        if own_transaction:
+            await native.execute("BEGIN")
+        
+        try:
+            cursor = await native.executemany(query, param_tuples)
+            if own_transaction:
+                await native.commit()
+            return cursor
+        except BaseException:
+            if own_transaction:
+                await native.rollback()
+            raise
+    
+    async def bulk_load(
+        self,
+        connection: DatabaseConnection,
+        table_name: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> int:
+        """Load a chunk of rows with a transaction-wrapped executemany."""
+        try:
+            connection.mark_used()
+            quoted_table = '.'.join(f'"{part}"' for part in table_name.split('.'))
+            column_names = ', '.join(f'"{column}"' for column in columns)
+            placeholders = ', '.join(['?'] * len(columns))
+            query = f'INSERT INTO {quoted_table} ({column_names}) VALUES ({placeholders})'
+            
+            records = self._rows_as_tuples(rows, columns)
+            await self._executemany_in_transaction(connection, query, records)
+            connection.query_count += 1
+            return len(records)
+            
+        except Exception as e:
+            raise wrap_database_error(
+                e,
+                operation="bulk_load",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                table_name=table_name
+            )
+    
     async def fetch_one(
         self,
         connection: DatabaseConnection,
@@ -635,6 +672,38 @@ class SQLiteAdapter(DatabaseAdapter):
         """Fetch all rows from SQLite."""
         return await self.fetch_many(connection, query, parameters)
     
+    async def stream_batches(
+        self,
+        connection: DatabaseConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Stream rows from SQLite in batches using cursor fetchmany."""
+        try:
+            connection.mark_used()
+            processed_query, param_values = self._process_parameters(query, parameters)
+            cursor = await connection.native_connection.execute(processed_query, param_values)
+            connection.query_count += 1
+            
+            try:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+            finally:
+                await cursor.close()
+                
+        except Exception as e:
+            raise wrap_database_error(
+                e,
+                operation="stream_batches",
+                database_name=self._get_database_name(self.config),
+                engine=self.engine,
+                query=query[:100] + "..." if len(query) > 100 else query
+            )
+    
     # Transaction management
     
     async def _begin_transaction(
@@ -5,8 +5,8 @@ This module provides intelligent caching capabilities for database operations
 with support for multiple caching backends, strategies, and invalidation policies.
 
 Features:
-- Multi-backend caching (Redis, Memcached, In-Memory)
-- Intelligent cache strategies (LRU, LFU, TTL-based)
+- Multi-backend caching (Redis, Memcached, In-Memory, tiered L1 + Redis)
+- Intelligent cache strategies (LRU, LFU, TTL-based, W-TinyLFU) with O(1) eviction
 - Automatic invalidation policies
 - Distributed caching support
 - Cache warming and preloading
@@ -28,20 +28,38 @@ from .config import (
 from .manager import (
     CacheManager,
     CacheEntry,
-    CacheStats
+    CacheStats,
+    CachedResult
 )
 from .backends import (
     CacheBackendInterface,
     RedisCacheBackend,
     MemcachedCacheBackend,
-    InMemoryCacheBackend
+    InMemoryCacheBackend,
+    TieredCacheBackend
 )
 from .strategies import (
     CacheStrategyInterface,
     LRUStrategy,
     LFUStrategy,
     TTLStrategy,
-    AdaptiveStrategy
+    AdaptiveStrategy,
+    TinyLFUStrategy
+)
+from .eviction import (
+    EvictionPolicy,
+    LRUEvictionPolicy,
+    LFUEvictionPolicy,
+    FIFOEvictionPolicy,
+    TinyLFUEvictionPolicy,
+    create_eviction_policy
+)
+from .sizing import (
+    SizeEstimatorInterface,
+    DeepSizeEstimator,
+    SerializedSizeEstimator,
+    CallableSizeEstimator,
+    create_size_estimator
 )
 from .invalidation import (
     InvalidationManager,
@@ -76,12 +94,14 @@ __all__ = [
     "CacheManager",
     "CacheEntry",
     "CacheStats",
+    "CachedResult",
     
     # Backends
     "CacheBackendInterface",
     "RedisCacheBackend",
     "MemcachedCacheBackend",
     "InMemoryCacheBackend",
+    "TieredCacheBackend",
     
     # Strategies
     "CacheStrategyInterface",
@@ -89,6 +109,22 @@ __all__ = [
     "LFUStrategy",
     "TTLStrategy",
     "AdaptiveStrategy",
+    "TinyLFUStrategy",
+    
+    # Eviction
+    "EvictionPolicy",
+    "LRUEvictionPolicy",
+    "LFUEvictionPolicy",
+    "FIFOEvictionPolicy",
+    "TinyLFUEvictionPolicy",
+    "create_eviction_policy",
+    
+    # Size estimation
+    "SizeEstimatorInterface",
+    "DeepSizeEstimator",
+    "SerializedSizeEstimator",
+    "CallableSizeEstimator",
+    "create_size_estimator",
     
     # Invalidation
     "InvalidationManager",
@@ -11,16 +11,20 @@ Version: 1.0.0
 import asyncio
 import json
 import pickle
+import re
 import time
+import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Callable
 from dataclasses import dataclass
 import threading
 from collections import OrderedDict
 import weakref
 
-from .config import CacheConfig, CacheBackend
+from .config import CacheConfig, CacheBackend, CacheStrategy
+from .eviction import EvictionPolicy, create_eviction_policy
+from .sizing import SizeEstimatorInterface, create_size_estimator
 from .exceptions import (
     CacheBackendError,
     CacheConnectionError,
@@ -166,6 +170,10 @@ class CacheBackendInterface(ABC):
         # This is a placeholder - actual implementation depends on backend
         return deleted_count
     
+    async def delete_by_pattern(self, pattern: str) -> int:
+        """Delete entries whose key matches a regex pattern (default: unsupported)."""
+        return 0
+    
     @property
     def is_connected(self) -> bool:
         """Check if backend is connected."""
@@ -243,19 +251,7 @@ class RedisCacheBackend(CacheBackendInterface):
             if not value_data:
                 return None
             
-            # Deserialize value
-            value = pickle.loads(value_data)
-            
-            # Create cache entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=datetime.fromisoformat(meta_data.get(b'created_at', b'').decode()) if meta_data.get(b'created_at') else datetime.now(timezone.utc),
-                expires_at=datetime.fromisoformat(meta_data.get(b'expires_at', b'').decode()) if meta_data.get(b'expires_at') else None,
-                access_count=int(meta_data.get(b'access_count', 0)),
-                size_bytes=int(meta_data.get(b'size_bytes', 0)),
-                tags=json.loads(meta_data.get(b'tags', b'[]').decode())
-            )
+            entry = self._build_entry(key, meta_data, value_data)
             
             # Check if expired
             if entry.is_expired:
@@ -283,52 +279,14 @@ class RedisCacheBackend(CacheBackendInterface):
             raise CacheBackendError("Redis client not connected")
         
         try:
-            # Serialize value
-            serialized_value = pickle.dumps(value)
-            
-            # Calculate expiration
-            expires_at = None
-            if ttl:
-                expires_at = datetime.now(timezone.utc) + ttl
-            
-            # Create cache entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=datetime.now(timezone.utc),
-                expires_at=expires_at,
-                size_bytes=len(serialized_value),
-                tags=tags or []
-            )
-            
-            # Store in Redis with pipeline
+            # Store value, metadata and tag indexes in one pipeline
             pipe = self._client.pipeline()
+            self._queue_set(pipe, key, value, ttl, tags or [])
             
-            # Set value
-            if ttl:
-                pipe.setex(key, int(ttl.total_seconds()), serialized_value)
-            else:
-                pipe.set(key, serialized_value)
-            
-            # Set metadata
-            meta_data = {
-                'created_at': entry.created_at.isoformat(),
-                'expires_at': entry.expires_at.isoformat() if entry.expires_at else '',
-                'access_count': entry.access_count,
-                'size_bytes': entry.size_bytes,
-                'tags': json.dumps(entry.tags)
-            }
-            
-            pipe.hset(f"{key}:meta", mapping=meta_data)
-            
-            if ttl:
-                pipe.expire(f"{key}:meta", int(ttl.total_seconds()))
-            
-            # Add to tag indexes
-            for tag in entry.tags:
+            for tag in tags or []:
                 pipe.sadd(f"tag:{tag}", key)
                 if ttl:
-                    pipe.expire(f"tag:{tag}", int(ttl.total_seconds()))
+                    pipe.expire(f"tag:{tag}", self._ttl_seconds(ttl))
             
             await pipe.execute()
             return True
@@ -432,14 +390,209 @@ class RedisCacheBackend(CacheBackendInterface):
         except Exception as e:
             raise CacheBackendError(f"Failed to delete by tags in Redis: {e}", backend="redis", operation="delete_by_tags")
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Optional[CacheEntry]]:
+        """Get multiple values with one MGET + HGETALL pipeline per chunk."""
+        if not self._client:
+            raise CacheBackendError("Redis client not connected")
+        
+        result: Dict[str, Optional[CacheEntry]] = {}
+        
+        try:
+            for chunk in self._chunks(keys):
+                pipe = self._client.pipeline(transaction=False)
+                pipe.mget(chunk)
+                for key in chunk:
+                    pipe.hgetall(f"{key}:meta")
+                
+                values, *metas = await pipe.execute()
+                
+                hits: List[CacheEntry] = []
+                expired: List[CacheEntry] = []
+                for key, value_data, meta_data in zip(chunk, values, metas):
+                    if not value_data:
+                        result[key] = None
+                        continue
+                    
+                    entry = self._build_entry(key, meta_data, value_data)
+                    if entry.is_expired:
+                        expired.append(entry)
+                        result[key] = None
+                        continue
+                    
+                    entry.mark_accessed()
+                    hits.append(entry)
+                    result[key] = entry
+                
+                if hits or expired:
+                    # Access metadata and expired cleanup share one round trip
+                    pipe = self._client.pipeline(transaction=False)
+                    for entry in hits:
+                        pipe.hset(f"{entry.key}:meta", mapping=self._access_metadata(entry))
+                    if expired:
+                        self._queue_unlink(pipe, {entry.key: entry.tags for entry in expired})
+                    await pipe.execute()
+            
+            return result
+            
+        except Exception as e:
+            raise CacheBackendError(f"Failed to get many from Redis: {e}", backend="redis", operation="get_many")
+    
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """Set multiple values with one pipeline (SET EX + metadata + tag index) per chunk."""
+        if not self._client:
+            raise CacheBackendError("Redis client not connected")
+        
+        result: Dict[str, bool] = {}
+        tags = tags or []
+        
+        try:
+            for chunk in self._chunks(list(items)):
+                pipe = self._client.pipeline(transaction=False)
+                for key in chunk:
+                    self._queue_set(pipe, key, items[key], ttl, tags)
+                
+                # One SADD per tag for the whole chunk
+                for tag in tags:
+                    pipe.sadd(f"tag:{tag}", *chunk)
+                    if ttl:
+                        pipe.expire(f"tag:{tag}", self._ttl_seconds(ttl))
+                
+                responses = await pipe.execute()
+                
+                commands_per_key = 3 if ttl else 2
+                for index, key in enumerate(chunk):
+                    result[key] = bool(responses[index * commands_per_key])
+            
+            return result
+            
+        except Exception as e:
+            raise CacheBackendError(f"Failed to set many in Redis: {e}", backend="redis", operation="set_many")
+    
+    async def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Delete multiple values with UNLINK, batching tag index cleanup per chunk."""
+        if not self._client:
+            raise CacheBackendError("Redis client not connected")
+        
+        result: Dict[str, bool] = {}
+        
+        try:
+            for chunk in self._chunks(keys):
+                pipe = self._client.pipeline(transaction=False)
+                for key in chunk:
+                    pipe.hget(f"{key}:meta", 'tags')
+                tag_data = await pipe.execute()
+                
+                key_tags = {
+                    key: json.loads(raw) if raw else []
+                    for key, raw in zip(chunk, tag_data)
+                }
+                
+                pipe = self._client.pipeline(transaction=False)
+                self._queue_unlink(pipe, key_tags)
+                responses = await pipe.execute()
+                
+                for key, deleted in zip(chunk, responses):
+                    result[key] = bool(deleted)
+            
+            return result
+            
+        except Exception as e:
+            raise CacheBackendError(f"Failed to delete many from Redis: {e}", backend="redis", operation="delete_many")
+    
+    def _chunks(self, keys: List[str]) -> List[List[str]]:
+        """Split keys into pipeline-sized chunks."""
+        size = max(1, self.redis_config.get("batch_chunk_size", 500))
+        return [keys[i:i + size] for i in range(0, len(keys), size)]
+    
+    @staticmethod
+    def _ttl_seconds(ttl: timedelta) -> int:
+        """Convert TTL to whole seconds (Redis rejects 0)."""
+        return max(1, int(ttl.total_seconds()))
+    
+    def _queue_set(
+        self,
+        pipe: Any,
+        key: str,
+        value: Any,
+        ttl: Optional[timedelta],
+        tags: List[str]
+    ) -> None:
+        """Queue SET (with expiry), HSET metadata and metadata EXPIRE for one key."""
+        serialized_value = pickle.dumps(value)
+        created_at = datetime.now(timezone.utc)
+        expires_at = created_at + ttl if ttl else None
+        
+        pipe.set(key, serialized_value, ex=self._ttl_seconds(ttl) if ttl else None)
+        pipe.hset(f"{key}:meta", mapping={
+            'created_at': created_at.isoformat(),
+            'expires_at': expires_at.isoformat() if expires_at else '',
+            'access_count': 0,
+            'size_bytes': len(serialized_value),
+            'tags': json.dumps(tags)
+        })
+        if ttl:
+            pipe.expire(f"{key}:meta", self._ttl_seconds(ttl))
+    
+    @staticmethod
+    def _queue_unlink(pipe: Any, key_tags: Dict[str, List[str]]) -> None:
+        """Queue one UNLINK per key (per-key results first), then metadata and tag cleanup."""
+        for key in key_tags:
+            pipe.unlink(key)
+        pipe.unlink(*(f"{key}:meta" for key in key_tags))
+        
+        tag_members: Dict[str, List[str]] = {}
+        for key, tags in key_tags.items():
+            for tag in tags:
+                tag_members.setdefault(tag, []).append(key)
+        for tag, members in tag_members.items():
+            pipe.srem(f"tag:{tag}", *members)
+    
+    @staticmethod
+    def _build_entry(key: str, meta_data: Dict[bytes, bytes], value_data: bytes) -> CacheEntry:
+        """Build cache entry from stored value and metadata hash."""
+        return CacheEntry(
+            key=key,
+            value=pickle.loads(value_data),
+            created_at=datetime.fromisoformat(meta_data.get(b'created_at', b'').decode()) if meta_data.get(b'created_at') else datetime.now(timezone.utc),
+            expires_at=datetime.fromisoformat(meta_data.get(b'expires_at', b'').decode()) if meta_data.get(b'expires_at') else None,
+            access_count=int(meta_data.get(b'access_count', 0)),
+            size_bytes=int(meta_data.get(b'size_bytes', 0)),
+            tags=json.loads(meta_data.get(b'tags', b'[]').decode())
+        )
+    
+    @staticmethod
+    def _access_metadata(entry: CacheEntry) -> Dict[str, Any]:
+        """Metadata fields updated on access."""
+        return {
+            'access_count': entry.access_count,
+            'last_accessed': entry.last_accessed.isoformat() if entry.last_accessed else ''
+        }
+    
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        """Publish a JSON message on a Redis pub/sub channel."""
+        if not self._client:
+            raise CacheBackendError("Redis client not connected")
+        
+        try:
+            return await self._client.publish(channel, json.dumps(message))
+        except Exception as e:
+            raise CacheBackendError(f"Failed to publish to Redis: {e}", backend="redis", operation="publish")
+    
+    def pubsub(self) -> Any:
+        """Create a pub/sub handle on the backend connection pool."""
+        if not self._client:
+            raise CacheBackendError("Redis client not connected")
+        return self._client.pubsub()
+    
     async def _update_metadata(self, key: str, entry: CacheEntry) -> None:
         """Update metadata for cache entry."""
         try:
-            meta_data = {
-                'access_count': entry.access_count,
-                'last_accessed': entry.last_accessed.isoformat() if entry.last_accessed else ''
-            }
-            await self._client.hset(f"{key}:meta", mapping=meta_data)
+            await self._client.hset(f"{key}:meta", mapping=self._access_metadata(entry))
         except Exception:
             # Ignore metadata update errors
             pass
@@ -448,9 +601,17 @@ class RedisCacheBackend(CacheBackendInterface):
 class InMemoryCacheBackend(CacheBackendInterface):
     """In-memory cache backend implementation."""
     
-    def __init__(self, config: CacheConfig):
+    def __init__(
+        self,
+        config: CacheConfig,
+        size_estimator: Union[str, Callable[[Any], int], SizeEstimatorInterface, None] = None,
+        memory_config: Optional[Dict[str, Any]] = None
+    ):
         super().__init__(config)
-        self.memory_config = config.get_backend_config(CacheBackend.MEMORY)
+        self.memory_config = {
+            **config.get_backend_config(CacheBackend.MEMORY),
+            **(memory_config or {})
+        }
         
         self._cache: Dict[str, CacheEntry] = {}
         self._tag_index: Dict[str, set] = {}
@@ -462,6 +623,32 @@ class InMemoryCacheBackend(CacheBackendInterface):
         
         self._current_memory_bytes = 0
         self._cleanup_task = None
+        
+        # Memory accounting
+        self._size_estimator = create_size_estimator(
+            size_estimator or self.memory_config.get("size_estimator"),
+            config,
+            sample_size=self.memory_config.get("size_sample_size", 32)
+        )
+        self._max_memory_bytes = int(self._max_memory_mb * 1024 * 1024)
+        self._max_entry_bytes = min(
+            self.memory_config.get("max_entry_bytes") or config.max_value_size,
+            self._max_memory_bytes
+        )
+        self._tag_bytes: Dict[str, int] = {}
+        self._database_bytes: Dict[str, int] = {}
+        self._rejected_entries = 0
+        
+        # O(1) eviction engine; CacheManager binds a strategy to it with create_strategy(..., backend=self)
+        self.eviction_strategy = CacheStrategy(
+            self.memory_config.get("eviction_strategy") or config.default_strategy
+        )
+        self._policy: EvictionPolicy = create_eviction_policy(self.eviction_strategy, self._max_size)
+    
+    @property
+    def eviction_policy(self) -> EvictionPolicy:
+        """Eviction policy that decides which entries this backend drops."""
+        return self._policy
     
     async def connect(self) -> None:
         """Connect to in-memory cache (start cleanup task)."""
@@ -489,15 +676,18 @@ class InMemoryCacheBackend(CacheBackendInterface):
             entry = self._cache.get(key)
             
             if entry is None:
+                self._policy.record_miss(key)
                 return None
             
             # Check if expired
             if entry.is_expired:
                 self._remove_entry(key)
+                self._policy.record_miss(key)
                 return None
             
             # Update access info
             entry.mark_accessed()
+            self._policy.record_hit(key)
             return entry
     
     async def set(
@@ -507,34 +697,33 @@ class InMemoryCacheBackend(CacheBackendInterface):
         ttl: Optional[timedelta] = None,
         tags: Optional[List[str]] = None
     ) -> bool:
-        """Set value in memory cache."""
+        """
+        Set value in memory cache.
+        
+        Entries larger than ``max_entry_bytes`` are rejected (returns False)
+        rather than flushing the cache to make room for them.
+        """
+        # Size outside the lock; deep estimation of large results is the slow part
+        size_bytes = self._size_estimator.estimate(value)
+        
         with self._lock if self._lock else nullcontext():
-            # Calculate size
-            import sys
-            size_bytes = sys.getsizeof(value)
-            
-            # Check capacity limits
-            if len(self._cache) >= self._max_size:
-                self._evict_entries(1)
-            
-            if (self._current_memory_bytes + size_bytes) > (self._max_memory_mb * 1024 * 1024):
-                # Try to free memory by evicting entries
-                target_memory = self._max_memory_mb * 1024 * 1024 * 0.8  # 80% of max
-                while self._current_memory_bytes > target_memory and self._cache:
-                    self._evict_entries(1)
-                
-                # Check again
-                if (self._current_memory_bytes + size_bytes) > (self._max_memory_mb * 1024 * 1024):
+            if size_bytes > self._max_entry_bytes:
+                self._rejected_entries += 1
+                return False
+            
+            # Remove existing entry if present (policy keeps tracking the key)
+            if key in self._cache:
+                self._remove_entry(key, keep_policy=True)
+            
+            # Evict only as much as the new entry needs, never the key being stored
+            while self._current_memory_bytes + size_bytes > self._max_memory_bytes:
+                if not self._evict_entries(1, exclude=key):
                     raise CacheCapacityError(
                         f"Cannot store entry: would exceed memory limit",
                         current_size=self._current_memory_bytes,
-                        max_size=self._max_memory_mb * 1024 * 1024
+                        max_size=self._max_memory_bytes
                     )
             
-            # Remove existing entry if present
-            if key in self._cache:
-                self._remove_entry(key)
-            
             # Calculate expiration
             expires_at = None
             if ttl:
@@ -552,7 +741,7 @@ class InMemoryCacheBackend(CacheBackendInterface):
             
             # Store entry
             self._cache[key] = entry
-            self._current_memory_bytes += size_bytes
+            self._account_entry(entry, 1)
             
             # Update tag index
             for tag in entry.tags:
@@ -560,7 +749,11 @@ class InMemoryCacheBackend(CacheBackendInterface):
                     self._tag_index[tag] = set()
                 self._tag_index[tag].add(key)
             
-            return True
+            # Let the policy make room; it may also reject the new key (W-TinyLFU)
+            for evicted_key in self._policy.insert(key):
+                self._remove_entry(evicted_key, keep_policy=True)
+            
+            return key in self._cache
     
     async def delete(self, key: str) -> bool:
         """Delete value from memory cache."""
@@ -584,6 +777,9 @@ class InMemoryCacheBackend(CacheBackendInterface):
         with self._lock if self._lock else nullcontext():
             self._cache.clear()
             self._tag_index.clear()
+            self._policy.clear()
+            self._tag_bytes.clear()
+            self._database_bytes.clear()
             self._current_memory_bytes = 0
             return True
     
@@ -597,7 +793,13 @@ class InMemoryCacheBackend(CacheBackendInterface):
                 'memory_usage_mb': self._current_memory_bytes / (1024 * 1024),
                 'max_entries': self._max_size,
                 'max_memory_mb': self._max_memory_mb,
-                'tag_count': len(self._tag_index)
+                'max_entry_bytes': self._max_entry_bytes,
+                'rejected_entries': self._rejected_entries,
+                'size_estimator': self._size_estimator.name,
+                'memory_by_tag': dict(self._tag_bytes),
+                'memory_by_database': dict(self._database_bytes),
+                'tag_count': len(self._tag_index),
+                'eviction': self._policy.get_metrics()
             }
     
     async def delete_by_tags(self, tags: List[str]) -> int:
@@ -617,11 +819,23 @@ class InMemoryCacheBackend(CacheBackendInterface):
             
             return deleted_count
     
-    def _remove_entry(self, key: str) -> None:
+    async def delete_by_pattern(self, pattern: str) -> int:
+        """Delete entries whose key matches a regex pattern."""
+        compiled = re.compile(pattern)
+        with self._lock if self._lock else nullcontext():
+            keys_to_delete = [key for key in self._cache if compiled.match(key)]
+            for key in keys_to_delete:
+                self._remove_entry(key)
+            return len(keys_to_delete)
+    
+    def _remove_entry(self, key: str, keep_policy: bool = False) -> None:
         """Remove entry and update indexes."""
+        if not keep_policy:
+            self._policy.remove(key)
+        
         entry = self._cache.pop(key, None)
         if entry:
-            self._current_memory_bytes -= entry.size_bytes
+            self._account_entry(entry, -1)
             
             # Update tag index
             for tag in entry.tags:
@@ -630,20 +844,42 @@ class InMemoryCacheBackend(CacheBackendInterface):
                     if not self._tag_index[tag]:
                         del self._tag_index[tag]
     
-    def _evict_entries(self, count: int) -> None:
-        """Evict entries using LRU strategy."""
-        if not self._cache:
-            return
+    def _account_entry(self, entry: CacheEntry, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) entry bytes from the usage counters."""
+        delta = sign * entry.size_bytes
+        self._current_memory_bytes += delta
         
-        # Sort by last accessed time (LRU)
-        sorted_entries = sorted(
-            self._cache.items(),
-            key=lambda x: x[1].last_accessed or x[1].created_at
-        )
+        for tag in entry.tags:
+            self._tag_bytes[tag] = self._tag_bytes.get(tag, 0) + delta
+            if self._tag_bytes[tag] <= 0:
+                del self._tag_bytes[tag]
         
-        for i in range(min(count, len(sorted_entries))):
-            key = sorted_entries[i][0]
-            self._remove_entry(key)
+        database_name = self._database_for_entry(entry)
+        if database_name:
+            self._database_bytes[database_name] = self._database_bytes.get(database_name, 0) + delta
+            if self._database_bytes[database_name] <= 0:
+                del self._database_bytes[database_name]
+    
+    @staticmethod
+    def _database_for_entry(entry: CacheEntry) -> Optional[str]:
+        """Resolve database name from a CacheManager key (cache:<db>:<hash>) or db: tag."""
+        if entry.key.startswith("cache:") and entry.key.count(":") >= 2:
+            return entry.key[len("cache:"):entry.key.rindex(":")]
+        for tag in entry.tags:
+            if tag.startswith("db:"):
+                return tag[len("db:"):]
+        return None
+    
+    def _evict_entries(self, count: int, exclude: Optional[str] = None) -> int:
+        """Evict up to count entries chosen by the eviction policy in O(1) each, sparing ``exclude``."""
+        evicted = 0
+        while evicted < count:
+            key = self._policy.evict(exclude)
+            if key is None:
+                break
+            self._remove_entry(key, keep_policy=True)
+            evicted += 1
+        return evicted
     
     async def _cleanup_loop(self) -> None:
         """Background cleanup loop for expired entries."""
@@ -671,6 +907,289 @@ class InMemoryCacheBackend(CacheBackendInterface):
                 continue
 
 
+class TieredCacheBackend(CacheBackendInterface):
+    """
+    Two-tier near cache: a small in-process L1 in front of Redis (L2).
+    
+    Reads are served from L1 when possible and filled from L2 on an L1 miss.
+    Every write, delete and invalidation is published on a Redis pub/sub
+    channel so that the L1 of every replica drops its copy. L1 entries also
+    carry a short TTL (``l1_ttl_seconds``) which bounds staleness if an
+    invalidation message is lost; L1 is flushed whenever the subscription
+    has to be re-established.
+    """
+    
+    def __init__(
+        self,
+        config: CacheConfig,
+        l1: Optional[InMemoryCacheBackend] = None,
+        l2: Optional[RedisCacheBackend] = None
+    ):
+        super().__init__(config)
+        self.hybrid_config = config.get_backend_config(CacheBackend.HYBRID)
+        
+        self._l1 = l1 or InMemoryCacheBackend(config, memory_config={
+            "max_size": self.hybrid_config.get("l1_max_size", 512),
+            "max_memory_mb": self.hybrid_config.get("l1_max_memory_mb", 32)
+        })
+        self._l2 = l2 or RedisCacheBackend(config)
+        self.eviction_strategy = self._l1.eviction_strategy
+        
+        self._l1_ttl = timedelta(seconds=self.hybrid_config.get("l1_ttl_seconds", 30.0))
+        self._channel = self.hybrid_config.get("invalidation_channel", "cache:invalidation")
+        self._instance_id = uuid.uuid4().hex
+        
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        
+        self._stats = {
+            'l1_hits': 0,
+            'l2_hits': 0,
+            'misses': 0,
+            'invalidations_published': 0,
+            'invalidations_received': 0,
+            'resubscriptions': 0
+        }
+    
+    @property
+    def eviction_policy(self) -> EvictionPolicy:
+        """Eviction policy of the in-process tier (Redis evicts L2 itself)."""
+        return self._l1.eviction_policy
+    
+    async def connect(self) -> None:
+        """Connect both tiers and subscribe to invalidation fan-out."""
+        await self._l2.connect()
+        await self._l1.connect()
+        
+        await self._subscribe()
+        self._connected = True
+        self._listener_task = asyncio.create_task(self._listen_invalidations())
+    
+    async def disconnect(self) -> None:
+        """Stop invalidation listener and disconnect both tiers."""
+        self._connected = False
+        
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        
+        await self._close_pubsub()
+        await self._l1.disconnect()
+        await self._l2.disconnect()
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Get value from L1, falling back to Redis and filling L1."""
+        entry = await self._l1.get(key)
+        if entry is not None:
+            self._stats['l1_hits'] += 1
+            return entry
+        
+        entry = await self._l2.get(key)
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+        
+        self._stats['l2_hits'] += 1
+        await self._fill_l1(entry)
+        return entry
+    
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """Write through to Redis, refresh local L1 and invalidate other replicas."""
+        success = await self._l2.set(key, value, ttl, tags)
+        await self._publish_invalidation('keys', [key])
+        
+        if success:
+            await self._fill_l1(CacheEntry(
+                key=key,
+                value=value,
+                created_at=datetime.now(timezone.utc),
+                expires_at=datetime.now(timezone.utc) + ttl if ttl else None,
+                tags=tags or []
+            ))
+        return success
+    
+    async def delete(self, key: str) -> bool:
+        """Delete from both tiers and invalidate other replicas."""
+        await self._l1.delete(key)
+        deleted = await self._l2.delete(key)
+        await self._publish_invalidation('keys', [key])
+        return deleted
+    
+    async def exists(self, key: str) -> bool:
+        """Check L1, then Redis."""
+        return await self._l1.exists(key) or await self._l2.exists(key)
+    
+    async def clear(self) -> bool:
+        """Clear both tiers on every replica."""
+        await self._l1.clear()
+        cleared = await self._l2.clear()
+        await self._publish_invalidation('clear', [])
+        return cleared
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Optional[CacheEntry]]:
+        """Serve what L1 has and fetch the rest from Redis in one batch."""
+        result = {}
+        missing = []
+        for key in keys:
+            entry = await self._l1.get(key)
+            if entry is not None:
+                self._stats['l1_hits'] += 1
+                result[key] = entry
+            else:
+                missing.append(key)
+        
+        if missing:
+            for key, entry in (await self._l2.get_many(missing)).items():
+                result[key] = entry
+                if entry is None:
+                    self._stats['misses'] += 1
+                else:
+                    self._stats['l2_hits'] += 1
+                    await self._fill_l1(entry)
+        
+        return result
+    
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """Write a batch through to Redis with a single invalidation message."""
+        for key in items:
+            await self._l1.delete(key)
+        result = await self._l2.set_many(items, ttl, tags)
+        await self._publish_invalidation('keys', list(items))
+        return result
+    
+    async def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Delete a batch from both tiers with a single invalidation message."""
+        for key in keys:
+            await self._l1.delete(key)
+        result = await self._l2.delete_many(keys)
+        await self._publish_invalidation('keys', keys)
+        return result
+    
+    async def delete_by_tags(self, tags: List[str]) -> int:
+        """Delete tagged entries in Redis and in every replica's L1."""
+        await self._l1.delete_by_tags(tags)
+        deleted = await self._l2.delete_by_tags(tags)
+        await self._publish_invalidation('tags', tags)
+        return deleted
+    
+    async def delete_by_pattern(self, pattern: str) -> int:
+        """Drop L1 entries matching pattern on every replica."""
+        deleted = await self._l1.delete_by_pattern(pattern)
+        deleted += await self._l2.delete_by_pattern(pattern)
+        await self._publish_invalidation('pattern', [pattern])
+        return deleted
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get statistics for both tiers and invalidation fan-out."""
+        lookups = self._stats['l1_hits'] + self._stats['l2_hits'] + self._stats['misses']
+        return {
+            'backend': 'hybrid',
+            **self._stats,
+            'l1_hit_rate': self._stats['l1_hits'] / lookups if lookups > 0 else 0.0,
+            'instance_id': self._instance_id,
+            'l1': await self._l1.get_stats(),
+            'l2': await self._l2.get_stats()
+        }
+    
+    async def _fill_l1(self, entry: CacheEntry) -> None:
+        """Copy an entry into L1 with a TTL no longer than l1_ttl_seconds."""
+        ttl = self._l1_ttl
+        if entry.expires_at:
+            remaining = entry.expires_at - datetime.now(timezone.utc)
+            if remaining.total_seconds() <= 0:
+                return
+            ttl = min(ttl, remaining)
+        
+        try:
+            await self._l1.set(entry.key, entry.value, ttl, entry.tags)
+        except CacheCapacityError:
+            # Not fitting in L1 only costs a Redis read
+            pass
+    
+    async def _publish_invalidation(self, kind: str, values: List[str]) -> None:
+        """Tell other replicas to drop L1 entries."""
+        await self._l2.publish(self._channel, {
+            'origin': self._instance_id,
+            'type': kind,
+            'values': values
+        })
+        self._stats['invalidations_published'] += 1
+    
+    async def _apply_invalidation(self, data: Union[str, bytes]) -> None:
+        """Apply an invalidation message from another replica to L1."""
+        message = json.loads(data)
+        if message.get('origin') == self._instance_id:
+            return
+        
+        kind = message.get('type')
+        values = message.get('values', [])
+        
+        if kind == 'keys':
+            await self._l1.delete_many(values)
+        elif kind == 'tags':
+            await self._l1.delete_by_tags(values)
+        elif kind == 'pattern':
+            for pattern in values:
+                await self._l1.delete_by_pattern(pattern)
+        elif kind == 'clear':
+            await self._l1.clear()
+        
+        self._stats['invalidations_received'] += 1
+    
+    async def _subscribe(self) -> None:
+        """Subscribe to the invalidation channel."""
+        self._pubsub = self._l2.pubsub()
+        await self._pubsub.subscribe(self._channel)
+    
+    async def _close_pubsub(self) -> None:
+        """Release the pub/sub connection."""
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.reset()
+            except Exception:
+                pass
+            self._pubsub = None
+    
+    async def _listen_invalidations(self) -> None:
+        """Background loop applying invalidation messages to L1."""
+        while self._connected:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=1.0
+                )
+                if message and message.get('type') == 'message':
+                    await self._apply_invalidation(message['data'])
+                
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                # Messages may have been missed: drop L1 rather than serve stale data
+                await self._l1.clear()
+                await self._close_pubsub()
+                await asyncio.sleep(1.0)
+                try:
+                    await self._subscribe()
+                    self._stats['resubscriptions'] += 1
+                except Exception:
+                    continue
+
+
 # Memcached backend placeholder
 class MemcachedCacheBackend(CacheBackendInterface):
     """Memcached cache backend implementation."""
@@ -32,6 +32,7 @@ class CacheStrategy(Enum):
     TTL = "ttl"  # Time To Live
     ADAPTIVE = "adaptive"  # Adaptive strategy based on usage patterns
     FIFO = "fifo"  # First In, First Out
+    TINYLFU = "w_tinylfu"  # Window TinyLFU admission + segmented LRU
 
 
 class InvalidationPolicy(Enum):
@@ -79,7 +80,8 @@ class CacheConfig(BaseModel):
             "socket_timeout": 5.0,
             "socket_connect_timeout": 5.0,
             "retry_on_timeout": True,
-            "health_check_interval": 30
+            "health_check_interval": 30,
+            "batch_chunk_size": 500  # Keys per pipeline in get_many/set_many/delete_many
         },
         description="Redis backend configuration"
     )
@@ -104,11 +106,25 @@ class CacheConfig(BaseModel):
             "max_size": 1000,
             "max_memory_mb": 100,
             "cleanup_interval": 60.0,
-            "thread_safe": True
+            "thread_safe": True,
+            "eviction_strategy": None,  # Defaults to default_strategy
+            "size_estimator": "deep",  # deep, serialized, shallow or a callable
+            "size_sample_size": 32,  # Items sampled per container by the deep estimator
+            "max_entry_bytes": None  # Defaults to max_value_size
         },
         description="In-memory backend configuration"
     )
     
+    hybrid_config: Dict[str, Any] = Field(
+        default_factory=lambda: {
+            "l1_max_size": 512,
+            "l1_max_memory_mb": 32,
+            "l1_ttl_seconds": 30.0,  # Upper bound on L1 staleness if an invalidation is lost
+            "invalidation_channel": "cache:invalidation"
+        },
+        description="Hybrid (in-process L1 + Redis L2) backend configuration"
+    )
+    
     # Cache strategy settings
     default_strategy: CacheStrategy = Field(
         default=CacheStrategy.LRU,
@@ -183,6 +199,22 @@ class CacheConfig(BaseModel):
         description="Delay between retry attempts in seconds"
     )
     
+    # Stampede protection settings
+    single_flight_enabled: bool = Field(
+        default=True,
+        description="Coalesce concurrent misses for the same key into one loader call"
+    )
+    
+    early_refresh_beta: float = Field(
+        default=1.0,
+        description="XFetch probabilistic early refresh factor (0 disables, >1 refreshes earlier)"
+    )
+    
+    stale_while_revalidate: timedelta = Field(
+        default=timedelta(seconds=0),
+        description="Window after expiry in which stale results are served while refreshing"
+    )
+    
     # Monitoring settings
     metrics_enabled: bool = Field(
         default=True,
@@ -222,7 +254,7 @@ class CacheConfig(BaseModel):
         description="Engine-specific cache settings"
     )
     
-    @validator('default_ttl')
+    @validator('default_ttl', 'stale_while_revalidate')
     def validate_ttl(cls, v):
         """Validate TTL value."""
         if isinstance(v, (int, float)):
@@ -255,6 +287,13 @@ class CacheConfig(BaseModel):
             raise ValueError("Value must be positive")
         return v
     
+    @validator('early_refresh_beta')
+    def validate_early_refresh_beta(cls, v):
+        """Validate early refresh factor."""
+        if v < 0:
+            raise ValueError("Early refresh beta must be non-negative")
+        return v
+    
     @validator('retry_attempts')
     def validate_retry_attempts(cls, v):
         """Validate retry attempts."""
@@ -327,6 +366,8 @@ class CacheConfig(BaseModel):
             return self.memcached_config
         elif backend == CacheBackend.MEMORY:
             return self.memory_config
+        elif backend == CacheBackend.HYBRID:
+            return self.hybrid_config
         else:
             return {}
     
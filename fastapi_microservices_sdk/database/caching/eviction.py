@@ -0,0 +1,553 @@
+"""
+Constant-time eviction policies for cache backends.
+
+This module provides the eviction engines used by the in-memory cache
+backend: an ordered-dict LRU, an O(1) frequency-bucket LFU, FIFO and a
+W-TinyLFU admission policy. Every operation on a policy is O(1) (amortized),
+so inserting into a full cache no longer sorts the whole key space.
+
+The same policy instances back the strategy classes in ``strategies.py``,
+so strategy metrics reflect the backend that actually evicts.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+from abc import ABC, abstractmethod
+from itertools import chain
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Iterator, Union
+
+from .config import CacheStrategy
+from .exceptions import CacheConfigurationError
+
+
+@dataclass
+class StrategyMetrics:
+    """Metrics for cache strategy performance."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    promotions: int = 0
+    demotions: int = 0
+    rejections: int = 0
+    total_operations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    @property
+    def eviction_rate(self) -> float:
+        """Calculate eviction rate."""
+        return self.evictions / self.total_operations if self.total_operations > 0 else 0.0
+
+
+class EvictionPolicy(ABC):
+    """
+    Abstract interface for O(1) eviction policies.
+
+    A policy tracks keys only; the owning backend stores the values. The
+    policy owns the capacity decision: ``insert`` returns the keys that the
+    backend must drop to stay within ``capacity``. A capacity of ``None``
+    disables count-based eviction (used by standalone strategies).
+    """
+
+    strategy: CacheStrategy = CacheStrategy.LRU
+
+    def __init__(self, capacity: Optional[int] = None):
+        if capacity is not None and capacity <= 0:
+            raise CacheConfigurationError(
+                "Eviction policy capacity must be positive",
+                config_key="max_size",
+                config_value=capacity
+            )
+        self.capacity = capacity
+        self.metrics = StrategyMetrics()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of tracked keys."""
+        pass
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        """Check if key is tracked."""
+        pass
+
+    @abstractmethod
+    def _touch(self, key: str) -> None:
+        """Update policy state for a hit on a tracked key."""
+        pass
+
+    @abstractmethod
+    def _add(self, key: str) -> List[str]:
+        """Track a new key, returning keys evicted to make room."""
+        pass
+
+    @abstractmethod
+    def _discard(self, key: str) -> bool:
+        """Stop tracking key. Returns True if it was tracked."""
+        pass
+
+    @abstractmethod
+    def iter_victims(self) -> Iterator[str]:
+        """
+        Iterate tracked keys in eviction order (next victim first).
+
+        Iterates the live structures without copying them, so the policy
+        must not be changed until the iteration is finished.
+        """
+        pass
+
+    def record_hit(self, key: str) -> None:
+        """Record a cache hit for key."""
+        if key in self:
+            self._touch(key)
+        self.metrics.hits += 1
+        self.metrics.total_operations += 1
+
+    def record_miss(self, key: str) -> None:
+        """Record a cache miss for key."""
+        self.metrics.misses += 1
+        self.metrics.total_operations += 1
+
+    def insert(self, key: str) -> List[str]:
+        """
+        Track an inserted key.
+
+        Re-inserting a tracked key counts as an access and never evicts.
+
+        Args:
+            key: Cache key that was stored
+
+        Returns:
+            Keys the caller must evict (may include ``key`` itself when the
+            policy rejects admission)
+        """
+        self.metrics.total_operations += 1
+        if key in self:
+            self._touch(key)
+            return []
+
+        evicted = self._add(key)
+        self.metrics.evictions += len(evicted)
+        return evicted
+
+    def remove(self, key: str) -> bool:
+        """Stop tracking a key removed by the caller (delete, expiry)."""
+        return self._discard(key)
+
+    def evict(self, exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Pop the next victim, for callers under non-count pressure (memory).
+
+        Args:
+            exclude: Key that must not be chosen, e.g. the one being stored
+        """
+        for key in self.iter_victims():
+            if key == exclude:
+                continue
+            self._discard(key)
+            self.metrics.evictions += 1
+            return key
+        return None
+
+    def victims(self, count: int) -> List[str]:
+        """Peek at the next ``count`` victims without evicting them."""
+        result = []
+        for key in self.iter_victims():
+            if len(result) >= count:
+                break
+            result.append(key)
+        return result
+
+    def clear(self) -> None:
+        """Forget all tracked keys (metrics are kept)."""
+        for key in list(self.iter_victims()):
+            self._discard(key)
+
+    def _is_full(self) -> bool:
+        """Check if adding one more key would exceed capacity."""
+        return self.capacity is not None and len(self) >= self.capacity
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get policy metrics."""
+        return {
+            'policy': self.strategy.value,
+            'capacity': self.capacity,
+            'size': len(self),
+            'hits': self.metrics.hits,
+            'misses': self.metrics.misses,
+            'evictions': self.metrics.evictions,
+            'promotions': self.metrics.promotions,
+            'demotions': self.metrics.demotions,
+            'rejections': self.metrics.rejections,
+            'total_operations': self.metrics.total_operations,
+            'hit_rate': self.metrics.hit_rate,
+            'eviction_rate': self.metrics.eviction_rate
+        }
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Least Recently Used policy backed by an ordered dict."""
+
+    strategy = CacheStrategy.LRU
+
+    def __init__(self, capacity: Optional[int] = None):
+        super().__init__(capacity)
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+    def _touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def _add(self, key: str) -> List[str]:
+        evicted = []
+        if self._is_full():
+            victim, _ = self._order.popitem(last=False)
+            evicted.append(victim)
+        self._order[key] = None
+        return evicted
+
+    def _discard(self, key: str) -> bool:
+        if key in self._order:
+            del self._order[key]
+            return True
+        return False
+
+    def evict(self, exclude: Optional[str] = None) -> Optional[str]:
+        if exclude is not None and exclude in self:
+            return super().evict(exclude)
+        if not self._order:
+            return None
+        victim, _ = self._order.popitem(last=False)
+        self.metrics.evictions += 1
+        return victim
+
+    def iter_victims(self) -> Iterator[str]:
+        return iter(self._order)
+
+
+class FIFOEvictionPolicy(LRUEvictionPolicy):
+    """First-In-First-Out policy (hits do not reorder keys)."""
+
+    strategy = CacheStrategy.FIFO
+
+    def _touch(self, key: str) -> None:
+        pass
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """
+    Least Frequently Used policy with O(1) frequency buckets.
+
+    Each frequency maps to an ordered dict of keys, so ties within the
+    lowest frequency are broken by recency (oldest first).
+    """
+
+    strategy = CacheStrategy.LFU
+
+    def __init__(self, capacity: Optional[int] = None):
+        super().__init__(capacity)
+        self._frequencies: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+
+    def __len__(self) -> int:
+        return len(self._frequencies)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._frequencies
+
+    def frequency(self, key: str) -> int:
+        """Get access frequency of a tracked key (0 if untracked)."""
+        return self._frequencies.get(key, 0)
+
+    def _touch(self, key: str) -> None:
+        freq = self._frequencies[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_frequency == freq:
+                self._min_frequency = freq + 1
+
+        self._frequencies[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def _add(self, key: str) -> List[str]:
+        evicted = []
+        if self._is_full():
+            victim = self._pop_min()
+            if victim is not None:
+                evicted.append(victim)
+
+        self._frequencies[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+        return evicted
+
+    def _pop_min(self) -> Optional[str]:
+        """Pop the oldest key of the lowest frequency bucket."""
+        bucket = self._buckets.get(self._min_frequency)
+        if not bucket:
+            if not self._buckets:
+                return None
+            # Buckets drained by removals; resync (rare, bounded by distinct frequencies)
+            self._min_frequency = min(self._buckets)
+            bucket = self._buckets[self._min_frequency]
+
+        victim, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_frequency]
+        del self._frequencies[victim]
+        return victim
+
+    def _discard(self, key: str) -> bool:
+        freq = self._frequencies.pop(key, None)
+        if freq is None:
+            return False
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+        return True
+
+    def evict(self, exclude: Optional[str] = None) -> Optional[str]:
+        if exclude is not None and exclude in self:
+            return super().evict(exclude)
+        victim = self._pop_min()
+        if victim is not None:
+            self.metrics.evictions += 1
+        return victim
+
+    def iter_victims(self) -> Iterator[str]:
+        for freq in sorted(self._buckets):
+            yield from self._buckets[freq]
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch with periodic aging, used as the TinyLFU frequency filter.
+
+    Counters saturate at 15 (4-bit semantics) and are halved every
+    ``sample_size`` increments so that old popularity fades out.
+    """
+
+    _MAX_COUNT = 15
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+
+    def __init__(self, capacity: int, depth: int = 4):
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self._mask = width - 1
+        self._depth = min(depth, len(self._SEEDS))
+        self._table = [bytearray(width) for _ in range(self._depth)]
+        self._sample_size = max(10 * capacity, 16)
+        self._additions = 0
+        self.resets = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [
+            (((h ^ seed) * 0x100000001B3) >> 16) & self._mask
+            for seed in self._SEEDS[:self._depth]
+        ]
+
+    def increment(self, key: str) -> None:
+        """Increment the estimated frequency of key."""
+        added = False
+        for row, index in zip(self._table, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+                added = True
+
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+    def estimate(self, key: str) -> int:
+        """Estimate the frequency of key."""
+        return min(row[index] for row, index in zip(self._table, self._indexes(key)))
+
+    def _reset(self) -> None:
+        """Halve all counters (aging)."""
+        for i, row in enumerate(self._table):
+            self._table[i] = bytearray(count >> 1 for count in row)
+        self._additions //= 2
+        self.resets += 1
+
+
+class TinyLFUEvictionPolicy(EvictionPolicy):
+    """
+    W-TinyLFU admission and eviction policy.
+
+    New keys enter a small LRU window. Keys leaving the window compete with
+    the victim of the main segmented LRU (probation + protected); the
+    candidate is only admitted if the frequency sketch estimates it is more
+    popular than the victim. This keeps one-hit wonders from flushing the
+    frequently used working set.
+    """
+
+    strategy = CacheStrategy.TINYLFU
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8
+    ):
+        super().__init__(capacity)
+        if capacity is None:
+            raise CacheConfigurationError(
+                "W-TinyLFU requires a bounded capacity",
+                config_key="max_size",
+                config_value=capacity
+            )
+
+        self._window_capacity = max(1, int(capacity * window_ratio))
+        self._main_capacity = max(0, capacity - self._window_capacity)
+        self._protected_capacity = int(self._main_capacity * protected_ratio)
+
+        self._window: "OrderedDict[str, None]" = OrderedDict()
+        self._probation: "OrderedDict[str, None]" = OrderedDict()
+        self._protected: "OrderedDict[str, None]" = OrderedDict()
+        self._sketch = CountMinSketch(capacity)
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._window or key in self._probation or key in self._protected
+
+    def record_miss(self, key: str) -> None:
+        self._sketch.increment(key)
+        super().record_miss(key)
+
+    def _touch(self, key: str) -> None:
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            self.metrics.promotions += 1
+
+            if len(self._protected) > self._protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+                self.metrics.demotions += 1
+        else:
+            self._protected.move_to_end(key)
+
+    def _add(self, key: str) -> List[str]:
+        self._sketch.increment(key)
+        self._window[key] = None
+
+        if len(self._window) <= self._window_capacity:
+            return []
+
+        candidate, _ = self._window.popitem(last=False)
+        if len(self._probation) + len(self._protected) < self._main_capacity:
+            self._probation[candidate] = None
+            return []
+
+        victim_segment = self._probation if self._probation else self._protected
+        if not victim_segment:
+            self.metrics.rejections += 1
+            return [candidate]
+
+        victim = next(iter(victim_segment))
+        if self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+            del victim_segment[victim]
+            self._probation[candidate] = None
+            return [victim]
+
+        self.metrics.rejections += 1
+        return [candidate]
+
+    def _discard(self, key: str) -> bool:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return True
+        return False
+
+    def evict(self, exclude: Optional[str] = None) -> Optional[str]:
+        if exclude is not None and exclude in self:
+            return super().evict(exclude)
+        for segment in (self._probation, self._window, self._protected):
+            if segment:
+                victim, _ = segment.popitem(last=False)
+                self.metrics.evictions += 1
+                return victim
+        return None
+
+    def iter_victims(self) -> Iterator[str]:
+        return chain(self._probation, self._window, self._protected)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = super().get_metrics()
+        metrics.update({
+            'window_size': len(self._window),
+            'probation_size': len(self._probation),
+            'protected_size': len(self._protected),
+            'sketch_resets': self._sketch.resets
+        })
+        return metrics
+
+
+def create_eviction_policy(
+    strategy: Union[CacheStrategy, str],
+    capacity: Optional[int] = None,
+    **kwargs
+) -> EvictionPolicy:
+    """
+    Factory function to create eviction policy instances.
+
+    TTL maps to FIFO (expired entries are removed by the backend; among live
+    entries the oldest goes first) and ADAPTIVE maps to W-TinyLFU, which
+    balances recency and frequency on its own.
+
+    Args:
+        strategy: Cache strategy (enum member or its value)
+        capacity: Maximum number of tracked keys (None for unbounded)
+        **kwargs: Policy-specific arguments
+
+    Returns:
+        Eviction policy instance
+
+    Raises:
+        CacheConfigurationError: If strategy is not supported
+    """
+    try:
+        strategy = CacheStrategy(strategy)
+    except ValueError:
+        raise CacheConfigurationError(
+            f"Unsupported eviction strategy: {strategy}",
+            config_key="strategy",
+            config_value=strategy
+        )
+
+    policy_map = {
+        CacheStrategy.LRU: LRUEvictionPolicy,
+        CacheStrategy.LFU: LFUEvictionPolicy,
+        CacheStrategy.FIFO: FIFOEvictionPolicy,
+        CacheStrategy.TTL: FIFOEvictionPolicy,
+        CacheStrategy.TINYLFU: TinyLFUEvictionPolicy,
+        CacheStrategy.ADAPTIVE: TinyLFUEvictionPolicy
+    }
+
+    return policy_map[strategy](capacity, **kwargs)
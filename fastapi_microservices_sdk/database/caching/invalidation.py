@@ -229,6 +229,15 @@ class InvalidationManager:
                     invalidated = await self.invalidate_by_tags(rule.tags, database_name)
                     total_invalidated += invalidated
             
+            # Drop matching keys in backends that can match patterns (e.g. near-cache L1s)
+            if database_name and database_name in self._backends:
+                target_backends = [self._backends[database_name]]
+            else:
+                target_backends = list(self._backends.values())
+            
+            for backend in target_backends:
+                total_invalidated += await backend.delete_by_pattern(pattern)
+            
             self.logger.info(f"Invalidated {total_invalidated} entries by pattern: {pattern}")
             return total_invalidated
         
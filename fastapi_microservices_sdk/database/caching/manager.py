@@ -13,14 +13,24 @@ import asyncio
 import hashlib
 import json
 import logging
+import math
+import random
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List, Union, Callable, Tuple
+from typing import Dict, Any, Optional, List, Union, Callable, Tuple, Awaitable
 from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
 
 from ..manager import DatabaseManager
 from .config import CacheConfig, CacheBackend, CacheStrategy, InvalidationPolicy
-from .backends import CacheBackendInterface, RedisCacheBackend, InMemoryCacheBackend, CacheEntry
+from .backends import (
+    CacheBackendInterface,
+    RedisCacheBackend,
+    InMemoryCacheBackend,
+    TieredCacheBackend,
+    CacheEntry
+)
+from .strategies import CacheStrategyInterface, create_strategy
 from .exceptions import (
     CacheError,
     CacheBackendError,
@@ -52,6 +62,10 @@ class CacheStats:
     miss_rate: float = 0.0
     average_get_time: float = 0.0
     average_set_time: float = 0.0
+    loads: int = 0
+    coalesced_requests: int = 0
+    early_refreshes: int = 0
+    stale_hits: int = 0
     
     def update_hit_rate(self) -> None:
         """Update hit and miss rates."""
@@ -77,10 +91,66 @@ class CacheStats:
             'hit_rate': self.hit_rate,
             'miss_rate': self.miss_rate,
             'average_get_time': self.average_get_time,
-            'average_set_time': self.average_set_time
+            'average_set_time': self.average_set_time,
+            'loads': self.loads,
+            'coalesced_requests': self.coalesced_requests,
+            'early_refreshes': self.early_refreshes,
+            'stale_hits': self.stale_hits
         }
 
 
+_ENVELOPE_MARKER = '__cache_envelope__'
+
+
+@dataclass
+class CachedResult:
+    """
+    Envelope stored by ``CacheManager.get_or_load``.
+    
+    The backend TTL covers the stale-while-revalidate window as well, so the
+    logical expiry and the time the loader took (``delta``) travel with the
+    value. Both are needed for XFetch probabilistic early expiration.
+    """
+    value: Any
+    expires_at: float
+    delta: float = 0.0
+    
+    def is_fresh(self, now: float) -> bool:
+        """Check if the result is within its logical TTL."""
+        return now < self.expires_at
+    
+    def should_refresh_early(self, now: float, beta: float) -> bool:
+        """
+        XFetch check: refresh with probability rising as expiry approaches.
+        
+        Expensive queries (large ``delta``) start refreshing earlier.
+        """
+        if beta <= 0 or self.delta <= 0:
+            return False
+        # 1 - random() is in (0, 1], so the log is always defined
+        return now - self.delta * beta * math.log(1.0 - random.random()) >= self.expires_at
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a serializer-friendly dictionary."""
+        return {
+            _ENVELOPE_MARKER: 1,
+            'value': self.value,
+            'expires_at': self.expires_at,
+            'delta': self.delta
+        }
+    
+    @classmethod
+    def from_stored(cls, stored: Any) -> Optional['CachedResult']:
+        """Rebuild envelope from a cached value (None if not an envelope)."""
+        if isinstance(stored, dict) and stored.get(_ENVELOPE_MARKER) == 1:
+            return cls(
+                value=stored.get('value'),
+                expires_at=float(stored.get('expires_at', 0.0)),
+                delta=float(stored.get('delta', 0.0))
+            )
+        return None
+
+
 class CacheManager:
     """
     Central cache management orchestrator.
@@ -96,6 +166,8 @@ class CacheManager:
         # Backend management
         self._backends: Dict[str, CacheBackendInterface] = {}
         self._default_backend: Optional[CacheBackendInterface] = None
+        # Strategies sharing state with the eviction policy of their backend
+        self._strategies: Dict[str, CacheStrategyInterface] = {}
         
         # Statistics and monitoring
         self._stats = CacheStats()
@@ -126,6 +198,9 @@ class CacheManager:
         # Cache warming
         self._warming_tasks: Dict[str, asyncio.Task] = {}
         
+        # In-flight loads by cache key (single-flight and background refresh)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
         self.logger.info("CacheManager initialized")
     
     async def initialize(self) -> None:
@@ -157,31 +232,49 @@ class CacheManager:
     async def _initialize_backends(self) -> None:
         """Initialize cache backends."""
         # Initialize default backend
-        if self.config.default_backend == CacheBackend.REDIS:
-            self._default_backend = RedisCacheBackend(self.config)
-        elif self.config.default_backend == CacheBackend.MEMORY:
-            self._default_backend = InMemoryCacheBackend(self.config)
-        else:
+        self._default_backend = self._create_backend(self.config.default_backend)
+        if self._default_backend is None:
             raise CacheConfigurationError(f"Unsupported default backend: {self.config.default_backend}")
         
         await self._default_backend.connect()
         self._backends['default'] = self._default_backend
+        self._bind_strategy('default', self._default_backend)
         
         # Initialize database-specific backends if configured
         for db_name in self.database_manager.list_databases():
             db_config = self.config.get_database_config(db_name)
             if 'backend' in db_config:
-                backend_type = CacheBackend(db_config['backend'])
-                
-                if backend_type == CacheBackend.REDIS:
-                    backend = RedisCacheBackend(self.config)
-                elif backend_type == CacheBackend.MEMORY:
-                    backend = InMemoryCacheBackend(self.config)
-                else:
+                backend = self._create_backend(db_config['backend'])
+                if backend is None:
                     continue
                 
                 await backend.connect()
                 self._backends[db_name] = backend
+                self._bind_strategy(db_name, backend)
+    
+    def _bind_strategy(self, name: str, backend: CacheBackendInterface) -> None:
+        """Create the strategy of a backend that evicts in-process, bound to its eviction policy."""
+        if getattr(backend, 'eviction_policy', None) is None:
+            return
+        self._strategies[name] = create_strategy(backend.eviction_strategy, self.config, backend=backend)
+    
+    def get_strategy(self, database_name: Optional[str] = None) -> Optional[CacheStrategyInterface]:
+        """Get the strategy bound to a database's backend (None if its backend evicts remotely)."""
+        if database_name and database_name in self._backends:
+            return self._strategies.get(database_name)
+        return self._strategies.get('default')
+    
+    def _create_backend(self, backend_type: Union[CacheBackend, str]) -> Optional[CacheBackendInterface]:
+        """Create backend instance for type (None if unsupported)."""
+        backend_type = CacheBackend(backend_type)
+        
+        if backend_type == CacheBackend.REDIS:
+            return RedisCacheBackend(self.config)
+        elif backend_type == CacheBackend.MEMORY:
+            return InMemoryCacheBackend(self.config)
+        elif backend_type == CacheBackend.HYBRID:
+            return TieredCacheBackend(self.config)
+        return None
     
     async def shutdown(self) -> None:
         """Shutdown cache manager and backends."""
@@ -200,6 +293,11 @@ class CacheManager:
                     pass
             self._warming_tasks.clear()
             
+            # Stop in-flight loads and refreshes
+            for task in list(self._inflight.values()):
+                task.cancel()
+            self._inflight.clear()
+            
             # Disconnect backends
             for backend in self._backends.values():
                 try:
@@ -208,6 +306,7 @@ class CacheManager:
                     self.logger.error(f"Error disconnecting backend: {e}")
             
             self._backends.clear()
+            self._strategies.clear()
             self._default_backend = None
             self._initialized = False
             
@@ -293,6 +392,16 @@ class CacheManager:
             # Get from cache
             entry = await backend.get(cache_key)
             
+            # Results stored by get_or_load are served here until their logical expiry
+            value = entry.value if entry else None
+            if entry:
+                cached = CachedResult.from_stored(value)
+                if cached is not None:
+                    if cached.is_fresh(time.time()):
+                        value = cached.value
+                    else:
+                        entry = None
+            
             # Update statistics
             if entry:
                 self._stats.hits += 1
@@ -301,11 +410,11 @@ class CacheManager:
                 # Execute hit callbacks
                 for callback in self._hit_callbacks:
                     try:
-                        await callback(cache_key, entry.value)
+                        await callback(cache_key, value)
                     except Exception as e:
                         self.logger.warning(f"Hit callback failed: {e}")
                 
-                return entry.value
+                return value
             else:
                 self._stats.misses += 1
                 self._database_stats[database_name].misses += 1
@@ -417,6 +526,169 @@ class CacheManager:
             if self._operation_times['set']:
                 self._stats.average_set_time = sum(self._operation_times['set']) / len(self._operation_times['set'])
     
+    async def get_or_load(
+        self,
+        database_name: str,
+        query: str,
+        loader: Callable[[], Awaitable[Any]],
+        parameters: Optional[Dict[str, Any]] = None,
+        table_name: Optional[str] = None,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Get cached query result, loading and caching it on a miss.
+        
+        Concurrent misses for the same key share a single loader call
+        (single-flight). Fresh hits may trigger a background refresh shortly
+        before expiry (XFetch), and results expired less than
+        ``stale_while_revalidate`` ago are returned immediately while a
+        background refresh runs.
+        
+        Args:
+            database_name: Name of the database
+            query: SQL query string
+            loader: Coroutine function executing the query
+            parameters: Query parameters
+            table_name: Table name for key generation
+            ttl: Time to live for cache entry
+            tags: Tags for invalidation
+            
+        Returns:
+            Cached or freshly loaded result
+        """
+        if not self.config.enabled:
+            return await loader()
+        
+        database_stats = self._get_database_stats(database_name)
+        
+        try:
+            cache_key = self._generate_cache_key(database_name, query, parameters, table_name)
+        except CacheKeyError as e:
+            self.logger.warning(f"Result not cacheable, loading directly: {e}")
+            return await loader()
+        
+        load_args = (database_name, query, loader, parameters, table_name, ttl, tags)
+        
+        try:
+            entry = await self._get_backend(database_name).get(cache_key)
+        except Exception as e:
+            self._stats.errors += 1
+            database_stats.errors += 1
+            self.logger.error(f"Cache get error: {e}")
+            entry = None
+        
+        if entry:
+            cached = CachedResult.from_stored(entry.value)
+            now = time.time()
+            
+            if cached is None:
+                self._record_hit(database_stats)
+                return entry.value
+            
+            if cached.is_fresh(now):
+                self._record_hit(database_stats)
+                if cached.should_refresh_early(now, self.config.early_refresh_beta):
+                    if self._schedule_load(cache_key, load_args)[1]:
+                        self._stats.early_refreshes += 1
+                        database_stats.early_refreshes += 1
+                return cached.value
+            
+            if now < cached.expires_at + self.config.stale_while_revalidate.total_seconds():
+                self._record_hit(database_stats)
+                self._stats.stale_hits += 1
+                database_stats.stale_hits += 1
+                self._schedule_load(cache_key, load_args)
+                return cached.value
+        
+        self._stats.misses += 1
+        database_stats.misses += 1
+        self._stats.update_hit_rate()
+        database_stats.update_hit_rate()
+        
+        if not self.config.single_flight_enabled:
+            return await self._load_and_store(*load_args)
+        
+        task, created = self._schedule_load(cache_key, load_args)
+        if not created:
+            self._stats.coalesced_requests += 1
+            database_stats.coalesced_requests += 1
+        
+        # Shield so a cancelled caller does not cancel the load other callers await
+        return await asyncio.shield(task)
+    
+    def _get_database_stats(self, database_name: str) -> CacheStats:
+        """Get statistics for database, creating them on first use."""
+        if database_name not in self._database_stats:
+            self._database_stats[database_name] = CacheStats()
+        return self._database_stats[database_name]
+    
+    def _record_hit(self, database_stats: CacheStats) -> None:
+        """Record a cache hit in global and database statistics."""
+        self._stats.hits += 1
+        database_stats.hits += 1
+        self._stats.update_hit_rate()
+        database_stats.update_hit_rate()
+    
+    def _schedule_load(self, cache_key: str, load_args: Tuple) -> Tuple[asyncio.Task, bool]:
+        """
+        Get the in-flight load for key, starting one if none is running.
+        
+        Returns:
+            Tuple of (task, created)
+        """
+        task = self._inflight.get(cache_key)
+        if task is not None and not task.done():
+            return task, False
+        
+        task = asyncio.create_task(self._load_and_store(*load_args))
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda t: self._on_load_done(cache_key, t))
+        return task, True
+    
+    def _on_load_done(self, cache_key: str, task: asyncio.Task) -> None:
+        """Forget a finished load and surface errors of unawaited refreshes."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(f"Cache load failed for {cache_key}: {task.exception()}")
+    
+    async def _load_and_store(
+        self,
+        database_name: str,
+        query: str,
+        loader: Callable[[], Awaitable[Any]],
+        parameters: Optional[Dict[str, Any]],
+        table_name: Optional[str],
+        ttl: Optional[timedelta],
+        tags: Optional[List[str]]
+    ) -> Any:
+        """Run loader and cache its result in an expiry envelope."""
+        start_time = time.perf_counter()
+        value = await loader()
+        delta = time.perf_counter() - start_time
+        
+        self._stats.loads += 1
+        self._get_database_stats(database_name).loads += 1
+        
+        if ttl is None:
+            ttl = self.config.get_ttl_for_query_type(self._extract_query_type(query))
+        
+        envelope = CachedResult(value=value, expires_at=time.time() + ttl.total_seconds(), delta=delta)
+        
+        # Keep the entry past its logical expiry so it can be served stale
+        await self.set(
+            database_name,
+            query,
+            envelope.to_dict(),
+            parameters=parameters,
+            table_name=table_name,
+            ttl=ttl + self.config.stale_while_revalidate,
+            tags=tags
+        )
+        return value
+    
     async def delete(
         self,
         database_name: str,
@@ -579,11 +851,31 @@ class CacheManager:
         if database_name:
             backend = self._get_backend(database_name)
             backend_stats = await backend.get_stats()
+            
+            # Byte usage as accounted by backends that track it per database
+            if database_name in backend_stats.get('memory_by_database', {}):
+                stats['total_size_bytes'] = backend_stats['memory_by_database'][database_name]
         else:
             for name, backend in self._backends.items():
                 backend_stats[name] = await backend.get_stats()
+            
+            stats['total_size_bytes'] = sum(
+                b.get('memory_usage_bytes', 0) for b in backend_stats.values()
+            )
+            stats['entry_count'] = sum(
+                b.get('total_entries', 0) for b in backend_stats.values()
+            )
         
         stats['backend_stats'] = backend_stats
+        
+        # Metrics of the eviction policies that actually evict
+        if database_name:
+            strategy = self.get_strategy(database_name)
+            stats['strategy_stats'] = await strategy.get_metrics() if strategy else {}
+        else:
+            stats['strategy_stats'] = {
+                name: await strategy.get_metrics() for name, strategy in self._strategies.items()
+            }
         return stats
     
     def add_hit_callback(self, callback: Callable) -> None:
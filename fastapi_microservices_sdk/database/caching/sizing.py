@@ -0,0 +1,201 @@
+"""
+Size estimation for cache entries.
+
+This module provides pluggable estimators used by the in-memory backend to
+account for the memory held by cached values. ``sys.getsizeof`` only
+measures the outer container, so a list of row dicts reports a few hundred
+bytes regardless of its content; the estimators here measure what the
+cache actually holds.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Set, Union
+
+from .config import CacheConfig, SerializationFormat
+from .exceptions import CacheConfigurationError
+from .serializers import SerializerInterface, create_serializer
+
+
+class SizeEstimatorInterface(ABC):
+    """Abstract interface for cache entry size estimators."""
+
+    @abstractmethod
+    def estimate(self, value: Any) -> int:
+        """Estimate memory used by value in bytes."""
+        pass
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Get estimator name."""
+        pass
+
+
+class ShallowSizeEstimator(SizeEstimatorInterface):
+    """Legacy estimator using ``sys.getsizeof`` (outer object only)."""
+
+    def estimate(self, value: Any) -> int:
+        return sys.getsizeof(value)
+
+    @property
+    def name(self) -> str:
+        return "shallow"
+
+
+class SerializedSizeEstimator(SizeEstimatorInterface):
+    """Estimate size as the length of the value's serialized form."""
+
+    def __init__(self, serializer: SerializerInterface):
+        self.serializer = serializer
+
+    def estimate(self, value: Any) -> int:
+        try:
+            return len(self.serializer.serialize(value))
+        except Exception:
+            # Values the serializer cannot handle are still cacheable in memory
+            return DeepSizeEstimator().estimate(value)
+
+    @property
+    def name(self) -> str:
+        return f"serialized_{self.serializer.format_name}"
+
+
+class DeepSizeEstimator(SizeEstimatorInterface):
+    """
+    Recursive size estimator with sampling for large containers.
+
+    Containers with more than ``sample_size`` items are measured on an evenly
+    spaced sample of their items and extrapolated, which keeps the cost of
+    sizing a 10k-row result set bounded. Shared objects are counted once.
+    """
+
+    _ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+    def __init__(self, sample_size: int = 32, max_depth: int = 8):
+        if sample_size <= 0:
+            raise CacheConfigurationError(
+                "Size estimator sample size must be positive",
+                config_key="size_sample_size",
+                config_value=sample_size
+            )
+        self.sample_size = sample_size
+        self.max_depth = max_depth
+
+    def estimate(self, value: Any) -> int:
+        return self._sizeof(value, set(), 0)
+
+    def _sizeof(self, value: Any, seen: Set[int], depth: int) -> int:
+        if isinstance(value, self._ATOMIC_TYPES):
+            return sys.getsizeof(value)
+
+        value_id = id(value)
+        if value_id in seen:
+            return 0
+        seen.add(value_id)
+
+        size = sys.getsizeof(value)
+        if depth >= self.max_depth:
+            return size
+
+        if isinstance(value, dict):
+            size += self._sized_items(list(value.items()), seen, depth, pairs=True)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            items = value if isinstance(value, (list, tuple)) else list(value)
+            size += self._sized_items(items, seen, depth)
+        elif hasattr(value, '__dict__'):
+            size += self._sizeof(vars(value), seen, depth + 1)
+        elif hasattr(value, '__slots__'):
+            size += sum(
+                self._sizeof(getattr(value, slot), seen, depth + 1)
+                for slot in value.__slots__
+                if hasattr(value, slot)
+            )
+
+        return size
+
+    def _sized_items(self, items, seen: Set[int], depth: int, pairs: bool = False) -> int:
+        count = len(items)
+        if count == 0:
+            return 0
+
+        if count <= self.sample_size:
+            sample = items
+        else:
+            step = count / self.sample_size
+            sample = [items[int(i * step)] for i in range(self.sample_size)]
+
+        if pairs:
+            sampled = sum(
+                self._sizeof(k, seen, depth + 1) + self._sizeof(v, seen, depth + 1)
+                for k, v in sample
+            )
+        else:
+            sampled = sum(self._sizeof(item, seen, depth + 1) for item in sample)
+
+        return int(sampled * count / len(sample))
+
+    @property
+    def name(self) -> str:
+        return "deep"
+
+
+class CallableSizeEstimator(SizeEstimatorInterface):
+    """Adapter for a user-supplied ``value -> bytes`` function."""
+
+    def __init__(self, sizer: Callable[[Any], int]):
+        self.sizer = sizer
+
+    def estimate(self, value: Any) -> int:
+        return int(self.sizer(value))
+
+    @property
+    def name(self) -> str:
+        return getattr(self.sizer, '__name__', 'custom')
+
+
+def create_size_estimator(
+    estimator: Union[str, Callable[[Any], int], SizeEstimatorInterface, None],
+    config: CacheConfig,
+    sample_size: int = 32
+) -> SizeEstimatorInterface:
+    """
+    Factory function to create size estimators.
+
+    Args:
+        estimator: ``"deep"``, ``"serialized"``, ``"shallow"``, an estimator
+            instance or a callable returning the size in bytes
+        config: Cache configuration (serializer settings for ``"serialized"``)
+        sample_size: Items sampled per container by the deep estimator
+
+    Returns:
+        Size estimator instance
+
+    Raises:
+        CacheConfigurationError: If estimator is not supported
+    """
+    if isinstance(estimator, SizeEstimatorInterface):
+        return estimator
+    if callable(estimator):
+        return CallableSizeEstimator(estimator)
+
+    if estimator in (None, "deep"):
+        return DeepSizeEstimator(sample_size=sample_size)
+    if estimator == "shallow":
+        return ShallowSizeEstimator()
+    if estimator == "serialized":
+        serializer = create_serializer(
+            SerializationFormat(config.serialization_format),
+            compression_enabled=config.compression_enabled,
+            compression_threshold=config.compression_threshold
+        )
+        return SerializedSizeEstimator(serializer)
+
+    raise CacheConfigurationError(
+        f"Unsupported size estimator: {estimator}",
+        config_key="size_estimator",
+        config_value=estimator
+    )
@@ -11,44 +11,87 @@ Version: 1.0.0
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from dataclasses import dataclass, field
 from collections import OrderedDict, defaultdict
 import heapq
 
 from .config import CacheConfig, CacheStrategy
 from .backends import CacheEntry
+from .eviction import (
+    StrategyMetrics,
+    EvictionPolicy,
+    LRUEvictionPolicy,
+    LFUEvictionPolicy,
+    FIFOEvictionPolicy,
+    TinyLFUEvictionPolicy
+)
 from .exceptions import CacheError
 
 
-@dataclass
-class StrategyMetrics:
-    """Metrics for cache strategy performance."""
-    hits: int = 0
-    misses: int = 0
-    evictions: int = 0
-    promotions: int = 0
-    demotions: int = 0
-    total_operations: int = 0
-    
-    @property
-    def hit_rate(self) -> float:
-        """Calculate hit rate."""
-        total = self.hits + self.misses
-        return self.hits / total if total > 0 else 0.0
-    
-    @property
-    def eviction_rate(self) -> float:
-        """Calculate eviction rate."""
-        return self.evictions / self.total_operations if self.total_operations > 0 else 0.0
-
-
 class CacheStrategyInterface(ABC):
     """Abstract interface for cache strategies."""
     
+    # Eviction policy type this strategy can share state with (None if it cannot)
+    policy_strategy: Optional[CacheStrategy] = None
+    
     def __init__(self, config: CacheConfig):
         self.config = config
         self.metrics = StrategyMetrics()
+        self._policy: Optional[EvictionPolicy] = None
+        self._bound = False
+    
+    def bind_policy(self, policy: EvictionPolicy) -> None:
+        """
+        Share state with the eviction policy of a backend.
+        
+        Once bound, the backend drives the policy and the strategy reports the
+        backend's real hits, misses and evictions; the on_* hooks stop
+        tracking state on their own.
+        
+        Args:
+            policy: Eviction policy owned by the backend
+        """
+        if self.policy_strategy is None or policy.strategy != self.policy_strategy:
+            raise CacheError(
+                f"{self.__class__.__name__} cannot share state with "
+                f"{policy.strategy.value} eviction policy"
+            )
+        self._policy = policy
+        self.metrics = policy.metrics
+        self._bound = True
+    
+    @property
+    def is_bound(self) -> bool:
+        """Check if strategy shares state with a backend eviction policy."""
+        return self._bound
+    
+    def _policy_candidates(
+        self,
+        entries: Dict[str, CacheEntry],
+        count: int,
+        fallback_key: Callable[[Tuple[str, CacheEntry]], Any]
+    ) -> List[str]:
+        """Take victims in policy order, sorting only keys the policy does not track."""
+        eviction_keys = []
+        for key in self._policy.iter_victims():
+            if len(eviction_keys) >= count:
+                break
+            if key in entries:
+                eviction_keys.append(key)
+        
+        if len(eviction_keys) < count:
+            untracked = sorted(
+                ((k, v) for k, v in entries.items() if k not in self._policy),
+                key=fallback_key
+            )
+            eviction_keys.extend(k for k, _ in untracked[:count - len(eviction_keys)])
+        
+        if not self._bound:
+            # Bound policies count evictions when the backend actually evicts
+            self.metrics.evictions += len(eviction_keys)
+        
+        return eviction_keys
     
     @abstractmethod
     async def should_evict(self, current_size: int, max_size: int) -> bool:
@@ -97,9 +140,12 @@ class CacheStrategyInterface(ABC):
 class LRUStrategy(CacheStrategyInterface):
     """Least Recently Used cache strategy."""
     
+    policy_strategy = CacheStrategy.LRU
+    
     def __init__(self, config: CacheConfig):
         super().__init__(config)
-        self._access_order: OrderedDict[str, float] = OrderedDict()
+        self._policy = LRUEvictionPolicy()
+        self.metrics = self._policy.metrics
     
     async def should_evict(self, current_size: int, max_size: int) -> bool:
         """Check if eviction is needed."""
@@ -111,42 +157,37 @@ class LRUStrategy(CacheStrategyInterface):
         count: int
     ) -> List[str]:
         """Select least recently used entries for eviction."""
-        # Sort by last access time (oldest first)
-        candidates = sorted(
-            entries.items(),
-            key=lambda x: x[1].last_accessed or x[1].created_at
+        return self._policy_candidates(
+            entries,
+            count,
+            lambda x: x[1].last_accessed or x[1].created_at
         )
-        
-        eviction_keys = [key for key, _ in candidates[:count]]
-        self.metrics.evictions += len(eviction_keys)
-        
-        return eviction_keys
     
     async def on_access(self, key: str, entry: CacheEntry) -> None:
         """Update access order on cache hit."""
-        self._access_order[key] = time.time()
-        self._access_order.move_to_end(key)
-        self.metrics.hits += 1
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.record_hit(key)
     
     async def on_insert(self, key: str, entry: CacheEntry) -> None:
         """Track new entry insertion."""
-        self._access_order[key] = time.time()
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.insert(key)
     
     async def on_evict(self, key: str, entry: CacheEntry) -> None:
         """Clean up evicted entry."""
-        self._access_order.pop(key, None)
+        if not self._bound:
+            self._policy.remove(key)
 
 
 class LFUStrategy(CacheStrategyInterface):
     """Least Frequently Used cache strategy."""
     
+    policy_strategy = CacheStrategy.LFU
+    
     def __init__(self, config: CacheConfig):
         super().__init__(config)
-        self._frequency_counter: Dict[str, int] = defaultdict(int)
-        self._frequency_buckets: Dict[int, set] = defaultdict(set)
-        self._min_frequency = 0
+        self._policy = LFUEvictionPolicy()
+        self.metrics = self._policy.metrics
     
     async def should_evict(self, current_size: int, max_size: int) -> bool:
         """Check if eviction is needed."""
@@ -158,59 +199,38 @@ class LFUStrategy(CacheStrategyInterface):
         count: int
     ) -> List[str]:
         """Select least frequently used entries for eviction."""
-        eviction_keys = []
-        
-        # Start from minimum frequency and work up
-        current_freq = self._min_frequency
-        
-        while len(eviction_keys) < count and current_freq in self._frequency_buckets:
-            bucket = self._frequency_buckets[current_freq]
-            
-            # Take keys from current frequency bucket
-            keys_needed = count - len(eviction_keys)
-            keys_from_bucket = list(bucket)[:keys_needed]
-            eviction_keys.extend(keys_from_bucket)
-            
-            current_freq += 1
-        
-        self.metrics.evictions += len(eviction_keys)
-        return eviction_keys
+        return self._policy_candidates(
+            entries,
+            count,
+            lambda x: (x[1].access_count, x[1].last_accessed or x[1].created_at)
+        )
     
     async def on_access(self, key: str, entry: CacheEntry) -> None:
         """Update frequency on cache hit."""
-        old_freq = self._frequency_counter[key]
-        new_freq = old_freq + 1
-        
-        # Update frequency counter
-        self._frequency_counter[key] = new_freq
-        
-        # Move from old bucket to new bucket
-        if old_freq > 0:
-            self._frequency_buckets[old_freq].discard(key)
-            if not self._frequency_buckets[old_freq] and old_freq == self._min_frequency:
-                self._min_frequency += 1
-        
-        self._frequency_buckets[new_freq].add(key)
-        
-        self.metrics.hits += 1
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.record_hit(key)
     
     async def on_insert(self, key: str, entry: CacheEntry) -> None:
         """Track new entry insertion."""
-        self._frequency_counter[key] = 1
-        self._frequency_buckets[1].add(key)
-        self._min_frequency = 1
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.insert(key)
     
     async def on_evict(self, key: str, entry: CacheEntry) -> None:
         """Clean up evicted entry."""
-        freq = self._frequency_counter.pop(key, 0)
-        if freq > 0:
-            self._frequency_buckets[freq].discard(key)
+        if not self._bound:
+            self._policy.remove(key)
 
 
 class TTLStrategy(CacheStrategyInterface):
-    """Time-To-Live based cache strategy."""
+    """
+    Time-To-Live based cache strategy.
+    
+    Backends evict TTL caches with a FIFO policy (expired entries are
+    removed on access and by the cleanup loop), so a bound strategy takes
+    live victims in the policy's insertion order.
+    """
+    
+    policy_strategy = CacheStrategy.FIFO
     
     def __init__(self, config: CacheConfig):
         super().__init__(config)
@@ -240,11 +260,18 @@ class TTLStrategy(CacheStrategyInterface):
         # If we need more evictions, select oldest entries
         if len(eviction_keys) < count:
             remaining_count = count - len(eviction_keys)
+            expired = set(expired_keys)
             non_expired = {
                 k: v for k, v in entries.items() 
-                if k not in expired_keys
+                if k not in expired
             }
             
+            if self._bound:
+                eviction_keys.extend(
+                    self._policy_candidates(non_expired, remaining_count, lambda x: x[1].created_at)
+                )
+                return eviction_keys
+            
             oldest_entries = sorted(
                 non_expired.items(),
                 key=lambda x: x[1].created_at
@@ -253,13 +280,15 @@ class TTLStrategy(CacheStrategyInterface):
             oldest_keys = [key for key, _ in oldest_entries[:remaining_count]]
             eviction_keys.extend(oldest_keys)
         
-        self.metrics.evictions += len(eviction_keys)
+        if not self._bound:
+            self.metrics.evictions += len(eviction_keys)
         return eviction_keys
     
     async def on_access(self, key: str, entry: CacheEntry) -> None:
         """Handle cache access."""
-        self.metrics.hits += 1
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self.metrics.hits += 1
+            self.metrics.total_operations += 1
     
     async def on_insert(self, key: str, entry: CacheEntry) -> None:
         """Track new entry with expiration."""
@@ -267,7 +296,8 @@ class TTLStrategy(CacheStrategyInterface):
             expiration_timestamp = entry.expires_at.timestamp()
             heapq.heappush(self._expiration_heap, (expiration_timestamp, key))
         
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self.metrics.total_operations += 1
     
     async def on_evict(self, key: str, entry: CacheEntry) -> None:
         """Clean up evicted entry."""
@@ -289,7 +319,15 @@ class TTLStrategy(CacheStrategyInterface):
 
 
 class AdaptiveStrategy(CacheStrategyInterface):
-    """Adaptive cache strategy that switches between LRU and LFU based on workload."""
+    """
+    Adaptive cache strategy that switches between LRU and LFU based on workload.
+    
+    Backends evict adaptive caches with W-TinyLFU, which balances recency
+    and frequency on its own; a bound strategy follows that policy instead
+    of switching between its LRU and LFU models.
+    """
+    
+    policy_strategy = CacheStrategy.TINYLFU
     
     def __init__(self, config: CacheConfig):
         super().__init__(config)
@@ -313,13 +351,17 @@ class AdaptiveStrategy(CacheStrategyInterface):
         entries: Dict[str, CacheEntry], 
         count: int
     ) -> List[str]:
-        """Delegate to current strategy."""
+        """Delegate to current strategy (or the bound W-TinyLFU policy)."""
+        if self._bound:
+            return self._policy_candidates(entries, count, lambda x: x[1].last_accessed or x[1].created_at)
         candidates = await self._current_strategy.select_eviction_candidates(entries, count)
         await self._evaluate_and_adapt()
         return candidates
     
     async def on_access(self, key: str, entry: CacheEntry) -> None:
         """Handle access with both strategies for comparison."""
+        if self._bound:
+            return
         await self._current_strategy.on_access(key, entry)
         
         # Also update the non-active strategy for comparison
@@ -332,6 +374,8 @@ class AdaptiveStrategy(CacheStrategyInterface):
     
     async def on_insert(self, key: str, entry: CacheEntry) -> None:
         """Handle insertion with both strategies."""
+        if self._bound:
+            return
         await self._lru_strategy.on_insert(key, entry)
         await self._lfu_strategy.on_insert(key, entry)
         self._operation_count += 1
@@ -339,6 +383,8 @@ class AdaptiveStrategy(CacheStrategyInterface):
     
     async def on_evict(self, key: str, entry: CacheEntry) -> None:
         """Handle eviction with both strategies."""
+        if self._bound:
+            return
         await self._lru_strategy.on_evict(key, entry)
         await self._lfu_strategy.on_evict(key, entry)
     
@@ -380,6 +426,9 @@ class AdaptiveStrategy(CacheStrategyInterface):
     async def get_metrics(self) -> Dict[str, Any]:
         """Get adaptive strategy metrics."""
         base_metrics = await super().get_metrics()
+        if self._bound:
+            base_metrics['current_strategy'] = 'TinyLFU'
+            return base_metrics
         
         lru_metrics = await self._lru_strategy.get_metrics()
         lfu_metrics = await self._lfu_strategy.get_metrics()
@@ -398,9 +447,12 @@ class AdaptiveStrategy(CacheStrategyInterface):
 class FIFOStrategy(CacheStrategyInterface):
     """First-In-First-Out cache strategy."""
     
+    policy_strategy = CacheStrategy.FIFO
+    
     def __init__(self, config: CacheConfig):
         super().__init__(config)
-        self._insertion_order: OrderedDict[str, float] = OrderedDict()
+        self._policy = FIFOEvictionPolicy()
+        self.metrics = self._policy.metrics
     
     async def should_evict(self, current_size: int, max_size: int) -> bool:
         """Check if eviction is needed."""
@@ -412,56 +464,118 @@ class FIFOStrategy(CacheStrategyInterface):
         count: int
     ) -> List[str]:
         """Select oldest entries for eviction."""
-        # Sort by creation time (oldest first)
-        candidates = sorted(
-            entries.items(),
-            key=lambda x: x[1].created_at
-        )
-        
-        eviction_keys = [key for key, _ in candidates[:count]]
-        self.metrics.evictions += len(eviction_keys)
-        
-        return eviction_keys
+        return self._policy_candidates(entries, count, lambda x: x[1].created_at)
     
     async def on_access(self, key: str, entry: CacheEntry) -> None:
         """Handle cache access (no reordering in FIFO)."""
-        self.metrics.hits += 1
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.record_hit(key)
     
     async def on_insert(self, key: str, entry: CacheEntry) -> None:
         """Track insertion order."""
-        self._insertion_order[key] = time.time()
-        self.metrics.total_operations += 1
+        if not self._bound:
+            self._policy.insert(key)
     
     async def on_evict(self, key: str, entry: CacheEntry) -> None:
         """Clean up evicted entry."""
-        self._insertion_order.pop(key, None)
+        if not self._bound:
+            self._policy.remove(key)
 
 
-def create_strategy(strategy_type: CacheStrategy, config: CacheConfig) -> CacheStrategyInterface:
+class TinyLFUStrategy(CacheStrategyInterface):
+    """
+    W-TinyLFU cache strategy.
+    
+    Unbound instances size their policy from ``memory_config['max_size']``;
+    keys rejected by admission are returned first as eviction candidates.
+    """
+    
+    policy_strategy = CacheStrategy.TINYLFU
+    
+    def __init__(self, config: CacheConfig):
+        super().__init__(config)
+        self._policy = TinyLFUEvictionPolicy(config.memory_config.get("max_size", 1000))
+        self.metrics = self._policy.metrics
+        self._rejected: List[str] = []
+    
+    async def should_evict(self, current_size: int, max_size: int) -> bool:
+        """Check if eviction is needed."""
+        return current_size >= max_size or bool(self._rejected)
+    
+    async def select_eviction_candidates(
+        self, 
+        entries: Dict[str, CacheEntry], 
+        count: int
+    ) -> List[str]:
+        """Select entries rejected by admission, then probation victims."""
+        rejected = [key for key in self._rejected if key in entries][:count]
+        self._rejected = self._rejected[len(rejected):]
+        
+        remaining = {k: v for k, v in entries.items() if k not in rejected}
+        return rejected + self._policy_candidates(
+            remaining,
+            count - len(rejected),
+            lambda x: x[1].last_accessed or x[1].created_at
+        )
+    
+    async def on_access(self, key: str, entry: CacheEntry) -> None:
+        """Update frequency sketch and segments on cache hit."""
+        if not self._bound:
+            self._policy.record_hit(key)
+    
+    async def on_insert(self, key: str, entry: CacheEntry) -> None:
+        """Run admission for the new entry."""
+        if not self._bound:
+            self._rejected.extend(self._policy.insert(key))
+    
+    async def on_evict(self, key: str, entry: CacheEntry) -> None:
+        """Clean up evicted entry."""
+        if not self._bound:
+            self._policy.remove(key)
+
+
+def create_strategy(
+    strategy_type: CacheStrategy,
+    config: CacheConfig,
+    backend: Optional[Any] = None
+) -> CacheStrategyInterface:
     """
     Factory function to create cache strategy instances.
     
     Args:
         strategy_type: Type of strategy to create
         config: Cache configuration
+        backend: Backend whose eviction policy the strategy should share
+            (e.g. ``InMemoryCacheBackend``), so metrics come from real evictions
         
     Returns:
         Strategy instance
         
     Raises:
-        CacheError: If strategy type is not supported
+        CacheError: If strategy type is not supported or cannot be bound
     """
     strategy_map = {
         CacheStrategy.LRU: LRUStrategy,
         CacheStrategy.LFU: LFUStrategy,
         CacheStrategy.TTL: TTLStrategy,
         CacheStrategy.ADAPTIVE: AdaptiveStrategy,
-        CacheStrategy.FIFO: FIFOStrategy
+        CacheStrategy.FIFO: FIFOStrategy,
+        CacheStrategy.TINYLFU: TinyLFUStrategy
     }
     
+    try:
+        strategy_type = CacheStrategy(strategy_type)
+    except ValueError:
+        raise CacheError(f"Unsupported cache strategy: {strategy_type}")
+    
     strategy_class = strategy_map.get(strategy_type)
     if not strategy_class:
         raise CacheError(f"Unsupported cache strategy: {strategy_type}")
     
-    return strategy_class(config)
\ No newline at end of file
+    strategy = strategy_class(config)
+    
+    policy = getattr(backend, 'eviction_policy', None)
+    if policy is not None:
+        strategy.bind_policy(policy)
+    
+    return strategy
\ No newline at end of file
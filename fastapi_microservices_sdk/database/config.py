@@ -144,6 +144,55 @@ class SSLConfig(BaseModel):
         return context
 
 
+class ConnectionPoolConfig(BaseModel):
+    """Connection pool configuration."""
+    
+    # Pool sizing
+    min_connections: int = Field(default=1, ge=0)
+    max_connections: int = Field(default=10, ge=1)
+    
+    # Pool strategy
+    strategy: ConnectionPoolStrategy = ConnectionPoolStrategy.DYNAMIC
+    
+    # Connection lifecycle
+    connection_timeout: float = Field(default=30.0, gt=0)
+    acquire_timeout: float = Field(default=30.0, gt=0)  # Wait for a free connection
+    idle_timeout: float = Field(default=300.0, gt=0)  # 5 minutes
+    max_lifetime: float = Field(default=3600.0, gt=0)  # 1 hour
+    
+    # Pool behavior
+    retry_attempts: int = Field(default=3, ge=0)
+    retry_delay: float = Field(default=1.0, ge=0)
+    
+    # Load balancing
+    load_balancing_strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN
+    
+    # Health checking
+    health_check_enabled: bool = True
+    health_check_interval: float = Field(default=30.0, gt=0)
+    
+    # Adaptive pool settings (for ADAPTIVE strategy)
+    scale_up_threshold: float = Field(default=0.8, ge=0, le=1)  # 80% utilization
+    scale_down_threshold: float = Field(default=0.2, ge=0, le=1)  # 20% utilization
+    scale_factor: float = Field(default=1.5, gt=1)  # 50% increase/decrease
+    
+    @validator('max_connections')
+    def validate_max_connections(cls, v, values):
+        """Ensure max_connections >= min_connections."""
+        min_conn = values.get('min_connections', 1)
+        if v < min_conn:
+            raise ValueError("max_connections must be >= min_connections")
+        return v
+    
+    @validator('scale_down_threshold')
+    def validate_scale_thresholds(cls, v, values):
+        """Ensure scale_down_threshold < scale_up_threshold."""
+        scale_up = values.get('scale_up_threshold', 0.8)
+        if v >= scale_up:
+            raise ValueError("scale_down_threshold must be < scale_up_threshold")
+        return v
+
+
 class DatabaseConnectionConfig(BaseModel):
     """Configuration for individual database connection."""
     
@@ -172,6 +221,13 @@ class DatabaseConnectionConfig(BaseModel):
     connection_timeout: float = 30.0
     command_timeout: float = 30.0
     
+    # Connection pooling
+    pool: ConnectionPoolConfig = Field(default_factory=ConnectionPoolConfig)
+    
+    # Query compilation caches (SQL engines)
+    query_template_cache_size: int = Field(default=1024, ge=0)
+    prepared_statement_cache_size: int = Field(default=256, ge=0)  # Per connection (PostgreSQL)
+    
     # Health check configuration
     health_check_interval: float = 30.0
     health_check_timeout: float = 5.0
@@ -227,54 +283,6 @@ class DatabaseConnectionConfig(BaseModel):
         return url
 
 
-class ConnectionPoolConfig(BaseModel):
-    """Connection pool configuration."""
-    
-    # Pool sizing
-    min_connections: int = Field(default=1, ge=0)
-    max_connections: int = Field(default=10, ge=1)
-    
-    # Pool strategy
-    strategy: ConnectionPoolStrategy = ConnectionPoolStrategy.DYNAMIC
-    
-    # Connection lifecycle
-    connection_timeout: float = Field(default=30.0, gt=0)
-    idle_timeout: float = Field(default=300.0, gt=0)  # 5 minutes
-    max_lifetime: float = Field(default=3600.0, gt=0)  # 1 hour
-    
-    # Pool behavior
-    retry_attempts: int = Field(default=3, ge=0)
-    retry_delay: float = Field(default=1.0, ge=0)
-    
-    # Load balancing
-    load_balancing_strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN
-    
-    # Health checking
-    health_check_enabled: bool = True
-    health_check_interval: float = Field(default=30.0, gt=0)
-    
-    # Adaptive pool settings (for ADAPTIVE strategy)
-    scale_up_threshold: float = Field(default=0.8, ge=0, le=1)  # 80% utilization
-    scale_down_threshold: float = Field(default=0.2, ge=0, le=1)  # 20% utilization
-    scale_factor: float = Field(default=1.5, gt=1)  # 50% increase/decrease
-    
-    @validator('max_connections')
-    def validate_max_connections(cls, v, values):
-        """Ensure max_connections >= min_connections."""
-        min_conn = values.get('min_connections', 1)
-        if v < min_conn:
-            raise ValueError("max_connections must be >= min_connections")
-        return v
-    
-    @validator('scale_down_threshold')
-    def validate_scale_thresholds(cls, v, values):
-        """Ensure scale_down_threshold < scale_up_threshold."""
-        scale_up = values.get('scale_up_threshold', 0.8)
-        if v >= scale_up:
-            raise ValueError("scale_down_threshold must be < scale_up_threshold")
-        return v
-
-
 class MigrationConfig(BaseModel):
     """Migration system configuration."""
     
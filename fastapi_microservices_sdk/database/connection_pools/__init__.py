@@ -1 +1,20 @@
-# fastapi-microservices-sdk/fastapi_microservices_sdk/database/connection_pools/__init__.py 
+"""
+Connection pooling for FastAPI Microservices SDK databases.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+from .pool_manager import (
+    ConnectionPool,
+    PoolMetrics,
+    LatencyHistogram,
+    DEFAULT_LATENCY_BUCKETS
+)
+
+__all__ = [
+    'ConnectionPool',
+    'PoolMetrics',
+    'LatencyHistogram',
+    'DEFAULT_LATENCY_BUCKETS'
+]
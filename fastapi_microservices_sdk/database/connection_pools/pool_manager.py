@@ -1 +1,505 @@
-# fastapi-microservices-sdk/fastapi_microservices_sdk/database/connection_pools/pool_manager.py 
+"""
+Async connection pool for FastAPI Microservices SDK database adapters.
+
+This module provides the pool shared by all database adapters: an idle
+connection deque, a FIFO wait queue with acquire timeouts, checkout tracking
+so a connection is never handed to two tasks at once, min-size pre-warming,
+max-lifetime recycling and pool metrics.
+
+Capacity works like a fair semaphore: a connection (or a free slot to create
+one) released while tasks are waiting is handed directly to the oldest
+waiter, so newly arriving tasks cannot barge ahead of the queue.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..exceptions import PoolError
+
+# Default latency buckets in seconds (upper bounds, +Inf is implicit)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Sentinel returned when no connection or free slot is available
+_NO_SLOT = object()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (non-cumulative counts, cumulative on export)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation in seconds."""
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def average(self) -> float:
+        """Average observed value."""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary with cumulative bucket counts."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self._counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets['+Inf'] = self.count
+
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'average': self.average,
+            'max': self.max,
+            'buckets': buckets
+        }
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool metrics."""
+    acquisitions: int = 0
+    releases: int = 0
+    timeouts: int = 0
+    connections_created: int = 0
+    connections_closed: int = 0
+    connections_recycled: int = 0
+    creation_failures: int = 0
+    wait_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    checkout_duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'acquisitions': self.acquisitions,
+            'releases': self.releases,
+            'timeouts': self.timeouts,
+            'connections_created': self.connections_created,
+            'connections_closed': self.connections_closed,
+            'connections_recycled': self.connections_recycled,
+            'creation_failures': self.creation_failures,
+            'wait_time': self.wait_time.to_dict(),
+            'checkout_duration': self.checkout_duration.to_dict()
+        }
+
+
+class ConnectionPool:
+    """
+    Fair async connection pool.
+
+    Pooled objects are adapter ``DatabaseConnection`` instances; the pool
+    relies on their ``connection_id``, ``age``, ``idle_time``, ``is_active``,
+    ``transaction_count``, ``mark_used()`` and ``close()`` members.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        name: str = "default",
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: Optional[float] = 30.0,
+        max_lifetime: Optional[float] = 3600.0,
+        idle_timeout: Optional[float] = 300.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise PoolError(
+                f"Invalid pool size: min={min_size}, max={max_size}",
+                pool_name=name,
+                pool_size=max_size
+            )
+
+        self.factory = factory
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._idle: Deque[Any] = deque()
+        self._in_use: Dict[str, Tuple[Any, float]] = {}
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._closing: Set[asyncio.Task] = set()
+        # Connections open or being opened (idle + in use + pending creation)
+        self._size = 0
+        self._closed = False
+        self.metrics = PoolMetrics()
+
+    @property
+    def size(self) -> int:
+        """Total number of connections (including ones being created)."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connections."""
+        return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        """Number of checked out connections."""
+        return len(self._in_use)
+
+    @property
+    def waiting_count(self) -> int:
+        """Number of tasks waiting for a connection."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if pool is closed."""
+        return self._closed
+
+    def is_checked_out(self, connection: Any) -> bool:
+        """Check if connection is currently checked out of this pool."""
+        return connection.connection_id in self._in_use
+
+    async def prewarm(self) -> int:
+        """
+        Open connections until the pool holds ``min_size`` of them.
+
+        Returns:
+            Number of connections created
+        """
+        created = 0
+        while not self._closed and self._size < self.min_size:
+            self._size += 1
+            try:
+                connection = await self._create()
+            except BaseException:
+                self._size -= 1
+                self._release_slot(None)
+                raise
+            self._release_slot(connection)
+            created += 1
+        return created
+
+    async def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a connection, waiting in FIFO order if the pool is exhausted.
+
+        Args:
+            timeout: Maximum seconds to wait (pool ``acquire_timeout`` if None)
+
+        Returns:
+            Checked out connection
+
+        Raises:
+            PoolError: If the pool is closed or the wait timed out
+        """
+        self._check_open()
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start_time = time.perf_counter()
+
+        # Waiters are served first; new arrivals never barge ahead of them
+        slot = self._take_slot() if not self._waiters else _NO_SLOT
+        if slot is _NO_SLOT:
+            slot = await self._wait_for_slot(timeout)
+
+        if slot is None:
+            try:
+                slot = await self._create()
+            except BaseException:
+                self._size -= 1
+                self._release_slot(None)
+                raise
+
+        now = time.perf_counter()
+        self._in_use[slot.connection_id] = (slot, now)
+        slot.mark_used()
+        self.metrics.acquisitions += 1
+        self.metrics.wait_time.observe(now - start_time)
+        return slot
+
+    async def release(self, connection: Any) -> None:
+        """
+        Return a checked out connection to the pool.
+
+        Connections with an open transaction, inactive connections and
+        connections past ``max_lifetime`` are closed instead of reused.
+        """
+        entry = self._in_use.pop(connection.connection_id, None)
+        if entry is None:
+            if self._closed:
+                # Connections checked out at shutdown were closed by close()
+                return
+            self.logger.warning(
+                f"Connection {connection.connection_id} released but not checked out from pool '{self.name}'"
+            )
+            return
+
+        self.metrics.releases += 1
+        self.metrics.checkout_duration.observe(time.perf_counter() - entry[1])
+        connection.mark_used()
+
+        if connection.transaction_count > 0:
+            self.logger.warning(
+                f"Connection {connection.connection_id} returned with active transactions, closing it"
+            )
+        elif self._is_reusable(connection):
+            self._release_slot(connection)
+            return
+        elif connection.is_active and not self._closed:
+            self.metrics.connections_recycled += 1
+
+        self._drop(connection)
+        await self._close(connection)
+        self._release_slot(None)
+
+    async def discard(self, connection: Any) -> bool:
+        """
+        Close a connection and remove it from the pool.
+
+        Returns:
+            True if the connection belonged to the pool
+        """
+        if self._in_use.pop(connection.connection_id, None) is None:
+            try:
+                self._idle.remove(connection)
+            except ValueError:
+                return False
+
+        self._drop(connection)
+        await self._close(connection)
+        self._release_slot(None)
+        return True
+
+    def find(self, connection_id: str) -> Optional[Any]:
+        """Find a pooled connection by ID."""
+        entry = self._in_use.get(connection_id)
+        if entry is not None:
+            return entry[0]
+        for connection in self._idle:
+            if connection.connection_id == connection_id:
+                return connection
+        return None
+
+    async def prune(self, max_idle_time: Optional[float] = None) -> int:
+        """
+        Close idle connections past their idle timeout or max lifetime.
+
+        Connections are kept when closing them would shrink the pool below
+        ``min_size``, unless they exceeded ``max_lifetime`` (they are then
+        replaced by pre-warming).
+
+        Args:
+            max_idle_time: Idle timeout in seconds (pool ``idle_timeout`` if None)
+
+        Returns:
+            Number of connections closed
+        """
+        max_idle_time = self.idle_timeout if max_idle_time is None else max_idle_time
+        to_close = []
+
+        # Oldest-used connections sit at the left of the deque
+        for connection in list(self._idle):
+            expired = self._is_expired(connection)
+            idle_too_long = max_idle_time is not None and connection.idle_time > max_idle_time
+            if expired or (idle_too_long and self._size > self.min_size):
+                self._idle.remove(connection)
+                self._drop(connection)
+                to_close.append(connection)
+                if expired:
+                    self.metrics.connections_recycled += 1
+
+        for connection in to_close:
+            await self._close(connection)
+            self._release_slot(None)
+
+        # Replace recycled connections to keep the pool at its minimum size
+        if not self._closed and self._size < self.min_size:
+            await self.prewarm()
+
+        return len(to_close)
+
+    async def close(self) -> None:
+        """Close the pool, failing pending waiters and closing all connections."""
+        self._closed = True
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(PoolError(
+                    f"Connection pool '{self.name}' closed while waiting",
+                    pool_name=self.name,
+                    pool_size=self._size
+                ))
+
+        connections = list(self._idle) + [entry[0] for entry in self._in_use.values()]
+        self._idle.clear()
+        self._in_use.clear()
+
+        for connection in connections:
+            self._drop(connection)
+            await self._close(connection)
+
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get pool status and metrics."""
+        return {
+            'pool_name': self.name,
+            'total_connections': self._size,
+            'active_connections': len(self._in_use),
+            'idle_connections': len(self._idle),
+            'waiting_tasks': self.waiting_count,
+            'max_connections': self.max_size,
+            'min_connections': self.min_size,
+            'pool_utilization': len(self._in_use) / self.max_size,
+            'closed': self._closed,
+            'metrics': self.metrics.to_dict()
+        }
+
+    # Internal helpers
+
+    def _check_open(self) -> None:
+        """Raise if the pool is closed."""
+        if self._closed:
+            raise PoolError(
+                f"Connection pool '{self.name}' is closed",
+                pool_name=self.name,
+                pool_size=self._size
+            )
+
+    def _take_slot(self) -> Any:
+        """
+        Take an idle connection or reserve capacity for a new one.
+
+        Returns:
+            Connection, None when the caller must create one, or ``_NO_SLOT``
+        """
+        while self._idle:
+            # Most recently used first, so surplus connections age out on the left
+            connection = self._idle.pop()
+            if self._is_reusable(connection):
+                return connection
+
+            if connection.is_active:
+                self.metrics.connections_recycled += 1
+            self._close_in_background(connection)
+
+        if self._size < self.max_size:
+            self._size += 1
+            return None
+        return _NO_SLOT
+
+    def _release_slot(self, connection: Optional[Any]) -> None:
+        """
+        Hand a connection (or freed capacity when None) to the oldest waiter.
+
+        When nobody waits, the connection goes back to the idle deque.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+
+            if connection is None:
+                if self._closed or self._size >= self.max_size:
+                    self._waiters.appendleft(waiter)
+                    return
+                self._size += 1
+            waiter.set_result(connection)
+            return
+
+        if connection is not None:
+            if self._closed:
+                self._close_in_background(connection)
+            else:
+                self._idle.append(connection)
+
+    async def _wait_for_slot(self, timeout: Optional[float]) -> Any:
+        """Queue behind earlier waiters until a slot is handed over."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon_waiter(waiter)
+            raise
+
+        if not done:
+            self._abandon_waiter(waiter)
+            self.metrics.timeouts += 1
+            raise PoolError(
+                f"Timed out after {timeout}s waiting for a connection from pool '{self.name}'",
+                pool_name=self.name,
+                pool_size=self._size,
+                active_connections=len(self._in_use)
+            )
+
+        return waiter.result()
+
+    def _abandon_waiter(self, waiter: asyncio.Future) -> None:
+        """Leave the queue, passing on a slot that was handed over meanwhile."""
+        if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+            self._release_slot(waiter.result())
+            return
+
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    async def _create(self) -> Any:
+        """Create a connection for a slot already counted in ``_size``."""
+        try:
+            connection = await self.factory()
+        except Exception:
+            self.metrics.creation_failures += 1
+            raise
+
+        self.metrics.connections_created += 1
+        return connection
+
+    def _is_expired(self, connection: Any) -> bool:
+        """Check if connection exceeded its maximum lifetime."""
+        return self.max_lifetime is not None and connection.age > self.max_lifetime
+
+    def _is_reusable(self, connection: Any) -> bool:
+        """Check if connection can be handed out again."""
+        return not self._closed and connection.is_active and not self._is_expired(connection)
+
+    def _drop(self, connection: Any) -> None:
+        """Stop counting a connection towards pool size (before closing it)."""
+        self._size = max(0, self._size - 1)
+        self.metrics.connections_closed += 1
+
+    async def _close(self, connection: Any) -> None:
+        """Close a connection already dropped from the pool."""
+        try:
+            await connection.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing pooled connection {connection.connection_id}: {e}")
+
+    def _close_in_background(self, connection: Any) -> None:
+        """Drop and close a connection without blocking the caller."""
+        self._drop(connection)
+        task = asyncio.ensure_future(self._close(connection))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
@@ -293,14 +293,16 @@ class TimeoutError(DatabaseError):
         message: str,
         timeout_duration: Optional[float] = None,
         operation: Optional[str] = None,
+        context: Optional[DatabaseErrorContext] = None,
         **kwargs
     ):
-        context = DatabaseErrorContext(
-            operation=f"timeout_{operation}" if operation else "timeout",
-            additional_info={
-                'timeout_duration': timeout_duration
-            }
-        )
+        if context is None:
+            context = DatabaseErrorContext(
+                operation=f"timeout_{operation}" if operation else "timeout",
+                additional_info={
+                    'timeout_duration': timeout_duration
+                }
+            )
         super().__init__(message, context=context, **kwargs)
 
 
@@ -312,15 +314,17 @@ class IntegrityError(DatabaseError):
         message: str,
         constraint_name: Optional[str] = None,
         table_name: Optional[str] = None,
+        context: Optional[DatabaseErrorContext] = None,
         **kwargs
     ):
-        context = DatabaseErrorContext(
-            operation="integrity_check",
-            table_name=table_name,
-            additional_info={
-                'constraint_name': constraint_name
-            }
-        )
+        if context is None:
+            context = DatabaseErrorContext(
+                operation="integrity_check",
+                table_name=table_name,
+                additional_info={
+                    'constraint_name': constraint_name
+                }
+            )
         super().__init__(message, context=context, **kwargs)
 
 
@@ -472,14 +476,18 @@ def wrap_database_error(
     original_error: Exception,
     operation: str,
     database_name: Optional[str] = None,
-    query: Optional[str] = None
+    query: Optional[str] = None,
+    engine: Optional[Any] = None,
+    **additional_info
 ) -> DatabaseError:
     """Wrap a generic exception as a DatabaseError with context."""
     
     context = DatabaseErrorContext(
         database_name=database_name,
+        engine=getattr(engine, 'value', engine),
         operation=operation,
-        query=query
+        query=query,
+        additional_info=additional_info
     )
     
     # Try to determine the most appropriate exception type
@@ -22,7 +22,9 @@ Version: 1.0.0
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union, AsyncGenerator, Type
+import time
+from itertools import islice
+from typing import Dict, Any, Optional, List, Union, AsyncGenerator, AsyncIterable, Callable, Iterable, Type
 from datetime import datetime, timezone
 import weakref
 from contextlib import asynccontextmanager
@@ -34,7 +36,9 @@ from .exceptions import (
     DatabaseError, ConnectionError, ConfigurationError, PoolError,
     wrap_database_error, create_error_from_driver_exception
 )
-from .adapters.base import DatabaseAdapter, QueryResult, QueryType, IsolationLevel
+from .adapters.base import (
+    DatabaseAdapter, QueryResult, QueryStream, BulkLoadResult, QueryType, IsolationLevel
+)
 from .adapters.registry import AdapterRegistry
 
 # Integration with communication logging
@@ -333,9 +337,9 @@ class DatabaseManager:
                 else:
                     raise DatabaseError(f"Circuit breaker open for database '{db_name}'")
             
-            # Get connection from adapter
+            # Check out a pooled connection from the adapter
             adapter = self._adapters[db_name]
-            connection = await adapter.create_connection()
+            connection = await adapter.get_connection()
             
             # Update metrics
             self._connection_metrics[db_name]['total_connections'] += 1
@@ -348,7 +352,7 @@ class DatabaseManager:
             self._status[db_name].connection_count += 1
             self._status[db_name].is_connected = True
             
-            self.logger.debug(f"Created connection for database '{db_name}': {connection.connection_id}")
+            self.logger.debug(f"Checked out connection for database '{db_name}': {connection.connection_id}")
             return connection
             
         except Exception as e:
@@ -439,6 +443,7 @@ class DatabaseManager:
                 'database_name': database_name,
                 'engine': self.config.databases[database_name].engine.value,
                 'connection_metrics': self._connection_metrics[database_name],
+                'connection_pool': await adapter.get_pool_status(),
                 'circuit_breaker_status': self._load_balancer_state[database_name]
             })
             
@@ -478,6 +483,10 @@ class DatabaseManager:
                 
                 await self._health_check_database(database_name)
                 
+                # Recycle idle and expired pooled connections
+                pool_config = self.config.databases[database_name].pool
+                await self._adapters[database_name].cleanup_idle_connections(pool_config.idle_timeout)
+                
                 # Execute health check callbacks
                 for callback in self._health_check_callbacks:
                     try:
@@ -536,7 +545,239 @@ class DatabaseManager:
         try:
             yield conn
         finally:
-            await self._close_connection_safe(conn, db_name)
+            await self.release_connection(conn, db_name)
+    
+    async def release_connection(
+        self,
+        connection: DatabaseConnection,
+        database_name: Optional[str] = None
+    ) -> None:
+        """
+        Return a connection obtained from get_connection to its pool.
+        
+        Args:
+            connection: Connection to release
+            database_name: Name of database (uses default if None)
+        """
+        db_name = database_name or self.config.default_database
+        
+        try:
+            if db_name in self._connections:
+                self._connections[db_name].pop(connection.connection_id, None)
+            
+            if db_name in self._adapters:
+                await self._adapters[db_name].return_connection(connection)
+            
+            if db_name in self._connection_metrics:
+                self._connection_metrics[db_name]['active_connections'] -= 1
+            
+            if db_name in self._status:
+                self._status[db_name].connection_count -= 1
+                
+        except Exception as e:
+            self.logger.error(f"Error releasing connection {connection.connection_id}: {e}")
+    
+    def stream(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database_name: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> QueryStream:
+        """
+        Stream query results without materializing them.
+        
+        Rows are read through a server-side cursor ``batch_size`` at a time.
+        A pooled connection is checked out on first iteration and held until
+        the stream is exhausted or closed; use ``async with`` so it is
+        released promptly when the consumer stops early.
+        
+        Args:
+            query: Query to execute
+            parameters: Query parameters
+            database_name: Target database (uses default if None)
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            QueryStream async iterator over result rows
+        """
+        if batch_size <= 0:
+            raise ConfigurationError(
+                "Stream batch size must be positive",
+                config_key="batch_size",
+                config_value=batch_size
+            )
+        
+        db_name = database_name or self.config.default_database
+        if db_name not in self._adapters:
+            raise ConfigurationError(f"Database '{db_name}' not configured")
+        
+        return QueryStream(self._stream_batches(db_name, query, parameters, batch_size))
+    
+    async def _stream_batches(
+        self,
+        db_name: str,
+        query: str,
+        parameters: Optional[Dict[str, Any]],
+        batch_size: int
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Hold a connection for the lifetime of a stream."""
+        connection = await self.get_connection(db_name)
+        batches = self._adapters[db_name].stream_batches(connection, query, parameters, batch_size)
+        try:
+            async for batch in batches:
+                yield batch
+        except DatabaseError as e:
+            self.logger.error(f"Streaming query failed on database '{db_name}': {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Streaming query failed on database '{db_name}': {e}")
+            raise wrap_database_error(e, "stream", db_name, query=query[:100])
+        finally:
+            # Close the adapter's cursor before the connection goes back to the pool
+            await batches.aclose()
+            await self.release_connection(connection, db_name)
+    
+    async def bulk_load(
+        self,
+        table_name: str,
+        rows: Union[Iterable[Any], AsyncIterable[Any]],
+        columns: Optional[List[str]] = None,
+        database_name: Optional[str] = None,
+        chunk_size: int = 5000,
+        max_pending_chunks: int = 2,
+        progress_callback: Optional[Callable[[BulkLoadResult], Any]] = None
+    ) -> BulkLoadResult:
+        """
+        Bulk-load rows into a table using the engine's fastest ingestion path.
+        
+        PostgreSQL uses COPY, MySQL multi-row INSERTs, SQLite a transaction
+        wrapped executemany and MongoDB unordered insert_many. Rows are read
+        from the source in ``chunk_size`` chunks while the previous chunk is
+        being written; at most ``max_pending_chunks`` chunks are buffered, so
+        a fast source is paused (backpressure) instead of filling memory.
+        
+        Each chunk is committed on its own. If a chunk fails, earlier chunks
+        stay loaded and the error context reports ``rows_loaded``.
+        
+        Args:
+            table_name: Target table (collection for MongoDB)
+            rows: Iterable or async iterable of dicts or sequences
+            columns: Column names (taken from the first dict row if None)
+            database_name: Target database (uses default if None)
+            chunk_size: Rows written per bulk operation
+            max_pending_chunks: Chunks read ahead of the writer
+            progress_callback: Called with the running result after each chunk
+            
+        Returns:
+            BulkLoadResult with row counts and throughput
+        """
+        if chunk_size <= 0 or max_pending_chunks <= 0:
+            raise ConfigurationError(
+                "Bulk load chunk_size and max_pending_chunks must be positive",
+                config_key="chunk_size",
+                config_value=chunk_size
+            )
+        
+        db_name = database_name or self.config.default_database
+        if db_name not in self._adapters:
+            raise ConfigurationError(f"Database '{db_name}' not configured")
+        
+        adapter = self._adapters[db_name]
+        result = BulkLoadResult(table_name=table_name)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_chunks)
+        
+        async def produce() -> None:
+            try:
+                async for chunk in self._iter_chunks(rows, chunk_size):
+                    await queue.put(chunk)
+            except Exception:
+                # Wake the writer so it can surface the source error
+                await queue.put(None)
+                raise
+            await queue.put(None)
+        
+        connection = await self.get_connection(db_name)
+        start_time = time.perf_counter()
+        producer = asyncio.create_task(produce())
+        
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    await producer  # Re-raise source errors
+                    break
+                
+                if columns is None:
+                    if not isinstance(chunk[0], dict):
+                        raise ConfigurationError("columns are required when rows are sequences")
+                    columns = list(chunk[0].keys())
+                
+                result.rows_loaded += await adapter.bulk_load(connection, table_name, columns, chunk)
+                result.chunks_loaded += 1
+                result.elapsed = time.perf_counter() - start_time
+                
+                if progress_callback:
+                    try:
+                        if asyncio.iscoroutinefunction(progress_callback):
+                            await progress_callback(result)
+                        else:
+                            progress_callback(result)
+                    except Exception as e:
+                        self.logger.error(f"Bulk load progress callback failed: {e}")
+            
+            result.elapsed = time.perf_counter() - start_time
+            self.logger.info(
+                f"Bulk loaded {result.rows_loaded} rows into '{table_name}' on database "
+                f"'{db_name}' in {result.elapsed:.2f}s ({result.rows_per_second:.0f} rows/s)"
+            )
+            return result
+            
+        except Exception as e:
+            self.logger.error(
+                f"Bulk load into '{table_name}' failed on database '{db_name}' "
+                f"after {result.rows_loaded} rows: {e}"
+            )
+            if isinstance(e, DatabaseError):
+                if isinstance(e.context, dict):
+                    e.context['rows_loaded'] = result.rows_loaded
+                else:
+                    e.context.additional_info['rows_loaded'] = result.rows_loaded
+                raise
+            raise wrap_database_error(
+                e, "bulk_load", db_name, table_name=table_name, rows_loaded=result.rows_loaded
+            )
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            await self.release_connection(connection, db_name)
+    
+    @staticmethod
+    async def _iter_chunks(
+        rows: Union[Iterable[Any], AsyncIterable[Any]],
+        chunk_size: int
+    ) -> AsyncGenerator[List[Any], None]:
+        """Group a sync or async row source into lists of ``chunk_size`` rows."""
+        if hasattr(rows, '__aiter__'):
+            chunk = []
+            async for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+            return
+        
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+            # Let the writer run between chunks of a synchronous source
+            await asyncio.sleep(0)
     
     async def __aenter__(self):
         """Async context manager entry."""
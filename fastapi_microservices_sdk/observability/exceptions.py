@@ -4,10 +4,39 @@ Observability Exceptions - Custom exceptions for observability components
 This module defines custom exceptions used throughout the observability system.
 """
 
+from typing import Any, Dict, Optional
+
 
 class ObservabilityError(Exception):
     """Base exception for observability-related errors."""
-    pass
+    
+    def __init__(
+        self,
+        message: str = "",
+        original_error: Optional[Exception] = None,
+        context: Optional[Dict[str, Any]] = None,
+        component: Optional[str] = None,
+        operation: Optional[str] = None,
+        **details: Any
+    ):
+        super().__init__(message)
+        self.message = message
+        self.original_error = original_error
+        self.context = context if isinstance(context, dict) else {}
+        self.component = component
+        self.operation = operation
+        self.details = details
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'error_type': self.__class__.__name__,
+            'message': self.message,
+            'component': self.component,
+            'operation': self.operation,
+            'original_error': str(self.original_error) if self.original_error else None,
+            'context': self.context,
+            'details': self.details
+        }
 
 
 class MetricsError(ObservabilityError):
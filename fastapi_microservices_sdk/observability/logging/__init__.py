@@ -49,9 +49,11 @@ from .handlers import (
     ELKHandler,
     RotatingFileHandler,
     ComplianceHandler,
+    LogPipeline,
     create_elk_handler,
     create_rotating_file_handler,
-    create_compliance_handler
+    create_compliance_handler,
+    create_log_pipeline
 )
 
 from .audit import (
@@ -93,6 +95,17 @@ from .search import (
     create_anomaly_detector
 )
 
+from .index import (
+    LogSegment,
+    LogIndex,
+    create_log_index
+)
+
+from .scan import (
+    LogScanner,
+    create_log_scanner
+)
+
 from .alerting import (
     AlertSeverity,
     AlertStatus,
@@ -160,9 +173,11 @@ __all__ = [
     'ELKHandler',
     'RotatingFileHandler',
     'ComplianceHandler',
+    'LogPipeline',
     'create_elk_handler',
     'create_rotating_file_handler',
     'create_compliance_handler',
+    'create_log_pipeline',
     
     # Audit Logging
     'AuditEventType',
@@ -199,6 +214,11 @@ __all__ = [
     'create_search_engine',
     'create_pattern_detector',
     'create_anomaly_detector',
+    'LogSegment',
+    'LogIndex',
+    'create_log_index',
+    'LogScanner',
+    'create_log_scanner',
     
     # Alerting
     'AlertSeverity',
@@ -232,11 +252,14 @@ def get_logging_info() -> dict:
         'version': '1.0.0',
         'features': [
             'Structured JSON Logging',
+            'Batched Asynchronous Log Pipeline',
             'ELK Stack Integration', 
             'Audit Logging with Digital Signatures',
             'Compliance Logging (GDPR, HIPAA, SOX)',
             'Log Retention and Cleanup',
             'Advanced Log Search and Analysis',
+            'Time-partitioned Inverted Log Index',
+            'Parallel Memory-mapped Log Scanning',
             'Pattern Detection and Anomaly Detection',
             'Multi-channel Alerting',
             'Compliance Dashboards and Reporting',
@@ -275,6 +275,15 @@ class LoggingConfig(BaseModel):
     worker_threads: int = Field(default=2, description="Number of worker threads")
     queue_size: int = Field(default=10000, description="Log queue size")
     
+    # Search indexing
+    search_index_enabled: bool = Field(default=False, description="Index log files for search (parsed logs are kept in memory)")
+    search_segment_minutes: int = Field(default=60, description="Time span of one search index segment")
+    search_max_segments: Optional[int] = Field(default=None, description="Maximum index segments kept per file")
+    search_index_max_bytes: Optional[int] = Field(default=64 * 1024 * 1024, description="Maximum raw log bytes indexed per file; oldest segments are dropped first")
+    search_max_indexed_files: int = Field(default=8, description="Indexed files kept; the least recently searched index is dropped")
+    search_scan_workers: Optional[int] = Field(default=None, description="Processes scanning unindexed files (default: CPU count)")
+    search_scan_chunk_size: int = Field(default=32 * 1024 * 1024, description="Bytes per scan chunk")
+    
     @validator('elk_config', pre=True, always=True)
     def set_elk_config(cls, v, values):
         """Set ELK config if ELK is enabled."""
@@ -31,6 +31,16 @@ class BaseFormatter(ABC):
         """Format log record."""
         pass
     
+    def format_batch(self, records: List[LogRecord]) -> List[Optional[str]]:
+        """Format several log records; records that fail to format give None."""
+        formatted = []
+        for record in records:
+            try:
+                formatted.append(self.format(record))
+            except LogFormatError:
+                formatted.append(None)
+        return formatted
+    
     def _sanitize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize sensitive data from log record."""
         if not self.config.security_config.enable_data_masking:
@@ -77,6 +87,13 @@ class JSONFormatter(BaseFormatter):
     def __init__(self, config: LoggingConfig, indent: Optional[int] = None):
         super().__init__(config)
         self.indent = indent
+        # json.dumps builds a new encoder per call when options are given
+        self._encoder = json.JSONEncoder(
+            indent=indent,
+            default=str,
+            ensure_ascii=False,
+            separators=(',', ':') if indent is None else None
+        )
     
     def format(self, record: LogRecord) -> str:
         """Format log record as JSON."""
@@ -88,13 +105,7 @@ class JSONFormatter(BaseFormatter):
             data = self._sanitize_data(data)
             
             # Format as JSON
-            return json.dumps(
-                data,
-                indent=self.indent,
-                default=str,
-                ensure_ascii=False,
-                separators=(',', ':') if self.indent is None else None
-            )
+            return self._encoder.encode(data)
             
         except Exception as e:
             raise LogFormatError(
@@ -2,7 +2,8 @@
 Log Handlers for FastAPI Microservices SDK.
 
 This module provides various log handlers for different destinations
-including console, file, ELK stack, and buffered handlers with retry logic.
+including console, file, ELK stack, and buffered handlers with retry logic,
+plus the LogPipeline that batches records to handlers on one writer thread.
 
 Author: FastAPI Microservices SDK
 Version: 1.0.0
@@ -10,6 +11,7 @@ Version: 1.0.0
 
 import asyncio
 import logging
+import sys
 import threading
 import time
 import queue
@@ -61,6 +63,10 @@ class BaseHandler(ABC):
         """Emit log record."""
         pass
     
+    def emit_batch(self, records: List[LogRecord]) -> int:
+        """Emit several log records; returns how many were written."""
+        return sum(1 for record in records if self.emit(record))
+    
     def flush(self):
         """Flush any buffered logs."""
         pass
@@ -129,6 +135,31 @@ class ConsoleHandler(BaseHandler):
             with self._lock:
                 self.metrics.logs_failed += 1
             return False
+    
+    def emit_batch(self, records: List[LogRecord]) -> int:
+        """Format a batch and write it with one call per output stream."""
+        if not self._enabled:
+            return 0
+        
+        stdout_lines, stderr_lines = [], []
+        for record, formatted in zip(records, self.formatter.format_batch(records)):
+            if formatted is None:
+                continue
+            if record.level in ('ERROR', 'CRITICAL'):
+                stderr_lines.append(formatted)
+            else:
+                stdout_lines.append(formatted)
+        
+        if stdout_lines:
+            sys.stdout.write('\n'.join(stdout_lines) + '\n')
+        if stderr_lines:
+            sys.stderr.write('\n'.join(stderr_lines) + '\n')
+        
+        written = len(stdout_lines) + len(stderr_lines)
+        with self._lock:
+            self.metrics.logs_processed += written
+            self.metrics.logs_failed += len(records) - written
+        return written
 
 
 class FileHandler(BaseHandler):
@@ -217,6 +248,29 @@ class FileHandler(BaseHandler):
                 self.metrics.logs_failed += 1
             return False
     
+    def emit_batch(self, records: List[LogRecord]) -> int:
+        """Format a batch and append it to the file with a single write."""
+        if not self._enabled or not self._file_handler:
+            return 0
+        
+        lines = [line for line in self.formatter.format_batch(records) if line is not None]
+        if lines:
+            # One record holding the whole batch: one write, one flush, one rollover check
+            self._file_handler.emit(logging.LogRecord(
+                name=records[0].logger_name,
+                level=logging.INFO,
+                pathname="",
+                lineno=0,
+                msg='\n'.join(lines),
+                args=(),
+                exc_info=None
+            ))
+        
+        with self._lock:
+            self.metrics.logs_processed += len(lines)
+            self.metrics.logs_failed += len(records) - len(lines)
+        return len(lines)
+    
     def flush(self):
         """Flush file handler."""
         if self._file_handler:
@@ -228,8 +282,222 @@ class FileHandler(BaseHandler):
             self._file_handler.close()
 
 
+class LogPipeline:
+    """
+    Asynchronous, batching log pipeline shared by loggers and handlers.
+
+    Producers append entries to a bounded deque without taking a lock; when
+    it is full the oldest entries are dropped. One writer thread drains up to
+    ``batch_size`` entries at a time (when a batch fills, a record at or above
+    the flush level arrives, or ``flush_interval`` passes), builds the
+    records, and gives every handler the whole batch through ``emit_batch``
+    so each batch is formatted together and written with one call. A handler
+    that raises is retried with exponential backoff.
+
+    Entries are LogRecord objects or ``(builder, *args)`` tuples captured by
+    StructuredLogger, so records for queued logs are built off the request
+    thread.
+    """
+    
+    def __init__(
+        self,
+        config: LoggingConfig,
+        handlers: Optional[List[BaseHandler]] = None,
+        capacity: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+        backoff_multiplier: float = 2.0,
+        name: str = "log-pipeline"
+    ):
+        self.config = config
+        self.handlers: List[BaseHandler] = list(handlers or [])
+        self.capacity = capacity or config.queue_size
+        self.batch_size = min(batch_size or config.buffer_size, self.capacity)
+        self.flush_interval = flush_interval or config.flush_interval
+        self.flush_level = getattr(logging, config.flush_level.value)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.backoff_multiplier = backoff_multiplier
+        
+        # deque.append/popleft are atomic; maxlen makes it a drop-oldest ring
+        self._buffer: deque = deque(maxlen=self.capacity)
+        
+        # Enqueue stage (updated by producers)
+        self._submitted = 0
+        self._dropped = 0
+        self._high_water = 0
+        
+        # Build, write and retry stages (updated by the writer thread only)
+        self._drained = 0
+        self._build_failures = 0
+        self._batches = 0
+        self._batch_time = 0.0
+        self._max_lag = 0.0
+        self._retries = 0
+        self._failed_batches = 0
+        
+        self._wakeup = threading.Event()
+        self._flush_requests: List[threading.Event] = []
+        self._flush_lock = threading.Lock()
+        self._shutdown = False
+        
+        self._writer = threading.Thread(target=self._run, name=name, daemon=True)
+        self._writer.start()
+    
+    def add_handler(self, handler: BaseHandler):
+        """Add a handler receiving every batch."""
+        self.handlers.append(handler)
+    
+    def submit(self, entry: Any, level: int = logging.INFO) -> bool:
+        """Queue a LogRecord or builder tuple; never blocks the caller."""
+        if self._shutdown:
+            return False
+        
+        buffer = self._buffer
+        depth = len(buffer)
+        if depth >= self.capacity:
+            self._dropped += 1
+        elif depth > self._high_water:
+            self._high_water = depth + 1
+        buffer.append((time.monotonic(), entry))
+        
+        self._submitted += 1
+        if level >= self.flush_level or depth + 1 >= self.batch_size:
+            self._wakeup.set()
+        return True
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything queued so far; returns False on timeout."""
+        if not self._writer.is_alive():
+            self._drain()
+            return True
+        
+        done = threading.Event()
+        with self._flush_lock:
+            self._flush_requests.append(done)
+        self._wakeup.set()
+        return done.wait(timeout)
+    
+    def close(self, timeout: float = 5.0):
+        """Stop accepting logs, write what is queued and close the handlers."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._wakeup.set()
+        self._writer.join(timeout)
+        
+        for handler in self.handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except Exception:
+                pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-stage pipeline statistics."""
+        return {
+            'enqueue': {
+                'submitted': self._submitted,
+                'dropped': self._dropped,
+                'queue_depth': len(self._buffer),
+                'queue_high_water': self._high_water,
+                'capacity': self.capacity
+            },
+            'build': {
+                'drained': self._drained,
+                'failed': self._build_failures
+            },
+            'write': {
+                'batches': self._batches,
+                'average_batch_time': self._batch_time / max(1, self._batches),
+                'max_lag_seconds': self._max_lag,
+                'retries': self._retries,
+                'failed_batches': self._failed_batches
+            },
+            'handlers': [handler.get_metrics() for handler in self.handlers],
+            'running': self._writer.is_alive()
+        }
+    
+    def _run(self):
+        """Writer loop: wait for a batch, a flush-level record or the interval."""
+        while not self._shutdown:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+            self._complete_flushes()
+        
+        # Final drain after close was requested
+        self._drain()
+        self._complete_flushes()
+    
+    def _drain(self):
+        """Write the queue out batch by batch."""
+        popleft = self._buffer.popleft
+        while self._buffer:
+            entries = []
+            try:
+                for _ in range(self.batch_size):
+                    entries.append(popleft())
+            except IndexError:
+                pass
+            self._write_batch(entries)
+    
+    def _write_batch(self, entries: List[tuple]):
+        """Build the records of a batch and hand it to every handler."""
+        start_time = time.monotonic()
+        self._max_lag = max(self._max_lag, start_time - entries[0][0])
+        self._drained += len(entries)
+        
+        records = []
+        for _, entry in entries:
+            try:
+                records.append(entry if isinstance(entry, LogRecord) else entry[0](*entry[1:]))
+            except Exception:
+                self._build_failures += 1
+        
+        if records:
+            for handler in self.handlers:
+                self._emit_with_retry(handler, records)
+        
+        self._batches += 1
+        self._batch_time += time.monotonic() - start_time
+    
+    def _emit_with_retry(self, handler: BaseHandler, records: List[LogRecord]):
+        """Emit a batch to one handler, retrying with backoff if it raises."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                handler.emit_batch(records)
+                return
+            except Exception as e:
+                if attempt == self.max_retries or self._shutdown:
+                    self._failed_batches += 1
+                    with handler._lock:
+                        handler.metrics.logs_failed += len(records)
+                    print(f"LOGGING FAILURE: {handler.__class__.__name__} dropped "
+                          f"{len(records)} records: {e}", file=sys.stderr)
+                    return
+                self._retries += 1
+                time.sleep(self.retry_delay * (self.backoff_multiplier ** attempt))
+    
+    def _complete_flushes(self):
+        """Flush handlers and release callers waiting in flush()."""
+        with self._flush_lock:
+            requests, self._flush_requests = self._flush_requests, []
+        if not requests:
+            return
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+        for done in requests:
+            done.set()
+
+
 class BufferedHandler(BaseHandler):
-    """Buffered log handler with automatic flushing."""
+    """Buffered log handler with automatic flushing, backed by a LogPipeline."""
     
     def __init__(
         self,
@@ -244,136 +512,36 @@ class BufferedHandler(BaseHandler):
         self.buffer_size = buffer_size or config.buffer_size
         self.flush_interval = flush_interval or config.flush_interval
         
-        self._buffer: deque = deque()
-        self._last_flush_time = time.time()
-        self._flush_timer: Optional[threading.Timer] = None
-        self._shutdown_event = threading.Event()
-        
-        # Start flush timer
-        self._start_flush_timer()
-    
-    def _start_flush_timer(self):
-        """Start automatic flush timer."""
-        if self._shutdown_event.is_set():
-            return
-        
-        self._flush_timer = threading.Timer(self.flush_interval, self._auto_flush)
-        self._flush_timer.daemon = True
-        self._flush_timer.start()
-    
-    def _auto_flush(self):
-        """Automatic flush callback."""
-        try:
-            self.flush()
-        except Exception:
-            pass  # Ignore flush errors in timer
-        finally:
-            # Schedule next flush
-            self._start_flush_timer()
+        # Batches of buffer_size records are written together
+        self.pipeline = LogPipeline(
+            config,
+            handlers=[target_handler],
+            capacity=max(self.buffer_size, config.queue_size),
+            batch_size=self.buffer_size,
+            flush_interval=self.flush_interval,
+            max_retries=0,
+            name="buffered-log-handler"
+        )
     
     def emit(self, record: LogRecord) -> bool:
         """Emit log record to buffer."""
         if not self._enabled:
             return False
-        
-        try:
-            with self._lock:
-                # Check if buffer is full
-                if len(self._buffer) >= self.buffer_size:
-                    # Drop oldest record
-                    self._buffer.popleft()
-                    self.metrics.logs_dropped += 1
-                
-                # Add to buffer
-                self._buffer.append(record)
-                self.metrics.logs_buffered += 1
-                
-                # Check if we need to flush immediately
-                should_flush = (
-                    len(self._buffer) >= self.buffer_size or
-                    record.level in ['ERROR', 'CRITICAL'] or
-                    time.time() - self._last_flush_time >= self.flush_interval
-                )
-                
-                if should_flush:
-                    self._flush_buffer()
-            
-            return True
-            
-        except Exception as e:
-            with self._lock:
-                self.metrics.logs_failed += 1
-            return False
-    
-    def _flush_buffer(self):
-        """Flush buffer to target handler."""
-        if not self._buffer:
-            return
-        
-        start_time = time.time()
-        
-        try:
-            # Get all records from buffer
-            records_to_flush = list(self._buffer)
-            self._buffer.clear()
-            
-            # Send to target handler
-            success_count = 0
-            for record in records_to_flush:
-                if self.target_handler.emit(record):
-                    success_count += 1
-            
-            # Update metrics
-            self.metrics.logs_processed += success_count
-            self.metrics.logs_failed += len(records_to_flush) - success_count
-            self.metrics.logs_buffered -= len(records_to_flush)
-            
-            flush_time = time.time() - start_time
-            self.metrics.last_flush_time = time.time()
-            self.metrics.total_flush_time += flush_time
-            self.metrics.flush_count += 1
-            
-        except Exception as e:
-            # Put records back in buffer if flush failed
-            for record in records_to_flush:
-                if len(self._buffer) < self.buffer_size:
-                    self._buffer.append(record)
-                else:
-                    self.metrics.logs_dropped += 1
-            
-            raise LogBufferError(
-                message=f"Failed to flush buffer: {e}",
-                buffer_size=len(records_to_flush),
-                buffer_type="deque",
-                flush_interval=self.flush_interval,
-                original_error=e
-            )
+        return self.pipeline.submit(record, getattr(logging, record.level, logging.INFO))
     
     def flush(self):
         """Manually flush buffer."""
-        with self._lock:
-            self._flush_buffer()
-        
-        # Also flush target handler
-        self.target_handler.flush()
+        self.pipeline.flush()
     
     def close(self):
-        """Close buffered handler."""
-        # Signal shutdown
-        self._shutdown_event.set()
-        
-        # Cancel timer
-        if self._flush_timer:
-            self._flush_timer.cancel()
-        
-        # Final flush
-        try:
-            self.flush()
-        except Exception:
-            pass
-        
-        # Close target handler
-        self.target_handler.close()
+        """Close buffered handler and its target handler."""
+        self.pipeline.close()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get handler metrics, including the pipeline stages."""
+        metrics = super().get_metrics()
+        metrics['pipeline'] = self.pipeline.get_stats()
+        return metrics
 
 
 class RetryHandler(BaseHandler):
@@ -486,7 +654,7 @@ class RetryHandler(BaseHandler):
 
 
 class AsyncHandler(BaseHandler):
-    """Asynchronous log handler."""
+    """Asynchronous log handler, backed by a LogPipeline."""
     
     def __init__(
         self,
@@ -499,85 +667,46 @@ class AsyncHandler(BaseHandler):
         super().__init__(config, formatter)
         self.target_handler = target_handler
         self.queue_size = queue_size or config.queue_size
+        # Kept for compatibility; a single writer thread keeps batches ordered
         self.worker_count = worker_count
         
-        # Async queue
-        self._queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
-        self._workers: List[threading.Thread] = []
-        self._shutdown_event = threading.Event()
-        
-        # Start workers
-        self._start_workers()
-    
-    def _start_workers(self):
-        """Start worker threads."""
-        def worker():
-            while not self._shutdown_event.is_set():
-                try:
-                    # Get record from queue
-                    try:
-                        record = self._queue.get(timeout=1.0)
-                    except queue.Empty:
-                        continue
-                    
-                    # Process record
-                    if self.target_handler.emit(record):
-                        with self._lock:
-                            self.metrics.logs_processed += 1
-                    else:
-                        with self._lock:
-                            self.metrics.logs_failed += 1
-                    
-                    self._queue.task_done()
-                    
-                except Exception:
-                    # Ignore errors in worker
-                    pass
-        
-        for i in range(self.worker_count):
-            worker_thread = threading.Thread(target=worker, daemon=True)
-            worker_thread.start()
-            self._workers.append(worker_thread)
+        self.pipeline = LogPipeline(
+            config,
+            handlers=[target_handler],
+            capacity=self.queue_size,
+            name="async-log-handler"
+        )
     
     def emit(self, record: LogRecord) -> bool:
         """Emit log record asynchronously."""
         if not self._enabled:
             return False
-        
-        try:
-            self._queue.put(record, block=False)
-            return True
-        except queue.Full:
-            with self._lock:
-                self.metrics.logs_dropped += 1
-            return False
+        return self.pipeline.submit(record, getattr(logging, record.level, logging.INFO))
     
     def flush(self):
         """Flush async handler."""
-        # Wait for queue to empty
-        self._queue.join()
-        
-        # Flush target handler
-        self.target_handler.flush()
+        self.pipeline.flush()
     
     def close(self):
-        """Close async handler."""
-        # Signal shutdown
-        self._shutdown_event.set()
-        
-        # Wait for queue to empty
-        try:
-            self._queue.join()
-        except Exception:
-            pass
-        
-        # Wait for workers
-        for worker in self._workers:
-            if worker.is_alive():
-                worker.join(timeout=2.0)
-        
-        # Close target handler
-        self.target_handler.close()
+        """Close async handler and its target handler."""
+        self.pipeline.close()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get handler metrics, including the pipeline stages."""
+        metrics = super().get_metrics()
+        metrics['pipeline'] = self.pipeline.get_stats()
+        return metrics
+
+
+def create_log_pipeline(
+    config: LoggingConfig,
+    handlers: Optional[List[BaseHandler]] = None,
+    **kwargs
+) -> LogPipeline:
+    """Create log pipeline writing to the given handlers (console by default)."""
+    if handlers is None:
+        handlers = [create_handler("console", config)]
+    return LogPipeline(config, handlers=handlers, **kwargs)
 
 
 def create_handler(
@@ -620,5 +749,7 @@ __all__ = [
     'BufferedHandler',
     'RetryHandler',
     'AsyncHandler',
+    'LogPipeline',
     'create_handler',
+    'create_log_pipeline',
 ]
\ No newline at end of file
@@ -0,0 +1,516 @@
+"""
+Log Indexing for FastAPI Microservices SDK.
+
+This module ingests JSON log lines into time-partitioned segments so the
+log search engine can answer queries without re-reading and re-parsing
+log files. Every segment covers a fixed time bucket, keeps its minimum and
+maximum timestamp for time-range pruning, and holds an inverted index over
+a few low-cardinality fields (level, service, correlation ID) and over the
+tokens of the log message. Candidates found through the index are always
+re-checked against the full query, so the index only ever narrows a scan.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Iterable, Set, Tuple
+
+from .exceptions import LoggingError
+
+
+DEFAULT_INDEXED_FIELDS = ('level', 'service_name', 'service', 'correlation_id')
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Convert an ISO-8601 string or epoch number to epoch seconds (naive means UTC)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _parse_object(line: bytes) -> Optional[Dict[str, Any]]:
+    """Parse one raw line as a JSON object (None if it is not one)."""
+    try:
+        log_data = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return log_data if isinstance(log_data, dict) else None
+
+
+def _index_key(value: Any) -> Any:
+    """Normalize a field value for the inverted index."""
+    if isinstance(value, str):
+        return value.lower()
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
+class LogSegment:
+    """Logs of one time bucket with an inverted index over selected fields."""
+
+    def __init__(self, key: Optional[int], start: Optional[float] = None, end: Optional[float] = None):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.min_timestamp: Optional[float] = None
+        self.max_timestamp: Optional[float] = None
+        self.size_bytes = 0  # Raw JSON bytes of the indexed logs
+
+        # Parallel lists: global ingestion sequence and parsed log for each local id
+        self.sequences: List[int] = []
+        self.documents: List[Dict[str, Any]] = []
+
+        # field -> normalized value -> local ids
+        self.postings: Dict[str, Dict[Any, List[int]]] = defaultdict(lambda: defaultdict(list))
+        # message token -> local ids
+        self.tokens: Dict[str, List[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(
+        self,
+        sequence: int,
+        log_data: Dict[str, Any],
+        timestamp: Optional[float],
+        indexed_fields: Iterable[str],
+        text_field: str,
+        size: int = 0
+    ) -> None:
+        """Add a parsed log and index its fields."""
+        doc_id = len(self.documents)
+        self.sequences.append(sequence)
+        self.documents.append(log_data)
+        self.size_bytes += size
+
+        if timestamp is not None:
+            if self.min_timestamp is None or timestamp < self.min_timestamp:
+                self.min_timestamp = timestamp
+            if self.max_timestamp is None or timestamp > self.max_timestamp:
+                self.max_timestamp = timestamp
+
+        for field_name in indexed_fields:
+            value = log_data.get(field_name)
+            if value is not None:
+                key = _index_key(value)
+                if key is not None:
+                    self.postings[field_name][key].append(doc_id)
+
+        text = log_data.get(text_field)
+        if isinstance(text, str):
+            for token in set(tokenize(text)):
+                self.tokens[token].append(doc_id)
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        """Check whether any log of the segment can fall inside [start, end]."""
+        if self.min_timestamp is None:
+            # Logs without a usable timestamp are never pruned by time
+            return True
+        if start is not None and self.max_timestamp < start:
+            return False
+        if end is not None and self.min_timestamp > end:
+            return False
+        return True
+
+    def text_candidates(self, value: str, exact: bool) -> Optional[Set[int]]:
+        """
+        Local ids whose message can contain (or, if exact, equal) ``value``.
+
+        The first and last token of a substring may be cut off, so they are
+        matched as token suffix and prefix against the segment vocabulary;
+        inner tokens must match exactly.
+        """
+        lowered = value.lower()
+        pieces = list(_TOKEN_PATTERN.finditer(lowered))
+        if not pieces:
+            return None
+
+        candidates: Optional[Set[int]] = None
+        for index, piece in enumerate(pieces):
+            token = piece.group()
+            open_start = not exact and index == 0 and piece.start() == 0
+            open_end = not exact and index == len(pieces) - 1 and piece.end() == len(lowered)
+
+            if not open_start and not open_end:
+                ids = set(self.tokens.get(token, ()))
+            else:
+                ids = set()
+                for candidate, postings in self.tokens.items():
+                    if open_start and open_end:
+                        found = token in candidate
+                    elif open_start:
+                        found = candidate.endswith(token)
+                    else:
+                        found = candidate.startswith(token)
+                    if found:
+                        ids.update(postings)
+
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return candidates
+        return candidates
+
+
+class LogIndex:
+    """
+    Time-partitioned, inverted index over JSON logs.
+
+    Logs are added one by one (``add``/``add_line``) or tailed from files
+    (``ingest_file``), which only reads the bytes appended since the last
+    call. ``search`` prunes segments by the query time range, intersects
+    posting lists for the criteria the index can answer, and verifies the
+    remaining candidates with ``SearchQuery.matches``. Results keep
+    ingestion order.
+
+    Parsed logs are kept in memory, so an index should be bounded with
+    ``max_segments`` and/or ``max_bytes``; the oldest segments are dropped
+    first. The index remembers what it dropped: ``covers`` tells whether a
+    query's time range reaches into dropped logs, in which case its results
+    are incomplete and callers should scan the file instead.
+    """
+
+    def __init__(
+        self,
+        segment_minutes: int = 60,
+        indexed_fields: Optional[Iterable[str]] = None,
+        text_field: str = 'message',
+        max_segments: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            segment_minutes: Time span covered by one segment
+            indexed_fields: Top-level fields with an inverted index
+            text_field: Field whose tokens are indexed for contains queries
+            max_segments: Drop the oldest time segments beyond this number
+            max_bytes: Drop the oldest segments once the raw JSON size of the
+                indexed logs exceeds this many bytes
+        """
+        self.segment_seconds = segment_minutes * 60
+        self.indexed_fields = tuple(indexed_fields or DEFAULT_INDEXED_FIELDS)
+        self.text_field = text_field
+        self.max_segments = max_segments
+        self.max_bytes = max_bytes
+
+        self._segments: Dict[int, LogSegment] = {}
+        self._untimed = LogSegment(key=None)
+        self._sequence = 0
+        self._generation = 0
+        self._size_bytes = 0
+        # Logs older than this epoch time were dropped (None if nothing was)
+        self._dropped_before: Optional[float] = None
+        self._dropped_untimed = False
+        # file path -> (device, inode, byte offset of the first unread line)
+        self._file_positions: Dict[str, Tuple[int, int, int]] = {}
+        self._invalid_lines = 0
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every change; part of search cache keys."""
+        return self._generation
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._untimed) + sum(len(segment) for segment in self._segments.values())
+
+    @property
+    def size_bytes(self) -> int:
+        """Raw JSON bytes of the indexed logs."""
+        return self._size_bytes
+
+    def add(self, log_data: Dict[str, Any], size: Optional[int] = None) -> None:
+        """Index a parsed log entry; ``size`` is its raw JSON length if known."""
+        timestamp = parse_timestamp(log_data.get('timestamp'))
+        if size is None and self.max_bytes is not None:
+            size = len(json.dumps(log_data, default=str))
+        with self._lock:
+            self._add(log_data, timestamp, size or 0)
+            self._enforce_max_segments()
+
+    def add_line(self, line: str) -> bool:
+        """Parse and index one JSON log line; returns False if it is not a JSON object."""
+        log_data = _parse_object(line)
+        if log_data is None:
+            self._invalid_lines += 1
+            return False
+        self.add(log_data, len(line))
+        return True
+
+    def ingest_file(self, file_path: str) -> int:
+        """
+        Index the complete lines appended to a file since the last call.
+
+        A last line without a trailing newline is indexed once it is a
+        complete JSON object, as a scan of the file would return it; a
+        partially written line is picked up by a later call. A file that
+        shrank or was replaced (log rotation) resets the index and is read
+        again from the start. Returns the number of lines read.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            raise LoggingError(f"Failed to index file {file_path}: {e}", original_error=e)
+
+        with self._lock:
+            device, inode, offset = self._file_positions.get(file_path, (stat.st_dev, stat.st_ino, 0))
+            if (device, inode) != (stat.st_dev, stat.st_ino) or stat.st_size < offset:
+                self.logger.info(f"Log file {file_path} was rotated or truncated, rebuilding index")
+                self.clear()
+                offset = 0
+            if stat.st_size == offset:
+                self._file_positions[file_path] = (stat.st_dev, stat.st_ino, offset)
+                return 0
+
+            lines = 0
+            try:
+                with open(file_path, 'rb') as f:
+                    f.seek(offset)
+                    for line in f:
+                        if not line.endswith(b'\n'):
+                            # Unterminated last line: index it if the writer finished the object
+                            log_data = _parse_object(line) if line.strip() else None
+                            if log_data is not None:
+                                offset += len(line)
+                                lines += 1
+                                self._add(log_data, parse_timestamp(log_data.get('timestamp')), len(line))
+                            break
+                        offset += len(line)
+                        lines += 1
+                        if line.strip():
+                            self._ingest_line(line)
+            except OSError as e:
+                raise LoggingError(f"Failed to index file {file_path}: {e}", original_error=e)
+
+            self._file_positions[file_path] = (stat.st_dev, stat.st_ino, offset)
+            self._enforce_max_segments()
+            return lines
+
+    def search(self, query: Any) -> List[Dict[str, Any]]:
+        """Return every log matching a SearchQuery, in ingestion order."""
+        start, end = self._time_bounds(query.time_range)
+
+        with self._lock:
+            segments = [self._untimed] + list(self._segments.values())
+            matches: List[Tuple[int, Dict[str, Any]]] = []
+            for segment in segments:
+                if not segment.documents or not segment.overlaps(start, end):
+                    continue
+                candidates = self._candidates(segment, query.criteria)
+                documents, sequences = segment.documents, segment.sequences
+                doc_ids = range(len(documents)) if candidates is None else sorted(candidates)
+                for doc_id in doc_ids:
+                    log_data = documents[doc_id]
+                    if query.matches(log_data):
+                        matches.append((sequences[doc_id], log_data))
+
+        matches.sort(key=lambda match: match[0])
+        return [log_data for _, log_data in matches]
+
+    def covers(self, time_range: Optional[tuple] = None) -> bool:
+        """
+        Check whether the index still holds every log a query over ``time_range`` can match.
+
+        False once segments the range reaches into were dropped (by
+        ``max_segments``, ``max_bytes`` or ``drop_before``); results for
+        such a query miss the dropped logs.
+        """
+        with self._lock:
+            if self._dropped_untimed:
+                return False
+            if self._dropped_before is None:
+                return True
+            start, _ = self._time_bounds(time_range)
+            return start is not None and start >= self._dropped_before
+
+    def drop_before(self, cutoff: datetime) -> int:
+        """Drop whole segments that end before ``cutoff``; returns the logs removed."""
+        cutoff_ts = parse_timestamp(cutoff)
+        removed = 0
+        with self._lock:
+            for key in [key for key, segment in self._segments.items() if segment.end <= cutoff_ts]:
+                removed += len(self._drop_segment(key))
+            if removed:
+                self._generation += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all indexed logs and forget file positions."""
+        with self._lock:
+            self._segments.clear()
+            self._untimed = LogSegment(key=None)
+            self._size_bytes = 0
+            self._dropped_before = None
+            self._dropped_untimed = False
+            self._file_positions.clear()
+            self._generation += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            timed = [segment for segment in self._segments.values() if segment.min_timestamp is not None]
+            return {
+                'segments': len(self._segments),
+                'indexed_logs': len(self),
+                'untimed_logs': len(self._untimed),
+                'size_bytes': self._size_bytes,
+                'dropped_before': self._dropped_before,
+                'dropped_untimed_logs': self._dropped_untimed,
+                'invalid_lines': self._invalid_lines,
+                'indexed_files': len(self._file_positions),
+                'segment_minutes': self.segment_seconds // 60,
+                'oldest_timestamp': min((s.min_timestamp for s in timed), default=None),
+                'newest_timestamp': max((s.max_timestamp for s in timed), default=None),
+                'generation': self._generation
+            }
+
+    def _ingest_line(self, line: bytes) -> None:
+        """Parse and add one raw line (lock held)."""
+        log_data = _parse_object(line)
+        if log_data is None:
+            self._invalid_lines += 1
+            return
+        self._add(log_data, parse_timestamp(log_data.get('timestamp')), len(line))
+
+    def _add(self, log_data: Dict[str, Any], timestamp: Optional[float], size: int = 0) -> None:
+        """Route a log to its time segment (lock held)."""
+        if timestamp is None:
+            segment = self._untimed
+        else:
+            key = int(timestamp // self.segment_seconds)
+            segment = self._segments.get(key)
+            if segment is None:
+                start = key * self.segment_seconds
+                segment = self._segments[key] = LogSegment(key, start, start + self.segment_seconds)
+
+        segment.add(self._sequence, log_data, timestamp, self.indexed_fields, self.text_field, size)
+        self._size_bytes += size
+        self._sequence += 1
+        self._generation += 1
+
+    def _drop_segment(self, key: int) -> LogSegment:
+        """Remove a time segment and move the dropped-data watermark past it (lock held)."""
+        segment = self._segments.pop(key)
+        self._size_bytes -= segment.size_bytes
+        if self._dropped_before is None or segment.end > self._dropped_before:
+            self._dropped_before = segment.end
+        return segment
+
+    def _enforce_max_segments(self) -> None:
+        """Drop the oldest segments beyond max_segments and max_bytes (lock held)."""
+        dropped = False
+        if self.max_segments is not None and len(self._segments) > self.max_segments:
+            for key in sorted(self._segments)[:len(self._segments) - self.max_segments]:
+                self._drop_segment(key)
+            dropped = True
+
+        if self.max_bytes is not None and self._size_bytes > self.max_bytes:
+            for key in sorted(self._segments):
+                if self._size_bytes <= self.max_bytes:
+                    break
+                self._drop_segment(key)
+                dropped = True
+            if self._size_bytes > self.max_bytes and len(self._untimed):
+                # Logs without timestamps have no age; drop them as a last resort
+                self._size_bytes -= self._untimed.size_bytes
+                self._untimed = LogSegment(key=None)
+                self._dropped_untimed = True
+                dropped = True
+
+        if dropped:
+            self._generation += 1
+
+    def _candidates(self, segment: LogSegment, criteria: List[Any]) -> Optional[Set[int]]:
+        """Intersect posting lists for the criteria the index can answer; None means all."""
+        candidates: Optional[Set[int]] = None
+        for criterion in criteria:
+            ids = self._criterion_candidates(segment, criterion)
+            if ids is None:
+                continue
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates
+
+    def _criterion_candidates(self, segment: LogSegment, criterion: Any) -> Optional[Set[int]]:
+        """Local ids that can satisfy one criterion, or None if it is not indexed."""
+        operator, value = criterion.operator, criterion.value
+
+        if criterion.field == self.text_field and isinstance(value, str):
+            if operator == 'contains':
+                return segment.text_candidates(value, exact=False)
+            if operator == 'eq':
+                return segment.text_candidates(value, exact=True)
+
+        if criterion.field in self.indexed_fields:
+            postings = segment.postings.get(criterion.field, {})
+            if operator == 'eq':
+                key = _index_key(value)
+                return None if key is None else set(postings.get(key, ()))
+            if operator == 'in' and isinstance(value, (list, tuple, set, frozenset)):
+                ids: Set[int] = set()
+                for item in value:
+                    key = _index_key(item)
+                    if key is None:
+                        return None
+                    ids.update(postings.get(key, ()))
+                return ids
+
+        return None
+
+    def _time_bounds(self, time_range: Optional[tuple]) -> Tuple[Optional[float], Optional[float]]:
+        """Convert a query time range to epoch bounds."""
+        if not time_range:
+            return None, None
+        start_time, end_time = time_range
+        return parse_timestamp(start_time), parse_timestamp(end_time)
+
+
+def create_log_index(config: Any = None, **kwargs) -> LogIndex:
+    """Create log index, taking the segment size from a LoggingConfig if given."""
+    if config is not None:
+        kwargs.setdefault('segment_minutes', config.search_segment_minutes)
+        kwargs.setdefault('max_segments', config.search_max_segments)
+        kwargs.setdefault('max_bytes', config.search_index_max_bytes)
+    return LogIndex(**kwargs)
+
+
+__all__ = [
+    'DEFAULT_INDEXED_FIELDS',
+    'LogSegment',
+    'LogIndex',
+    'tokenize',
+    'parse_timestamp',
+    'create_log_index',
+]
@@ -0,0 +1,240 @@
+"""
+Parallel Log File Scanning for FastAPI Microservices SDK.
+
+This module scans JSON log files that are not indexed. Files are memory
+mapped and split into newline-aligned chunks that are scanned in a process
+pool, so large rotated logs are parsed on every core instead of one. Lines
+are checked against literal substrings taken from the query before they
+are parsed, which skips ``json.loads`` for most non-matching lines. Results
+are streamed back in file order as a generator.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import json
+import logging
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Tuple
+
+from .exceptions import LoggingError
+
+
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Characters that every JSON encoder writes verbatim inside a string
+_SAFE_LITERAL = re.compile(r"[A-Za-z0-9 _.:,;=@#%+*()!?'-]+")
+
+# Operators for which the criterion value must appear in the raw line
+_LITERAL_OPERATORS = ('eq', 'contains', 'starts_with', 'ends_with')
+
+# Characters whose lowercase form contains ASCII letters ('İ', Kelvin 'K'), raw
+# and JSON-escaped; a lowercased raw line can miss a match for these
+_FOLDS_TO_ASCII = ('\u0130', '\u212a', '\\u0130', '\\u212a', '\\u212A')
+
+
+def _folds_to_ascii(data: str) -> bool:
+    """Check for characters that only match case-insensitively after Unicode lowering."""
+    return any(sequence in data for sequence in _FOLDS_TO_ASCII)
+
+
+class LinePrefilter:
+    """
+    Cheap substring check on raw log lines before JSON parsing.
+
+    Every literal must occur in the line. Case-insensitive literals are
+    compared against the lowercased line, except on lines holding one of
+    the few characters whose lowercase is ASCII. ``anchor`` is
+    searched for across a whole chunk to jump from one candidate line to
+    the next without touching the lines in between.
+    """
+
+    def __init__(self, literals: List[str], insensitive_literals: List[str]):
+        self.literals = literals
+        self.insensitive_literals = insensitive_literals
+        self.anchor = literals[0] if literals else insensitive_literals[0]
+        self.anchor_insensitive = not literals
+
+    def __call__(self, line: str) -> bool:
+        for literal in self.literals:
+            if literal not in line:
+                return False
+        if self.insensitive_literals:
+            lowered = line.lower()
+            for literal in self.insensitive_literals:
+                if literal not in lowered:
+                    return _folds_to_ascii(line)
+        return True
+
+
+def build_prefilter(query: Any) -> Optional[LinePrefilter]:
+    """Derive the literals a matching line must contain; None if there are none."""
+    if query is None:
+        return None
+
+    literals, insensitive_literals = [], []
+    for criterion in query.criteria:
+        value = criterion.value
+        if criterion.operator not in _LITERAL_OPERATORS or not isinstance(value, str):
+            continue
+        if not value or not _SAFE_LITERAL.fullmatch(value):
+            continue
+        if criterion.case_sensitive:
+            literals.append(value)
+        else:
+            insensitive_literals.append(value.lower())
+
+    if not literals and not insensitive_literals:
+        return None
+    return LinePrefilter(literals, insensitive_literals)
+
+
+def chunk_boundaries(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Split a file into (start, end) byte ranges that end on a newline."""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            boundaries = []
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    newline = mapped.find(b'\n', end - 1)
+                    end = size if newline == -1 else newline + 1
+                boundaries.append((start, end))
+                start = end
+            return boundaries
+
+
+def scan_range(
+    file_path: str,
+    start: int,
+    end: int,
+    query: Any = None,
+    prefilter: Optional[LinePrefilter] = None
+) -> List[Dict[str, Any]]:
+    """Parse the JSON log lines in [start, end) that match the query."""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = mapped[start:end].decode('utf-8', errors='replace')
+
+    # Anchor search needs positions in the haystack to line up with the text
+    haystack = None
+    if prefilter is not None:
+        if not prefilter.anchor_insensitive:
+            haystack = text
+        elif not _folds_to_ascii(text):
+            lowered = text.lower()
+            if len(lowered) == len(text):
+                haystack = lowered
+
+    matches = []
+
+    def parse(line: str) -> None:
+        try:
+            log_data = json.loads(line)
+        except ValueError:
+            return
+        if isinstance(log_data, dict) and (query is None or query.matches(log_data)):
+            matches.append(log_data)
+
+    if haystack is None:
+        for line in text.split('\n'):
+            if line and (prefilter is None or prefilter(line)):
+                parse(line)
+        return matches
+
+    # Jump from one line containing the anchor literal to the next
+    position, size = 0, len(text)
+    while position < size:
+        hit = haystack.find(prefilter.anchor, position)
+        if hit == -1:
+            break
+        newline = text.rfind('\n', position, hit)
+        line_start = position if newline == -1 else newline + 1
+        line_end = text.find('\n', hit)
+        if line_end == -1:
+            line_end = size
+        line = text[line_start:line_end]
+        position = line_end + 1
+        if prefilter(line):
+            parse(line)
+    return matches
+
+
+class LogScanner:
+    """Streams matching logs from a file using memory-mapped, parallel chunks."""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the scanner.
+
+        Args:
+            workers: Worker processes (defaults to the CPU count); 1 scans in-process
+            chunk_size: Approximate bytes per chunk handed to a worker
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+
+    def scan(self, file_path: str, query: Any = None) -> Iterator[Dict[str, Any]]:
+        """Yield logs matching a SearchQuery (all logs if None) in file order."""
+        try:
+            boundaries = chunk_boundaries(file_path, self.chunk_size)
+        except (OSError, ValueError) as e:
+            raise LoggingError(f"Failed to scan file {file_path}: {e}", original_error=e)
+
+        prefilter = build_prefilter(query)
+        if self.workers == 1 or len(boundaries) <= 1:
+            for start, end in boundaries:
+                yield from scan_range(file_path, start, end, query, prefilter)
+            return
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(self.workers, len(boundaries)))
+        except (OSError, NotImplementedError, ImportError) as e:
+            self.logger.warning(f"Process pool unavailable, scanning {file_path} in-process: {e}")
+            for start, end in boundaries:
+                yield from scan_range(file_path, start, end, query, prefilter)
+            return
+
+        # Keep a bounded number of chunks in flight and yield them in order
+        pending = deque()
+        chunks = iter(boundaries)
+        try:
+            for start, end in chunks:
+                pending.append(executor.submit(scan_range, file_path, start, end, query, prefilter))
+                if len(pending) >= self.workers * 2:
+                    break
+            while pending:
+                matches = pending.popleft().result()
+                for start, end in chunks:
+                    pending.append(executor.submit(scan_range, file_path, start, end, query, prefilter))
+                    break
+                yield from matches
+        finally:
+            # Reached on completion, error, or when the caller stops iterating
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def create_log_scanner(config: Any) -> LogScanner:
+    """Create log scanner from a LoggingConfig."""
+    return LogScanner(workers=config.search_scan_workers, chunk_size=config.search_scan_chunk_size)
+
+
+__all__ = [
+    'LinePrefilter',
+    'LogScanner',
+    'build_prefilter',
+    'chunk_boundaries',
+    'scan_range',
+    'create_log_scanner',
+]
@@ -6,13 +6,14 @@ Author: FastAPI Microservices SDK
 Version: 1.0.0
 """
 import json
+import os
 import re
 import statistics
-from typing import Dict, Any, Optional, List, Union, Callable, Iterator
+from typing import Dict, Any, Optional, List, Union, Callable, Iterator, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import logging
 
 # Optional dependencies for advanced analysis
@@ -31,6 +32,8 @@ except ImportError:
 
 from .config import LoggingConfig
 from .exceptions import LoggingError
+from .index import LogIndex
+from .scan import create_log_scanner
 
 
 class SearchOperator(str, Enum):
@@ -186,6 +189,7 @@ class SearchResult:
     """Search result container."""
     logs: List[Dict[str, Any]] = field(default_factory=list)
     total_count: int = 0
+    total_count_exact: bool = True  # False when the search stopped early; total_count is a lower bound
     query_time_ms: float = 0.0
     aggregations: Dict[str, Any] = field(default_factory=dict)
 
@@ -194,6 +198,7 @@ class SearchResult:
         return {
             'logs': self.logs,
             'total_count': self.total_count,
+            'total_count_exact': self.total_count_exact,
             'query_time_ms': self.query_time_ms,
             'aggregations': self.aggregations
         }
@@ -259,18 +264,39 @@ class LogSearchEngine:
         self._query_cache: Dict[str, SearchResult] = {}
         self._cache_max_size = 100
 
+        # Per-file indexes, refreshed incrementally before each search (LRU order)
+        self.index_enabled = config.search_index_enabled
+        self._indexes: "OrderedDict[str, LogIndex]" = OrderedDict()
+
+        # Parallel memory-mapped scanning for files that are not indexed
+        self.scanner = create_log_scanner(config)
+
     def search(
         self,
         query: SearchQuery,
-        log_source: Union[str, Iterator[Dict[str, Any]]]
+        log_source: Union[str, LogIndex, Iterator[Dict[str, Any]]]
     ) -> SearchResult:
         """Search logs with given query."""
         import time
         start_time = time.time()
 
         try:
+            # Identify the source version so cached results never go stale
+            if isinstance(log_source, str):
+                if self.index_enabled:
+                    index = self.index_file(log_source)
+                    source_key = (log_source, index.generation)
+                else:
+                    stat = os.stat(log_source)
+                    source_key = (log_source, stat.st_mtime_ns, stat.st_size)
+            elif isinstance(log_source, LogIndex):
+                source_key = (id(log_source), log_source.generation)
+            else:
+                # Iterators are consumed by the search and cannot be cached
+                source_key = None
+
             # Check cache
-            query_hash = self._hash_query(query)
+            query_hash = self._hash_query(query, source_key) if source_key is not None else None
             if query_hash in self._query_cache:
                 self._cache_hits += 1
                 return self._query_cache[query_hash]
@@ -279,6 +305,10 @@ class LogSearchEngine:
             if isinstance(log_source, str):
                 # File-based search
                 result = self._search_file(query, log_source)
+            elif isinstance(log_source, LogIndex):
+                # Index-based search; incomplete if the index dropped logs the query reaches
+                result = self._paginate(query, log_source.search(query))
+                result.total_count_exact = log_source.covers(query.time_range)
             else:
                 # Iterator-based search
                 result = self._search_iterator(query, log_source)
@@ -290,7 +320,8 @@ class LogSearchEngine:
             self._total_search_time += query_time
 
             # Cache result
-            self._cache_result(query_hash, result)
+            if query_hash is not None:
+                self._cache_result(query_hash, result)
 
             return result
 
@@ -298,65 +329,88 @@ class LogSearchEngine:
             self.logger.error(f"Search failed: {e}")
             raise LoggingError(f"Search failed: {e}", original_error=e)
 
+    def index_file(self, file_path: str) -> LogIndex:
+        """Get the index of a log file, indexing lines appended since the last call."""
+        index = self._indexes.get(file_path)
+        if index is None:
+            index = self._indexes[file_path] = LogIndex(
+                segment_minutes=self.config.search_segment_minutes,
+                max_segments=self.config.search_max_segments,
+                max_bytes=self.config.search_index_max_bytes
+            )
+            while len(self._indexes) > max(1, self.config.search_max_indexed_files):
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(file_path)
+        index.ingest_file(file_path)
+        return index
+
+    def iter_search(self, query: SearchQuery, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream every log in a file matching the query, in file order."""
+        index = self._covering_index(query, file_path)
+        if index is not None:
+            return iter(index.search(query))
+        return self.scanner.scan(file_path, query)
+
+    def _covering_index(self, query: SearchQuery, file_path: str) -> Optional[LogIndex]:
+        """Index of a file if it holds every log the query can match, else None (scan the file)."""
+        if not self.index_enabled:
+            return None
+        index = self.index_file(file_path)
+        if not index.covers(query.time_range):
+            self.logger.debug(f"Index of {file_path} dropped logs this query reaches; scanning the file")
+            return None
+        return index
+
     def _search_file(self, query: SearchQuery, file_path: str) -> SearchResult:
         """Search logs in file."""
-        result = SearchResult()
+        index = self._covering_index(query, file_path)
+        if index is not None:
+            return self._paginate(query, index.search(query))
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f):
-                    if line_num < query.offset:
-                        continue
-                    if query.limit and len(result.logs) >= query.limit:
-                        break
-
-                    try:
-                        log_data = json.loads(line.strip())
-                        if query.matches(log_data):
-                            result.logs.append(log_data)
-                            result.total_count += 1
-                    except json.JSONDecodeError:
-                        continue
-
-            # Sort results
-            if query.sort_by and result.logs:
-                reverse = query.sort_order == "desc"
-                result.logs.sort(
-                    key=lambda x: x.get(query.sort_by, ''),
-                    reverse=reverse
-                )
-
-        except Exception as e:
-            raise LoggingError(f"Failed to search file {file_path}: {e}")
+        if query.sort_by:
+            return self._paginate(query, list(self.scanner.scan(file_path, query)))
 
+        # Unsorted: count every match but only keep the requested page
+        result = SearchResult()
+        end = query.offset + query.limit if query.limit else None
+        for log_data in self.scanner.scan(file_path, query):
+            if result.total_count >= query.offset and (end is None or result.total_count < end):
+                result.logs.append(log_data)
+            result.total_count += 1
         return result
 
     def _search_iterator(self, query: SearchQuery, log_iterator: Iterator[Dict[str, Any]]) -> SearchResult:
         """Search logs from iterator."""
-        result = SearchResult()
-        processed = 0
+        # Without sorting, stop reading once the requested page is complete
+        stop_after = None
+        if query.limit and not query.sort_by:
+            stop_after = query.offset + query.limit
 
+        matches = []
+        stopped_early = False
         for log_data in log_iterator:
-            if processed < query.offset:
-                processed += 1
-                continue
-            if query.limit and len(result.logs) >= query.limit:
-                break
-
             if query.matches(log_data):
-                result.logs.append(log_data)
-                result.total_count += 1
-            processed += 1
+                matches.append(log_data)
+                if stop_after is not None and len(matches) >= stop_after:
+                    stopped_early = True
+                    break
 
-        # Sort results
-        if query.sort_by and result.logs:
+        result = self._paginate(query, matches)
+        result.total_count_exact = not stopped_early
+        return result
+
+    def _paginate(self, query: SearchQuery, matches: List[Dict[str, Any]]) -> SearchResult:
+        """Sort all matches, then apply offset and limit."""
+        if query.sort_by and matches:
             reverse = query.sort_order == "desc"
-            result.logs.sort(
+            matches.sort(
                 key=lambda x: x.get(query.sort_by, ''),
                 reverse=reverse
             )
 
-        return result
+        end = query.offset + query.limit if query.limit else None
+        return SearchResult(logs=matches[query.offset:end], total_count=len(matches))
 
     def aggregate(
         self,
@@ -420,11 +474,12 @@ class LogSearchEngine:
                 return None
         return current
 
-    def _hash_query(self, query: SearchQuery) -> str:
+    def _hash_query(self, query: SearchQuery, source_key: Any = None) -> str:
         """Create hash for query caching."""
         import hashlib
         query_str = json.dumps({
-            'criteria': [(c.field, c.operator.value, c.value) for c in query.criteria],
+            'source': source_key,
+            'criteria': [(c.field, c.operator.value, c.value, c.case_sensitive) for c in query.criteria],
             'time_range': query.time_range,
             'limit': query.limit,
             'offset': query.offset,
@@ -450,7 +505,9 @@ class LogSearchEngine:
             'average_search_time_ms': avg_search_time,
             'cache_hits': self._cache_hits,
             'cache_hit_rate': self._cache_hits / max(1, self._search_count),
-            'cached_queries': len(self._query_cache)
+            'cached_queries': len(self._query_cache),
+            'indexed_files': len(self._indexes),
+            'indexed_logs': sum(len(index) for index in self._indexes.values())
         }
 
 
@@ -547,6 +604,7 @@ class AnomalyDetector:
     def __init__(self, config: LoggingConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.scanner = create_log_scanner(config)
 
         # Baseline metrics
         self._baseline_metrics = {}
@@ -554,12 +612,16 @@ class AnomalyDetector:
 
     def detect_anomalies(
         self,
-        logs: List[Dict[str, Any]],
-        time_window_minutes: int = 60
+        logs: Union[List[Dict[str, Any]], str],
+        time_window_minutes: int = 60,
+        query: Optional[SearchQuery] = None
     ) -> List[Anomaly]:
-        """Detect anomalies in logs."""
+        """Detect anomalies in logs, or in a log file scanned in parallel (optionally filtered by query)."""
         anomalies = []
 
+        if isinstance(logs, str):
+            logs = self.scanner.scan(logs, query)
+
         # Group logs by time windows
         time_groups = self._group_logs_by_time(logs, time_window_minutes)
 
@@ -584,7 +646,7 @@ class AnomalyDetector:
 
     def _group_logs_by_time(
         self,
-        logs: List[Dict[str, Any]],
+        logs: Iterable[Dict[str, Any]],
         window_minutes: int
     ) -> Dict[datetime, List[Dict[str, Any]]]:
         """Group logs by time windows."""
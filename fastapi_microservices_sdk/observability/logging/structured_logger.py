@@ -14,7 +14,7 @@ import threading
 import time
 import uuid
 from typing import Dict, Any, Optional, List, Union, Callable
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from contextvars import ContextVar
 from enum import Enum
@@ -36,6 +36,24 @@ correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', def
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
 
+# Standard library level numbers, for the level check before any record work
+_LEVEL_NUMBERS: Dict[str, int] = {level.value: getattr(logging, level.value) for level in LogLevel}
+
+# Hostname does not change while the process runs
+_hostname: Optional[str] = None
+
+
+def _get_hostname() -> Optional[str]:
+    """Get the (cached) hostname."""
+    global _hostname
+    if _hostname is None:
+        try:
+            import socket
+            _hostname = socket.gethostname()
+        except Exception:
+            pass
+    return _hostname
+
 
 class LogEventType(str, Enum):
     """Log event type enumeration."""
@@ -101,10 +119,8 @@ class LogRecord:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert log record to dictionary."""
-        data = asdict(self)
-        
-        # Remove None values
-        return {k: v for k, v in data.items() if v is not None}
+        # Shallow copy; asdict() deep-copies every field on each log call
+        return {k: v for k, v in self.__dict__.items() if v is not None}
     
     def to_json(self) -> str:
         """Convert log record to JSON string."""
@@ -180,12 +196,16 @@ class StructuredLogger:
         self,
         name: str,
         config: LoggingConfig,
-        schema: Optional[LogSchema] = None
+        schema: Optional[LogSchema] = None,
+        pipeline: Optional[Any] = None
     ):
         self.name = name
         self.config = config
         self.schema = schema or LogSchema()
         
+        # Optional LogPipeline; records are then built and written off-thread
+        self._pipeline = pipeline
+        
         # Create underlying logger
         self._logger = logging.getLogger(name)
         self._logger.setLevel(getattr(logging, config.root_level.value))
@@ -242,6 +262,14 @@ class StructuredLogger:
         """Add custom correlation extractor."""
         self._correlation_extractors.append(extractor)
     
+    def attach_pipeline(self, pipeline: Optional[Any]):
+        """Send logs through a LogPipeline (None restores synchronous logging)."""
+        self._pipeline = pipeline
+    
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a level would be logged."""
+        return self._logger.isEnabledFor(_LEVEL_NUMBERS[level.value])
+    
     def _extract_correlation_data(self) -> Dict[str, Any]:
         """Extract correlation data from all extractors."""
         correlation_data = {}
@@ -267,44 +295,48 @@ class StructuredLogger:
         **kwargs
     ) -> LogRecord:
         """Create structured log record."""
+        return self._record_from_entry(
+            time.time(),
+            level,
+            message,
+            extra,
+            self._exception_info(exception),
+            event_type,
+            self._extract_correlation_data(),
+            threading.get_ident() if self.config.include_thread_info else None,
+            kwargs
+        )
+    
+    def _exception_info(self, exception: Optional[Exception]) -> Optional[tuple]:
+        """Capture exception type, message and traceback on the logging thread."""
+        if not exception:
+            return None
         
-        # Get current timestamp
-        timestamp = datetime.now(timezone.utc).isoformat()
-        
-        # Extract correlation data
-        correlation_data = self._extract_correlation_data()
-        
-        # Get thread and process info if enabled
-        thread_id = threading.get_ident() if self.config.include_thread_info else None
-        process_id = os.getpid() if self.config.include_process_info else None
-        
-        # Get hostname
-        hostname = None
+        exception_traceback = None
         try:
-            import socket
-            hostname = socket.gethostname()
+            import traceback
+            exception_traceback = traceback.format_exc()
         except Exception:
             pass
+        return type(exception).__name__, str(exception), exception_traceback
+    
+    def _record_from_entry(
+        self,
+        created: float,
+        level: LogLevel,
+        message: str,
+        extra: Optional[Dict[str, Any]],
+        exception_info: Optional[tuple],
+        event_type: LogEventType,
+        correlation_data: Dict[str, Any],
+        thread_id: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> LogRecord:
+        """Build a LogRecord from the data captured at the logging call."""
+        exception_type, exception_message, exception_traceback = exception_info or (None, None, None)
         
-        # Handle exception information
-        exception_type = None
-        exception_message = None
-        exception_traceback = None
-        
-        if exception:
-            exception_type = type(exception).__name__
-            exception_message = str(exception)
-            
-            # Get traceback if available
-            try:
-                import traceback
-                exception_traceback = traceback.format_exc()
-            except Exception:
-                pass
-        
-        # Create log record
-        record = LogRecord(
-            timestamp=timestamp,
+        return LogRecord(
+            timestamp=datetime.fromtimestamp(created, timezone.utc).isoformat(),
             level=level.value,
             logger_name=self.name,
             message=message,
@@ -313,8 +345,8 @@ class StructuredLogger:
             environment=self.config.environment,
             event_type=event_type,
             thread_id=thread_id,
-            process_id=process_id,
-            hostname=hostname,
+            process_id=os.getpid() if self.config.include_process_info else None,
+            hostname=_get_hostname(),
             exception_type=exception_type,
             exception_message=exception_message,
             exception_traceback=exception_traceback,
@@ -322,8 +354,6 @@ class StructuredLogger:
             **correlation_data,
             **kwargs
         )
-        
-        return record
     
     def _log(
         self,
@@ -336,8 +366,27 @@ class StructuredLogger:
     ):
         """Internal logging method."""
         
-        with self._lock:
-            try:
+        # Dropped levels cost one comparison, before any record is built
+        log_level = _LEVEL_NUMBERS[level.value]
+        if not self._logger.isEnabledFor(log_level):
+            return
+        
+        try:
+            if self._pipeline is not None:
+                # Capture what depends on the calling context; the writer builds the record
+                self._pipeline.submit((
+                    self._record_from_entry,
+                    time.time(),
+                    level,
+                    message,
+                    extra,
+                    self._exception_info(exception),
+                    event_type,
+                    self._extract_correlation_data(),
+                    threading.get_ident() if self.config.include_thread_info else None,
+                    kwargs
+                ), log_level)
+            else:
                 # Create log record
                 record = self._create_log_record(
                     level=level,
@@ -359,22 +408,23 @@ class StructuredLogger:
                     formatted_message = f"{record.timestamp} [{record.level}] {record.logger_name}: {record.message}"
                 
                 # Log using underlying logger
-                log_level = getattr(logging, level.value)
                 self._logger.log(log_level, formatted_message, extra={'structured_record': record_dict})
-                
-                # Update metrics
+            
+            # Update metrics
+            with self._lock:
                 self._log_count += 1
                 self._last_log_time = time.time()
-                
-            except Exception as e:
+            
+        except Exception as e:
+            with self._lock:
                 self._error_count += 1
-                # Fallback to simple logging
-                try:
-                    self._logger.error(f"Structured logging failed: {e}. Original message: {message}")
-                except Exception:
-                    # Last resort - print to stderr
-                    import sys
-                    print(f"LOGGING FAILURE: {e}. Original: {message}", file=sys.stderr)
+            # Fallback to simple logging
+            try:
+                self._logger.error(f"Structured logging failed: {e}. Original message: {message}")
+            except Exception:
+                # Last resort - print to stderr
+                import sys
+                print(f"LOGGING FAILURE: {e}. Original: {message}", file=sys.stderr)
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
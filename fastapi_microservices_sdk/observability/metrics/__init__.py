@@ -25,11 +25,26 @@ from .types import (
     Histogram,
     Summary,
     MetricType,
-    MetricValue
+    MetricValue,
+    CounterChild,
+    GaugeChild,
+    HistogramChild,
+    SummaryChild
 )
+from .sketch import DDSketch, merge_sketches
+from .multiprocess import (
+    MultiProcessStore,
+    MultiProcessCollector,
+    enable_multiprocess,
+    get_multiprocess_store,
+    mark_process_dead
+)
+from .routing import PathFilter, EndpointNormalizer
 from .middleware import (
     PrometheusMiddleware,
-    MetricsMiddleware
+    MetricsMiddleware,
+    PrometheusASGIMiddleware,
+    MetricsASGIMiddleware
 )
 from .exporter import (
     PrometheusExporter,
@@ -60,10 +75,27 @@ __all__ = [
     'Summary',
     'MetricType',
     'MetricValue',
+    'CounterChild',
+    'GaugeChild',
+    'HistogramChild',
+    'SummaryChild',
+    'DDSketch',
+    'merge_sketches',
+    
+    # Multiprocess mode
+    'MultiProcessStore',
+    'MultiProcessCollector',
+    'enable_multiprocess',
+    'get_multiprocess_store',
+    'mark_process_dead',
     
     # Middleware
     'PrometheusMiddleware',
     'MetricsMiddleware',
+    'PrometheusASGIMiddleware',
+    'MetricsASGIMiddleware',
+    'PathFilter',
+    'EndpointNormalizer',
     
     # Exporters
     'PrometheusExporter',
@@ -395,63 +395,83 @@ class HTTPMetricsCollector(MetricsCollector):
         # In-progress requests tracking
         self._requests_in_progress = 0
         self._requests_lock = threading.Lock()
+        
+        # Bound label children by (method, endpoint, status_code)
+        self.max_cached_label_sets = config.get('max_cached_label_sets', 10000)
+        self._request_children: Dict[tuple, tuple] = {}
     
     async def _setup_metrics(self) -> None:
         """Setup HTTP metrics."""
+        self.register_metrics()
+    
+    def register_metrics(self) -> None:
+        """
+        Create and register the HTTP metrics.
+        
+        Safe to call more than once and from several collectors sharing a
+        registry: metrics already registered under the same name and type
+        are reused instead of colliding.
+        """
         try:
             # Request count
-            self.request_count_counter = Counter(
+            self.request_count_counter = self._get_or_register(Counter(
                 'http_requests_total',
                 'Total number of HTTP requests',
                 labels=['method', 'endpoint', 'status_code'],
                 unit='requests'
-            )
-            self.registry.register(self.request_count_counter)
+            ))
             
             # Request duration
-            self.request_duration_histogram = Histogram(
+            self.request_duration_histogram = self._get_or_register(Histogram(
                 'http_request_duration_seconds',
                 'HTTP request duration in seconds',
                 labels=['method', 'endpoint'],
                 unit='seconds',
                 buckets=self.duration_buckets
-            )
-            self.registry.register(self.request_duration_histogram)
+            ))
             
             # Request size
             if self.track_request_size:
-                self.request_size_histogram = Histogram(
+                self.request_size_histogram = self._get_or_register(Histogram(
                     'http_request_size_bytes',
                     'HTTP request size in bytes',
                     labels=['method', 'endpoint'],
                     unit='bytes',
                     buckets=self.size_buckets
-                )
-                self.registry.register(self.request_size_histogram)
+                ))
             
             # Response size
             if self.track_response_size:
-                self.response_size_histogram = Histogram(
+                self.response_size_histogram = self._get_or_register(Histogram(
                     'http_response_size_bytes',
                     'HTTP response size in bytes',
                     labels=['method', 'endpoint', 'status_code'],
                     unit='bytes',
                     buckets=self.size_buckets
-                )
-                self.registry.register(self.response_size_histogram)
+                ))
             
             # Requests in progress
             if self.track_in_progress:
-                self.requests_in_progress_gauge = Gauge(
+                self.requests_in_progress_gauge = self._get_or_register(Gauge(
                     'http_requests_in_progress',
                     'Number of HTTP requests currently being processed',
-                    unit='requests'
-                )
-                self.registry.register(self.requests_in_progress_gauge)
+                    unit='requests',
+                    multiprocess_mode='livesum'
+                ))
+            
+            self._request_children.clear()
             
         except Exception as e:
             raise handle_http_metrics_error(e)
     
+    def _get_or_register(self, metric: Any) -> Any:
+        """Register a metric, reusing an existing one of the same name and type."""
+        existing = self.registry.get(metric.name)
+        if existing is not None and type(existing) is type(metric):
+            return existing
+        self.registry.register(metric)
+        return metric
+    
     async def _collect_metrics(self) -> None:
         """HTTP metrics are collected via middleware, not periodic collection."""
         # Update in-progress gauge
@@ -459,6 +479,19 @@ class HTTPMetricsCollector(MetricsCollector):
             with self._requests_lock:
                 self.requests_in_progress_gauge.set(self._requests_in_progress)
     
+    def _bind_request_children(self, method: str, endpoint: str, status: str) -> tuple:
+        """Resolve the label children used for one (method, endpoint, status) triple."""
+        return (
+            self.request_count_counter.with_labels(method, endpoint, status)
+            if self.request_count_counter else None,
+            self.request_duration_histogram.with_labels(method, endpoint)
+            if self.request_duration_histogram else None,
+            self.request_size_histogram.with_labels(method, endpoint)
+            if self.request_size_histogram else None,
+            self.response_size_histogram.with_labels(method, endpoint, status)
+            if self.response_size_histogram else None
+        )
+    
     def record_request(
         self,
         method: str,
@@ -470,40 +503,30 @@ class HTTPMetricsCollector(MetricsCollector):
     ) -> None:
         """Record HTTP request metrics."""
         try:
-            labels = {
-                'method': method.upper(),
-                'endpoint': endpoint,
-                'status_code': str(status_code)
-            }
+            children = self._request_children.get((method, endpoint, status_code))
+            if children is None:
+                if len(self._request_children) >= self.max_cached_label_sets:
+                    self._request_children.clear()
+                children = self._bind_request_children(method.upper(), endpoint, str(status_code))
+                self._request_children[(method, endpoint, status_code)] = children
+            
+            count_child, duration_child, request_size_child, response_size_child = children
             
             # Request count
-            if self.request_count_counter:
-                self.request_count_counter.inc(1.0, labels)
+            if count_child is not None:
+                count_child.inc(1.0)
             
             # Request duration
-            if self.request_duration_histogram:
-                duration_labels = {
-                    'method': method.upper(),
-                    'endpoint': endpoint
-                }
-                self.request_duration_histogram.observe(duration_seconds, duration_labels)
+            if duration_child is not None:
+                duration_child.observe(duration_seconds)
             
             # Request size
-            if self.request_size_histogram and request_size_bytes is not None:
-                size_labels = {
-                    'method': method.upper(),
-                    'endpoint': endpoint
-                }
-                self.request_size_histogram.observe(request_size_bytes, size_labels)
+            if request_size_child is not None and request_size_bytes is not None:
+                request_size_child.observe(request_size_bytes)
             
             # Response size
-            if self.response_size_histogram and response_size_bytes is not None:
-                response_labels = {
-                    'method': method.upper(),
-                    'endpoint': endpoint,
-                    'status_code': str(status_code)
-                }
-                self.response_size_histogram.observe(response_size_bytes, response_labels)
+            if response_size_child is not None and response_size_bytes is not None:
+                response_size_child.observe(response_size_bytes)
             
         except Exception as e:
             self.collection_errors += 1
@@ -514,12 +537,16 @@ class HTTPMetricsCollector(MetricsCollector):
         if self.track_in_progress:
             with self._requests_lock:
                 self._requests_in_progress += 1
+                if self.requests_in_progress_gauge:
+                    self.requests_in_progress_gauge.set(self._requests_in_progress)
     
     def end_request(self) -> None:
         """Mark the end of a request (for in-progress tracking)."""
         if self.track_in_progress:
             with self._requests_lock:
                 self._requests_in_progress = max(0, self._requests_in_progress - 1)
+                if self.requests_in_progress_gauge:
+                    self.requests_in_progress_gauge.set(self._requests_in_progress)
 
 
 # Factory functions
@@ -1,25 +1,39 @@
 """
 Prometheus metrics exporter.
 
-This module provides exporters for metrics in Prometheus format,
-including HTTP endpoint and file-based export capabilities.
+This module provides exporters for metrics in Prometheus and OpenMetrics
+format, including HTTP endpoint and file-based export capabilities.
 
 Author: FastAPI Microservices SDK
 Version: 1.0.0
 """
 
 import asyncio
+import functools
+import gzip
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union, TextIO
+from typing import Dict, List, Optional, Any, Union, TextIO, Tuple, Callable
 from datetime import datetime, timezone
 from io import StringIO
 
 from .registry import MetricRegistry, get_global_registry
-from .types import BaseMetric, Counter, Gauge, Histogram, Summary, MetricType
+from .types import BaseMetric, Counter, Gauge, Histogram, Summary, MetricType, key_to_labels
+from .multiprocess import (
+    MultiProcessCollector,
+    enable_multiprocess,
+    get_multiprocess_dir,
+    get_multiprocess_store
+)
 from .exceptions import MetricsExportError, PrometheusIntegrationError
 
 
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_MEDIA_TYPE = "application/openmetrics-text"
+CONTENT_TYPE_OPENMETRICS = f"{OPENMETRICS_MEDIA_TYPE}; version=1.0.0; charset=utf-8"
+
+
 class PrometheusFormatter:
     """Formatter for Prometheus exposition format."""
     
@@ -76,51 +90,151 @@ class PrometheusFormatter:
 
 
 class PrometheusExporter:
-    """Exporter for Prometheus metrics format."""
+    """
+    Exporter for Prometheus metrics format.
     
-    def __init__(self, registry: Optional[MetricRegistry] = None):
+    Rendered series are cached between scrapes: every series keeps its
+    pre-rendered sample prefixes (name plus formatted labels) and the lines
+    rendered for its last values, so a scrape only formats the series whose
+    values changed. Both the Prometheus text format and OpenMetrics are
+    supported, and ``render_async`` produces the (optionally gzip-compressed)
+    body in a worker thread instead of on the event loop.
+    """
+    
+    def __init__(
+        self,
+        registry: Optional[MetricRegistry] = None,
+        multiprocess_dir: Optional[str] = None,
+        gzip_min_size: int = 1024,
+        gzip_level: int = 6
+    ):
         self.registry = registry or get_global_registry()
         self.logger = logging.getLogger("observability.prometheus_exporter")
         self.formatter = PrometheusFormatter()
         
+        # Multiprocess mode: merge the metrics of all worker processes
+        self.multiprocess_dir = multiprocess_dir or get_multiprocess_dir()
+        self._multiprocess_collector = (
+            MultiProcessCollector(self.multiprocess_dir) if self.multiprocess_dir else None
+        )
+        
+        # Response compression
+        self.gzip_min_size = gzip_min_size
+        self.gzip_level = gzip_level
+        
+        # Rendered series by format, rebuilt each scrape so removed series drop out
+        self._series_cache: Dict[bool, Dict[Any, Tuple[Any, List[str], str]]] = {False: {}, True: {}}
+        self._previous_series: Optional[Dict[Any, Tuple[Any, List[str], str]]] = None
+        self._current_series: Optional[Dict[Any, Tuple[Any, List[str], str]]] = None
+        self._openmetrics = False
+        self._export_lock = threading.Lock()
+        
         # Export statistics
         self.exports_total = 0
         self.export_errors = 0
         self.last_export_time = 0.0
         self.export_duration_seconds = 0.0
+        self.series_rendered = 0
+        self.series_reused = 0
     
-    def export_metrics(self, include_timestamp: bool = False) -> str:
-        """Export all metrics in Prometheus format."""
-        try:
-            start_time = time.time()
-            output = StringIO()
-            
-            metrics = self.registry.get_all_metrics()
-            
-            for name, metric in metrics.items():
+    def export_metrics(self, include_timestamp: bool = False, openmetrics: bool = False) -> str:
+        """
+        Export all metrics.
+        
+        Args:
+            include_timestamp: Append a timestamp to every sample (disables caching)
+            openmetrics: Render OpenMetrics instead of the Prometheus text format
+        
+        Returns:
+            Exposition text
+        """
+        with self._export_lock:
+            try:
+                start_time = time.time()
+                output = StringIO()
+                
+                metrics = self._collect_metrics()
+                
+                self._openmetrics = openmetrics
+                self._previous_series = self._series_cache[openmetrics]
+                self._current_series = {}
+                
                 try:
-                    self._export_metric(output, metric, include_timestamp)
-                except Exception as e:
-                    self.logger.error(f"Failed to export metric {name}: {e}")
-                    self.export_errors += 1
-            
-            result = output.getvalue()
-            
-            # Update statistics
-            self.export_duration_seconds = time.time() - start_time
-            self.last_export_time = time.time()
-            self.exports_total += 1
-            
-            return result
-            
-        except Exception as e:
-            self.export_errors += 1
-            raise MetricsExportError(
-                message=f"Failed to export metrics: {str(e)}",
-                export_destination="prometheus",
-                export_format="text",
-                original_error=e
-            )
+                    for name, metric in metrics.items():
+                        try:
+                            self._export_metric(output, metric, include_timestamp)
+                        except Exception as e:
+                            self.logger.error(f"Failed to export metric {name}: {e}")
+                            self.export_errors += 1
+                    
+                    self._series_cache[openmetrics] = self._current_series
+                finally:
+                    self._previous_series = None
+                    self._current_series = None
+                    self._openmetrics = False
+                
+                if openmetrics:
+                    output.write("# EOF\n")
+                
+                result = output.getvalue()
+                
+                # Update statistics
+                self.export_duration_seconds = time.time() - start_time
+                self.last_export_time = time.time()
+                self.exports_total += 1
+                
+                return result
+                
+            except Exception as e:
+                self.export_errors += 1
+                raise MetricsExportError(
+                    message=f"Failed to export metrics: {str(e)}",
+                    export_destination="prometheus",
+                    export_format="openmetrics" if openmetrics else "text",
+                    original_error=e
+                )
+    
+    def render(self, accept: str = "", accept_encoding: str = "") -> Tuple[bytes, Dict[str, str]]:
+        """
+        Render a scrape response with content negotiation.
+        
+        Args:
+            accept: Request ``Accept`` header (selects OpenMetrics when offered)
+            accept_encoding: Request ``Accept-Encoding`` header (enables gzip)
+        
+        Returns:
+            Tuple of (response body, response headers)
+        """
+        openmetrics = OPENMETRICS_MEDIA_TYPE in accept
+        body = self.export_metrics(openmetrics=openmetrics).encode('utf-8')
+        headers = {
+            'Content-Type': CONTENT_TYPE_OPENMETRICS if openmetrics else CONTENT_TYPE_PROMETHEUS,
+            'Vary': 'Accept, Accept-Encoding'
+        }
+        
+        if 'gzip' in accept_encoding and len(body) >= self.gzip_min_size:
+            body = gzip.compress(body, compresslevel=self.gzip_level)
+            headers['Content-Encoding'] = 'gzip'
+        
+        return body, headers
+    
+    async def render_async(self, accept: str = "", accept_encoding: str = "") -> Tuple[bytes, Dict[str, str]]:
+        """Render a scrape response in a worker thread, keeping the event loop free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.render, accept, accept_encoding))
+    
+    def _collect_metrics(self) -> Dict[str, BaseMetric]:
+        """Get the metrics to export, merged across processes in multiprocess mode."""
+        if self._multiprocess_collector is None:
+            return self.registry.get_all_metrics()
+        
+        # Make sure this process's latest values are on disk before merging
+        store = get_multiprocess_store()
+        if store is None:
+            store = enable_multiprocess(self.multiprocess_dir, self.registry)
+        store.flush()
+        
+        return self._multiprocess_collector.collect().get_all_metrics()
     
     def export_metric(self, metric: BaseMetric, include_timestamp: bool = False) -> str:
         """Export a single metric in Prometheus format."""
@@ -139,18 +253,24 @@ class PrometheusExporter:
     def _export_metric(self, output: TextIO, metric: BaseMetric, include_timestamp: bool = False) -> None:
         """Export a single metric to the output stream."""
         metric_name = self.formatter.format_metric_name(metric.name)
+        family_name = metric_name
+        
+        # OpenMetrics names counter families without the _total suffix
+        if self._openmetrics and isinstance(metric, Counter) and family_name.endswith('_total'):
+            family_name = family_name[:-len('_total')]
         
         # Write HELP comment
         if metric.description:
-            output.write(f"# HELP {metric_name} {metric.description}\n")
+            output.write(f"# HELP {family_name} {metric.description}\n")
         
         # Write TYPE comment
         metric_type = self._get_prometheus_type(metric.get_type())
-        output.write(f"# TYPE {metric_name} {metric_type}\n")
+        output.write(f"# TYPE {family_name} {metric_type}\n")
         
         # Export metric data based on type
         if isinstance(metric, Counter):
-            self._export_counter(output, metric, metric_name, include_timestamp)
+            sample_name = f"{family_name}_total" if self._openmetrics else metric_name
+            self._export_counter(output, metric, sample_name, include_timestamp)
         elif isinstance(metric, Gauge):
             self._export_gauge(output, metric, metric_name, include_timestamp)
         elif isinstance(metric, Histogram):
@@ -158,112 +278,197 @@ class PrometheusExporter:
         elif isinstance(metric, Summary):
             self._export_summary(output, metric, metric_name, include_timestamp)
     
+    def _write_series(
+        self,
+        output: TextIO,
+        child: Any,
+        state: Any,
+        build_prefixes: Callable[[], List[str]],
+        values: Callable[[], List[Union[int, float]]],
+        include_timestamp: bool
+    ) -> None:
+        """
+        Write the samples of one series, reusing cached renderings.
+        
+        Args:
+            output: Output stream
+            child: Series (metric child) being rendered
+            state: Comparable snapshot of the series values
+            build_prefixes: Builds the sample prefixes (name and labels) once per series
+            values: Produces sample values in prefix order
+            include_timestamp: Append a timestamp to every sample
+        """
+        cached = self._previous_series.get(child) if self._previous_series is not None else None
+        
+        if include_timestamp:
+            prefixes = cached[1] if cached is not None else build_prefixes()
+            timestamp = self.formatter.format_timestamp()
+            lines = "".join(
+                f"{prefix}{self.formatter.format_value(value)} {timestamp}\n"
+                for prefix, value in zip(prefixes, values())
+            )
+        elif cached is not None and cached[0] == state:
+            prefixes, lines = cached[1], cached[2]
+            self.series_reused += 1
+        else:
+            prefixes = cached[1] if cached is not None else build_prefixes()
+            lines = "".join(
+                f"{prefix}{self.formatter.format_value(value)}\n"
+                for prefix, value in zip(prefixes, values())
+            )
+            self.series_rendered += 1
+        
+        if self._current_series is not None:
+            self._current_series[child] = (state, prefixes, lines)
+        output.write(lines)
+    
     def _export_counter(self, output: TextIO, counter: Counter, metric_name: str, include_timestamp: bool) -> None:
         """Export counter metric."""
-        all_values = counter.get_all_values()
+        children = counter.get_children()
         
-        if not all_values:
+        if not children:
             # Export zero value with no labels
             timestamp = self.formatter.format_timestamp() if include_timestamp else ""
             output.write(f"{metric_name} 0 {timestamp}\n".strip() + "\n")
         else:
-            for label_key, value in all_values.items():
-                labels = self._parse_label_key(label_key)
-                labels_str = self.formatter.format_labels(labels)
-                value_str = self.formatter.format_value(value)
-                timestamp = self.formatter.format_timestamp() if include_timestamp else ""
+            previous = self._previous_series if not include_timestamp else None
+            current = self._current_series
+            
+            for child in children:
+                value = child.get()
+                
+                # Fast path: unchanged series reuse their rendered line
+                cached = previous.get(child) if previous is not None else None
+                if cached is not None and cached[0] == value:
+                    current[child] = cached
+                    output.write(cached[2])
+                    self.series_reused += 1
+                    continue
                 
-                output.write(f"{metric_name}{labels_str} {value_str} {timestamp}\n".strip() + "\n")
+                self._write_series(
+                    output, child, value,
+                    lambda: [f"{metric_name}{self.formatter.format_labels(child.label_values)} "],
+                    lambda: [value],
+                    include_timestamp
+                )
     
     def _export_gauge(self, output: TextIO, gauge: Gauge, metric_name: str, include_timestamp: bool) -> None:
         """Export gauge metric."""
-        all_values = gauge.get_all_values()
+        children = gauge.get_children()
         
-        if not all_values:
+        if not children:
             # Export zero value with no labels
             timestamp = self.formatter.format_timestamp() if include_timestamp else ""
             output.write(f"{metric_name} 0 {timestamp}\n".strip() + "\n")
         else:
-            for label_key, value in all_values.items():
-                labels = self._parse_label_key(label_key)
-                labels_str = self.formatter.format_labels(labels)
-                value_str = self.formatter.format_value(value)
-                timestamp = self.formatter.format_timestamp() if include_timestamp else ""
+            previous = self._previous_series if not include_timestamp else None
+            current = self._current_series
+            
+            for child in children:
+                value = child.get()
+                
+                # Fast path: unchanged series reuse their rendered line
+                cached = previous.get(child) if previous is not None else None
+                if cached is not None and cached[0] == value:
+                    current[child] = cached
+                    output.write(cached[2])
+                    self.series_reused += 1
+                    continue
                 
-                output.write(f"{metric_name}{labels_str} {value_str} {timestamp}\n".strip() + "\n")
+                self._write_series(
+                    output, child, value,
+                    lambda: [f"{metric_name}{self.formatter.format_labels(child.label_values)} "],
+                    lambda: [value],
+                    include_timestamp
+                )
+    
+    def _format_bound(self, bound: float) -> str:
+        """Format a bucket bound or quantile for the ``le``/``quantile`` label."""
+        if self._openmetrics:
+            # OpenMetrics expects canonical floats, e.g. "1.0"
+            return self.formatter.format_value(float(bound))
+        return self.formatter.format_value(bound)
     
     def _export_histogram(self, output: TextIO, histogram: Histogram, metric_name: str, include_timestamp: bool) -> None:
         """Export histogram metric."""
-        all_values = histogram.get_all_values()
+        children = histogram.get_children()
         
-        if not all_values:
+        if not children:
             # Export empty histogram
             timestamp = self.formatter.format_timestamp() if include_timestamp else ""
-            output.write(f"{metric_name}_count 0 {timestamp}\n".strip() + "\n")
-            output.write(f"{metric_name}_sum 0 {timestamp}\n".strip() + "\n")
             
             # Export buckets
             for bucket in histogram.buckets:
-                bucket_str = self.formatter.format_value(bucket)
-                bucket_labels = self.formatter.format_labels({"le": str(bucket)})
+                bucket_labels = self.formatter.format_labels({"le": self._format_bound(bucket)})
                 output.write(f"{metric_name}_bucket{bucket_labels} 0 {timestamp}\n".strip() + "\n")
+            
+            output.write(f"{metric_name}_count 0 {timestamp}\n".strip() + "\n")
+            output.write(f"{metric_name}_sum 0 {timestamp}\n".strip() + "\n")
         else:
-            for label_key, stats in all_values.items():
-                labels = self._parse_label_key(label_key)
-                labels_str = self.formatter.format_labels(labels)
-                timestamp = self.formatter.format_timestamp() if include_timestamp else ""
-                
-                # Export count and sum
-                count_str = self.formatter.format_value(stats['count'])
-                sum_str = self.formatter.format_value(stats['sum'])
+            for child in children:
+                stats = child.get()
+                bucket_counts = list(stats['buckets'].values())
                 
-                output.write(f"{metric_name}_count{labels_str} {count_str} {timestamp}\n".strip() + "\n")
-                output.write(f"{metric_name}_sum{labels_str} {sum_str} {timestamp}\n".strip() + "\n")
-                
-                # Export buckets
-                for bucket, bucket_count in stats['buckets'].items():
-                    bucket_labels = dict(labels)
-                    bucket_labels['le'] = str(bucket)
-                    bucket_labels_str = self.formatter.format_labels(bucket_labels)
-                    bucket_count_str = self.formatter.format_value(bucket_count)
+                def build_prefixes(child=child, bounds=list(stats['buckets'])) -> List[str]:
+                    labels = child.label_values
+                    labels_str = self.formatter.format_labels(labels)
                     
-                    output.write(f"{metric_name}_bucket{bucket_labels_str} {bucket_count_str} {timestamp}\n".strip() + "\n")
+                    # Cumulative buckets (le="+Inf" equals the count), then count and sum
+                    prefixes = []
+                    for bound in bounds:
+                        bucket_labels = dict(labels)
+                        bucket_labels['le'] = self._format_bound(bound)
+                        prefixes.append(f"{metric_name}_bucket{self.formatter.format_labels(bucket_labels)} ")
+                    prefixes.append(f"{metric_name}_count{labels_str} ")
+                    prefixes.append(f"{metric_name}_sum{labels_str} ")
+                    return prefixes
+                
+                self._write_series(
+                    output, child, (stats['sum'], tuple(bucket_counts)),
+                    build_prefixes,
+                    lambda: bucket_counts + [stats['count'], stats['sum']],
+                    include_timestamp
+                )
     
     def _export_summary(self, output: TextIO, summary: Summary, metric_name: str, include_timestamp: bool) -> None:
         """Export summary metric."""
-        all_values = summary.get_all_values()
+        children = summary.get_children()
         
-        if not all_values:
+        if not children:
             # Export empty summary
             timestamp = self.formatter.format_timestamp() if include_timestamp else ""
-            output.write(f"{metric_name}_count 0 {timestamp}\n".strip() + "\n")
-            output.write(f"{metric_name}_sum 0 {timestamp}\n".strip() + "\n")
             
             # Export quantiles
             for quantile in summary.quantiles:
-                quantile_labels = self.formatter.format_labels({"quantile": str(quantile)})
+                quantile_labels = self.formatter.format_labels({"quantile": self._format_bound(quantile)})
                 output.write(f"{metric_name}{quantile_labels} 0 {timestamp}\n".strip() + "\n")
+            
+            output.write(f"{metric_name}_count 0 {timestamp}\n".strip() + "\n")
+            output.write(f"{metric_name}_sum 0 {timestamp}\n".strip() + "\n")
         else:
-            for label_key, stats in all_values.items():
-                labels = self._parse_label_key(label_key)
-                labels_str = self.formatter.format_labels(labels)
-                timestamp = self.formatter.format_timestamp() if include_timestamp else ""
-                
-                # Export count and sum
-                count_str = self.formatter.format_value(stats['count'])
-                sum_str = self.formatter.format_value(stats['sum'])
+            for child in children:
+                stats = child.get()
+                quantile_values = list(stats['quantiles'].values())
                 
-                output.write(f"{metric_name}_count{labels_str} {count_str} {timestamp}\n".strip() + "\n")
-                output.write(f"{metric_name}_sum{labels_str} {sum_str} {timestamp}\n".strip() + "\n")
-                
-                # Export quantiles
-                for quantile, value in stats['quantiles'].items():
-                    quantile_labels = dict(labels)
-                    quantile_labels['quantile'] = str(quantile)
-                    quantile_labels_str = self.formatter.format_labels(quantile_labels)
-                    value_str = self.formatter.format_value(value)
+                def build_prefixes(child=child, quantiles=list(stats['quantiles'])) -> List[str]:
+                    labels = child.label_values
+                    labels_str = self.formatter.format_labels(labels)
                     
-                    output.write(f"{metric_name}{quantile_labels_str} {value_str} {timestamp}\n".strip() + "\n")
+                    prefixes = []
+                    for quantile in quantiles:
+                        quantile_labels = dict(labels)
+                        quantile_labels['quantile'] = self._format_bound(quantile)
+                        prefixes.append(f"{metric_name}{self.formatter.format_labels(quantile_labels)} ")
+                    prefixes.append(f"{metric_name}_count{labels_str} ")
+                    prefixes.append(f"{metric_name}_sum{labels_str} ")
+                    return prefixes
+                
+                self._write_series(
+                    output, child, (stats['count'], stats['sum'], tuple(quantile_values)),
+                    build_prefixes,
+                    lambda: quantile_values + [stats['count'], stats['sum']],
+                    include_timestamp
+                )
     
     def _get_prometheus_type(self, metric_type: MetricType) -> str:
         """Get Prometheus type string for metric type."""
@@ -277,20 +482,13 @@ class PrometheusExporter:
     
     def _parse_label_key(self, label_key: str) -> Dict[str, str]:
         """Parse label key back to labels dict."""
-        if not label_key:
-            return {}
-        
-        labels = {}
-        for item in label_key.split(','):
-            if '=' in item:
-                key, value = item.split('=', 1)
-                labels[key] = value
-        
-        return labels
+        return key_to_labels(label_key)
     
     def get_export_statistics(self) -> Dict[str, Any]:
         """Get export statistics."""
         return {
+            'series_rendered': self.series_rendered,
+            'series_reused': self.series_reused,
             'exports_total': self.exports_total,
             'export_errors': self.export_errors,
             'error_rate': self.export_errors / max(1, self.exports_total),
@@ -309,9 +507,10 @@ class MetricsExporter:
     
     def export(self, format_type: str = "prometheus", **kwargs) -> str:
         """Export metrics in the specified format."""
-        if format_type.lower() == "prometheus":
+        if format_type.lower() in ("prometheus", "openmetrics"):
             return self.prometheus_exporter.export_metrics(
-                include_timestamp=kwargs.get('include_timestamp', False)
+                include_timestamp=kwargs.get('include_timestamp', False),
+                openmetrics=format_type.lower() == "openmetrics"
             )
         else:
             raise MetricsExportError(
@@ -346,9 +545,12 @@ class MetricsExporter:
 
 # Factory functions
 
-def create_prometheus_exporter(registry: Optional[MetricRegistry] = None) -> PrometheusExporter:
+def create_prometheus_exporter(
+    registry: Optional[MetricRegistry] = None,
+    multiprocess_dir: Optional[str] = None
+) -> PrometheusExporter:
     """Create a Prometheus exporter."""
-    return PrometheusExporter(registry)
+    return PrometheusExporter(registry, multiprocess_dir)
 
 
 def create_metrics_exporter(registry: Optional[MetricRegistry] = None) -> MetricsExporter:
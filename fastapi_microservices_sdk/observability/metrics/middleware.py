@@ -16,7 +16,7 @@ from urllib.parse import urlparse
 try:
     from fastapi import FastAPI, Request, Response
     from starlette.middleware.base import BaseHTTPMiddleware
-    from starlette.types import ASGIApp
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
@@ -25,10 +25,12 @@ except ImportError:
     Response = None
     BaseHTTPMiddleware = None
     ASGIApp = None
+    Message = Receive = Scope = Send = None
 
 from .collector import HTTPMetricsCollector
 from .exporter import PrometheusExporter
 from .registry import MetricRegistry, get_global_registry
+from .routing import PathFilter, EndpointNormalizer
 from .exceptions import HTTPMetricsError, handle_http_metrics_error
 
 
@@ -45,7 +47,10 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         group_paths: bool = True,
         track_request_size: bool = True,
         track_response_size: bool = True,
-        track_in_progress: bool = True
+        track_in_progress: bool = True,
+        path_patterns: Optional[Dict[str, str]] = None,
+        max_endpoints: int = 1000,
+        path_cache_size: int = 4096
     ):
         if not FASTAPI_AVAILABLE:
             raise ImportError("FastAPI is required for PrometheusMiddleware")
@@ -71,31 +76,36 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         }
         
         self.http_collector = HTTPMetricsCollector(config=collector_config)
+        self.http_collector.register_metrics()
         self.exporter = PrometheusExporter(self.registry)
         
         self.logger = logging.getLogger("observability.prometheus_middleware")
         
-        # Path grouping patterns
-        self.path_patterns = {
-            r'/api/v\d+/users/\d+': '/api/v{version}/users/{id}',
-            r'/api/v\d+/items/\d+': '/api/v{version}/items/{id}',
-            r'/files/[^/]+': '/files/{filename}',
-            r'/docs.*': '/docs',
-            r'/redoc.*': '/redoc',
-        }
+        # Compiled once; per-request lookups hit the LRU caches
+        self.path_filter = PathFilter(
+            exclude_paths=self.exclude_paths,
+            include_paths=self.include_paths,
+            cache_size=path_cache_size
+        )
+        self.normalizer = EndpointNormalizer(
+            path_patterns=path_patterns,
+            cache_size=path_cache_size,
+            max_endpoints=max_endpoints
+        )
+        self.path_patterns = self.normalizer.path_patterns
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process HTTP request and collect metrics."""
+        # Handle metrics endpoint (it is also excluded from the metrics)
+        if request.url.path == self.metrics_endpoint:
+            return await self._handle_metrics_endpoint(request)
+        
         # Check if path should be excluded
         if self._should_exclude_path(request.url.path):
             return await call_next(request)
         
-        # Handle metrics endpoint
-        if request.url.path == self.metrics_endpoint:
-            return await self._handle_metrics_endpoint(request)
-        
         # Start request tracking
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.http_collector.start_request()
         
         try:
@@ -106,13 +116,13 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Get response size
             response_size = self._get_response_size(response)
             
             # Record metrics
-            endpoint = self._normalize_endpoint(request.url.path)
+            endpoint = self._normalize_endpoint(request.url.path, request.scope)
             
             self.http_collector.record_request(
                 method=request.method,
@@ -127,8 +137,8 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             # Record error metrics
-            duration = time.time() - start_time
-            endpoint = self._normalize_endpoint(request.url.path)
+            duration = time.perf_counter() - start_time
+            endpoint = self._normalize_endpoint(request.url.path, request.scope)
             
             try:
                 self.http_collector.record_request(
@@ -149,13 +159,14 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
     async def _handle_metrics_endpoint(self, request: Request) -> Response:
         """Handle the metrics endpoint request."""
         try:
-            metrics_content = self.exporter.export_metrics()
-            
-            return Response(
-                content=metrics_content,
-                media_type="text/plain; version=0.0.4; charset=utf-8"
+            # Rendered in a worker thread so large scrapes don't stall live requests
+            body, headers = await self.exporter.render_async(
+                accept=request.headers.get('accept', ''),
+                accept_encoding=request.headers.get('accept-encoding', '')
             )
             
+            return Response(content=body, headers=headers)
+            
         except Exception as e:
             self.logger.error(f"Failed to export metrics: {e}")
             return Response(
@@ -166,46 +177,15 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
     
     def _should_exclude_path(self, path: str) -> bool:
         """Check if path should be excluded from metrics."""
-        # Check explicit exclusions
-        if path in self.exclude_paths:
-            return True
-        
-        # Check if path matches any exclusion pattern
-        for exclude_pattern in self.exclude_paths:
-            if '*' in exclude_pattern:
-                # Simple wildcard matching
-                if exclude_pattern.replace('*', '') in path:
-                    return True
-        
-        # Check inclusions (if specified)
-        if self.include_paths is not None:
-            if path not in self.include_paths:
-                # Check if path matches any inclusion pattern
-                for include_pattern in self.include_paths:
-                    if '*' in include_pattern:
-                        if include_pattern.replace('*', '') in path:
-                            return False
-                return True
-        
-        return False
+        return self.path_filter.is_excluded(path)
     
-    def _normalize_endpoint(self, path: str) -> str:
+    def _normalize_endpoint(self, path: str, scope: Optional[Dict[str, Any]] = None) -> str:
         """Normalize endpoint path for metrics grouping."""
         if not self.group_paths:
             return path
         
-        # Apply path grouping patterns
-        import re
-        for pattern, replacement in self.path_patterns.items():
-            if re.match(pattern, path):
-                return replacement
-        
-        # Default grouping for paths with IDs
-        normalized = re.sub(r'/\d+', '/{id}', path)
-        normalized = re.sub(r'/[a-f0-9-]{36}', '/{uuid}', normalized)  # UUIDs
-        normalized = re.sub(r'/[a-f0-9]{24}', '/{objectid}', normalized)  # MongoDB ObjectIds
-        
-        return normalized
+        # The router stores the matched route in the scope during call_next
+        return self.normalizer.normalize(path, scope)
     
     async def _get_request_size(self, request: Request) -> Optional[int]:
         """Get request content length."""
@@ -273,7 +253,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         
         # Start request tracking for all collectors
-        start_time = time.time()
+        start_time = time.perf_counter()
         for collector in self.collectors:
             collector.start_request()
         
@@ -282,7 +262,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Record metrics with all collectors
             for collector in self.collectors:
@@ -300,7 +280,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             # Record error metrics
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             for collector in self.collectors:
                 try:
@@ -331,6 +311,111 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return False
 
 
+def _content_length(scope: Scope) -> Optional[int]:
+    """Read the request content-length from raw ASGI headers."""
+    for name, value in scope.get('headers', ()):
+        if name == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class PrometheusASGIMiddleware(PrometheusMiddleware):
+    """
+    Pure ASGI variant of PrometheusMiddleware.
+    
+    Wraps ``send`` instead of going through BaseHTTPMiddleware, so no extra
+    task or body stream copy is created per request and streaming responses
+    pass through untouched. Response sizes are the number of body bytes sent.
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope['path']
+        if path == self.metrics_endpoint:
+            response = await self._handle_metrics_endpoint(Request(scope, receive))
+            await response(scope, receive, send)
+            return
+        
+        if self._should_exclude_path(path):
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        self.http_collector.start_request()
+        status_code = 500
+        response_size = 0
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                response_size += len(message.get('body', b''))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._record(scope, status_code, time.perf_counter() - start_time, response_size)
+            self.http_collector.end_request()
+    
+    def _record(self, scope: Scope, status_code: int, duration: float, response_size: int) -> None:
+        """Record metrics for a finished request."""
+        try:
+            self.http_collector.record_request(
+                method=scope['method'],
+                endpoint=self._normalize_endpoint(scope['path'], scope),
+                status_code=status_code,
+                duration_seconds=duration,
+                request_size_bytes=_content_length(scope),
+                response_size_bytes=response_size
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to record request metrics: {e}")
+
+
+class MetricsASGIMiddleware(MetricsMiddleware):
+    """Pure ASGI variant of MetricsMiddleware."""
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or self._should_exclude_path(scope['path']):
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        for collector in self.collectors:
+            collector.start_request()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            for collector in self.collectors:
+                try:
+                    collector.record_request(
+                        method=scope['method'],
+                        endpoint=scope['path'],
+                        status_code=status_code,
+                        duration_seconds=duration
+                    )
+                except Exception as e:
+                    self.logger.error(f"Collector {collector.name} failed to record metrics: {e}")
+                collector.end_request()
+
+
 # Utility functions for FastAPI integration
 
 def add_prometheus_middleware(
@@ -403,12 +488,12 @@ def collect_metrics(
             if collector is None:
                 return await func(*args, **kwargs)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             collector.start_request()
             
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # Extract request info if available
                 method = "UNKNOWN"
@@ -432,7 +517,7 @@ def collect_metrics(
                 return result
                 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 collector.record_request(
                     method="UNKNOWN",
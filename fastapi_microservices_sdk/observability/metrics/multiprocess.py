@@ -0,0 +1,650 @@
+"""
+Multiprocess metrics aggregation.
+
+With several worker processes (``uvicorn --workers N``, gunicorn) every
+worker has its own registry, so a scrape only sees the worker that happened
+to answer it. In multiprocess mode each worker snapshots its registry into
+its own memory-mapped file in a shared directory, from a background thread,
+so the request hot path is unchanged. At scrape time the files of all
+workers are merged with per-type semantics:
+
+- counters, histograms and summary count/sum are summed
+- summary quantiles come from the merged DDSketches of live workers
+- gauges follow their ``multiprocess_mode`` (per-process series, sum, max
+  or min, optionally restricted to live processes)
+
+Files of workers that exited are folded into an archive file and removed,
+so counters never go backwards and the directory does not grow with
+worker restarts.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import atexit
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    psutil = None
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    fcntl = None
+
+from .registry import MetricRegistry, get_global_registry
+from .sketch import DDSketch
+from .types import BaseMetric, Counter, Gauge, Histogram, Summary
+from .exceptions import MetricsError
+
+
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+_HEADER = struct.Struct('i')
+_LENGTH = struct.Struct('i')
+_VALUE = struct.Struct('d')
+_HEADER_SIZE = 8
+_INITIAL_SIZE = 1 << 20
+
+_PROCESS_FILE_PREFIX = "metrics_"
+_PROCESS_FILE_SUFFIX = ".db"
+_ARCHIVE_FILE = "metrics_archive.db"
+_LOCK_FILE = ".metrics.lock"
+
+# Gauge modes that only count running processes
+_LIVE_GAUGE_MODES = ('liveall', 'livesum', 'livemax', 'livemin')
+
+
+def _padded_key_length(length: int) -> int:
+    """Length prefix plus key, padded so the value that follows is 8-byte aligned."""
+    size = _LENGTH.size + length
+    return size + (8 - size % 8) % 8
+
+
+def _read_entries(data: Any, used: int) -> Iterator[Tuple[str, float, int]]:
+    """Yield (key, value, value offset) for every complete entry."""
+    position = _HEADER_SIZE
+    while position < used:
+        length = _LENGTH.unpack_from(data, position)[0]
+        key = bytes(data[position + _LENGTH.size:position + _LENGTH.size + length]).decode('utf-8')
+        value_offset = position + _padded_key_length(length)
+        yield key, _VALUE.unpack_from(data, value_offset)[0], value_offset
+        position = value_offset + _VALUE.size
+
+
+def read_values(path: str) -> List[Tuple[str, float]]:
+    """Read all (key, value) pairs from a values file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER_SIZE:
+        return []
+    used = _HEADER.unpack_from(data, 0)[0]
+    return [(key, value) for key, value, _ in _read_entries(data, used)]
+
+
+class MmapedValues:
+    """
+    Append-only ``key -> float64`` file written by a single process.
+
+    An entry is a length-prefixed UTF-8 key followed by an aligned double.
+    New entries are fully written before the used-bytes header is advanced,
+    so readers in other processes never see a partial entry; existing
+    values are updated in place.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'a+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _INITIAL_SIZE:
+            self._file.truncate(_INITIAL_SIZE)
+            size = _INITIAL_SIZE
+        self._capacity = size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._positions: Dict[str, int] = {}
+
+        self._used = _HEADER.unpack_from(self._map, 0)[0]
+        if self._used == 0:
+            self._used = _HEADER_SIZE
+            _HEADER.pack_into(self._map, 0, self._used)
+        else:
+            for key, _, value_offset in _read_entries(self._map, self._used):
+                self._positions[key] = value_offset
+
+    def write(self, key: str, value: float) -> None:
+        """Set the value for a key, appending the key on first use."""
+        offset = self._positions.get(key)
+        if offset is None:
+            offset = self._append(key)
+        _VALUE.pack_into(self._map, offset, value)
+
+    def keys(self) -> List[str]:
+        """Get all keys in the file."""
+        return list(self._positions)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode('utf-8')
+        key_size = _padded_key_length(len(encoded))
+        entry_size = key_size + _VALUE.size
+        while self._used + entry_size > self._capacity:
+            self._grow()
+
+        start = self._used
+        _LENGTH.pack_into(self._map, start, len(encoded))
+        self._map[start + _LENGTH.size:start + _LENGTH.size + len(encoded)] = encoded
+        value_offset = start + key_size
+        _VALUE.pack_into(self._map, value_offset, 0.0)
+
+        # Publish the entry only once it is complete
+        self._used += entry_size
+        _HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = value_offset
+        return value_offset
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        self._map.close()
+        self._file.truncate(self._capacity)
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+
+
+def _pid_exists(pid: int) -> bool:
+    """Check whether a process is alive, with psutil or a signal 0 probe on POSIX."""
+    if PSUTIL_AVAILABLE:
+        return psutil.pid_exists(pid)
+    if os.name != 'posix':
+        # os.kill would terminate the process on Windows; treat it as alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_file_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{_PROCESS_FILE_PREFIX}{pid}{_PROCESS_FILE_SUFFIX}")
+
+
+def _encode_key(name: str, metric_type: str, description: str, meta: Any, labels: Dict[str, str], sample: str) -> str:
+    return json.dumps([name, metric_type, description, meta, sorted(labels.items()), sample], separators=(',', ':'))
+
+
+def _combine(metric_type: str, meta: Any, sample: str, current: Optional[float], value: float) -> float:
+    """Combine one sample across processes."""
+    if current is None:
+        return value
+    if sample == 'min' or (metric_type == 'gauge' and meta in ('min', 'livemin')):
+        return min(current, value)
+    if sample == 'max' or (metric_type == 'gauge' and meta in ('max', 'livemax')):
+        return max(current, value)
+    return current + value
+
+
+def _is_archivable(metric_type: str, meta: Any, sample: str) -> bool:
+    """Whether a dead process's sample must be kept (cumulative values only)."""
+    if metric_type in ('counter', 'histogram'):
+        return True
+    if metric_type == 'summary':
+        return sample in ('count', 'sum')
+    return meta in ('sum', 'max', 'min')
+
+
+class MultiProcessStore:
+    """Snapshots this process's registry into its values file."""
+
+    def __init__(
+        self,
+        directory: str,
+        registry: Optional[MetricRegistry] = None,
+        flush_interval: float = 1.0
+    ):
+        self.directory = directory
+        self.registry = registry or get_global_registry()
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger("observability.metrics_multiprocess")
+
+        self._lock = threading.Lock()
+        self._values: Optional[MmapedValues] = None
+        self._pid: Optional[int] = None
+        self._written: set = set()
+        self._key_cache: Dict[Tuple[Any, str], str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Flush statistics
+        self.flushes_total = 0
+        self.flush_errors = 0
+
+    def start(self) -> None:
+        """Open this process's file and start the background flush thread."""
+        with self._lock:
+            self._open()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._flush_loop, name="metrics-multiprocess-flush", daemon=True)
+        self._thread.start()
+
+    def flush(self) -> None:
+        """Write the current value of every sample to this process's file."""
+        with self._lock:
+            if self._values is None or self._pid != os.getpid():
+                self._open()
+
+            current = set()
+            for key, value in self._samples():
+                self._values.write(key, value)
+                current.add(key)
+
+            # Samples that disappeared (removed children, expired quantile bins)
+            for key in self._written - current:
+                self._values.write(key, 0.0)
+            self._written = current
+            self.flushes_total += 1
+
+    def close(self) -> None:
+        """Stop the flush thread, write a final snapshot and close the file."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 1.0)
+        self._thread = None
+
+        try:
+            if self._pid == os.getpid():
+                self.flush()
+        finally:
+            with self._lock:
+                if self._values is not None:
+                    self._values.close()
+                    self._values = None
+
+    def _open(self) -> None:
+        """Open the values file for the current process (lock held)."""
+        pid = os.getpid()
+        path = _process_file_path(self.directory, pid)
+        if self._values is not None:
+            # Inherited across fork: the parent's file belongs to the parent
+            self._values = None
+        elif os.path.exists(path):
+            # Left behind by a dead process whose pid was reused
+            MultiProcessCollector(self.directory).mark_process_dead(pid)
+
+        self._values = MmapedValues(path)
+        self._pid = pid
+        self._written = set()
+        self._key_cache.clear()
+
+    def _after_fork(self) -> None:
+        """Re-create per-process state in a forked child."""
+        self._lock = threading.Lock()
+        self._values = None
+        self._pid = None
+        self._thread = None
+        if not self._stop.is_set():
+            self.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.flush_errors += 1
+                self.logger.error(f"Failed to flush multiprocess metrics: {e}")
+
+    def _key(self, metric: BaseMetric, metric_type: str, meta: Any, child: Any, sample: str) -> str:
+        cache_key = (child, sample)
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            if len(self._key_cache) >= 100000:
+                self._key_cache.clear()
+            key = _encode_key(metric.name, metric_type, metric.description, meta, child.label_values, sample)
+            self._key_cache[cache_key] = key
+        return key
+
+    def _samples(self) -> Iterator[Tuple[str, float]]:
+        """Yield (key, value) for every sample in the registry."""
+        for metric in self.registry.get_all_metrics().values():
+            if isinstance(metric, Counter):
+                for child in metric.get_children():
+                    yield self._key(metric, 'counter', None, child, ''), child.get()
+
+            elif isinstance(metric, Gauge):
+                mode = metric.multiprocess_mode
+                for child in metric.get_children():
+                    yield self._key(metric, 'gauge', mode, child, ''), child.get()
+
+            elif isinstance(metric, Histogram):
+                buckets = list(metric.buckets)
+                for child in metric.get_children():
+                    stats = child.get()
+                    previous = 0
+                    for index, cumulative in enumerate(stats['buckets'].values()):
+                        yield self._key(metric, 'histogram', buckets, child, f"b:{index}"), cumulative - previous
+                        previous = cumulative
+                    yield self._key(metric, 'histogram', buckets, child, 'sum'), stats['sum']
+                    yield self._key(metric, 'histogram', buckets, child, 'count'), stats['count']
+
+            elif isinstance(metric, Summary):
+                meta = {
+                    'quantiles': list(metric.quantiles),
+                    'relative_accuracy': metric.relative_accuracy,
+                    'max_bins': metric.max_bins
+                }
+                for child in metric.get_children():
+                    stats = child.get()
+                    yield self._key(metric, 'summary', meta, child, 'sum'), stats['sum']
+                    yield self._key(metric, 'summary', meta, child, 'count'), stats['count']
+
+                    window = child.sketch().to_dict()
+                    if not window['count']:
+                        continue
+                    yield self._key(metric, 'summary', meta, child, 'min'), window['min']
+                    yield self._key(metric, 'summary', meta, child, 'max'), window['max']
+                    yield self._key(metric, 'summary', meta, child, 'zero'), window['zero_count']
+                    for bin_key, bin_count in window['positive'].items():
+                        yield self._key(metric, 'summary', meta, child, f"p:{bin_key}"), bin_count
+                    for bin_key, bin_count in window['negative'].items():
+                        yield self._key(metric, 'summary', meta, child, f"n:{bin_key}"), bin_count
+
+
+class MultiProcessCollector:
+    """Merges the values files of all worker processes at scrape time."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.logger = logging.getLogger("observability.metrics_multiprocess")
+        self._parsed_keys: Dict[str, list] = {}
+
+    def collect(self) -> MetricRegistry:
+        """
+        Merge all process files into a registry of plain metrics.
+
+        Returns:
+            Registry holding one merged metric per metric name
+        """
+        self.cleanup_dead_processes()
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        with self._locked(exclusive=False):
+            for path, pid in self._value_files():
+                live = pid is not None and _pid_exists(pid)
+                try:
+                    values = read_values(path)
+                except FileNotFoundError:
+                    continue
+
+                for key, value in values:
+                    name, metric_type, description, meta, labels, sample = self._parse_key(key)
+                    if metric_type == 'gauge':
+                        if meta in _LIVE_GAUGE_MODES and not live:
+                            continue
+                        if meta in ('all', 'liveall'):
+                            labels = labels + [['pid', str(pid)]]
+                    elif metric_type == 'summary' and not live and sample not in ('count', 'sum'):
+                        continue
+
+                    metric = merged.setdefault(name, {
+                        'type': metric_type,
+                        'description': description,
+                        'meta': meta,
+                        'series': {}
+                    })
+                    series = metric['series'].setdefault(tuple(map(tuple, labels)), {})
+                    series[sample] = _combine(metric_type, meta, sample, series.get(sample), value)
+
+        return self._build_registry(merged)
+
+    def mark_process_dead(self, pid: int) -> None:
+        """
+        Fold a dead process's cumulative samples into the archive and delete its file.
+
+        Call this from the process manager (e.g. gunicorn's ``child_exit``
+        hook); dead processes are also detected on every scrape.
+        """
+        path = _process_file_path(self.directory, pid)
+        with self._locked(exclusive=True):
+            if not os.path.exists(path):
+                return
+
+            archive_path = os.path.join(self.directory, _ARCHIVE_FILE)
+            combined: Dict[str, float] = {}
+            sources = [archive_path, path] if os.path.exists(archive_path) else [path]
+            for source in sources:
+                for key, value in read_values(source):
+                    _, metric_type, _, meta, _, sample = self._parse_key(key)
+                    if _is_archivable(metric_type, meta, sample):
+                        combined[key] = _combine(metric_type, meta, sample, combined.get(key), value)
+
+            temporary_path = f"{archive_path}.{os.getpid()}.tmp"
+            archive = MmapedValues(temporary_path)
+            try:
+                for key, value in combined.items():
+                    archive.write(key, value)
+            finally:
+                archive.close()
+            os.replace(temporary_path, archive_path)
+            os.remove(path)
+
+    def cleanup_dead_processes(self) -> int:
+        """
+        Archive the files of processes that are no longer running.
+
+        Returns:
+            Number of process files cleaned up
+        """
+        if not FCNTL_AVAILABLE:
+            return 0
+
+        cleaned = 0
+        for _, pid in self._value_files():
+            if pid is not None and pid != os.getpid() and not _pid_exists(pid):
+                try:
+                    self.mark_process_dead(pid)
+                    cleaned += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to clean up metrics of process {pid}: {e}")
+        return cleaned
+
+    def _value_files(self) -> List[Tuple[str, Optional[int]]]:
+        """List (path, pid) of process files, plus the archive with pid None."""
+        files = []
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            if filename == _ARCHIVE_FILE:
+                files.append((path, None))
+            elif filename.startswith(_PROCESS_FILE_PREFIX) and filename.endswith(_PROCESS_FILE_SUFFIX):
+                pid = filename[len(_PROCESS_FILE_PREFIX):-len(_PROCESS_FILE_SUFFIX)]
+                if pid.isdigit():
+                    files.append((path, int(pid)))
+        return files
+
+    def _parse_key(self, key: str) -> list:
+        parsed = self._parsed_keys.get(key)
+        if parsed is None:
+            if len(self._parsed_keys) >= 100000:
+                self._parsed_keys.clear()
+            parsed = json.loads(key)
+            self._parsed_keys[key] = parsed
+        return parsed
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the directory lock (shared for reads, exclusive for cleanup)."""
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+
+        with open(os.path.join(self.directory, _LOCK_FILE), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _build_registry(self, merged: Dict[str, Dict[str, Any]]) -> MetricRegistry:
+        """Materialize merged samples as metrics the exporter can render."""
+        registry = MetricRegistry(enable_collision_detection=False)
+
+        for name, info in merged.items():
+            metric_type = info['type']
+            meta = info['meta']
+            series = info['series']
+            label_names = [label for label, _ in next(iter(series))] if series else []
+
+            try:
+                if metric_type == 'counter':
+                    metric = Counter(name, info['description'], labels=label_names)
+                    for labels, samples in series.items():
+                        metric.with_labels(**dict(labels)).inc(samples.get('', 0.0))
+
+                elif metric_type == 'gauge':
+                    metric = Gauge(name, info['description'], labels=label_names, multiprocess_mode=meta)
+                    for labels, samples in series.items():
+                        metric.with_labels(**dict(labels)).set(samples.get('', 0.0))
+
+                elif metric_type == 'histogram':
+                    metric = Histogram(name, info['description'], labels=label_names, buckets=meta)
+                    for labels, samples in series.items():
+                        bucket_counts = [samples.get(f"b:{index}", 0.0) for index in range(len(metric.buckets))]
+                        metric.with_labels(**dict(labels)).merge(
+                            bucket_counts, samples.get('sum', 0.0), samples.get('count', 0.0)
+                        )
+
+                elif metric_type == 'summary':
+                    metric = Summary(
+                        name,
+                        info['description'],
+                        labels=label_names,
+                        quantiles=meta['quantiles'],
+                        relative_accuracy=meta['relative_accuracy'],
+                        max_bins=meta['max_bins']
+                    )
+                    for labels, samples in series.items():
+                        metric.with_labels(**dict(labels)).merge(
+                            self._window_sketch(meta, samples),
+                            count=int(samples.get('count', 0)),
+                            sum_value=samples.get('sum', 0.0)
+                        )
+
+                else:
+                    continue
+
+                registry.register(metric)
+
+            except Exception as e:
+                self.logger.error(f"Failed to merge multiprocess metric {name}: {e}")
+
+        return registry
+
+    @staticmethod
+    def _window_sketch(meta: Dict[str, Any], samples: Dict[str, float]) -> DDSketch:
+        """Rebuild the merged quantile window of one summary series."""
+        positive = {}
+        negative = {}
+        for sample, value in samples.items():
+            if value and sample.startswith('p:'):
+                positive[sample[2:]] = int(value)
+            elif value and sample.startswith('n:'):
+                negative[sample[2:]] = int(value)
+
+        zero_count = int(samples.get('zero', 0))
+        count = sum(positive.values()) + sum(negative.values()) + zero_count
+        return DDSketch.from_dict({
+            'relative_accuracy': meta['relative_accuracy'],
+            'max_bins': meta['max_bins'],
+            'positive': positive,
+            'negative': negative,
+            'zero_count': zero_count,
+            'count': count,
+            'sum': 0.0,
+            'min': samples.get('min'),
+            'max': samples.get('max')
+        })
+
+
+# Process-wide store
+
+_store: Optional[MultiProcessStore] = None
+_store_lock = threading.Lock()
+
+
+def get_multiprocess_dir() -> Optional[str]:
+    """Get the multiprocess directory from the environment, if configured."""
+    return os.environ.get(MULTIPROCESS_DIR_ENV) or None
+
+
+def enable_multiprocess(
+    directory: Optional[str] = None,
+    registry: Optional[MetricRegistry] = None,
+    flush_interval: float = 1.0
+) -> MultiProcessStore:
+    """
+    Enable multiprocess mode for this process.
+
+    Call in every worker (or in the master before forking; forked children
+    re-open their own file automatically). Safe to call more than once.
+
+    Args:
+        directory: Shared directory for value files (defaults to $PROMETHEUS_MULTIPROC_DIR)
+        registry: Registry to snapshot (defaults to the global registry)
+        flush_interval: Seconds between background snapshots
+
+    Returns:
+        The process-wide multiprocess store
+    """
+    global _store
+
+    directory = directory or get_multiprocess_dir()
+    if not directory:
+        raise MetricsError(
+            message=f"Multiprocess mode needs a directory (argument or ${MULTIPROCESS_DIR_ENV})",
+            operation="multiprocess"
+        )
+
+    with _store_lock:
+        if _store is not None:
+            return _store
+
+        os.makedirs(directory, exist_ok=True)
+        store = MultiProcessStore(directory, registry, flush_interval)
+        store.start()
+        atexit.register(store.close)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=store._after_fork)
+        _store = store
+        return store
+
+
+def get_multiprocess_store() -> Optional[MultiProcessStore]:
+    """Get the process-wide multiprocess store, if enabled."""
+    return _store
+
+
+def mark_process_dead(pid: int, directory: Optional[str] = None) -> None:
+    """Archive a dead worker's metrics (for gunicorn's ``child_exit`` hook)."""
+    directory = directory or get_multiprocess_dir()
+    if directory:
+        MultiProcessCollector(directory).mark_process_dead(pid)
@@ -0,0 +1,193 @@
+"""
+Request path matching and endpoint normalization for HTTP metrics.
+
+This module provides the precompiled path handling used by the HTTP metrics
+middleware. Include/exclude rules are compiled once into an exact-match set
+plus a single wildcard regex, and endpoint normalization prefers the route
+template matched by the framework router, falling back to a compiled pattern
+set whose results are kept in a bounded LRU cache. The number of distinct
+fallback labels is capped so unmatched paths (scanners, 404 floods) cannot
+grow metric cardinality without bound.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Pattern, Set
+
+
+DEFAULT_PATH_PATTERNS: Dict[str, str] = {
+    r'/api/v\d+/users/\d+': '/api/v{version}/users/{id}',
+    r'/api/v\d+/items/\d+': '/api/v{version}/items/{id}',
+    r'/files/[^/]+': '/files/{filename}',
+    r'/docs.*': '/docs',
+    r'/redoc.*': '/redoc',
+}
+
+# Identifier-looking path segments collapsed by the default normalization
+_SEGMENT_PATTERN = re.compile(
+    r'/(?:(?P<id>\d+)|(?P<uuid>[a-f0-9-]{36})|(?P<objectid>[a-f0-9]{24}))(?=/|$)'
+)
+_SEGMENT_LABELS = {'id': '/{id}', 'uuid': '/{uuid}', 'objectid': '/{objectid}'}
+
+
+def _compile_wildcards(patterns: Iterable[str]) -> Optional[Pattern]:
+    """Compile ``*`` wildcard rules into one substring-search regex."""
+    fragments = sorted({p.replace('*', '') for p in patterns if '*' in p})
+    if not fragments:
+        return None
+    return re.compile('|'.join(re.escape(fragment) for fragment in fragments))
+
+
+def route_template(scope: Mapping[str, Any]) -> Optional[str]:
+    """Return the path template of the route the router matched, if any."""
+    route = scope.get('route')
+    if route is None:
+        return None
+    return getattr(route, 'path_format', None) or getattr(route, 'path', None)
+
+
+class PathFilter:
+    """Precompiled include/exclude rules for request paths."""
+
+    def __init__(
+        self,
+        exclude_paths: Optional[Iterable[str]] = None,
+        include_paths: Optional[Iterable[str]] = None,
+        cache_size: int = 4096
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            exclude_paths: Exact paths or ``*`` wildcard rules to skip
+            include_paths: If given, only these paths (or wildcards) are kept
+            cache_size: Maximum number of cached per-path decisions
+        """
+        self.exclude_paths: Set[str] = set(exclude_paths or [])
+        self.include_paths: Optional[Set[str]] = set(include_paths) if include_paths else None
+        self.cache_size = cache_size
+
+        self._exclude_wildcards = _compile_wildcards(self.exclude_paths)
+        self._include_wildcards = _compile_wildcards(self.include_paths or [])
+        self._cache: "OrderedDict[str, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_excluded(self, path: str) -> bool:
+        """Check if path should be excluded from metrics."""
+        with self._lock:
+            excluded = self._cache.get(path)
+            if excluded is not None:
+                self._cache.move_to_end(path)
+                return excluded
+
+        excluded = self._evaluate(path)
+
+        with self._lock:
+            self._cache[path] = excluded
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return excluded
+
+    def _evaluate(self, path: str) -> bool:
+        """Apply the rules to a path without consulting the cache."""
+        if path in self.exclude_paths:
+            return True
+        if self._exclude_wildcards is not None and self._exclude_wildcards.search(path):
+            return True
+
+        if self.include_paths is not None and path not in self.include_paths:
+            if self._include_wildcards is not None and self._include_wildcards.search(path):
+                return False
+            return True
+
+        return False
+
+
+class EndpointNormalizer:
+    """Maps raw request paths to bounded-cardinality endpoint labels."""
+
+    def __init__(
+        self,
+        path_patterns: Optional[Mapping[str, str]] = None,
+        cache_size: int = 4096,
+        max_endpoints: int = 1000,
+        overflow_label: str = '/{other}'
+    ):
+        """
+        Initialize the normalizer.
+
+        Args:
+            path_patterns: Ordered regex -> label rules; the first match wins
+            cache_size: Maximum number of cached raw path -> label entries
+            max_endpoints: Maximum distinct labels produced from raw paths
+            overflow_label: Label used once ``max_endpoints`` is reached
+        """
+        self.path_patterns: Dict[str, str] = dict(
+            DEFAULT_PATH_PATTERNS if path_patterns is None else path_patterns
+        )
+        self.cache_size = cache_size
+        self.max_endpoints = max_endpoints
+        self.overflow_label = overflow_label
+
+        # One alternation, tried in declaration order like the rules themselves
+        self._labels = list(self.path_patterns.values())
+        self._pattern: Optional[Pattern] = None
+        if self.path_patterns:
+            self._pattern = re.compile('|'.join(
+                f'(?P<_rule{index}>{pattern})'
+                for index, pattern in enumerate(self.path_patterns)
+            ))
+
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._endpoints: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def normalize(self, path: str, scope: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Return the endpoint label for a request path.
+
+        The matched route template is used when ``scope`` carries one;
+        otherwise the path goes through the compiled patterns and cache.
+        """
+        if scope is not None:
+            template = route_template(scope)
+            if template:
+                return template
+
+        with self._lock:
+            label = self._cache.get(path)
+            if label is not None:
+                self._cache.move_to_end(path)
+                return label
+
+        label = self._apply_patterns(path)
+
+        with self._lock:
+            if label not in self._endpoints:
+                if len(self._endpoints) >= self.max_endpoints:
+                    label = self.overflow_label
+                else:
+                    self._endpoints.add(label)
+            self._cache[path] = label
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return label
+
+    def _apply_patterns(self, path: str) -> str:
+        """Normalize a path with the configured rules and default grouping."""
+        if self._pattern is not None:
+            match = self._pattern.match(path)
+            if match is not None:
+                return self._labels[int(match.lastgroup[len('_rule'):])]
+
+        return _SEGMENT_PATTERN.sub(lambda m: _SEGMENT_LABELS[m.lastgroup], path)
+
+    def clear(self) -> None:
+        """Drop cached labels and reset the distinct-label budget."""
+        with self._lock:
+            self._cache.clear()
+            self._endpoints.clear()
@@ -0,0 +1,240 @@
+"""
+Streaming quantile sketches for summary metrics.
+
+This module provides a DDSketch implementation: a bounded-memory quantile
+sketch with a relative-accuracy guarantee. Values are mapped to logarithmic
+bins, so every quantile estimate is within ``relative_accuracy`` of the true
+value, memory depends only on the value range (not the number of
+observations), and two sketches merge exactly by adding bin counts. Sketches
+serialize to plain dicts so they can be combined across workers and
+processes.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import math
+from typing import Dict, Any, Optional, Iterable
+
+from .exceptions import MetricValidationError
+
+
+class DDSketch:
+    """Mergeable quantile sketch with relative-error guarantees."""
+
+    __slots__ = (
+        'relative_accuracy', 'max_bins', '_gamma', '_log_gamma', '_min_indexable',
+        '_positive', '_negative', 'zero_count', 'count', 'sum', 'min', 'max'
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+            max_bins: Bin limit per sign; the lowest bins collapse beyond it
+        """
+        if not 0 < relative_accuracy < 1:
+            raise MetricValidationError(
+                message=f"Relative accuracy {relative_accuracy} must be between 0 and 1",
+                validation_rule="valid_relative_accuracy"
+            )
+        if max_bins < 1:
+            raise MetricValidationError(
+                message="Sketch must allow at least one bin",
+                validation_rule="positive_max_bins"
+            )
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        # Values closer to zero than this are counted as zero
+        self._min_indexable = 1e-9
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        if value > self._min_indexable:
+            bins = self._positive
+            key = math.ceil(math.log(value) / self._log_gamma)
+            bins[key] = bins.get(key, 0) + 1
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+        elif value < -self._min_indexable:
+            bins = self._negative
+            key = math.ceil(math.log(-value) / self._log_gamma)
+            bins[key] = bins.get(key, 0) + 1
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+        else:
+            self.zero_count += 1
+
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value (0.0 for an empty sketch)
+        """
+        return self.quantiles([q])[q]
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """Estimate several quantiles in one pass over the bins."""
+        qs = list(qs)
+        if self.count == 0:
+            return {q: 0.0 for q in qs}
+
+        results: Dict[float, float] = {}
+        pending = []
+        for q in sorted(qs):
+            if q <= 0:
+                results[q] = self.min
+            elif q >= 1:
+                results[q] = self.max
+            else:
+                pending.append((q * (self.count - 1), q))
+
+        # Walk bins in value order: negatives by descending magnitude, zero, positives
+        index = 0
+        seen = 0
+        for sign, bins, keys in (
+            (-1.0, self._negative, sorted(self._negative, reverse=True)),
+            (0.0, {0: self.zero_count}, (0,)),
+            (1.0, self._positive, sorted(self._positive))
+        ):
+            for key in keys:
+                if index == len(pending):
+                    break
+                seen += bins[key]
+                if seen > pending[index][0]:
+                    value = self._clamp(sign * self._bin_value(key) if sign else 0.0)
+                    while index < len(pending) and seen > pending[index][0]:
+                        results[pending[index][1]] = value
+                        index += 1
+
+        for _, q in pending[index:]:
+            results[q] = self.max
+
+        return {q: results[q] for q in qs}
+
+    def merge(self, other: 'DDSketch') -> None:
+        """
+        Merge another sketch into this one.
+
+        Raises:
+            MetricValidationError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise MetricValidationError(
+                message="Cannot merge sketches with different relative accuracy",
+                validation_rule="compatible_sketches"
+            )
+        if other.count == 0:
+            return
+
+        for bins, other_bins in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, bin_count in other_bins.items():
+                bins[key] = bins.get(key, 0) + bin_count
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> 'DDSketch':
+        """Create an independent copy of this sketch."""
+        sketch = DDSketch(self.relative_accuracy, self.max_bins)
+        sketch.merge(self)
+        return sketch
+
+    def clear(self) -> None:
+        """Remove all observations."""
+        self._positive.clear()
+        self._negative.clear()
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def bin_count(self) -> int:
+        """Number of non-empty bins held."""
+        return len(self._positive) + len(self._negative)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dict."""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'max_bins': self.max_bins,
+            'positive': {str(k): v for k, v in self._positive.items()},
+            'negative': {str(k): v for k, v in self._negative.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DDSketch':
+        """Rebuild a sketch serialized with ``to_dict``."""
+        sketch = cls(data['relative_accuracy'], data.get('max_bins', 2048))
+        sketch._positive = {int(k): v for k, v in data.get('positive', {}).items()}
+        sketch._negative = {int(k): v for k, v in data.get('negative', {}).items()}
+        sketch.zero_count = data.get('zero_count', 0)
+        sketch.count = data.get('count', 0)
+        sketch.sum = data.get('sum', 0.0)
+        if sketch.count:
+            sketch.min = data['min']
+            sketch.max = data['max']
+        return sketch
+
+    def _bin_value(self, key: int) -> float:
+        """Representative value of a bin (relative error bounded by accuracy)."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        """Keep estimates within the observed range."""
+        return min(max(value, self.min), self.max)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Fold the lowest-magnitude bins together to respect max_bins."""
+        keys = sorted(bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            bins[target] += bins.pop(key)
+
+
+def merge_sketches(sketches: Iterable[DDSketch]) -> Optional[DDSketch]:
+    """Merge sketches into a new sketch (None when there are none)."""
+    merged: Optional[DDSketch] = None
+    for sketch in sketches:
+        if merged is None:
+            merged = sketch.copy()
+        else:
+            merged.merge(sketch)
+    return merged
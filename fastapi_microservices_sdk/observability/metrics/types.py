@@ -4,6 +4,13 @@ Metric types and value containers.
 This module defines the core metric types (Counter, Gauge, Histogram, Summary)
 and their associated value containers and operations.
 
+Every metric keeps one child per label set. ``metric.with_labels(...)`` returns
+the cached child, so hot paths resolve labels once and then update the
+child's storage directly. Counters and histograms accumulate into per-thread
+cells that are merged on read, and histogram buckets are located with
+``bisect`` and made cumulative only when read. Summaries estimate quantiles
+with time-rotated DDSketches (see ``sketch``).
+
 Author: FastAPI Microservices SDK
 Version: 1.0.0
 """
@@ -11,13 +18,19 @@ Version: 1.0.0
 import time
 import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from typing import Dict, List, Optional, Union, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
 import statistics
 
 from .exceptions import MetricValidationError, MetricsError
+from .sketch import DDSketch
+
+
+# Gauge aggregation across worker processes: per-process series ("all"),
+# sum, max or min; "live" modes only include processes that are running
+MULTIPROCESS_GAUGE_MODES = ('all', 'liveall', 'sum', 'livesum', 'max', 'livemax', 'min', 'livemin')
 
 
 class MetricType(Enum):
@@ -34,7 +47,7 @@ class MetricValue:
     value: Union[int, float]
     timestamp: float = field(default_factory=time.time)
     labels: Dict[str, str] = field(default_factory=dict)
-    
+
     def __post_init__(self):
         if not isinstance(self.value, (int, float)):
             raise MetricValidationError(
@@ -43,9 +56,344 @@ class MetricValue:
             )
 
 
+# Label key encoding
+
+_KEY_ESCAPES = str.maketrans({'\\': '\\\\', ',': '\\,', '=': '\\='})
+
+
+def labels_to_key(labels: Dict[str, str]) -> str:
+    """
+    Encode labels as a string key (``name=value`` pairs sorted by name).
+
+    Backslashes, commas and equals signs in values are escaped, so
+    ``key_to_labels`` recovers any label set exactly.
+    """
+    if not labels:
+        return ""
+    return ",".join(f"{k}={str(v).translate(_KEY_ESCAPES)}" for k, v in sorted(labels.items()))
+
+
+def key_to_labels(key: str) -> Dict[str, str]:
+    """Decode a key produced by ``labels_to_key``."""
+    labels: Dict[str, str] = {}
+    if not key:
+        return labels
+
+    name = None
+    chars: List[str] = []
+    escaped = False
+    for char in key:
+        if escaped:
+            chars.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '=' and name is None:
+            name = ''.join(chars)
+            chars = []
+        elif char == ',':
+            labels[name] = ''.join(chars)
+            name = None
+            chars = []
+        else:
+            chars.append(char)
+
+    if name is not None:
+        labels[name] = ''.join(chars)
+    return labels
+
+
+class _ThreadCells:
+    """
+    Per-thread accumulator cells, merged on read.
+
+    Each thread adds into its own list, so updates need no lock (a single
+    thread's ``cell[i] += x`` cannot race with itself). The lock is only
+    taken when a thread first touches the metric and when cells are read;
+    cells of exited threads are folded into a retired cell whenever a new
+    thread registers, so thread churn does not grow the cell list.
+    """
+
+    __slots__ = ('local', '_size', '_cells', '_retired', '_lock')
+
+    def __init__(self, size: int):
+        self.local = threading.local()
+        self._size = size
+        self._cells: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired: List[float] = [0] * size
+        self._lock = threading.Lock()
+
+    def new_cell(self) -> List[float]:
+        """Create and register the calling thread's cell."""
+        cell: List[float] = [0] * self._size
+        with self._lock:
+            self._retire_dead_cells()
+            self._cells.append((threading.current_thread(), cell))
+        self.local.cell = cell
+        return cell
+
+    def totals(self) -> List[float]:
+        """Sum all cells."""
+        with self._lock:
+            cells = self._cells
+            if len(cells) == 1 and not any(self._retired):
+                return list(cells[0][1])
+            totals = list(self._retired)
+            for _, cell in cells:
+                for index, value in enumerate(cell):
+                    totals[index] += value
+        return totals
+
+    def reset(self) -> None:
+        """Zero all cells."""
+        with self._lock:
+            self._retired = [0] * self._size
+            for _, cell in self._cells:
+                cell[:] = [0] * self._size
+
+    def _retire_dead_cells(self) -> None:
+        """Fold cells of exited threads into the retired totals (lock held)."""
+        if all(thread.is_alive() for thread, _ in self._cells):
+            return
+
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                for index, value in enumerate(cell):
+                    self._retired[index] += value
+        self._cells = live
+
+
+class CounterChild:
+    """Counter bound to one label set."""
+
+    __slots__ = ('label_values', '_cells')
+
+    def __init__(self, label_values: Dict[str, str]):
+        self.label_values = label_values
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        if amount < 0:
+            raise MetricValidationError(
+                message="Counter increment must be non-negative",
+                validation_rule="non_negative_increment"
+            )
+        try:
+            self._cells.local.cell[0] += amount
+        except AttributeError:
+            self._cells.new_cell()[0] += amount
+
+    def get(self) -> float:
+        """Get the current counter value."""
+        return float(self._cells.totals()[0])
+
+    def reset(self) -> None:
+        """Reset the counter to zero."""
+        self._cells.reset()
+
+
+class GaugeChild:
+    """Gauge bound to one label set."""
+
+    __slots__ = ('label_values', '_value', '_lock')
+
+    def __init__(self, label_values: Dict[str, str]):
+        self.label_values = label_values
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        if not isinstance(value, (int, float)):
+            raise MetricValidationError(
+                message="Gauge value must be numeric",
+                validation_rule="numeric_value"
+            )
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the gauge value."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge value."""
+        with self._lock:
+            self._value -= amount
+
+    def get(self) -> float:
+        """Get the current gauge value."""
+        return self._value
+
+    def reset(self) -> None:
+        """Reset the gauge to zero."""
+        self._value = 0.0
+
+
+class HistogramChild:
+    """Histogram bound to one label set."""
+
+    __slots__ = ('label_values', '_upper_bounds', '_cells')
+
+    def __init__(self, label_values: Dict[str, str], upper_bounds: Tuple[float, ...]):
+        self.label_values = label_values
+        self._upper_bounds = upper_bounds
+        # Cell layout: one non-cumulative count per bucket, then sum, then count
+        self._cells = _ThreadCells(len(upper_bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        """Observe a value in the histogram."""
+        index = bisect_left(self._upper_bounds, value)
+        try:
+            cell = self._cells.local.cell
+        except AttributeError:
+            cell = self._cells.new_cell()
+        cell[index] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def get(self) -> Dict[str, Any]:
+        """Get histogram statistics with cumulative bucket counts."""
+        totals = self._cells.totals()
+        count = int(totals[-1])
+        sum_value = float(totals[-2])
+
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self._upper_bounds, totals):
+            cumulative += bucket_count
+            buckets[bound] = int(cumulative)
+
+        return {
+            'count': count,
+            'sum': sum_value,
+            'buckets': buckets,
+            'average': sum_value / count if count > 0 else 0.0
+        }
+
+    def merge(self, bucket_counts: List[float], sum_value: float, count: float) -> None:
+        """Add non-cumulative bucket counts, sum and count (e.g. from another worker)."""
+        try:
+            cell = self._cells.local.cell
+        except AttributeError:
+            cell = self._cells.new_cell()
+        for index, bucket_count in enumerate(bucket_counts):
+            cell[index] += bucket_count
+        cell[-2] += sum_value
+        cell[-1] += count
+
+    def reset(self) -> None:
+        """Reset histogram values."""
+        self._cells.reset()
+
+
+class SummaryChild:
+    """
+    Summary bound to one label set.
+    
+    Quantiles come from a ring of ``age_buckets`` DDSketches, each covering
+    ``max_age_seconds / age_buckets``. Observations go into the newest
+    sketch; when its time slot ends the oldest sketch is cleared and becomes
+    the newest, so expiring old data costs nothing per observation and a
+    scrape merges a fixed number of bounded sketches instead of sorting raw
+    values. Count and sum are cumulative, as in the Prometheus data model.
+    """
+
+    __slots__ = ('label_values', '_summary', '_buckets', '_head', '_rotated_at', '_sum', '_count', '_lock')
+
+    def __init__(self, label_values: Dict[str, str], summary: 'Summary'):
+        self.label_values = label_values
+        self._summary = summary
+        self._buckets: List[DDSketch] = [summary._new_sketch() for _ in range(summary.age_buckets)]
+        self._head = 0
+        self._rotated_at = time.monotonic()
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Observe a value in the summary."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._rotated_at >= self._summary.bucket_width:
+                self._rotate(now)
+            self._buckets[self._head].add(value)
+            self._sum += value
+            self._count += 1
+
+    def merge(self, sketch: DDSketch, count: Optional[int] = None, sum_value: Optional[float] = None) -> None:
+        """
+        Fold observations from another sketch (e.g. another worker) into this summary.
+        
+        Args:
+            sketch: Windowed observations to add to the quantile estimates
+            count: Cumulative count to add (defaults to the sketch's count)
+            sum_value: Cumulative sum to add (defaults to the sketch's sum)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._rotated_at >= self._summary.bucket_width:
+                self._rotate(now)
+            self._buckets[self._head].merge(sketch)
+            self._sum += sketch.sum if sum_value is None else sum_value
+            self._count += sketch.count if count is None else count
+
+    def sketch(self) -> DDSketch:
+        """Get a merged sketch of the observations inside the age window."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._rotated_at >= self._summary.bucket_width:
+                self._rotate(now)
+            merged = self._summary._new_sketch()
+            for bucket in self._buckets:
+                merged.merge(bucket)
+        return merged
+
+    def get(self) -> Dict[str, Any]:
+        """Get summary statistics including quantiles."""
+        window = self.sketch()
+        count = self._count
+        sum_value = self._sum
+
+        # No observations in the age window: quantiles are unknown (NaN), not zero
+        if window.count:
+            quantiles = window.quantiles(self._summary.quantiles)
+        else:
+            quantiles = {q: float('nan') for q in self._summary.quantiles}
+
+        return {
+            'count': count,
+            'sum': sum_value,
+            'quantiles': quantiles,
+            'average': sum_value / count if count > 0 else 0.0
+        }
+
+    def reset(self) -> None:
+        """Reset summary values."""
+        with self._lock:
+            for bucket in self._buckets:
+                bucket.clear()
+            self._rotated_at = time.monotonic()
+            self._sum = 0.0
+            self._count = 0
+
+    def _rotate(self, now: float) -> None:
+        """Expire time slots that have ended (lock held)."""
+        width = self._summary.bucket_width
+        steps = int((now - self._rotated_at) // width)
+        for _ in range(min(steps, len(self._buckets))):
+            self._head = (self._head + 1) % len(self._buckets)
+            self._buckets[self._head].clear()
+        self._rotated_at += steps * width
+
+
 class BaseMetric(ABC):
     """Base class for all metric types."""
-    
+
     def __init__(
         self,
         name: str,
@@ -59,15 +407,19 @@ class BaseMetric(ABC):
         self.unit = unit
         self.created_at = time.time()
         self._lock = threading.RLock()
-        
+
+        # Children by label values (declared labels) or sorted label items
+        self._label_names: Tuple[str, ...] = tuple(self.labels)
+        self._children: Dict[Tuple, Any] = {}
+
         # Validate metric name
         self._validate_name(name)
-        
+
         # Validate labels
         if labels:
             for label in labels:
                 self._validate_label_name(label)
-    
+
     def _validate_name(self, name: str) -> None:
         """Validate metric name according to Prometheus conventions."""
         if not name:
@@ -75,19 +427,19 @@ class BaseMetric(ABC):
                 message="Metric name cannot be empty",
                 validation_rule="non_empty_name"
             )
-        
+
         if not name.replace('_', '').replace(':', '').isalnum():
             raise MetricValidationError(
                 message=f"Invalid metric name '{name}'. Must contain only alphanumeric characters, underscores, and colons",
                 validation_rule="valid_characters"
             )
-        
+
         if name[0].isdigit():
             raise MetricValidationError(
                 message=f"Metric name '{name}' cannot start with a digit",
                 validation_rule="no_leading_digit"
             )
-    
+
     def _validate_label_name(self, label: str) -> None:
         """Validate label name according to Prometheus conventions."""
         if not label:
@@ -95,24 +447,24 @@ class BaseMetric(ABC):
                 message="Label name cannot be empty",
                 validation_rule="non_empty_label"
             )
-        
+
         if label.startswith('__'):
             raise MetricValidationError(
                 message=f"Label name '{label}' cannot start with '__' (reserved for internal use)",
                 validation_rule="no_reserved_prefix"
             )
-        
+
         if not label.replace('_', '').isalnum():
             raise MetricValidationError(
                 message=f"Invalid label name '{label}'. Must contain only alphanumeric characters and underscores",
                 validation_rule="valid_label_characters"
             )
-    
+
     def _validate_label_values(self, label_values: Dict[str, str]) -> None:
         """Validate label values."""
         if not label_values:
             return
-        
+
         # Check that all required labels are provided
         if self.labels:
             missing_labels = set(self.labels) - set(label_values.keys())
@@ -121,7 +473,7 @@ class BaseMetric(ABC):
                     message=f"Missing required labels: {missing_labels}",
                     validation_rule="required_labels"
                 )
-        
+
         # Check for unexpected labels
         if self.labels:
             unexpected_labels = set(label_values.keys()) - set(self.labels)
@@ -130,7 +482,7 @@ class BaseMetric(ABC):
                     message=f"Unexpected labels: {unexpected_labels}",
                     validation_rule="unexpected_labels"
                 )
-        
+
         # Validate label values
         for key, value in label_values.items():
             if not isinstance(value, str):
@@ -138,22 +490,124 @@ class BaseMetric(ABC):
                     message=f"Label value for '{key}' must be a string, got {type(value)}",
                     validation_rule="string_label_values"
                 )
-    
+
+    def with_labels(self, *label_values: str, **label_kwargs: str) -> Any:
+        """
+        Get the child bound to a label set, creating it on first use.
+
+        Values are given positionally in declaration order or by name.
+        Children are cached, so binding once and reusing the child skips
+        label validation and key building on every update::
+
+            requests = counter.with_labels("GET", "/users")
+            requests.inc()
+        """
+        if label_values and label_kwargs:
+            raise MetricValidationError(
+                message="Pass label values either positionally or by name, not both",
+                validation_rule="label_arguments"
+            )
+
+        if label_kwargs:
+            return self._child_for(label_kwargs)
+
+        child = self._children.get(label_values)
+        if child is None:
+            if len(label_values) != len(self._label_names):
+                raise MetricValidationError(
+                    message=f"Expected {len(self._label_names)} label values for '{self.name}', got {len(label_values)}",
+                    validation_rule="required_labels"
+                )
+            child = self._create_child(label_values, dict(zip(self._label_names, label_values)))
+        return child
+
+    def remove(self, *label_values: str) -> bool:
+        """Remove the child for a label set (positional values)."""
+        with self._lock:
+            return self._children.pop(tuple(label_values), None) is not None
+
+    def get_children(self) -> List[Any]:
+        """Get a snapshot of all children (each has ``label_values``)."""
+        with self._lock:
+            return list(self._children.values())
+
+    def _child_for(self, labels: Optional[Dict[str, str]], create: bool = True) -> Any:
+        """Resolve the child for a labels dict (the dict-based update API)."""
+        if not labels:
+            key: Tuple = ()
+        elif self._label_names:
+            if len(labels) != len(self._label_names):
+                self._validate_label_values(labels)
+            try:
+                key = tuple([labels[name] for name in self._label_names])
+            except KeyError:
+                self._validate_label_values(labels)
+                raise
+        else:
+            # Labels not declared up front: key by the sorted label items
+            key = tuple(sorted(labels.items()))
+
+        child = self._children.get(key)
+        if child is None and create:
+            child = self._create_child(key, dict(labels) if labels else {})
+        return child
+
+    def _create_child(self, key: Tuple, label_values: Dict[str, str]) -> Any:
+        """Validate a new label set and register its child."""
+        self._validate_label_values(label_values)
+
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_child(label_values)
+                self._children[key] = child
+            return child
+
+    @abstractmethod
+    def _new_child(self, label_values: Dict[str, str]) -> Any:
+        """Create the child storage for a label set."""
+        pass
+
+    def _reset_children(self, labels: Optional[Dict[str, str]]) -> None:
+        """Reset one child, or all children in place when labels are empty."""
+        if labels:
+            child = self._child_for(labels, create=False)
+            if child is not None:
+                child.reset()
+        else:
+            for child in self.get_children():
+                child.reset()
+
+    def get_all_values(self) -> Dict[str, Any]:
+        """Get all values keyed by encoded label key (see ``labels_to_key``)."""
+        return {
+            labels_to_key(child.label_values): child.get()
+            for child in self.get_children()
+        }
+
+    def _labels_to_key(self, labels: Dict[str, str]) -> str:
+        """Convert labels dict to a string key."""
+        return labels_to_key(labels)
+
+    def _key_to_labels(self, key: str) -> Dict[str, str]:
+        """Convert string key back to labels dict."""
+        return key_to_labels(key)
+
     @abstractmethod
     def get_type(self) -> MetricType:
         """Get the metric type."""
         pass
-    
+
     @abstractmethod
     def get_value(self, labels: Optional[Dict[str, str]] = None) -> Union[float, Dict[str, Any]]:
         """Get the current metric value."""
         pass
-    
+
     @abstractmethod
     def reset(self, labels: Optional[Dict[str, str]] = None) -> None:
         """Reset the metric value."""
         pass
-    
+
     def get_metadata(self) -> Dict[str, Any]:
         """Get metric metadata."""
         return {
@@ -168,143 +622,92 @@ class BaseMetric(ABC):
 
 class Counter(BaseMetric):
     """Counter metric that only increases."""
-    
+
     def __init__(self, name: str, description: str = "", labels: Optional[List[str]] = None, unit: str = ""):
         super().__init__(name, description, labels, unit)
-        self._values: Dict[str, float] = defaultdict(float)
-    
+
     def get_type(self) -> MetricType:
         return MetricType.COUNTER
-    
+
+    def _new_child(self, label_values: Dict[str, str]) -> CounterChild:
+        return CounterChild(label_values)
+
     def inc(self, amount: float = 1.0, labels: Optional[Dict[str, str]] = None) -> None:
         """Increment the counter."""
-        if amount < 0:
-            raise MetricValidationError(
-                message="Counter increment must be non-negative",
-                validation_rule="non_negative_increment"
-            )
-        
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            self._values[label_key] += amount
-    
+        self._child_for(labels).inc(amount)
+
     def get_value(self, labels: Optional[Dict[str, str]] = None) -> float:
         """Get the current counter value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            return self._values.get(label_key, 0.0)
-    
+        child = self._child_for(labels, create=False)
+        return child.get() if child is not None else 0.0
+
     def reset(self, labels: Optional[Dict[str, str]] = None) -> None:
         """Reset the counter value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            if labels:
-                label_key = self._labels_to_key(labels)
-                self._values[label_key] = 0.0
-            else:
-                self._values.clear()
-    
+        self._reset_children(labels)
+
     def get_all_values(self) -> Dict[str, float]:
         """Get all counter values with their labels."""
-        with self._lock:
-            return dict(self._values)
-    
-    def _labels_to_key(self, labels: Dict[str, str]) -> str:
-        """Convert labels dict to a string key."""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        return super().get_all_values()
 
 
 class Gauge(BaseMetric):
     """Gauge metric that can increase and decrease."""
-    
-    def __init__(self, name: str, description: str = "", labels: Optional[List[str]] = None, unit: str = ""):
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[List[str]] = None,
+        unit: str = "",
+        multiprocess_mode: str = "all"
+    ):
         super().__init__(name, description, labels, unit)
-        self._values: Dict[str, float] = defaultdict(float)
-    
+        
+        # How values from several worker processes combine (see ``multiprocess``)
+        if multiprocess_mode not in MULTIPROCESS_GAUGE_MODES:
+            raise MetricValidationError(
+                message=f"Invalid multiprocess mode '{multiprocess_mode}'. Must be one of {MULTIPROCESS_GAUGE_MODES}",
+                validation_rule="valid_multiprocess_mode"
+            )
+        self.multiprocess_mode = multiprocess_mode
+
     def get_type(self) -> MetricType:
         return MetricType.GAUGE
-    
+
+    def _new_child(self, label_values: Dict[str, str]) -> GaugeChild:
+        return GaugeChild(label_values)
+
     def set(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
         """Set the gauge value."""
-        if not isinstance(value, (int, float)):
-            raise MetricValidationError(
-                message="Gauge value must be numeric",
-                validation_rule="numeric_value"
-            )
-        
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            self._values[label_key] = float(value)
-    
+        self._child_for(labels).set(value)
+
     def inc(self, amount: float = 1.0, labels: Optional[Dict[str, str]] = None) -> None:
         """Increment the gauge value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            self._values[label_key] += amount
-    
+        self._child_for(labels).inc(amount)
+
     def dec(self, amount: float = 1.0, labels: Optional[Dict[str, str]] = None) -> None:
         """Decrement the gauge value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            self._values[label_key] -= amount
-    
+        self._child_for(labels).dec(amount)
+
     def get_value(self, labels: Optional[Dict[str, str]] = None) -> float:
         """Get the current gauge value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            return self._values.get(label_key, 0.0)
-    
+        child = self._child_for(labels, create=False)
+        return child.get() if child is not None else 0.0
+
     def reset(self, labels: Optional[Dict[str, str]] = None) -> None:
         """Reset the gauge value."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            if labels:
-                label_key = self._labels_to_key(labels)
-                self._values[label_key] = 0.0
-            else:
-                self._values.clear()
-    
+        self._reset_children(labels)
+
     def get_all_values(self) -> Dict[str, float]:
         """Get all gauge values with their labels."""
-        with self._lock:
-            return dict(self._values)
-    
-    def _labels_to_key(self, labels: Dict[str, str]) -> str:
-        """Convert labels dict to a string key."""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        return super().get_all_values()
 
 
 class Histogram(BaseMetric):
     """Histogram metric for measuring distributions."""
-    
+
     DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, float('inf')]
-    
+
     def __init__(
         self,
         name: str,
@@ -314,20 +717,20 @@ class Histogram(BaseMetric):
         buckets: Optional[List[float]] = None
     ):
         super().__init__(name, description, labels, unit)
-        self.buckets = sorted(buckets or self.DEFAULT_BUCKETS)
-        
+        self.buckets = sorted(set(buckets or self.DEFAULT_BUCKETS))
+
         # Ensure +Inf bucket exists
         if float('inf') not in self.buckets:
             self.buckets.append(float('inf'))
-        
-        # Initialize bucket counters and sum/count
-        self._bucket_counts: Dict[str, Dict[float, int]] = defaultdict(lambda: defaultdict(int))
-        self._sums: Dict[str, float] = defaultdict(float)
-        self._counts: Dict[str, int] = defaultdict(int)
-    
+
+        self._upper_bounds: Tuple[float, ...] = tuple(self.buckets)
+
     def get_type(self) -> MetricType:
         return MetricType.HISTOGRAM
-    
+
+    def _new_child(self, label_values: Dict[str, str]) -> HistogramChild:
+        return HistogramChild(label_values, self._upper_bounds)
+
     def observe(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
         """Observe a value in the histogram."""
         if not isinstance(value, (int, float)):
@@ -335,84 +738,36 @@ class Histogram(BaseMetric):
                 message="Histogram observation must be numeric",
                 validation_rule="numeric_observation"
             )
-        
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            
-            # Update sum and count
-            self._sums[label_key] += value
-            self._counts[label_key] += 1
-            
-            # Update bucket counts
-            for bucket in self.buckets:
-                if value <= bucket:
-                    self._bucket_counts[label_key][bucket] += 1
-    
+
+        self._child_for(labels).observe(value)
+
     def get_value(self, labels: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Get histogram statistics."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            
-            count = self._counts.get(label_key, 0)
-            sum_value = self._sums.get(label_key, 0.0)
-            buckets = dict(self._bucket_counts.get(label_key, {}))
-            
-            return {
-                'count': count,
-                'sum': sum_value,
-                'buckets': buckets,
-                'average': sum_value / count if count > 0 else 0.0
-            }
-    
+        child = self._child_for(labels, create=False)
+        if child is not None:
+            return child.get()
+
+        return {
+            'count': 0,
+            'sum': 0.0,
+            'buckets': {bound: 0 for bound in self._upper_bounds},
+            'average': 0.0
+        }
+
     def reset(self, labels: Optional[Dict[str, str]] = None) -> None:
         """Reset histogram values."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            if labels:
-                label_key = self._labels_to_key(labels)
-                self._bucket_counts[label_key].clear()
-                self._sums[label_key] = 0.0
-                self._counts[label_key] = 0
-            else:
-                self._bucket_counts.clear()
-                self._sums.clear()
-                self._counts.clear()
-    
+        self._reset_children(labels)
+
     def get_all_values(self) -> Dict[str, Dict[str, Any]]:
         """Get all histogram values with their labels."""
-        with self._lock:
-            result = {}
-            for label_key in self._counts.keys():
-                labels = self._key_to_labels(label_key)
-                result[label_key] = self.get_value(labels)
-            return result
-    
-    def _labels_to_key(self, labels: Dict[str, str]) -> str:
-        """Convert labels dict to a string key."""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-    
-    def _key_to_labels(self, key: str) -> Dict[str, str]:
-        """Convert string key back to labels dict."""
-        if not key:
-            return {}
-        return dict(item.split('=', 1) for item in key.split(','))
+        return super().get_all_values()
 
 
 class Summary(BaseMetric):
     """Summary metric for measuring distributions with quantiles."""
-    
+
     DEFAULT_QUANTILES = [0.5, 0.9, 0.95, 0.99]
-    
+
     def __init__(
         self,
         name: str,
@@ -421,13 +776,27 @@ class Summary(BaseMetric):
         unit: str = "",
         quantiles: Optional[List[float]] = None,
         max_age_seconds: float = 600.0,
-        age_buckets: int = 5
+        age_buckets: int = 5,
+        relative_accuracy: float = 0.01,
+        max_bins: int = 2048
     ):
         super().__init__(name, description, labels, unit)
         self.quantiles = quantiles or self.DEFAULT_QUANTILES
         self.max_age_seconds = max_age_seconds
         self.age_buckets = age_buckets
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
         
+        if age_buckets < 1 or max_age_seconds <= 0:
+            raise MetricValidationError(
+                message="Summary needs at least one age bucket and a positive max age",
+                validation_rule="valid_age_window"
+            )
+        self.bucket_width = max_age_seconds / age_buckets
+        
+        # Fail fast on an invalid sketch configuration
+        self._new_sketch()
+
         # Validate quantiles
         for q in self.quantiles:
             if not 0 <= q <= 1:
@@ -435,15 +804,16 @@ class Summary(BaseMetric):
                     message=f"Quantile {q} must be between 0 and 1",
                     validation_rule="valid_quantile"
                 )
-        
-        # Initialize observations storage
-        self._observations: Dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
-        self._sums: Dict[str, float] = defaultdict(float)
-        self._counts: Dict[str, int] = defaultdict(int)
-    
+
     def get_type(self) -> MetricType:
         return MetricType.SUMMARY
+
+    def _new_child(self, label_values: Dict[str, str]) -> SummaryChild:
+        return SummaryChild(label_values, self)
     
+    def _new_sketch(self) -> DDSketch:
+        return DDSketch(self.relative_accuracy, self.max_bins)
+
     def observe(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
         """Observe a value in the summary."""
         if not isinstance(value, (int, float)):
@@ -451,118 +821,33 @@ class Summary(BaseMetric):
                 message="Summary observation must be numeric",
                 validation_rule="numeric_observation"
             )
-        
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            
-            # Add observation with timestamp
-            observation = (value, time.time())
-            self._observations[label_key].append(observation)
-            
-            # Update sum and count
-            self._sums[label_key] += value
-            self._counts[label_key] += 1
-            
-            # Clean old observations
-            self._clean_old_observations(label_key)
-    
+
+        self._child_for(labels).observe(value)
+
     def get_value(self, labels: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Get summary statistics including quantiles."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            label_key = self._labels_to_key(labels)
-            
-            # Clean old observations first
-            self._clean_old_observations(label_key)
-            
-            observations = self._observations.get(label_key, deque())
-            count = len(observations)
-            sum_value = sum(obs[0] for obs in observations)
-            
-            if count == 0:
-                return {
-                    'count': 0,
-                    'sum': 0.0,
-                    'quantiles': {q: 0.0 for q in self.quantiles}
-                }
-            
-            # Calculate quantiles
-            values = sorted([obs[0] for obs in observations])
-            quantile_values = {}
-            
-            for q in self.quantiles:
-                if q == 0.0:
-                    quantile_values[q] = values[0]
-                elif q == 1.0:
-                    quantile_values[q] = values[-1]
-                else:
-                    index = int(q * (count - 1))
-                    quantile_values[q] = values[index]
-            
-            return {
-                'count': count,
-                'sum': sum_value,
-                'quantiles': quantile_values,
-                'average': sum_value / count
-            }
+        child = self._child_for(labels, create=False)
+        if child is not None:
+            return child.get()
+
+        return {
+            'count': 0,
+            'sum': 0.0,
+            'quantiles': {q: 0.0 for q in self.quantiles}
+        }
     
+    def get_sketch(self, labels: Optional[Dict[str, str]] = None) -> DDSketch:
+        """Get the merged sketch for the current age window (empty if never observed)."""
+        child = self._child_for(labels, create=False)
+        return child.sketch() if child is not None else self._new_sketch()
+
     def reset(self, labels: Optional[Dict[str, str]] = None) -> None:
         """Reset summary values."""
-        labels = labels or {}
-        self._validate_label_values(labels)
-        
-        with self._lock:
-            if labels:
-                label_key = self._labels_to_key(labels)
-                self._observations[label_key].clear()
-                self._sums[label_key] = 0.0
-                self._counts[label_key] = 0
-            else:
-                self._observations.clear()
-                self._sums.clear()
-                self._counts.clear()
-    
+        self._reset_children(labels)
+
     def get_all_values(self) -> Dict[str, Dict[str, Any]]:
         """Get all summary values with their labels."""
-        with self._lock:
-            result = {}
-            for label_key in self._observations.keys():
-                labels = self._key_to_labels(label_key)
-                result[label_key] = self.get_value(labels)
-            return result
-    
-    def _clean_old_observations(self, label_key: str) -> None:
-        """Remove observations older than max_age_seconds."""
-        if label_key not in self._observations:
-            return
-        
-        current_time = time.time()
-        cutoff_time = current_time - self.max_age_seconds
-        
-        observations = self._observations[label_key]
-        
-        # Remove old observations from the left
-        while observations and observations[0][1] < cutoff_time:
-            old_value, _ = observations.popleft()
-            self._sums[label_key] -= old_value
-            self._counts[label_key] -= 1
-    
-    def _labels_to_key(self, labels: Dict[str, str]) -> str:
-        """Convert labels dict to a string key."""
-        if not labels:
-            return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-    
-    def _key_to_labels(self, key: str) -> Dict[str, str]:
-        """Convert string key back to labels dict."""
-        if not key:
-            return {}
-        return dict(item.split('=', 1) for item in key.split(','))
+        return super().get_all_values()
 
 
 # Utility functions for metric creation
@@ -572,9 +857,15 @@ def create_counter(name: str, description: str = "", labels: Optional[List[str]]
     return Counter(name, description, labels, unit)
 
 
-def create_gauge(name: str, description: str = "", labels: Optional[List[str]] = None, unit: str = "") -> Gauge:
+def create_gauge(
+    name: str,
+    description: str = "",
+    labels: Optional[List[str]] = None,
+    unit: str = "",
+    multiprocess_mode: str = "all"
+) -> Gauge:
     """Create a new Gauge metric."""
-    return Gauge(name, description, labels, unit)
+    return Gauge(name, description, labels, unit, multiprocess_mode)
 
 
 def create_histogram(
@@ -595,7 +886,8 @@ def create_summary(
     unit: str = "",
     quantiles: Optional[List[float]] = None,
     max_age_seconds: float = 600.0,
-    age_buckets: int = 5
+    age_buckets: int = 5,
+    relative_accuracy: float = 0.01
 ) -> Summary:
     """Create a new Summary metric."""
-    return Summary(name, description, labels, unit, quantiles, max_age_seconds, age_buckets)
\ No newline at end of file
+    return Summary(name, description, labels, unit, quantiles, max_age_seconds, age_buckets, relative_accuracy)
\ No newline at end of file
@@ -100,6 +100,34 @@ try:
 except ImportError:
     JAEGER_ADVANCED_AVAILABLE = False
 
+# Non-blocking span pipeline
+try:
+    from .pipeline import (
+        SpanRingBuffer,
+        SpanExportPipeline,
+        PipelineSpanProcessor
+    )
+    from .tracer import set_span_pipeline, get_span_pipeline
+    SPAN_PIPELINE_AVAILABLE = True
+except ImportError:
+    SPAN_PIPELINE_AVAILABLE = False
+
+# Tail-based sampling
+try:
+    from .tail_sampling import (
+        BufferedTrace,
+        TailSamplingPolicy,
+        ErrorPolicy,
+        LatencyPolicy,
+        RareEndpointPolicy,
+        ProbabilisticPolicy,
+        TailSamplingProcessor,
+        default_tail_policies
+    )
+    TAIL_SAMPLING_AVAILABLE = True
+except ImportError:
+    TAIL_SAMPLING_AVAILABLE = False
+
 # Advanced sampling strategies
 try:
     from .sampling import (
@@ -183,6 +211,8 @@ __all__ = [
     "JAEGER_ADVANCED_AVAILABLE",
     "ADVANCED_SAMPLING_AVAILABLE",
     "PERFORMANCE_ANALYSIS_AVAILABLE",
+    "SPAN_PIPELINE_AVAILABLE",
+    "TAIL_SAMPLING_AVAILABLE",
 ]
 
 # Conditional exports based on availability
@@ -257,6 +287,27 @@ if JAEGER_ADVANCED_AVAILABLE:
         "JAEGER_AVAILABLE",
     ])
 
+if SPAN_PIPELINE_AVAILABLE:
+    __all__.extend([
+        "SpanRingBuffer",
+        "SpanExportPipeline",
+        "PipelineSpanProcessor",
+        "set_span_pipeline",
+        "get_span_pipeline",
+    ])
+
+if TAIL_SAMPLING_AVAILABLE:
+    __all__.extend([
+        "BufferedTrace",
+        "TailSamplingPolicy",
+        "ErrorPolicy",
+        "LatencyPolicy",
+        "RareEndpointPolicy",
+        "ProbabilisticPolicy",
+        "TailSamplingProcessor",
+        "default_tail_policies",
+    ])
+
 if ADVANCED_SAMPLING_AVAILABLE:
     __all__.extend([
         "SamplingDecision",
@@ -298,6 +349,8 @@ def get_tracing_info() -> dict:
         'jaeger_advanced_available': JAEGER_ADVANCED_AVAILABLE,
         'advanced_sampling_available': ADVANCED_SAMPLING_AVAILABLE,
         'performance_analysis_available': PERFORMANCE_ANALYSIS_AVAILABLE,
+        'span_pipeline_available': SPAN_PIPELINE_AVAILABLE,
+        'tail_sampling_available': TAIL_SAMPLING_AVAILABLE,
         'version': '1.0.0',
         'supported_backends': [
             'Jaeger',
@@ -317,6 +370,8 @@ def get_tracing_info() -> dict:
             'Advanced Jaeger Integration',
             'Intelligent Sampling Strategies',
             'Performance Analysis & Bottleneck Detection',
+            'Non-blocking Batched Span Export',
+            'Tail-based Sampling',
             'Automatic Instrumentation'
         ]
     }
@@ -343,6 +398,10 @@ if ADVANCED_SAMPLING_AVAILABLE:
     available_features.append("Advanced Sampling")
 if PERFORMANCE_ANALYSIS_AVAILABLE:
     available_features.append("Performance Analysis")
+if SPAN_PIPELINE_AVAILABLE:
+    available_features.append("Span Pipeline")
+if TAIL_SAMPLING_AVAILABLE:
+    available_features.append("Tail Sampling")
 
 if available_features:
     logger.info(f"Available tracing features: {', '.join(available_features)}")
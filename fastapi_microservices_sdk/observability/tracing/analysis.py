@@ -10,6 +10,7 @@ Version: 1.0.0
 """
 
 import logging
+import threading
 import time
 import statistics
 from typing import Dict, Any, Optional, List, Tuple, Set
@@ -114,6 +115,8 @@ class PerformanceAnalyzer:
         self._performance_metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self._dependency_graph: Dict[str, Set[str]] = defaultdict(set)
         self._service_operations: Dict[str, Set[str]] = defaultdict(set)
+        # Guards the stores above: spans may arrive from a pipeline worker thread
+        self._lock = threading.RLock()
         
         # Analysis results cache
         self._bottleneck_cache: Dict[str, BottleneckDetection] = {}
@@ -124,12 +127,29 @@ class PerformanceAnalyzer:
     
     def record_span(self, span: Span) -> None:
         """Record span data for analysis."""
+        self.record_spans([span])
+    
+    def record_spans(self, spans: List[Span]) -> None:
+        """
+        Record a batch of finished spans.
+        
+        This is the analysis stage of a SpanExportPipeline: span data is built
+        and the dependency graph updated on the pipeline's worker thread
+        instead of the request thread that finished the span.
+        """
+        timestamp = datetime.now(timezone.utc)
+        with self._lock:
+            for span in spans:
+                self._record_span_data(span, timestamp)
+    
+    def _record_span_data(self, span: Span, timestamp: datetime) -> None:
+        """Store one span's data, metric and dependencies."""
         try:
             span_data = span.get_span_data()
             
             # Add timestamp if not present
             if 'timestamp' not in span_data:
-                span_data['timestamp'] = datetime.now(timezone.utc)
+                span_data['timestamp'] = timestamp
             
             self._span_data.append(span_data)
             
@@ -163,8 +183,11 @@ class PerformanceAnalyzer:
         bottlenecks = []
         
         try:
+            with self._lock:
+                metric_items = [(key, list(metrics)) for key, metrics in self._performance_metrics.items()]
+            
             # Analyze each service-operation combination
-            for metric_key, metrics in self._performance_metrics.items():
+            for metric_key, metrics in metric_items:
                 if len(metrics) < self.sample_size_threshold:
                     continue
                 
@@ -200,7 +223,8 @@ class PerformanceAnalyzer:
         """Analyze latency patterns for a specific operation."""
         try:
             metric_key = f"{service}.{operation}"
-            metrics = self._performance_metrics.get(metric_key, [])
+            with self._lock:
+                metrics = list(self._performance_metrics.get(metric_key, []))
             
             if len(metrics) < self.sample_size_threshold:
                 return None
@@ -261,22 +285,26 @@ class PerformanceAnalyzer:
         try:
             dependency_mappings = {}
             
+            with self._lock:
+                services = list(self._service_operations.keys())
+                dependency_graph = {service: set(deps) for service, deps in self._dependency_graph.items()}
+            
             # Analyze dependency relationships
-            for service in self._service_operations.keys():
+            for service in services:
                 dependencies = {}
                 dependents = {}
                 total_calls = 0
                 error_count = 0
                 
                 # Count calls to dependencies
-                for dependency in self._dependency_graph.get(service, set()):
+                for dependency in dependency_graph.get(service, set()):
                     call_count = self._count_service_calls(service, dependency)
                     if call_count > 0:
                         dependencies[dependency] = call_count
                         total_calls += call_count
                 
                 # Count calls from dependents
-                for dependent_service, deps in self._dependency_graph.items():
+                for dependent_service, deps in dependency_graph.items():
                     if service in deps:
                         call_count = self._count_service_calls(dependent_service, service)
                         if call_count > 0:
@@ -367,15 +395,19 @@ class PerformanceAnalyzer:
                 severity_counts[bottleneck.severity.value] += 1
             
             # Get service statistics
+            with self._lock:
+                operations = {service: len(ops) for service, ops in self._service_operations.items()}
+                dependency_graph_size = sum(len(deps) for deps in self._dependency_graph.values())
+            
             service_stats = {}
-            for service in self._service_operations.keys():
+            for service, operations_count in operations.items():
                 error_rate = self._calculate_service_error_rate(service)
                 avg_latency = self._calculate_service_avg_latency(service)
                 
                 service_stats[service] = {
                     'error_rate': error_rate,
                     'avg_latency_ms': avg_latency,
-                    'operations_count': len(self._service_operations[service])
+                    'operations_count': operations_count
                 }
             
             return {
@@ -383,9 +415,9 @@ class PerformanceAnalyzer:
                 'total_spans_analyzed': len(self._span_data),
                 'bottlenecks_detected': len(bottlenecks),
                 'bottlenecks_by_severity': dict(severity_counts),
-                'services_analyzed': len(self._service_operations),
+                'services_analyzed': len(operations),
                 'service_statistics': service_stats,
-                'dependency_graph_size': sum(len(deps) for deps in self._dependency_graph.values()),
+                'dependency_graph_size': dependency_graph_size,
                 'analysis_timestamp': datetime.now(timezone.utc).isoformat()
             }
             
@@ -590,6 +622,11 @@ class PerformanceAnalyzer:
         except Exception:
             return "stable"
     
+    def _snapshot_span_data(self) -> List[Dict[str, Any]]:
+        """Copy recorded span data so it can be scanned without the lock."""
+        with self._lock:
+            return list(self._span_data)
+    
     def _count_service_calls(self, from_service: str, to_service: str) -> int:
         """Count calls between services."""
         # This would be implemented based on actual span data analysis
@@ -600,7 +637,7 @@ class PerformanceAnalyzer:
         """Calculate error rate for a service."""
         try:
             service_spans = [
-                span for span in self._span_data
+                span for span in self._snapshot_span_data()
                 if span.get('attributes', {}).get('service.name') == service
             ]
             
@@ -621,7 +658,7 @@ class PerformanceAnalyzer:
         """Calculate average latency for a service."""
         try:
             service_spans = [
-                span for span in self._span_data
+                span for span in self._snapshot_span_data()
                 if span.get('attributes', {}).get('service.name') == service
                 and 'duration_ms' in span
             ]
@@ -0,0 +1,334 @@
+"""
+Non-blocking span pipeline for distributed tracing.
+
+This module moves span export and per-span analysis off request threads.
+Finished spans are written into a fixed-size ring buffer without taking a
+lock; a background thread drains the buffer in batches (by size or after a
+delay) and hands each batch to exporters and analyzers. The same thread
+runs the exporters' timers (``check_timeouts``) and their ``force_flush``
+on flush and shutdown, so exporters that buffer spans themselves, like the
+tail sampler, are drained with the pipeline. When producers
+outrun the exporter the oldest spans are overwritten and counted as dropped,
+so memory and request latency stay bounded even at 100% sampling.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# OpenTelemetry imports
+try:
+    from opentelemetry.sdk.trace import SpanProcessor
+    OPENTELEMETRY_SDK_AVAILABLE = True
+except ImportError:
+    OPENTELEMETRY_SDK_AVAILABLE = False
+    # Mock class for development
+    class SpanProcessor:
+        pass
+
+
+class SpanRingBuffer:
+    """
+    Multi-producer, single-consumer ring buffer with drop-oldest overflow.
+
+    Producers claim a sequence number from an atomic counter and store
+    ``(sequence, item)`` in the matching slot, so ``put`` never blocks or
+    locks. The consumer detects overwritten slots from their sequence
+    numbers and counts the skipped items as dropped.
+
+    A producer preempted between claiming and storing can write its entry
+    after the slot was reused by a later lap, leaving an older sequence at
+    a position the consumer waits on. Once later items are visible and the
+    slot has stayed behind for ``stale_timeout`` seconds, it is skipped as
+    dropped instead of stalling the consumer.
+    """
+
+    def __init__(self, capacity: int = 2048, stale_timeout: float = 1.0):
+        size = 1
+        while size < capacity:
+            size <<= 1
+
+        self.capacity = size
+        self.stale_timeout = stale_timeout
+        self._mask = size - 1
+        self._slots: List[Optional[tuple]] = [None] * size
+        self._sequence = itertools.count()
+        self._read = 0
+        # (read position, monotonic time) where the consumer first waited on a slot
+        self._stalled: Optional[tuple] = None
+        self.dropped = 0
+
+    def put(self, item: Any) -> int:
+        """Store an item, overwriting the oldest one when full; returns its sequence."""
+        sequence = next(self._sequence)
+        self._slots[sequence & self._mask] = (sequence, item)
+        return sequence
+
+    def drain(self, max_items: int) -> List[Any]:
+        """Remove up to ``max_items`` items in order (single consumer only)."""
+        items = []
+        read = self._read
+        slots, mask, capacity = self._slots, self._mask, self.capacity
+
+        while len(items) < max_items:
+            entry = slots[read & mask]
+            if entry is None or entry[0] < read:
+                # Not written yet (or a claimed slot still holds the previous lap)
+                if not self._is_stale(read):
+                    break
+                # The slot holds an older lap written late; its item is lost
+                self.dropped += 1
+                read += 1
+                continue
+            sequence, item = entry
+            if sequence > read:
+                # Producers lapped the reader; everything up to this lap is gone
+                resume = sequence - capacity + 1
+                self.dropped += resume - read
+                read = resume
+                continue
+            items.append(item)
+            read += 1
+
+        self._read = read
+        return items
+
+    def _is_stale(self, read: int) -> bool:
+        """Check whether the slot at ``read`` will not be written any more (consumer only)."""
+        later = self._slots[(read + 1) & self._mask]
+        if later is None or later[0] <= read:
+            # Nothing published after this position: the buffer is just empty
+            self._stalled = None
+            return False
+
+        now = time.monotonic()
+        if self._stalled is None or self._stalled[0] != read:
+            self._stalled = (read, now)
+            return False
+        return now - self._stalled[1] >= self.stale_timeout
+
+
+class SpanExportPipeline:
+    """Batches finished spans to exporters and analyzers on a background thread."""
+
+    def __init__(
+        self,
+        exporters: Optional[List[Any]] = None,
+        analyzers: Optional[List[Any]] = None,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay_millis: int = 5000,
+        export_timeout_millis: int = 30000,
+        name: str = "span-export-pipeline"
+    ):
+        """
+        Initialize and start the pipeline.
+
+        Args:
+            exporters: Objects with ``export(batch)`` (OpenTelemetry span
+                exporters, AdvancedJaegerExporter, ...)
+            analyzers: Objects with ``record_spans(batch)`` such as
+                PerformanceAnalyzer
+            max_queue_size: Ring buffer capacity (rounded up to a power of two)
+            max_export_batch_size: Maximum spans handed over per batch
+            schedule_delay_millis: Maximum time a span waits for its batch
+            export_timeout_millis: Default wait for flush and shutdown
+        """
+        self.max_export_batch_size = max_export_batch_size
+        self.schedule_delay = schedule_delay_millis / 1000.0
+        self.export_timeout = export_timeout_millis / 1000.0
+
+        self._buffer = SpanRingBuffer(max_queue_size)
+        self._consumers: List[Callable[[List[Any]], Any]] = []
+        self._flushers: List[Callable[[], Any]] = []
+        self._timers: List[Callable[[], Any]] = []
+        for exporter in exporters or []:
+            self.add_exporter(exporter)
+        for analyzer in analyzers or []:
+            self.add_analyzer(analyzer)
+
+        # Statistics (written by the worker thread only)
+        self._exported_spans = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._last_export_time = 0.0
+
+        self._wakeup = threading.Event()
+        self._flush_requests: List[threading.Event] = []
+        self._flush_lock = threading.Lock()
+        self._shutdown = False
+        self._logger = logging.getLogger(__name__)
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def add_exporter(self, exporter: Any) -> None:
+        """
+        Add an exporter receiving every batch through ``export(batch)``.
+
+        Its ``force_flush()`` runs when the pipeline is flushed or shut
+        down, and its ``check_timeouts()`` on every wakeup of the worker
+        (at least every ``schedule_delay_millis``), if it has them.
+        """
+        self._consumers.append(exporter.export)
+        if hasattr(exporter, 'force_flush'):
+            self._flushers.append(exporter.force_flush)
+        if hasattr(exporter, 'check_timeouts'):
+            self._timers.append(exporter.check_timeouts)
+
+    def add_analyzer(self, analyzer: Any) -> None:
+        """Add an analyzer receiving every batch through ``record_spans(batch)``."""
+        self._consumers.append(analyzer.record_spans)
+
+    def submit(self, span: Any) -> None:
+        """Queue a finished span; never blocks the calling thread."""
+        if self._shutdown:
+            return
+        if self._buffer.put(span) % self.max_export_batch_size == 0:
+            self._wakeup.set()
+
+    def force_flush(self, timeout: Optional[float] = None) -> bool:
+        """Export everything queued so far and flush the exporters; returns False on timeout."""
+        if not self._worker.is_alive():
+            self._export_pending()
+            self._flush_exporters()
+            return True
+
+        done = threading.Event()
+        with self._flush_lock:
+            self._flush_requests.append(done)
+        self._wakeup.set()
+        return done.wait(self.export_timeout if timeout is None else timeout)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting spans, export what is queued and stop the worker."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._wakeup.set()
+        self._worker.join(self.export_timeout if timeout is None else timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline statistics."""
+        return {
+            'queue_capacity': self._buffer.capacity,
+            'exported_spans': self._exported_spans,
+            'dropped_spans': self._buffer.dropped,
+            'batches': self._batches,
+            'failed_batches': self._failed_batches,
+            'last_export_time': self._last_export_time,
+            'running': self._worker.is_alive()
+        }
+
+    def _run(self) -> None:
+        """Worker loop: wait for a full batch or the schedule delay, then export."""
+        while not self._shutdown:
+            self._wakeup.wait(self.schedule_delay)
+            self._wakeup.clear()
+            self._export_pending()
+            self._run_timers()
+            self._complete_flushes()
+
+        # Final drain after shutdown was requested
+        self._export_pending()
+        self._complete_flushes(flush_exporters=True)
+
+    def _export_pending(self) -> None:
+        """Drain the buffer batch by batch."""
+        while True:
+            batch = self._buffer.drain(self.max_export_batch_size)
+            if not batch:
+                return
+            self._export_batch(batch)
+
+    def _export_batch(self, batch: List[Any]) -> None:
+        """Hand one batch to every consumer; one failing consumer does not stop the rest."""
+        failed = False
+        for consumer in self._consumers:
+            try:
+                consumer(batch)
+            except Exception as e:
+                failed = True
+                self._logger.error(f"Span pipeline consumer failed for {len(batch)} spans: {e}")
+
+        self._batches += 1
+        self._exported_spans += len(batch)
+        if failed:
+            self._failed_batches += 1
+        self._last_export_time = time.time()
+
+    def _run_timers(self) -> None:
+        """Let exporters act on time passing, e.g. decide traces that timed out."""
+        for timer in self._timers:
+            try:
+                timer()
+            except Exception as e:
+                self._logger.error(f"Span pipeline exporter timer failed: {e}")
+
+    def _flush_exporters(self) -> None:
+        """Flush spans the exporters still hold."""
+        for flush in self._flushers:
+            try:
+                flush()
+            except Exception as e:
+                self._logger.error(f"Span pipeline exporter flush failed: {e}")
+
+    def _complete_flushes(self, flush_exporters: bool = False) -> None:
+        """Flush the exporters if requested and release callers waiting in force_flush."""
+        with self._flush_lock:
+            requests, self._flush_requests = self._flush_requests, []
+        if requests or flush_exporters:
+            self._flush_exporters()
+        for done in requests:
+            done.set()
+
+
+class PipelineSpanProcessor(SpanProcessor):
+    """OpenTelemetry span processor that exports through a SpanExportPipeline."""
+
+    def __init__(
+        self,
+        span_exporter: Any,
+        max_queue_size: int = 2048,
+        schedule_delay_millis: int = 5000,
+        max_export_batch_size: int = 512,
+        export_timeout_millis: int = 30000
+    ):
+        self.span_exporter = span_exporter
+        self.pipeline = SpanExportPipeline(
+            exporters=[span_exporter],
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+            schedule_delay_millis=schedule_delay_millis,
+            export_timeout_millis=export_timeout_millis,
+            name="otel-span-pipeline"
+        )
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        """Nothing to do when a span starts."""
+
+    def on_end(self, span: Any) -> None:
+        """Queue a sampled span for export."""
+        if span.context is not None and span.context.trace_flags.sampled:
+            self.pipeline.submit(span)
+
+    def shutdown(self) -> None:
+        """Flush queued and exporter-held spans and shut down the exporter."""
+        self.pipeline.shutdown()
+        self.span_exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export all queued spans, including traces a tail sampling exporter still holds."""
+        return self.pipeline.force_flush(timeout_millis / 1000.0)
+
+
+__all__ = [
+    'SpanRingBuffer',
+    'SpanExportPipeline',
+    'PipelineSpanProcessor',
+]
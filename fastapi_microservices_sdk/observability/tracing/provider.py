@@ -49,6 +49,8 @@ except ImportError:
         pass
 
 from ..config import TracingConfig, TracingBackend, SamplingStrategy
+from .pipeline import PipelineSpanProcessor
+from .tail_sampling import TailSamplingProcessor, default_tail_policies
 from .exceptions import (
     TracerProviderError,
     TraceExportError,
@@ -69,6 +71,8 @@ class ProcessorType(Enum):
     """Types of span processors."""
     BATCH = "batch"
     SIMPLE = "simple"
+    PIPELINE = "pipeline"
+    TAIL_SAMPLING = "tail_sampling"
 
 
 @dataclass
@@ -92,6 +96,11 @@ class TraceProviderConfig:
     max_export_batch_size: int = 512
     export_timeout_millis: int = 30000
     
+    # Tail sampling settings (ProcessorType.TAIL_SAMPLING)
+    tail_sampling_rate: float = 0.01
+    tail_decision_wait_seconds: float = 30.0
+    tail_max_traces: int = 10000
+    
     # Jaeger settings
     jaeger_endpoint: str = "http://localhost:14268/api/traces"
     jaeger_agent_host: str = "localhost"
@@ -241,6 +250,10 @@ class TracingProvider:
     def _create_sampler(self) -> Any:
         """Create sampling strategy."""
         try:
+            # Tail sampling decides after the trace ends, so it must see every trace
+            if self.config.processor_type == ProcessorType.TAIL_SAMPLING:
+                return ParentBased(root=AlwaysOn())
+            
             if self.config.sampling_strategy == SamplingStrategy.ALWAYS_ON:
                 return AlwaysOn()
             elif self.config.sampling_strategy == SamplingStrategy.ALWAYS_OFF:
@@ -321,6 +334,30 @@ class TracingProvider:
                 max_export_batch_size=self.config.max_export_batch_size,
                 export_timeout_millis=self.config.export_timeout_millis
             )
+        elif self.config.processor_type == ProcessorType.TAIL_SAMPLING:
+            tail_sampler = TailSamplingProcessor(
+                exporter=exporter,
+                policies=default_tail_policies(self.config.tail_sampling_rate),
+                decision_wait_seconds=self.config.tail_decision_wait_seconds,
+                max_traces=self.config.tail_max_traces,
+                max_spans_per_trace=self.config.max_spans_per_trace
+            )
+            return PipelineSpanProcessor(
+                span_exporter=tail_sampler,
+                max_queue_size=self.config.max_queue_size,
+                schedule_delay_millis=self.config.schedule_delay_millis,
+                max_export_batch_size=self.config.max_export_batch_size,
+                export_timeout_millis=self.config.export_timeout_millis
+            )
+        elif self.config.processor_type == ProcessorType.PIPELINE:
+            # Lock-free ring buffer with drop-oldest overflow
+            return PipelineSpanProcessor(
+                span_exporter=exporter,
+                max_queue_size=self.config.max_queue_size,
+                schedule_delay_millis=self.config.schedule_delay_millis,
+                max_export_batch_size=self.config.max_export_batch_size,
+                export_timeout_millis=self.config.export_timeout_millis
+            )
         else:
             return SimpleSpanProcessor(span_exporter=exporter)
 
@@ -617,25 +617,8 @@ def create_composite_sampler(
     return CompositeSampler(samplers, combination_strategy)
 
 
-# Export main classes and functions
-__all__ = [
-    'SamplingDecision',
-    'SamplingContext',
-    'SamplingStats',
-    'AdvancedSampler',
-    'ProbabilisticSampler',
-    'RateLimitingSampler',
-    'AdaptiveSampler',
-    'PrioritySampler',
-    'CompositeSampler',
-    'OpenTelemetrySamplerAdapter',
-    'create_probabilistic_sampler',
-    'create_rate_limiting_sampler',
-    'create_adaptive_sampler',
-    'create_priority_sampler',
-    'create_composite_sampler',
-]
-class RateLimitingSampler(BaseSampler):
+
+class OTelRateLimitingSampler(BaseSampler):
     """Rate-limiting sampler with token bucket algorithm."""
     
     def __init__(self, config: SamplingConfig):
@@ -692,7 +675,7 @@ class RateLimitingSampler(BaseSampler):
                 return SamplingResult()
 
 
-class AdaptiveSampler(BaseSampler):
+class OTelAdaptiveSampler(BaseSampler):
     """Adaptive sampler that adjusts based on system conditions."""
     
     def __init__(self, config: SamplingConfig):
@@ -861,10 +844,10 @@ class SamplingManager:
                 self._current_sampler = ProbabilisticSampler(self.config)
                 
             elif self.config.strategy == SamplingStrategy.RATE_LIMITING:
-                self._current_sampler = RateLimitingSampler(self.config)
+                self._current_sampler = OTelRateLimitingSampler(self.config)
                 
             elif self.config.strategy == SamplingStrategy.ADAPTIVE:
-                self._current_sampler = AdaptiveSampler(self.config)
+                self._current_sampler = OTelAdaptiveSampler(self.config)
             
             # Wrap with parent-based sampler if enabled
             if self.config.parent_based_enabled and OPENTELEMETRY_AVAILABLE:
@@ -936,11 +919,25 @@ __all__ = [
     'AdaptiveSamplingMode',
     'SamplingConfig',
     'BaseSampler',
+    'SamplingDecision',
+    'SamplingContext',
+    'SamplingStats',
+    'AdvancedSampler',
     'ProbabilisticSampler',
     'RateLimitingSampler',
     'AdaptiveSampler',
+    'PrioritySampler',
+    'CompositeSampler',
+    'OpenTelemetrySamplerAdapter',
+    'OTelRateLimitingSampler',
+    'OTelAdaptiveSampler',
     'CustomSampler',
     'SamplingManager',
+    'create_probabilistic_sampler',
+    'create_rate_limiting_sampler',
+    'create_adaptive_sampler',
+    'create_priority_sampler',
+    'create_composite_sampler',
     'create_sampling_manager',
     'create_probabilistic_sampler_config',
     'create_rate_limiting_sampler_config',
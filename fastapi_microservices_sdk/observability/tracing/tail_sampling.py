@@ -0,0 +1,413 @@
+"""
+Tail-based Sampling for Distributed Tracing.
+
+Head-based samplers decide when a trace starts, before anyone knows whether
+it will fail or be slow. This module buffers finished spans per trace ID and
+decides once the local root span ends, so every error trace and every
+unusually slow trace can be kept while routine traffic is sampled down.
+
+The processor is a span exporter: put it behind a SpanExportPipeline (or a
+PipelineSpanProcessor) and it runs on the pipeline's worker thread, forwarding
+kept traces to the downstream exporter. Buffering is bounded by trace count,
+total span count and spans per trace; traces evicted under pressure or that
+exceed ``decision_wait`` are decided early with the spans seen so far; the
+pipeline checks that timeout on its own timer, so traces are decided even
+when no new spans arrive, and flushing the pipeline flushes them all. Head
+sampling should be AlwaysOn so the tail sampler sees every trace.
+
+Author: FastAPI Microservices SDK
+Version: 1.0.0
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..metrics.sketch import DDSketch
+
+# OpenTelemetry imports
+try:
+    from opentelemetry.trace import StatusCode
+    from opentelemetry.sdk.trace.export import SpanExportResult
+    OPENTELEMETRY_AVAILABLE = True
+except ImportError:
+    OPENTELEMETRY_AVAILABLE = False
+    # Mock classes for development
+    class StatusCode:
+        UNSET = "UNSET"
+        OK = "OK"
+        ERROR = "ERROR"
+    class SpanExportResult:
+        SUCCESS = "SUCCESS"
+        FAILURE = "FAILURE"
+
+
+@dataclass
+class BufferedTrace:
+    """Spans of one trace collected while waiting for a sampling decision."""
+    trace_id: int
+    spans: List[Any] = field(default_factory=list)
+    root: Optional[Any] = None
+    has_error: bool = False
+    first_seen: float = field(default_factory=time.monotonic)
+    dropped_spans: int = 0
+
+    @property
+    def endpoint(self) -> str:
+        """Root span name (the endpoint), or the first span's name."""
+        span = self.root if self.root is not None else self.spans[0]
+        return span.name
+
+    @property
+    def duration_ms(self) -> float:
+        """Root span duration, or the extent of the spans seen so far."""
+        if self.root is not None:
+            return _duration_ms(self.root)
+        start = min(span.start_time or 0 for span in self.spans)
+        end = max(span.end_time or 0 for span in self.spans)
+        return (end - start) / 1e6
+
+
+def _duration_ms(span: Any) -> float:
+    """Duration of an OpenTelemetry ReadableSpan in milliseconds."""
+    if span.start_time is None or span.end_time is None:
+        return 0.0
+    return (span.end_time - span.start_time) / 1e6
+
+
+def _is_local_root(span: Any) -> bool:
+    """A span is the local root if it has no parent or a remote parent."""
+    parent = span.parent
+    return parent is None or parent.is_remote
+
+
+def _is_error(span: Any) -> bool:
+    """Check whether a span finished with an error status."""
+    status = span.status
+    return status is not None and status.status_code == StatusCode.ERROR
+
+
+class TailSamplingPolicy(ABC):
+    """A rule deciding whether a completed trace is worth keeping."""
+
+    name = "policy"
+
+    @abstractmethod
+    def evaluate(self, trace: BufferedTrace) -> bool:
+        """Return True to keep the trace; called once for every trace."""
+        pass
+
+
+class ErrorPolicy(TailSamplingPolicy):
+    """Keeps every trace containing an error span."""
+
+    name = "error"
+
+    def evaluate(self, trace: BufferedTrace) -> bool:
+        return trace.has_error
+
+
+class LatencyPolicy(TailSamplingPolicy):
+    """
+    Keeps traces slower than a per-endpoint latency quantile.
+
+    Root durations feed one DDSketch per endpoint, rotated every
+    ``window_seconds`` so the threshold follows recent traffic. Until an
+    endpoint has ``min_samples`` observations only ``threshold_ms`` applies.
+    """
+
+    name = "latency"
+
+    def __init__(
+        self,
+        quantile: float = 0.99,
+        threshold_ms: Optional[float] = None,
+        min_samples: int = 100,
+        window_seconds: float = 300.0,
+        refresh_every: int = 50,
+        max_endpoints: int = 1000
+    ):
+        self.quantile = quantile
+        self.threshold_ms = threshold_ms
+        self.min_samples = min_samples
+        self.window_seconds = window_seconds
+        self.refresh_every = refresh_every
+        self.max_endpoints = max_endpoints
+        # endpoint -> [current sketch, previous sketch, window start, cached threshold]
+        self._endpoints: Dict[str, list] = {}
+
+    def evaluate(self, trace: BufferedTrace) -> bool:
+        duration = trace.duration_ms
+        if self.threshold_ms is not None and duration >= self.threshold_ms:
+            self._observe(trace.endpoint, duration)
+            return True
+
+        threshold = self._observe(trace.endpoint, duration)
+        return threshold is not None and duration >= threshold
+
+    def _observe(self, endpoint: str, duration: float) -> Optional[float]:
+        """Add a duration and return the endpoint's current threshold."""
+        state = self._endpoints.get(endpoint)
+        now = time.monotonic()
+        if state is None:
+            if len(self._endpoints) >= self.max_endpoints:
+                return None
+            state = self._endpoints[endpoint] = [DDSketch(), None, now, None]
+
+        current, previous, window_start, threshold = state
+        if now - window_start >= self.window_seconds:
+            state[0], state[1], state[2] = DDSketch(), current, now
+            current, previous = state[0], state[1]
+
+        current.add(duration)
+        count = current.count + (previous.count if previous is not None else 0)
+        if count < self.min_samples:
+            return None
+
+        if threshold is None or current.count % self.refresh_every == 0:
+            merged = current.copy()
+            if previous is not None:
+                merged.merge(previous)
+            threshold = state[3] = merged.quantile(self.quantile)
+        return threshold
+
+
+class RareEndpointPolicy(TailSamplingPolicy):
+    """Keeps the first ``traces_per_window`` traces of each endpoint per window."""
+
+    name = "rare_endpoint"
+
+    def __init__(self, traces_per_window: int = 5, window_seconds: float = 60.0):
+        self.traces_per_window = traces_per_window
+        self.window_seconds = window_seconds
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._window_start = time.monotonic()
+
+    def evaluate(self, trace: BufferedTrace) -> bool:
+        now = time.monotonic()
+        if now - self._window_start >= self.window_seconds:
+            self._counts.clear()
+            self._window_start = now
+
+        self._counts[trace.endpoint] += 1
+        return self._counts[trace.endpoint] <= self.traces_per_window
+
+
+class ProbabilisticPolicy(TailSamplingPolicy):
+    """Keeps a fixed fraction of traces, chosen deterministically by trace ID."""
+
+    name = "probabilistic"
+
+    def __init__(self, sampling_rate: float = 0.01):
+        self.sampling_rate = sampling_rate
+        self._threshold = int(sampling_rate * (1 << 64))
+
+    def evaluate(self, trace: BufferedTrace) -> bool:
+        # The low 64 bits of a W3C trace ID are random
+        return (trace.trace_id & 0xFFFFFFFFFFFFFFFF) < self._threshold
+
+
+def default_tail_policies(sampling_rate: float = 0.01) -> List[TailSamplingPolicy]:
+    """Errors, p99-slow traces, rare endpoints, then probabilistic for the rest."""
+    return [
+        ErrorPolicy(),
+        LatencyPolicy(quantile=0.99),
+        RareEndpointPolicy(),
+        ProbabilisticPolicy(sampling_rate)
+    ]
+
+
+class TailSamplingProcessor:
+    """Span exporter that assembles traces in memory and keeps them by policy."""
+
+    def __init__(
+        self,
+        exporter: Any,
+        policies: Optional[List[TailSamplingPolicy]] = None,
+        decision_wait_seconds: float = 30.0,
+        max_traces: int = 10000,
+        max_buffered_spans: int = 100000,
+        max_spans_per_trace: int = 1000,
+        decision_cache_size: int = 50000
+    ):
+        """
+        Initialize the processor.
+
+        Args:
+            exporter: Downstream exporter receiving kept spans via ``export``
+            policies: Keep rules; a trace is kept if any rule keeps it
+            decision_wait_seconds: Decide traces whose root has not ended by then
+            max_traces: Maximum traces buffered at once
+            max_buffered_spans: Maximum spans buffered across all traces
+            max_spans_per_trace: Spans beyond this are dropped from a trace
+            decision_cache_size: Decided trace IDs remembered for late spans
+        """
+        self.exporter = exporter
+        self.policies = policies if policies is not None else default_tail_policies()
+        self.decision_wait_seconds = decision_wait_seconds
+        self.max_traces = max_traces
+        self.max_buffered_spans = max_buffered_spans
+        self.max_spans_per_trace = max_spans_per_trace
+        self.decision_cache_size = decision_cache_size
+
+        # Insertion order is age order, so eviction and timeouts scan from the front
+        self._traces: "OrderedDict[int, BufferedTrace]" = OrderedDict()
+        self._decisions: "OrderedDict[int, bool]" = OrderedDict()
+        self._buffered_spans = 0
+        self._lock = threading.Lock()
+
+        self._kept_by_policy: Dict[str, int] = defaultdict(int)
+        self._traces_kept = 0
+        self._traces_dropped = 0
+        self._traces_evicted = 0
+        self._traces_timed_out = 0
+        self._spans_received = 0
+        self._spans_exported = 0
+        self._spans_truncated = 0
+        self._logger = logging.getLogger(__name__)
+
+    def export(self, spans: List[Any]) -> Any:
+        """Buffer a batch of finished spans and forward the traces kept."""
+        to_export: List[Any] = []
+        with self._lock:
+            self._spans_received += len(spans)
+            for span in spans:
+                self._add_span(span, to_export)
+            self._expire(time.monotonic(), to_export)
+            self._spans_exported += len(to_export)
+
+        return self._forward(to_export)
+
+    def check_timeouts(self) -> Any:
+        """Decide traces that waited past decision_wait_seconds and forward the kept spans."""
+        to_export: List[Any] = []
+        with self._lock:
+            self._expire(time.monotonic(), to_export)
+            self._spans_exported += len(to_export)
+
+        return self._forward(to_export)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Decide every buffered trace now and forward the kept spans."""
+        to_export: List[Any] = []
+        with self._lock:
+            while self._traces:
+                self._decide(self._traces.popitem(last=False)[1], to_export)
+            self._spans_exported += len(to_export)
+        self._forward(to_export)
+        return True
+
+    def shutdown(self) -> None:
+        """Flush buffered traces and shut down the downstream exporter."""
+        self.force_flush()
+        if hasattr(self.exporter, 'shutdown'):
+            self.exporter.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tail sampling statistics."""
+        with self._lock:
+            decided = self._traces_kept + self._traces_dropped
+            return {
+                'buffered_traces': len(self._traces),
+                'buffered_spans': self._buffered_spans,
+                'traces_kept': self._traces_kept,
+                'traces_dropped': self._traces_dropped,
+                'traces_evicted': self._traces_evicted,
+                'traces_timed_out': self._traces_timed_out,
+                'kept_by_policy': dict(self._kept_by_policy),
+                'keep_rate': self._traces_kept / max(1, decided),
+                'spans_received': self._spans_received,
+                'spans_exported': self._spans_exported,
+                'spans_truncated': self._spans_truncated
+            }
+
+    def _add_span(self, span: Any, to_export: List[Any]) -> None:
+        """Attach a span to its trace and decide the trace if its root ended."""
+        trace_id = span.context.trace_id
+
+        decided = self._decisions.get(trace_id)
+        if decided is not None:
+            # Late span of a trace that was already decided
+            if decided:
+                to_export.append(span)
+            return
+
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            trace = self._traces[trace_id] = BufferedTrace(trace_id=trace_id)
+
+        if len(trace.spans) >= self.max_spans_per_trace:
+            trace.dropped_spans += 1
+            self._spans_truncated += 1
+        else:
+            trace.spans.append(span)
+            self._buffered_spans += 1
+        if _is_error(span):
+            trace.has_error = True
+
+        if _is_local_root(span):
+            trace.root = span
+            del self._traces[trace_id]
+            self._decide(trace, to_export)
+            return
+
+        # Memory bound: decide the oldest traces early with what they have
+        while len(self._traces) > self.max_traces or self._buffered_spans > self.max_buffered_spans:
+            self._traces_evicted += 1
+            self._decide(self._traces.popitem(last=False)[1], to_export)
+
+    def _expire(self, now: float, to_export: List[Any]) -> None:
+        """Decide traces that waited longer than decision_wait_seconds."""
+        while self._traces:
+            trace = next(iter(self._traces.values()))
+            if now - trace.first_seen < self.decision_wait_seconds:
+                return
+            del self._traces[trace.trace_id]
+            self._traces_timed_out += 1
+            self._decide(trace, to_export)
+
+    def _decide(self, trace: BufferedTrace, to_export: List[Any]) -> None:
+        """Run every policy on a removed trace and queue its spans if kept."""
+        self._buffered_spans -= len(trace.spans)
+
+        keep = False
+        for policy in self.policies:
+            try:
+                # Every policy sees every trace so their statistics stay complete
+                if policy.evaluate(trace) and not keep:
+                    keep = True
+                    self._kept_by_policy[policy.name] += 1
+            except Exception as e:
+                self._logger.error(f"Tail sampling policy {policy.name} failed: {e}")
+
+        if keep:
+            self._traces_kept += 1
+            to_export.extend(trace.spans)
+        else:
+            self._traces_dropped += 1
+
+        self._decisions[trace.trace_id] = keep
+        if len(self._decisions) > self.decision_cache_size:
+            self._decisions.popitem(last=False)
+
+    def _forward(self, spans: List[Any]) -> Any:
+        """Hand kept spans to the downstream exporter."""
+        if not spans:
+            return SpanExportResult.SUCCESS
+        return self.exporter.export(spans)
+
+
+__all__ = [
+    'BufferedTrace',
+    'TailSamplingPolicy',
+    'ErrorPolicy',
+    'LatencyPolicy',
+    'RareEndpointPolicy',
+    'ProbabilisticPolicy',
+    'default_tail_policies',
+    'TailSamplingProcessor',
+]
@@ -41,6 +41,7 @@ except ImportError:
         pass
 
 from .provider import get_tracer_provider
+from .pipeline import SpanExportPipeline
 from .exceptions import (
     SpanCreationError,
     SpanFinishError,
@@ -217,12 +218,17 @@ class Span:
             
             self._finished = True
             
+            # Analysis happens on the pipeline's worker thread
+            pipeline = _span_pipeline
+            if pipeline is not None:
+                pipeline.submit(self)
+            
             # Log span completion
-            duration_ms = self.duration_ms
-            self._logger.debug(
-                f"Span '{self._operation_name}' finished - "
-                f"Duration: {duration_ms:.2f}ms, Status: {self._status.value}"
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    f"Span '{self._operation_name}' finished - "
+                    f"Duration: {self.duration_ms:.2f}ms, Status: {self._status.value}"
+                )
             
         except Exception as e:
             self._logger.error(f"Failed to finish span: {e}")
@@ -448,6 +454,20 @@ class TracingSystem:
 # Global tracing system instance
 _global_tracing_system = TracingSystem()
 
+# Pipeline receiving finished spans (None keeps finish() free of extra work)
+_span_pipeline: Optional[SpanExportPipeline] = None
+
+
+def set_span_pipeline(pipeline: Optional[SpanExportPipeline]) -> None:
+    """Route finished spans to a pipeline (None to disable)."""
+    global _span_pipeline
+    _span_pipeline = pipeline
+
+
+def get_span_pipeline() -> Optional[SpanExportPipeline]:
+    """Get the pipeline receiving finished spans."""
+    return _span_pipeline
+
 
 def get_tracer(name: str, version: Optional[str] = None) -> Tracer:
     """Get a tracer from the global tracing system."""
@@ -509,5 +529,7 @@ __all__ = [
     'get_current_span',
     'create_span',
     'trace_operation',
+    'set_span_pipeline',
+    'get_span_pipeline',
     'OPENTELEMETRY_AVAILABLE',
 ]
\ No newline at end of file
@@ -60,6 +60,7 @@ from .ca_client import (
 )
 from .unified_middleware import (
     UnifiedSecurityMiddleware,
+    UnifiedSecurityASGIMiddleware,
     SecurityLayerType,
     SecurityLayerStatus,
     SecurityLayerConfig,
@@ -140,6 +141,7 @@ __all__ = [
     "CertificateRequestStatus",
     "CAClientFactory",
     "UnifiedSecurityMiddleware",
+    "UnifiedSecurityASGIMiddleware",
     "SecurityLayerType",
     "SecurityLayerStatus",
     "SecurityLayerConfig",
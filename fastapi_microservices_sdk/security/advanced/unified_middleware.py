@@ -24,9 +24,10 @@ from datetime import datetime, timezone
 
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Import security components
 from .config import AdvancedSecurityConfig
@@ -262,20 +263,9 @@ class UnifiedSecurityMiddleware(BaseHTTPMiddleware):
         
         try:
             # Process through security layers in order
-            for layer_config in self.layer_configs:
-                if not layer_config.enabled:
-                    continue
-                    
-                try:
-                    await self._process_security_layer(request, security_context, layer_config)
-                except Exception as e:
-                    await self._handle_layer_failure(request, security_context, layer_config, e)
-                    
-                    # If layer is required and doesn't fail open, block the request
-                    if layer_config.required and not layer_config.fail_open:
-                        return await self._create_security_error_response(
-                            request, security_context, layer_config.layer_type, str(e)
-                        )
+            error_response = await self._run_security_layers(request, security_context)
+            if error_response is not None:
+                return error_response
             
             # All security layers passed, proceed to application
             response = await call_next(request)
@@ -305,6 +295,33 @@ class UnifiedSecurityMiddleware(BaseHTTPMiddleware):
                 request, security_context, SecurityLayerType.APPLICATION, str(e)
             )
     
+    async def _run_security_layers(
+        self,
+        request: Request,
+        security_context: SecurityContext
+    ) -> Optional[JSONResponse]:
+        """
+        Run the enabled security layers in order.
+        
+        Returns the error response for the first required layer that fails
+        closed, or None when the request may proceed to the application.
+        """
+        for layer_config in self.layer_configs:
+            if not layer_config.enabled:
+                continue
+                
+            try:
+                await self._process_security_layer(request, security_context, layer_config)
+            except Exception as e:
+                await self._handle_layer_failure(request, security_context, layer_config, e)
+                
+                # If layer is required and doesn't fail open, block the request
+                if layer_config.required and not layer_config.fail_open:
+                    return await self._create_security_error_response(
+                        request, security_context, layer_config.layer_type, str(e)
+                    )
+        return None
+    
     async def _process_security_layer(
         self, 
         request: Request, 
@@ -616,15 +633,19 @@ class UnifiedSecurityMiddleware(BaseHTTPMiddleware):
     
     def _add_security_headers(self, response: Response, security_context: SecurityContext):
         """Add security headers to response."""
+        self._apply_security_headers(response.headers, security_context)
+    
+    def _apply_security_headers(self, headers: MutableHeaders, security_context: SecurityContext):
+        """Set the correlation and layer status headers on a header mapping."""
         # Add correlation ID header
-        response.headers["X-Request-ID"] = security_context.request_id
+        headers["X-Request-ID"] = security_context.request_id
         
         # Add security layer status headers (for debugging)
         if self.config.debug_mode:
             for layer_type, result in security_context.layer_results.items():
                 header_name = f"X-Security-{layer_type.value.replace('_', '-').title()}"
                 header_value = "success" if result.get("success") else "failed"
-                response.headers[header_name] = header_value
+                headers[header_name] = header_value
     
     async def _create_security_error_response(
         self, 
@@ -849,6 +870,83 @@ class UnifiedSecurityMiddleware(BaseHTTPMiddleware):
         self.metrics = SecurityMetrics()
 
 
+class UnifiedSecurityASGIMiddleware(UnifiedSecurityMiddleware):
+    """
+    Pure ASGI variant of UnifiedSecurityMiddleware.
+    
+    Runs the same security layers, but calls the application directly and
+    sets the security headers on ``http.response.start`` instead of going
+    through BaseHTTPMiddleware. This avoids the per-request task and body
+    stream copy, and streaming responses pass through unchanged.
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.time()
+        request, security_context, error_response = await self._authorize(scope, receive)
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                self._apply_security_headers(MutableHeaders(scope=message), security_context)
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            await self._complete(request, security_context, start_time, e)
+            # Once headers are out the error can only propagate to the server
+            if response_started:
+                raise
+            error_response = await self._create_security_error_response(
+                request, security_context, SecurityLayerType.APPLICATION, str(e)
+            )
+            await error_response(scope, receive, send)
+            return
+        
+        await self._complete(request, security_context, start_time)
+    
+    async def _authorize(
+        self,
+        scope: Scope,
+        receive: Receive
+    ) -> Tuple[Request, SecurityContext, Optional[JSONResponse]]:
+        """Build the request security context and run the security layers."""
+        request = Request(scope, receive)
+        security_context = SecurityContext(request_id=self._generate_request_id())
+        
+        request.state.security_context = security_context
+        request.state.request_id = security_context.request_id
+        
+        error_response = await self._run_security_layers(request, security_context)
+        return request, security_context, error_response
+    
+    async def _complete(
+        self,
+        request: Request,
+        security_context: SecurityContext,
+        start_time: float,
+        error: Optional[Exception] = None
+    ):
+        """Record metrics and log the outcome of a request."""
+        processing_time = time.time() - start_time
+        self.metrics.record_request(error is None, processing_time)
+        
+        if error is None:
+            await self._log_security_success(request, security_context, processing_time)
+        else:
+            await self._log_security_failure(request, security_context, error, processing_time)
+
+
 # Convenience functions for FastAPI integration
 def setup_unified_security_middleware(
     app: FastAPI,
@@ -944,6 +1042,7 @@ def create_default_layer_configs(config: AdvancedSecurityConfig) -> List[Securit
 # Export main classes and functions
 __all__ = [
     "UnifiedSecurityMiddleware",
+    "UnifiedSecurityASGIMiddleware",
     "SecurityLayerType",
     "SecurityLayerStatus", 
     "SecurityLayerConfig",
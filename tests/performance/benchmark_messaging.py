@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Messaging Benchmarks for FastAPI Microservices SDK
+Compares the old serial Kafka consume loop (one offset commit per message)
+with the partition-aware consumer engine against an in-memory broker that
+charges a simulated round trip per fetch and per commit, and per-message
+database writes with bulk writes from a BatchMessageHandler, the old
+JSON envelope serialization with the header envelope and payload codecs,
+one awaited publish per message with the batching PublishAccumulator, and
+the scanning message deduplicator with the time-bucketed one.
+
+Requires: aiokafka, kafka-python (pip install aiokafka kafka-python)
+"""
+
+import asyncio
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+ROUND_TRIP_SECONDS = 0.002  # 2ms, a typical same-zone broker round trip
+HANDLER_SECONDS = 0.001  # Simulated I/O per message in the handler
+PARTITIONS = 12
+MESSAGES = 12_000
+
+Record = namedtuple("Record", "topic partition offset key value headers timestamp")
+
+
+class InMemoryConsumer:
+    """KafkaConsumer stand-in serving pre-filled partitions with simulated latency"""
+
+    def __init__(self, partitions: int, messages: int, max_records: int = 500):
+        from aiokafka.structs import TopicPartition
+
+        self.logs = {TopicPartition("orders", p): [] for p in range(partitions)}
+        for index in range(messages):
+            partition = TopicPartition("orders", index % partitions)
+            log = self.logs[partition]
+            log.append(Record("orders", partition.partition, len(log), f"k{index % 100}".encode(), b'{"n": 1}', [], 0))
+        self.positions = {partition: 0 for partition in self.logs}
+        self.paused = set()
+        self.committed = {}
+        self.commits = 0
+        self.max_records = max_records
+
+    async def fetch(self, max_records: int = 500, timeout_ms: int = 1000):
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        batch, budget = {}, max_records
+        for partition, log in self.logs.items():
+            if partition in self.paused or budget == 0:
+                continue
+            start = self.positions[partition]
+            records = log[start:start + budget]
+            if records:
+                batch[partition] = records
+                self.positions[partition] += len(records)
+                budget -= len(records)
+        return batch
+
+    def pause(self, *partitions):
+        self.paused.update(partitions)
+
+    def resume(self, *partitions):
+        self.paused.difference_update(partitions)
+
+    async def commit(self, offsets):
+        self.commits += 1
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        self.committed.update(offsets)
+
+    def done(self) -> bool:
+        return all(self.committed.get(partition) == len(log) for partition, log in self.logs.items())
+
+
+async def handle(message) -> bool:
+    await asyncio.sleep(HANDLER_SECONDS)
+    return True
+
+
+async def serial_loop(consumer: InMemoryConsumer) -> None:
+    """The previous consume loop: process each record, then commit it alone"""
+    from fastapi_microservices_sdk.communication.messaging.kafka import KafkaMessage
+
+    while not consumer.done():
+        for partition, records in (await consumer.fetch()).items():
+            for record in records:
+                await handle(KafkaMessage.from_consumer_record(record))
+                await consumer.commit({partition: record.offset + 1})
+
+
+async def engine_loop(consumer: InMemoryConsumer, max_in_flight: int, process_message=handle, batch_handler=None) -> dict:
+    """Run the consumer engine until every partition is committed to the end"""
+    from fastapi_microservices_sdk.communication.messaging.kafka import (
+        KafkaConsumerConfig, KafkaConsumerEngine
+    )
+
+    async def process_batch(messages):
+        acks = await batch_handler.handle_batch(messages)
+        return [True] * len(acks)
+
+    config = KafkaConsumerConfig(group_id="benchmark", max_in_flight_per_partition=max_in_flight)
+    engine = KafkaConsumerEngine(
+        consumer, process_message, config,
+        process_batch=process_batch if batch_handler else None,
+        batch_size=lambda topic: batch_handler.max_batch_size
+    )
+    task = asyncio.create_task(engine.run())
+    while not consumer.done():
+        await asyncio.sleep(0.01)
+        if engine.get_stats()["processed"] == MESSAGES:
+            await engine.commit()
+    stats = engine.get_stats()
+    await engine.stop()
+    task.cancel()
+    return stats
+
+
+async def benchmark_consumer():
+    """Compare messages per second and commit round trips"""
+    print(f"\n🔍 Kafka consume ({MESSAGES} messages, {PARTITIONS} partitions, "
+          f"{ROUND_TRIP_SECONDS * 1000:.0f}ms round trip, {HANDLER_SECONDS * 1000:.0f}ms handler)")
+
+    serial_count = MESSAGES // 20
+    consumer = InMemoryConsumer(PARTITIONS, serial_count)
+    start = time.perf_counter()
+    await serial_loop(consumer)
+    elapsed = time.perf_counter() - start
+    print(f"   🐌 Serial, commit per message:  {serial_count / elapsed:>9,.0f} msg/s, {consumer.commits} commits")
+
+    for max_in_flight in (1, 16):
+        consumer = InMemoryConsumer(PARTITIONS, MESSAGES)
+        start = time.perf_counter()
+        stats = await engine_loop(consumer, max_in_flight)
+        elapsed = time.perf_counter() - start
+        print(f"   ⚡ Engine, {max_in_flight:>2} in flight/partition: {MESSAGES / elapsed:>9,.0f} msg/s, "
+              f"{consumer.commits} commits, {stats['pauses']} pauses")
+
+
+async def benchmark_batch_handler():
+    """Compare one database round trip per message with one bulk insert per batch"""
+    from fastapi_microservices_sdk.communication.messaging.base import (
+        BatchMessageHandler, MessageAcknowledgment, MessageStatus
+    )
+
+    class BulkInsertHandler(BatchMessageHandler):
+        max_batch_size = 200
+
+        def __init__(self):
+            self.round_trips = 0
+
+        async def handle_batch(self, messages):
+            self.round_trips += 1
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+            return [MessageAcknowledgment(message_id=m.id, status=MessageStatus.ACKNOWLEDGED) for m in messages]
+
+    print(f"\n🔍 Handler database writes ({MESSAGES} messages, {ROUND_TRIP_SECONDS * 1000:.0f}ms per write)")
+
+    async def insert_one(message) -> bool:
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        return True
+
+    handler = BulkInsertHandler()
+    consumer = InMemoryConsumer(PARTITIONS, MESSAGES)
+    start = time.perf_counter()
+    await engine_loop(consumer, 1, process_message=insert_one)
+    elapsed = time.perf_counter() - start
+    print(f"   🐌 One write per message: {MESSAGES / elapsed:>9,.0f} msg/s, {MESSAGES} writes")
+
+    consumer = InMemoryConsumer(PARTITIONS, MESSAGES)
+    start = time.perf_counter()
+    await engine_loop(consumer, 1, batch_handler=handler)
+    elapsed = time.perf_counter() - start
+    print(f"   ⚡ Bulk write per batch:  {MESSAGES / elapsed:>9,.0f} msg/s, {handler.round_trips} writes")
+
+
+def benchmark_codecs():
+    """Compare JSON envelope bodies with header envelopes and codec-encoded payloads"""
+    import json
+    from fastapi_microservices_sdk.communication.messaging.base import Message
+
+    rounds = 20_000
+    order = {"order_id": 1234, "items": [{"sku": f"SKU-{i}", "qty": i, "price": 9.99} for i in range(10)],
+             "customer": {"id": 42, "email": "a@example.com"}}
+    print(f"\n🔍 Message encode + decode ({rounds} messages)")
+
+    message = Message(topic="orders", payload=order)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = json.dumps(message.to_dict(), default=str).encode('utf-8')
+        Message.from_dict(json.loads(body.decode('utf-8')))
+    elapsed = time.perf_counter() - start
+    print(f"   🐌 JSON envelope in body:   {rounds / elapsed:>9,.0f} msg/s, {len(body)} bytes")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body, headers = message.to_wire()
+        Message.from_wire(body, headers, "orders")
+    elapsed = time.perf_counter() - start
+    print(f"   ⚡ Header envelope + codec: {rounds / elapsed:>9,.0f} msg/s, {len(body)} bytes")
+
+    blob = bytes(256 * 1024)
+    message = Message(topic="images", payload=blob, content_type="application/octet-stream")
+    slow_rounds = rounds // 100
+    start = time.perf_counter()
+    for _ in range(slow_rounds):
+        body = json.dumps(message.to_dict(), default=str).encode('utf-8')
+    elapsed = time.perf_counter() - start
+    print(f"   🐌 256KB binary, old encode: {slow_rounds / elapsed:>9,.0f} msg/s, payload str()-ed into JSON")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body, headers = message.to_wire()
+    elapsed = time.perf_counter() - start
+    print(f"   ⚡ 256KB binary, to_wire():  {rounds / elapsed:>9,.0f} msg/s, body is payload: {body is blob}")
+
+
+async def benchmark_publish():
+    """Compare awaiting each publish with accumulated publish_many batches"""
+    from fastapi_microservices_sdk.communication.messaging.base import MessageAcknowledgment, MessageStatus
+    from fastapi_microservices_sdk.communication.messaging.publisher import PublishAccumulator, PublishBatchConfig
+
+    class RoundTripBroker:
+        """Broker stand-in charging one round trip per publish or publish_many call"""
+
+        def __init__(self):
+            self.round_trips = 0
+
+        async def publish(self, topic, message, **kwargs):
+            self.round_trips += 1
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+        async def publish_many(self, topic, messages, **kwargs):
+            self.round_trips += 1
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+            return [MessageAcknowledgment(message_id=m.id, status=MessageStatus.ACKNOWLEDGED) for m in messages]
+
+    event = {"type": "order.created", "order_id": 1234, "total": 99.5}
+    print(f"\n🔍 Event publishing ({MESSAGES} events, {ROUND_TRIP_SECONDS * 1000:.0f}ms round trip)")
+
+    broker = RoundTripBroker()
+    serial_count = MESSAGES // 20
+    start = time.perf_counter()
+    for _ in range(serial_count):
+        await broker.publish("orders", event)
+    elapsed = time.perf_counter() - start
+    print(f"   🐌 Awaited publish per event: {serial_count / elapsed:>9,.0f} msg/s, {broker.round_trips} round trips")
+
+    broker = RoundTripBroker()
+    start = time.perf_counter()
+    async with PublishAccumulator(broker, PublishBatchConfig(linger_ms=5)) as publisher:
+        futures = [await publisher.publish("orders", event) for _ in range(MESSAGES)]
+        await asyncio.gather(*futures)
+    elapsed = time.perf_counter() - start
+    print(f"   ⚡ PublishAccumulator:        {MESSAGES / elapsed:>9,.0f} msg/s, {broker.round_trips} round trips")
+
+
+async def benchmark_deduplicator():
+    """Compare per-message dedup cost as the number of tracked messages grows"""
+    import hashlib
+    from datetime import datetime, timedelta, timezone
+    from fastapi_microservices_sdk.communication.messaging.base import Message
+    from fastapi_microservices_sdk.communication.messaging.reliability import MessageDeduplicator
+
+    class ScanningDeduplicator:
+        """The previous deduplicator: lock, full expiry scan and str() hash per message"""
+
+        def __init__(self, window_minutes: int = 60):
+            self.window_minutes = window_minutes
+            self.message_hashes = {}
+            self._lock = asyncio.Lock()
+
+        async def is_duplicate(self, message) -> bool:
+            async with self._lock:
+                message_hash = f"id:{message.id}" if message.id else \
+                    hashlib.sha256(f"{message.topic}:{message.payload}".encode()).hexdigest()
+                current_time = datetime.now(timezone.utc)
+                cutoff_time = current_time - timedelta(minutes=self.window_minutes)
+                for hash_key in [k for k, t in self.message_hashes.items() if t < cutoff_time]:
+                    del self.message_hashes[hash_key]
+                if message_hash in self.message_hashes:
+                    return True
+                self.message_hashes[message_hash] = current_time
+                return False
+
+    checks = 500
+    print(f"\n🔍 Deduplication cost per message ({checks} checks after N tracked messages)")
+    for tracked in (1_000, 10_000, 100_000):
+        messages = [Message(id=f"m{i}") for i in range(tracked + checks)]
+        for name, deduplicator in (
+            ("🐌 Scanning   ", ScanningDeduplicator()),
+            ("⚡ Time buckets", MessageDeduplicator(max_entries=1_000_000)),
+            ("⚡ Bloom filter", MessageDeduplicator(max_entries=1_000_000, use_bloom_filter=True)),
+        ):
+            if isinstance(deduplicator, ScanningDeduplicator):
+                # Filling it message by message would take quadratic time
+                now = datetime.now(timezone.utc)
+                deduplicator.message_hashes = {f"id:{m.id}": now for m in messages[:tracked]}
+            else:
+                for message in messages[:tracked]:
+                    await deduplicator.is_duplicate(message)
+            start = time.perf_counter()
+            for message in messages[tracked:]:
+                await deduplicator.is_duplicate(message)
+            elapsed = time.perf_counter() - start
+            print(f"   {name} {tracked:>7,} tracked: {elapsed / checks * 1e6:>9,.1f} µs/message")
+
+
+def main():
+    """Run all messaging benchmarks"""
+    print("🚀 Starting Messaging Benchmarks...")
+    asyncio.run(benchmark_consumer())
+    asyncio.run(benchmark_batch_handler())
+    benchmark_codecs()
+    asyncio.run(benchmark_publish())
+    asyncio.run(benchmark_deduplicator())
+    print("✅ Messaging benchmarks completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Metrics Hot Path Benchmarks for FastAPI Microservices SDK
+Measures the per-operation cost of metric updates through the labels-dict API,
+through cached label children, and through HTTPMetricsCollector.record_request,
+compares sketch-backed summaries with raw observation windows, measures
+cached exposition scrapes and compiled endpoint normalization.
+"""
+
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+OPERATIONS = 200_000
+THREADS = 4
+SUMMARY_LABEL_SETS = 200
+SUMMARY_OBSERVATIONS = 10_000
+QUANTILES = [0.5, 0.9, 0.95, 0.99]
+EXPOSITION_SERIES = 50_000
+
+
+class RawWindowSummary:
+    """Reference summary keeping raw (value, timestamp) pairs and sorting per scrape"""
+
+    def __init__(self, max_age_seconds: float = 600.0):
+        self.max_age_seconds = max_age_seconds
+        self.observations = deque(maxlen=10000)
+
+    def observe(self, value: float):
+        self.observations.append((value, time.time()))
+        cutoff = time.time() - self.max_age_seconds
+        while self.observations and self.observations[0][1] < cutoff:
+            self.observations.popleft()
+
+    def quantiles(self):
+        values = sorted(obs[0] for obs in self.observations)
+        return {q: values[int(q * (len(values) - 1))] for q in QUANTILES}
+
+
+def per_op_us(operation, count: int = OPERATIONS) -> float:
+    """Run an operation count times and return microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(count):
+        operation()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def benchmark_updates():
+    """Compare labels-dict updates with cached children"""
+    from fastapi_microservices_sdk.observability.metrics.types import Counter, Histogram
+
+    counter = Counter("bench_requests_total", labels=["method", "endpoint", "status_code"])
+    histogram = Histogram("bench_duration_seconds", labels=["method", "endpoint"])
+    labels = {"method": "GET", "endpoint": "/users/{id}", "status_code": "200"}
+    duration_labels = {"method": "GET", "endpoint": "/users/{id}"}
+
+    counter_child = counter.with_labels("GET", "/users/{id}", "200")
+    histogram_child = histogram.with_labels("GET", "/users/{id}")
+
+    print("\n🔍 Single-thread update cost")
+    print(f"   🐌 Counter.inc(labels=...):     {per_op_us(lambda: counter.inc(1.0, labels)):.3f}µs")
+    print(f"   ⚡ CounterChild.inc():          {per_op_us(counter_child.inc):.3f}µs")
+    print(f"   🐌 Histogram.observe(labels=...): {per_op_us(lambda: histogram.observe(0.042, duration_labels)):.3f}µs")
+    print(f"   ⚡ HistogramChild.observe():    {per_op_us(lambda: histogram_child.observe(0.042)):.3f}µs")
+
+
+def benchmark_threads():
+    """Measure counter throughput with several threads updating one child"""
+    from fastapi_microservices_sdk.observability.metrics.types import Counter
+
+    counter = Counter("bench_threaded_total")
+    child = counter.with_labels()
+    per_thread = OPERATIONS // THREADS
+
+    def worker():
+        for _ in range(per_thread):
+            child.inc()
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n🔍 {THREADS} threads x {per_thread} increments")
+    print(f"   ⚡ {elapsed / (per_thread * THREADS) * 1e6:.3f}µs per increment, total={child.get():.0f}")
+
+
+def benchmark_record_request():
+    """Measure the full per-request cost of HTTPMetricsCollector.record_request"""
+    from fastapi_microservices_sdk.observability.metrics.collector import HTTPMetricsCollector
+    from fastapi_microservices_sdk.observability.metrics.registry import MetricRegistry
+
+    collector = HTTPMetricsCollector(config={"registry": MetricRegistry()})
+    collector.register_metrics()
+
+    def record():
+        collector.record_request("GET", "/users/{id}", 200, 0.042, 512, 2048)
+
+    print("\n🔍 HTTPMetricsCollector.record_request")
+    print(f"   ⚡ {per_op_us(record):.3f}µs per request (count + duration + sizes)")
+
+
+def benchmark_summary():
+    """Compare memory and scrape latency of raw windows and DDSketch summaries"""
+    from fastapi_microservices_sdk.observability.metrics.types import Summary
+
+    rng = random.Random(42)
+    values = [rng.lognormvariate(-3, 1.2) for _ in range(SUMMARY_OBSERVATIONS)]
+    label_sets = [str(i) for i in range(SUMMARY_LABEL_SETS)]
+
+    tracemalloc.start()
+    raw = {label: RawWindowSummary() for label in label_sets}
+    for label in label_sets:
+        for value in values:
+            raw[label].observe(value)
+    raw_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    summary = Summary("bench_latency_seconds", labels=["route"], quantiles=QUANTILES)
+    for label in label_sets:
+        child = summary.with_labels(label)
+        for value in values:
+            child.observe(value)
+    sketch_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    raw_results = {label: raw[label].quantiles() for label in label_sets}
+    raw_scrape = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sketch_results = {child.label_values["route"]: child.get()["quantiles"] for child in summary.get_children()}
+    sketch_scrape = time.perf_counter() - start
+
+    worst_error = max(
+        abs(sketch_results[label][q] - raw_results[label][q]) / raw_results[label][q]
+        for label in label_sets for q in QUANTILES
+    )
+
+    print(f"\n🔍 Summary with {SUMMARY_LABEL_SETS} label sets x {SUMMARY_OBSERVATIONS} observations")
+    print(f"   🐌 Raw window: {raw_memory / 1e6:.1f}MB, scrape {raw_scrape * 1000:.1f}ms")
+    print(f"   ⚡ DDSketch:   {sketch_memory / 1e6:.1f}MB, scrape {sketch_scrape * 1000:.1f}ms")
+    print(f"   📈 Worst relative quantile error: {worst_error:.2%}")
+    print(f"   ⚡ Observe cost: {per_op_us(lambda: child.observe(0.042)):.3f}µs")
+
+
+def benchmark_exposition():
+    """Measure cold and cached scrapes of a large registry"""
+    from fastapi_microservices_sdk.observability.metrics.exporter import PrometheusExporter
+    from fastapi_microservices_sdk.observability.metrics.registry import MetricRegistry
+    from fastapi_microservices_sdk.observability.metrics.types import Counter
+
+    registry = MetricRegistry()
+    counter = Counter("bench_jobs_total", "Jobs", labels=["job"])
+    registry.register(counter)
+    for index in range(EXPOSITION_SERIES):
+        counter.with_labels(str(index)).inc()
+
+    exporter = PrometheusExporter(registry)
+
+    start = time.perf_counter()
+    exporter.export_metrics()
+    cold = time.perf_counter() - start
+
+    # Touch 1% of the series between scrapes
+    for index in range(0, EXPOSITION_SERIES, 100):
+        counter.with_labels(str(index)).inc()
+
+    start = time.perf_counter()
+    exporter.export_metrics()
+    warm = time.perf_counter() - start
+
+    body, headers = exporter.render(accept_encoding="gzip")
+    plain, _ = exporter.render()
+
+    print(f"\n🔍 Exposition of {EXPOSITION_SERIES} series")
+    print(f"   🐌 First scrape:  {cold * 1000:.1f}ms")
+    print(f"   ⚡ Cached scrape: {warm * 1000:.1f}ms (1% of series changed)")
+    print(f"   📦 Body: {len(plain) / 1e6:.2f}MB plain, {len(body) / 1e6:.2f}MB {headers.get('Content-Encoding', 'identity')}")
+
+
+def legacy_normalize(path: str, path_patterns: dict) -> str:
+    """Reference normalization running every regex on every request"""
+    for pattern, replacement in path_patterns.items():
+        if re.match(pattern, path):
+            return replacement
+    normalized = re.sub(r'/\d+', '/{id}', path)
+    normalized = re.sub(r'/[a-f0-9-]{36}', '/{uuid}', normalized)
+    return re.sub(r'/[a-f0-9]{24}', '/{objectid}', normalized)
+
+
+def benchmark_normalization():
+    """Compare per-request regex normalization with the compiled, cached normalizer"""
+    from fastapi_microservices_sdk.observability.metrics.routing import (
+        DEFAULT_PATH_PATTERNS, EndpointNormalizer
+    )
+
+    normalizer = EndpointNormalizer()
+    paths = [f"/orders/{index}/items/{index * 7}" for index in range(500)]
+    paths += [f"/api/v1/users/{index}" for index in range(500)]
+    cycle = iter(paths * (OPERATIONS // len(paths) + 1))
+
+    legacy = per_op_us(lambda: legacy_normalize(next(cycle), DEFAULT_PATH_PATTERNS))
+    cycle = iter(paths * (OPERATIONS // len(paths) + 1))
+    compiled = per_op_us(lambda: normalizer.normalize(next(cycle)))
+
+    print(f"\n🔍 Endpoint normalization over {len(paths)} distinct paths")
+    print(f"   🐌 re per request: {legacy:.3f}µs")
+    print(f"   ⚡ Compiled + LRU: {compiled:.3f}µs")
+
+
+def main():
+    """Run all metrics benchmarks"""
+    print("🚀 Starting Metrics Benchmarks...")
+    benchmark_updates()
+    benchmark_threads()
+    benchmark_record_request()
+    benchmark_summary()
+    benchmark_exposition()
+    benchmark_normalization()
+    print("✅ Metrics benchmarks completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Middleware Stack Benchmarks for FastAPI Microservices SDK
+Measures requests/sec of a small JSON endpoint with 0 to 6 middleware layers,
+comparing BaseHTTPMiddleware layers with the pure ASGI SDK middleware, and
+the Prometheus middleware with the fused observability pipeline. Requests are
+driven straight through the ASGI interface, so no server or socket cost is
+included.
+
+Requires: fastapi
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+REQUESTS = 5_000
+MAX_LAYERS = 6
+
+
+def build_app(layers):
+    """Build a FastAPI app with one JSON route and the given middleware stack"""
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id, "name": "widget"}
+
+    for middleware_class, options in layers:
+        app.add_middleware(middleware_class, **options)
+    return app
+
+
+async def requests_per_second(app, count: int = REQUESTS) -> float:
+    """Drive count GET requests through an ASGI app and return requests/sec"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/42",
+        "raw_path": b"/items/42",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"accept", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # Warm up routing and the middleware stack build
+    await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return count / (time.perf_counter() - start)
+
+
+def passthrough_layers(count: int):
+    """BaseHTTPMiddleware pass-through layers, as the core middleware used to be"""
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    class PassthroughMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            return await call_next(request)
+
+    return [(PassthroughMiddleware, {})] * count
+
+
+def asgi_layers(count: int):
+    """Pure ASGI SDK core middleware, cycled to the requested depth"""
+    from fastapi_microservices_sdk.core.middleware import (
+        CircuitBreakerMiddleware,
+        LoadBalancerMiddleware,
+        RequestTracingMiddleware,
+        ServiceDiscoveryMiddleware
+    )
+
+    classes = [
+        RequestTracingMiddleware,
+        CircuitBreakerMiddleware,
+        LoadBalancerMiddleware,
+        ServiceDiscoveryMiddleware,
+    ]
+    return [(classes[index % len(classes)], {}) for index in range(count)]
+
+
+async def benchmark_layers():
+    """Compare requests/sec as layers are stacked"""
+    print(f"\n🔍 Requests/sec with 0-{MAX_LAYERS} stacked layers ({REQUESTS} requests)")
+    print(f"   {'layers':>6} {'BaseHTTPMiddleware':>20} {'pure ASGI':>12}")
+    for count in range(MAX_LAYERS + 1):
+        base = await requests_per_second(build_app(passthrough_layers(count)))
+        pure = await requests_per_second(build_app(asgi_layers(count)))
+        print(f"   {count:>6} {base:>20,.0f} {pure:>12,.0f}")
+
+
+async def benchmark_observability():
+    """Compare the metrics middleware variants and the fused pipeline"""
+    from fastapi_microservices_sdk.core.middleware.pipeline import ObservabilitySecurityMiddleware
+    from fastapi_microservices_sdk.observability.metrics import (
+        MetricRegistry,
+        PrometheusASGIMiddleware,
+        PrometheusMiddleware
+    )
+
+    variants = [
+        ("PrometheusMiddleware", PrometheusMiddleware, {"registry": MetricRegistry()}),
+        ("PrometheusASGIMiddleware", PrometheusASGIMiddleware, {"registry": MetricRegistry()}),
+        ("ObservabilitySecurityMiddleware", ObservabilitySecurityMiddleware, {"registry": MetricRegistry()}),
+    ]
+
+    print(f"\n🔍 Metrics middleware ({REQUESTS} requests)")
+    for name, middleware_class, options in variants:
+        rate = await requests_per_second(build_app([(middleware_class, options)]))
+        print(f"   ⚡ {name:<32} {rate:>10,.0f} req/s")
+
+
+def main():
+    """Run all middleware benchmarks"""
+    print("🚀 Starting Middleware Benchmarks...")
+    asyncio.run(benchmark_layers())
+    asyncio.run(benchmark_observability())
+    print("✅ Middleware benchmarks completed!")
+
+
+if __name__ == "__main__":
+    main()
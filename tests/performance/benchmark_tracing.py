@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tracing Hot Path Benchmarks for FastAPI Microservices SDK
+Measures the request-thread cost of finishing a span when performance analysis
+runs synchronously versus through the batched span export pipeline, the
+drop accounting of the pipeline under overload, and the export volume left
+after tail-based sampling.
+"""
+
+import random
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+SPANS = 50_000
+THREADS = 4
+ATTRIBUTES = {"service.name": "orders", "db.system": "postgresql", "http.url": "http://inventory:8000/items"}
+
+
+def span_latency_us(finish_span, count: int = SPANS):
+    """Finish count spans and return (mean, p50, p99) microseconds per span"""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        finish_span()
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return sum(timings) / count, timings[count // 2], timings[int(count * 0.99)]
+
+
+def benchmark_finish():
+    """Compare synchronous analysis with the pipeline analysis stage"""
+    from fastapi_microservices_sdk.observability.tracing.analysis import PerformanceAnalyzer
+    from fastapi_microservices_sdk.observability.tracing.pipeline import SpanExportPipeline
+    from fastapi_microservices_sdk.observability.tracing.tracer import get_tracer, set_span_pipeline
+
+    tracer = get_tracer("benchmark")
+
+    def traced_operation():
+        with tracer.span("GET /orders", attributes=ATTRIBUTES):
+            pass
+
+    analyzer = PerformanceAnalyzer()
+
+    def traced_operation_sync():
+        with tracer.span("GET /orders", attributes=ATTRIBUTES) as span:
+            pass
+        analyzer.record_span(span)
+
+    baseline = span_latency_us(traced_operation)
+    synchronous = span_latency_us(traced_operation_sync)
+
+    pipeline = SpanExportPipeline(analyzers=[PerformanceAnalyzer()], max_queue_size=SPANS * 2)
+    set_span_pipeline(pipeline)
+    try:
+        pipelined = span_latency_us(traced_operation)
+        start = time.perf_counter()
+        pipeline.force_flush()
+        drain = time.perf_counter() - start
+    finally:
+        set_span_pipeline(None)
+        pipeline.shutdown()
+
+    print(f"\n🔍 Span finish cost ({SPANS} spans, mean / p50 / p99)")
+    for label, (mean, p50, p99) in (
+        ("📏 No analysis:         ", baseline),
+        ("🐌 Synchronous analysis:", synchronous),
+        ("⚡ Pipeline submit:     ", pipelined),
+    ):
+        print(f"   {label} {mean:.2f} / {p50:.2f} / {p99:.2f}µs")
+    print(f"   📦 Worker drained the remaining backlog in {drain * 1000:.1f}ms")
+
+
+def benchmark_overload():
+    """Flood a small pipeline from several threads with a slow exporter"""
+    from fastapi_microservices_sdk.observability.tracing.pipeline import SpanExportPipeline
+
+    class SlowExporter:
+        def export(self, batch):
+            time.sleep(0.002)
+
+    pipeline = SpanExportPipeline(
+        exporters=[SlowExporter()],
+        max_queue_size=2048,
+        max_export_batch_size=512,
+        schedule_delay_millis=100
+    )
+
+    def producer():
+        for index in range(SPANS):
+            pipeline.submit(index)
+
+    threads = [threading.Thread(target=producer) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    pipeline.force_flush()
+    stats = pipeline.get_stats()
+    pipeline.shutdown()
+
+    print(f"\n🔍 Overload: {THREADS} threads x {SPANS} spans into a {stats['queue_capacity']}-slot queue")
+    print(f"   ⚡ Submit cost: {elapsed / (THREADS * SPANS) * 1e6:.2f}µs per span")
+    print(f"   📦 Exported {stats['exported_spans']}, dropped {stats['dropped_spans']}")
+
+
+def synthetic_traces(count: int, spans_per_trace: int = 8):
+    """Yield (spans, is_error, duration_ms) for ReadableSpan-like traces over a few endpoints"""
+    from fastapi_microservices_sdk.observability.tracing.tail_sampling import StatusCode
+
+    endpoints = ["GET /orders", "GET /items", "POST /orders", "GET /health"]
+    ok, error = SimpleNamespace(status_code=StatusCode.OK), SimpleNamespace(status_code=StatusCode.ERROR)
+    rng = random.Random(7)
+    for _ in range(count):
+        trace_id = rng.getrandbits(128)
+        is_error = rng.random() < 0.005
+        duration_ms = rng.lognormvariate(3, 0.5)
+        start = time.time_ns()
+        end = start + int(duration_ms * 1e6)
+        root_context = SimpleNamespace(trace_id=trace_id, span_id=rng.getrandbits(64), is_remote=False)
+        children = [
+            SimpleNamespace(
+                name="db.query", context=SimpleNamespace(trace_id=trace_id), parent=root_context,
+                status=error if is_error and index == 0 else ok, start_time=start, end_time=end
+            )
+            for index in range(spans_per_trace - 1)
+        ]
+        root = SimpleNamespace(
+            name=rng.choice(endpoints), context=root_context, parent=None,
+            status=ok, start_time=start, end_time=end
+        )
+        yield children + [root], is_error, duration_ms
+
+
+def benchmark_tail_sampling(traces: int = 20_000):
+    """Measure export volume and keep accuracy of the default tail policies"""
+    from fastapi_microservices_sdk.observability.tracing.tail_sampling import TailSamplingProcessor
+
+    class CountingExporter:
+        def __init__(self):
+            self.trace_ids = set()
+            self.spans = 0
+
+        def export(self, spans):
+            self.spans += len(spans)
+            self.trace_ids.update(span.context.trace_id for span in spans)
+
+    exporter = CountingExporter()
+    processor = TailSamplingProcessor(exporter)
+    generated = list(synthetic_traces(traces))
+
+    start = time.perf_counter()
+    for spans, _, _ in generated:
+        processor.export(spans)
+    processor.force_flush()
+    elapsed = time.perf_counter() - start
+
+    # Slow traces are judged against the true p99 of all root durations
+    p99 = sorted(duration for _, _, duration in generated)[int(traces * 0.99)]
+    errors = [spans[-1].context.trace_id for spans, is_error, _ in generated if is_error]
+    slow = [spans[-1].context.trace_id for spans, _, duration in generated if duration >= p99 * 1.1]
+    total_spans = sum(len(spans) for spans, _, _ in generated)
+    stats = processor.get_stats()
+
+    print(f"\n🔍 Tail sampling ({traces} traces, {total_spans} spans)")
+    print(f"   ⚡ Processing cost: {elapsed / total_spans * 1e6:.2f}µs per span")
+    print(f"   📦 Exported {exporter.spans} spans ({total_spans / max(1, exporter.spans):.1f}x reduction)")
+    print(f"   🚨 Error traces kept: {sum(t in exporter.trace_ids for t in errors)}/{len(errors)}")
+    print(f"   🐌 Traces >1.1x p99 kept: {sum(t in exporter.trace_ids for t in slow)}/{len(slow)}")
+    print(f"   📊 Kept by policy: {stats['kept_by_policy']}")
+
+
+def main():
+    """Run all tracing benchmarks"""
+    print("🚀 Starting Tracing Benchmarks...")
+    benchmark_finish()
+    benchmark_overload()
+    benchmark_tail_sampling()
+    print("✅ Tracing benchmarks completed!")
+
+
+if __name__ == "__main__":
+    main()
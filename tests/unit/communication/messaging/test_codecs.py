@@ -0,0 +1,96 @@
+"""
+Unit tests for message codecs and the Message wire format.
+"""
+
+import pytest
+
+from fastapi_microservices_sdk.communication.messaging.base import Message
+from fastapi_microservices_sdk.communication.messaging.codecs import (
+    BINARY_CONTENT_TYPE,
+    JSON_CONTENT_TYPE,
+    MSGPACK_AVAILABLE,
+    MSGPACK_CONTENT_TYPE,
+    TEXT_CONTENT_TYPE,
+    decode_payload,
+    encode_payload,
+    infer_content_type,
+)
+from fastapi_microservices_sdk.communication.exceptions import MessageSerializationError
+
+
+class TestCodecs:
+    """Test payload encoding by content type."""
+
+    @pytest.mark.parametrize("payload, content_type", [
+        ({"order": 1}, JSON_CONTENT_TYPE),
+        ("hello", TEXT_CONTENT_TYPE),
+        (b"\x00\xff", BINARY_CONTENT_TYPE),
+    ])
+    def test_infers_content_type(self, payload, content_type):
+        assert infer_content_type(payload) == content_type
+
+    def test_bytes_are_passed_through(self):
+        payload = bytearray(b"raw")
+
+        body, content_type = encode_payload(payload)
+
+        assert body is payload
+        assert content_type == BINARY_CONTENT_TYPE
+
+    def test_legacy_body_without_content_type(self):
+        assert decode_payload(b'{"a": 1}') == {"a": 1}
+        assert decode_payload(b"plain text") == "plain text"
+        assert decode_payload(b"\xff\xfe") == b"\xff\xfe"
+
+    def test_invalid_json_raises_serialization_error(self):
+        with pytest.raises(MessageSerializationError):
+            decode_payload(b"{not json", JSON_CONTENT_TYPE)
+
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        body, _ = encode_payload({"n": [1, 2]}, MSGPACK_CONTENT_TYPE)
+
+        assert decode_payload(body, MSGPACK_CONTENT_TYPE) == {"n": [1, 2]}
+
+
+class TestMessageWire:
+    """Test Message.to_wire and Message.from_wire."""
+
+    @pytest.mark.parametrize("payload", [{"order": 1, "items": ["a"]}, "hello", b"\x00\x01binary"])
+    def test_round_trip_keeps_payload_and_envelope(self, payload):
+        message = Message(topic="orders", payload=payload, correlation_id="c-1", ttl=30, priority=5)
+
+        body, headers = message.to_wire()
+        received = Message.from_wire(body, headers, topic="orders")
+
+        assert received.payload == payload
+        assert received.id == message.id
+        assert received.correlation_id == "c-1"
+        assert received.ttl == 30
+        assert received.priority == 5
+
+    def test_bytes_payload_is_labelled_binary(self):
+        body, headers = Message(payload=b"\xff\x00").to_wire()
+
+        assert body == b"\xff\x00"
+        assert headers["content-type"] == BINARY_CONTENT_TYPE
+
+    def test_explicit_content_type_for_encoded_bytes(self):
+        body, headers = Message(payload=b'{"a": 1}', content_type=JSON_CONTENT_TYPE).to_wire()
+
+        assert headers["content-type"] == JSON_CONTENT_TYPE
+        assert Message.from_wire(body, headers).payload == {"a": 1}
+
+    def test_compressed_round_trip(self):
+        message = Message(payload={"text": "x" * 1000})
+
+        body, headers = message.to_wire(compression="gzip")
+
+        assert headers["content-encoding"] == "gzip"
+        assert len(body) < 1000
+        assert Message.from_wire(body, headers).payload == message.payload
+
+    def test_serialize_bytes_payload(self):
+        message = Message(payload=b"\xff\x00")
+
+        assert message.serialize() == b"\xff\x00"
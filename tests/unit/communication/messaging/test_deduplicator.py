@@ -0,0 +1,136 @@
+"""
+Unit tests for MessageDeduplicator and RedisMessageDeduplicator.
+"""
+
+import pytest
+
+from fastapi_microservices_sdk.communication.messaging.base import Message
+from fastapi_microservices_sdk.communication.messaging.reliability import (
+    MessageDeduplicator,
+    RedisMessageDeduplicator,
+)
+
+
+class FakeRedis:
+    """The SET NX / DELETE subset of redis.asyncio used by the deduplicator."""
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+
+    async def set(self, key, value, nx=False, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+@pytest.fixture(params=[False, True], ids=["exact", "bloom"])
+def deduplicator(request):
+    """Create a local deduplicator in exact and Bloom filter mode."""
+    return MessageDeduplicator(window_minutes=60, max_entries=1000, use_bloom_filter=request.param)
+
+
+class TestMessageDeduplicator:
+    """Test local deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_detects_repeated_message_id(self, deduplicator):
+        message = Message(id="m-1", topic="orders", payload={"n": 1})
+
+        assert await deduplicator.is_duplicate(message) is False
+        assert await deduplicator.is_duplicate(message) is True
+        assert await deduplicator.is_duplicate(Message(id="m-2", topic="orders")) is False
+
+    @pytest.mark.asyncio
+    async def test_released_message_is_accepted_again(self, deduplicator):
+        message = Message(id="m-1", topic="orders")
+
+        assert await deduplicator.is_duplicate(message) is False
+        await deduplicator.release_message(message)
+        assert await deduplicator.is_duplicate(message) is False
+        assert await deduplicator.is_duplicate(message) is True
+
+    @pytest.mark.asyncio
+    async def test_tracked_message_is_duplicate(self, deduplicator):
+        message = Message(id="m-1", topic="orders")
+
+        await deduplicator.track_message(message)
+        assert await deduplicator.is_duplicate(message) is True
+
+    @pytest.mark.asyncio
+    async def test_statistics(self, deduplicator):
+        message = Message(id="m-1", topic="orders")
+        await deduplicator.is_duplicate(message)
+        await deduplicator.is_duplicate(message)
+
+        stats = await deduplicator.get_statistics()
+
+        assert stats['duplicates_detected'] == 1
+        assert stats['tracked_messages'] == 1
+        assert stats['bloom_filter'] is deduplicator.use_bloom_filter
+        if deduplicator.use_bloom_filter:
+            assert stats['bloom_filter_bytes'] > 0
+
+    @pytest.mark.asyncio
+    async def test_max_entries_drops_oldest_buckets(self):
+        deduplicator = MessageDeduplicator(window_minutes=60, max_entries=100, bucket_count=10)
+        for n in range(1000):
+            await deduplicator.is_duplicate(Message(id=f"m-{n}"))
+
+        stats = await deduplicator.get_statistics()
+
+        assert stats['tracked_messages'] <= 110
+        assert await deduplicator.is_duplicate(Message(id="m-999")) is True
+        assert await deduplicator.is_duplicate(Message(id="m-0")) is False
+
+
+class TestRedisMessageDeduplicator:
+    """Test deduplication shared through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_other_replica_sees_claimed_message_as_duplicate(self):
+        redis = FakeRedis()
+        first = RedisMessageDeduplicator(redis, key_prefix="test")
+        second = RedisMessageDeduplicator(redis, key_prefix="test")
+        message = Message(id="m-1", topic="orders")
+
+        assert await first.is_duplicate(message) is False
+        assert await second.is_duplicate(message) is True
+        assert "test:id:m-1" in redis.data
+
+    @pytest.mark.asyncio
+    async def test_release_deletes_claim(self):
+        redis = FakeRedis()
+        first = RedisMessageDeduplicator(redis, key_prefix="test")
+        second = RedisMessageDeduplicator(redis, key_prefix="test")
+        message = Message(id="m-1", topic="orders")
+
+        assert await first.is_duplicate(message) is False
+        await first.release_message(message)
+
+        assert redis.data == {}
+        assert await second.is_duplicate(message) is False
+        assert await first.is_duplicate(message) is True
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_state_when_redis_fails(self):
+        redis = FakeRedis()
+        redis.fail = True
+        deduplicator = RedisMessageDeduplicator(redis)
+        message = Message(id="m-1", topic="orders")
+
+        assert await deduplicator.is_duplicate(message) is False
+        assert await deduplicator.is_duplicate(message) is True
+        await deduplicator.release_message(message)
+
+        stats = await deduplicator.get_statistics()
+        assert stats['backend'] == 'redis'
+        assert stats['redis_errors'] == 2
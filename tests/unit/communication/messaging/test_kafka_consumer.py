@@ -0,0 +1,249 @@
+"""
+Unit tests for consuming through KafkaClient and KafkaConsumerEngine.
+"""
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+pytest.importorskip("aiokafka")
+pytest.importorskip("kafka")
+
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from fastapi_microservices_sdk.communication.messaging import kafka as kafka_module
+from fastapi_microservices_sdk.communication.messaging.base import (
+    BatchMessageHandler,
+    MessageAcknowledgment,
+    MessageHandler,
+    MessageStatus,
+)
+from fastapi_microservices_sdk.communication.messaging.kafka import (
+    KafkaClient,
+    KafkaClusterConfig,
+    KafkaConsumerConfig,
+    KafkaDeadLetterConfig,
+    PartitionOffsetTracker,
+)
+
+
+TOPIC = "orders"
+PARTITION = TopicPartition(TOPIC, 0)
+
+
+class StubConsumer:
+    """In-memory partition log with Kafka's fetch position, pause and seek behaviour."""
+
+    def __init__(self, values: List[bytes]):
+        self.log = [
+            ConsumerRecord(
+                topic=TOPIC, partition=0, offset=offset, timestamp=0, timestamp_type=0,
+                key=None, value=value, checksum=None, serialized_key_size=0,
+                serialized_value_size=len(value), headers=[("content-type", b"text/plain")]
+            )
+            for offset, value in enumerate(values)
+        ]
+        self.position = 0
+        self.paused = False
+        self.commits: List[int] = []
+        self.seeks: List[int] = []
+
+    async def subscribe(self, topics, listener=None):
+        self.topics = topics
+
+    async def unsubscribe(self):
+        pass
+
+    async def fetch(self, max_records=500, timeout_ms=1000) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        await asyncio.sleep(0.001)
+        if self.paused or self.position >= len(self.log):
+            return {}
+        records = self.log[self.position:self.position + max_records]
+        self.position += len(records)
+        return {PARTITION: records}
+
+    def pause(self, *partitions):
+        self.paused = True
+
+    def resume(self, *partitions):
+        self.paused = False
+
+    async def seek(self, partition, offset):
+        self.seeks.append(offset)
+        self.position = offset
+
+    async def commit(self, offsets=None):
+        self.commits.append(offsets[PARTITION])
+
+
+class StubProducer:
+    """Records dead-lettered messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, topic, value, key=None, headers=None, content_type=None):
+        self.sent.append((topic, value, headers))
+
+
+class RecordingHandler(MessageHandler):
+    """Fails each payload the configured number of times before acknowledging it."""
+
+    def __init__(self, failures: Dict[str, int]):
+        self.failures = dict(failures)
+        self.deliveries: List[str] = []
+
+    async def handle_message(self, message):
+        self.deliveries.append(message.payload)
+        if self.failures.get(message.payload, 0) > 0:
+            self.failures[message.payload] -= 1
+            raise RuntimeError(f"cannot process {message.payload}")
+        return MessageAcknowledgment(message_id=message.id, status=MessageStatus.ACKNOWLEDGED)
+
+
+class RecordingBatchHandler(BatchMessageHandler):
+    """Rejects the payloads listed in ``failures`` once."""
+
+    max_batch_size = 10
+
+    def __init__(self, failures: List[str]):
+        self.failures = set(failures)
+        self.batches: List[List[str]] = []
+
+    async def handle_batch(self, messages):
+        self.batches.append([message.payload for message in messages])
+        acks = []
+        for message in messages:
+            failed = message.payload in self.failures
+            self.failures.discard(message.payload)
+            acks.append(MessageAcknowledgment(
+                message_id=message.id,
+                status=MessageStatus.FAILED if failed else MessageStatus.ACKNOWLEDGED,
+                error="rejected" if failed else None
+            ))
+        return acks
+
+    async def handle_message(self, message):
+        return (await self.handle_batch([message]))[0]
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Create a connected KafkaClient around a stub consumer and producer."""
+    monkeypatch.setattr(kafka_module, "KafkaAdminClient", lambda **config: object())
+    clients = []
+
+    def _make(values, dead_letter_config=None):
+        client = KafkaClient(
+            KafkaClusterConfig(bootstrap_servers=["localhost:9092"]),
+            consumer_config=KafkaConsumerConfig(group_id="test", commit_interval_ms=10),
+            dead_letter_config=dead_letter_config or KafkaDeadLetterConfig(max_retries=1, retry_delay_ms=0)
+        )
+        client._consumer = StubConsumer(values)
+        client._producer = StubProducer()
+        client._is_connected = True
+        clients.append(client)
+        return client
+
+    yield _make
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    """Poll until condition() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.005)
+
+
+class TestPartitionOffsetTracker:
+    """Test the contiguous commit position."""
+
+    def test_position_waits_for_earlier_offsets(self):
+        tracker = PartitionOffsetTracker()
+        for offset in range(3):
+            tracker.start(offset)
+
+        tracker.complete(1)
+        assert tracker.position is None
+        assert tracker.first_pending == 0
+
+        tracker.complete(0)
+        assert tracker.position == 2
+        assert tracker.first_pending == 2
+
+
+class TestKafkaClientConsume:
+    """Test consuming through KafkaClient.subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_acknowledged_messages_are_committed(self, make_client):
+        client = make_client([b"a", b"b", b"c"])
+        handler = RecordingHandler({})
+
+        await client.subscribe(TOPIC, handler)
+        await wait_for(lambda: client._consumer.commits and client._consumer.commits[-1] == 3)
+        await client.unsubscribe(TOPIC)
+
+        assert handler.deliveries == ["a", "b", "c"]
+        assert client._consumer.seeks == []
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_redelivered_before_commit(self, make_client):
+        client = make_client([b"a", b"b", b"c"])
+        handler = RecordingHandler({"b": 1})
+
+        await client.subscribe(TOPIC, handler)
+        await wait_for(lambda: client._consumer.commits and client._consumer.commits[-1] == 3)
+        await client.unsubscribe(TOPIC)
+
+        assert handler.deliveries == ["a", "b", "b", "c"]
+        assert client._consumer.seeks == [1]
+        assert client._producer.sent == []
+        # Nothing past the failed offset was committed before it succeeded
+        first_full = client._consumer.commits.index(3)
+        assert all(offset <= 1 for offset in client._consumer.commits[:first_full])
+
+    @pytest.mark.asyncio
+    async def test_message_is_dead_lettered_after_retries(self, make_client):
+        client = make_client([b"a", b"b", b"c"])
+        handler = RecordingHandler({"b": 10})
+
+        await client.subscribe(TOPIC, handler)
+        await wait_for(lambda: client._consumer.commits and client._consumer.commits[-1] == 3)
+        await client.unsubscribe(TOPIC)
+
+        # One delivery plus max_retries redeliveries, then the dead letter topic
+        assert handler.deliveries == ["a", "b", "b", "c"]
+        assert [(topic, value) for topic, value, _ in client._producer.sent] == [("orders.DLT", "b")]
+        assert client._producer.sent[0][2]["x-original-offset"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_failed_offset_is_not_committed_without_dead_letter(self, make_client):
+        client = make_client(
+            [b"a", b"b", b"c"],
+            dead_letter_config=KafkaDeadLetterConfig(enabled=False, retry_delay_ms=0)
+        )
+        handler = RecordingHandler({"b": 10**6})
+
+        await client.subscribe(TOPIC, handler)
+        await wait_for(lambda: handler.deliveries.count("b") >= 3)
+        await client.unsubscribe(TOPIC)
+
+        assert "c" not in handler.deliveries
+        assert max(client._consumer.commits) == 1
+        assert client._consumer.seeks[:2] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_failures_are_redelivered(self, make_client):
+        client = make_client([b"a", b"b", b"c"])
+        handler = RecordingBatchHandler(["b"])
+
+        await client.subscribe(TOPIC, handler)
+        await wait_for(lambda: client._consumer.commits and client._consumer.commits[-1] == 3)
+        await client.unsubscribe(TOPIC)
+
+        assert handler.batches == [["a", "b", "c"], ["b", "c"]]
+        assert client._consumer.seeks == [1]
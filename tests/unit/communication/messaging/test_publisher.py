@@ -0,0 +1,58 @@
+"""
+Unit tests for PublishAccumulator.
+"""
+
+import asyncio
+
+import pytest
+
+from fastapi_microservices_sdk.communication.exceptions import MessagePublishError
+from fastapi_microservices_sdk.communication.messaging.base import MessageAcknowledgment, MessageStatus
+from fastapi_microservices_sdk.communication.messaging.publisher import PublishAccumulator, PublishBatchConfig
+
+
+class StubBroker:
+    """Records batches and acknowledges at most ``ack_limit`` messages of each."""
+
+    def __init__(self, ack_limit=None):
+        self.ack_limit = ack_limit
+        self.batches = []
+
+    async def publish_many(self, topic, messages, **kwargs):
+        self.batches.append([message.payload for message in messages])
+        return [
+            MessageAcknowledgment(message_id=message.id, status=MessageStatus.ACKNOWLEDGED)
+            for message in messages[:self.ack_limit]
+        ]
+
+
+class TestPublishAccumulator:
+    """Batching and delivery results of the accumulator."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_sent_in_publish_order(self):
+        broker = StubBroker()
+        async with PublishAccumulator(broker, PublishBatchConfig(max_batch_size=3)) as publisher:
+            futures = [await publisher.publish("events", f"event-{i}") for i in range(3)]
+            message_ids = await asyncio.gather(*futures)
+
+        assert broker.batches == [[b"event-0", b"event-1", b"event-2"]]
+        assert len(set(message_ids)) == 3
+
+    @pytest.mark.asyncio
+    async def test_messages_without_acknowledgment_fail_and_release_capacity(self):
+        broker = StubBroker(ack_limit=1)
+        config = PublishBatchConfig(max_batch_size=3, max_pending=3)
+        async with PublishAccumulator(broker, config) as publisher:
+            futures = [await publisher.publish("events", f"event-{i}") for i in range(3)]
+            results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), timeout=1)
+
+            assert isinstance(results[0], str)
+            assert all(isinstance(result, MessagePublishError) for result in results[1:])
+
+            # Every max_pending slot was released, so publishing does not block
+            future = await asyncio.wait_for(publisher.publish("events", "event-3"), timeout=1)
+            await publisher.flush()
+            assert future.done()
+
+        assert publisher.get_stats()['messages_failed'] == 2
@@ -0,0 +1,154 @@
+"""
+Unit tests for batch consumption of Redis streams.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("redis")
+
+from fastapi_microservices_sdk.communication.messaging.base import (
+    BatchMessageHandler,
+    MessageAcknowledgment,
+    MessageStatus,
+)
+from fastapi_microservices_sdk.communication.messaging.redis_pubsub import (
+    RedisClient,
+    RedisConnectionConfig,
+    RedisMessage,
+    RedisStreamConfig,
+)
+
+
+class FakeStreamClient:
+    """Consumer group semantics of one consumer: new entries and its pending list."""
+
+    def __init__(self, config, entries):
+        self.stream_config = config
+        self.new = list(entries)
+        self.pending = {}
+        self.reads = []
+        self.acked = []
+        self.dead_lettered = []
+
+    async def read_from_stream(self, stream_name, start_id=">", count=None, block=None):
+        self.reads.append(start_id)
+        if start_id == "0":
+            ids = list(self.pending)[:count]
+        else:
+            ids = []
+            while self.new and len(ids) < count:
+                stream_id, payload = self.new.pop(0)
+                self.pending[stream_id] = payload
+                ids.append(stream_id)
+        if not ids:
+            await asyncio.sleep(0.001)  # XREADGROUP BLOCK
+        return [
+            RedisMessage.from_stream_message(stream_name, stream_id, {'payload': self.pending[stream_id]})
+            for stream_id in ids
+        ]
+
+    async def acknowledge_messages(self, stream_name, message_ids):
+        for stream_id in message_ids:
+            del self.pending[stream_id]
+        self.acked.extend(message_ids)
+        return len(message_ids)
+
+    async def dead_letter_messages(self, stream_name, messages, errors):
+        for message in messages:
+            del self.pending[message.stream_id]
+        self.dead_lettered.extend(message.stream_id for message in messages)
+
+
+class FailingBatchHandler(BatchMessageHandler):
+    """Fails the payloads in ``poison`` and records every delivery."""
+
+    max_batch_size = 10
+
+    def __init__(self, poison=(), raise_error=False):
+        self.poison = set(poison)
+        self.raise_error = raise_error
+        self.deliveries = []
+
+    async def handle_batch(self, messages):
+        payloads = [message.stream_fields['payload'] for message in messages]
+        self.deliveries.append(payloads)
+        if self.raise_error:
+            raise RuntimeError("database unavailable")
+        return [
+            MessageAcknowledgment(
+                message_id=message.id,
+                status=MessageStatus.FAILED if payload in self.poison else MessageStatus.ACKNOWLEDGED,
+                error="poison" if payload in self.poison else None
+            )
+            for message, payload in zip(messages, payloads)
+        ]
+
+
+async def consume(entries, handler, **config_options):
+    """Run the batch consumer until the fake stream is drained."""
+    config = RedisStreamConfig("workers", "worker-1", retry_delay_ms=0, **config_options)
+    client = RedisClient(RedisConnectionConfig(), stream_config=config)
+    stream = FakeStreamClient(config, entries)
+    client._stream_client = stream
+
+    task = asyncio.create_task(client._consume_stream_batches("orders", handler))
+    for _ in range(500):
+        await asyncio.sleep(0.001)
+        if not stream.new and not stream.pending:
+            break
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return stream
+
+
+class TestRedisStreamBatches:
+    """Retry and dead letter handling of failed stream entries."""
+
+    @pytest.mark.asyncio
+    async def test_successful_batch_is_acknowledged(self):
+        handler = FailingBatchHandler()
+        stream = await consume([("1-0", "a"), ("2-0", "b")], handler)
+
+        assert stream.acked == ["1-0", "2-0"]
+        assert stream.dead_lettered == []
+        assert handler.deliveries == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_entry_is_retried_then_dead_lettered(self):
+        handler = FailingBatchHandler(poison={"b"})
+        stream = await consume([("1-0", "a"), ("2-0", "b")], handler, max_retries=2)
+
+        assert stream.acked == ["1-0"]
+        assert stream.dead_lettered == ["2-0"]
+        # First delivery plus two retries read from the pending list
+        assert handler.deliveries == [["a", "b"], ["b"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_are_read_before_new_entries(self):
+        handler = FailingBatchHandler(poison={"a"})
+        handler.max_batch_size = 1
+        stream = await consume([("1-0", "a"), ("2-0", "b")], handler, max_retries=1)
+
+        assert handler.deliveries == [["a"], ["a"], ["b"]]
+        assert stream.dead_lettered == ["1-0"]
+        assert stream.acked == ["2-0"]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_fails_whole_batch(self):
+        handler = FailingBatchHandler(raise_error=True)
+        stream = await consume([("1-0", "a"), ("2-0", "b")], handler, max_retries=1)
+
+        assert stream.acked == []
+        assert stream.dead_lettered == ["1-0", "2-0"]
+        assert len(handler.deliveries) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_dead_letter_stream_entries_stay_pending(self):
+        handler = FailingBatchHandler(poison={"a"})
+        stream = await consume([("1-0", "a")], handler, max_retries=1, dead_letter_suffix=None)
+
+        assert stream.dead_lettered == []
+        assert "1-0" in stream.pending
+        assert len(handler.deliveries) > 2
@@ -0,0 +1,68 @@
+"""
+Unit tests for the fused observability middleware.
+"""
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from fastapi_microservices_sdk.core.middleware.pipeline import ObservabilitySecurityMiddleware
+from fastapi_microservices_sdk.observability.metrics import MetricRegistry
+
+
+def make_client(**options):
+    """App with two routes behind the fused middleware."""
+    app = FastAPI()
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: int):
+        return {"user_id": user_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield b"x" * 10
+        return StreamingResponse(chunks())
+
+    app.add_middleware(ObservabilitySecurityMiddleware, registry=MetricRegistry(), **options)
+    return TestClient(app)
+
+
+def request_counts(client):
+    """Lines of the http_requests_total series in the metrics output."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    return [line for line in response.text.splitlines() if line.startswith("http_requests_total{")]
+
+
+class TestObservabilitySecurityMiddleware:
+    """Metrics recorded by the fused middleware."""
+
+    def test_serves_metrics_labelled_with_route_template(self):
+        client = make_client()
+
+        assert client.get("/users/1").json() == {"user_id": 1}
+        assert client.get("/users/2").status_code == 200
+
+        lines = request_counts(client)
+        assert any('endpoint="/users/{user_id}"' in line and line.endswith(" 2.0") for line in lines)
+        assert not any("/users/1" in line for line in lines)
+
+    def test_streaming_response_passes_through(self):
+        client = make_client()
+
+        assert client.get("/stream").content == b"x" * 30
+
+        lines = request_counts(client)
+        assert any('endpoint="/stream"' in line for line in lines)
+
+    def test_excluded_paths_are_not_recorded(self):
+        client = make_client(exclude_paths=["/stream"])
+
+        client.get("/stream")
+        client.get("/users/1")
+
+        lines = request_counts(client)
+        assert not any('endpoint="/stream"' in line for line in lines)
+        assert any('endpoint="/users/{user_id}"' in line for line in lines)
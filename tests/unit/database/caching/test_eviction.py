@@ -0,0 +1,187 @@
+"""
+Unit tests for eviction policies and the strategies bound to them.
+"""
+
+import pytest
+
+from fastapi_microservices_sdk.database.caching.backends import InMemoryCacheBackend
+from fastapi_microservices_sdk.database.caching.config import CacheBackend, CacheConfig, CacheStrategy
+from fastapi_microservices_sdk.database.caching.eviction import (
+    CountMinSketch,
+    FIFOEvictionPolicy,
+    LFUEvictionPolicy,
+    LRUEvictionPolicy,
+    TinyLFUEvictionPolicy,
+    create_eviction_policy,
+)
+from fastapi_microservices_sdk.database.caching.manager import CacheManager
+from fastapi_microservices_sdk.database.caching.strategies import (
+    AdaptiveStrategy,
+    TTLStrategy,
+    create_strategy,
+)
+
+
+def make_backend(strategy, max_size=1000):
+    """Create an in-memory backend evicting with the given strategy."""
+    config = CacheConfig(default_strategy=strategy)
+    return InMemoryCacheBackend(config, memory_config={"max_size": max_size, "cleanup_interval": 0})
+
+
+class TestEvictionPolicies:
+    """Eviction order of each policy."""
+
+    def test_lru_evicts_least_recently_used(self):
+        policy = LRUEvictionPolicy(3)
+        for key in ("a", "b", "c"):
+            policy.insert(key)
+        policy.record_hit("a")
+
+        assert policy.insert("d") == ["b"]
+        assert policy.victims(3) == ["c", "a", "d"]
+
+    def test_fifo_ignores_hits(self):
+        policy = FIFOEvictionPolicy(3)
+        for key in ("a", "b", "c"):
+            policy.insert(key)
+        policy.record_hit("a")
+
+        assert policy.insert("d") == ["a"]
+        assert policy.evict() == "b"
+
+    def test_lfu_evicts_least_frequent_then_oldest(self):
+        policy = LFUEvictionPolicy(3)
+        for key in ("a", "b", "c"):
+            policy.insert(key)
+        policy.record_hit("a")
+        policy.record_hit("c")
+
+        assert policy.insert("d") == ["b"]
+        assert policy.victims(3) == ["d", "a", "c"]
+        assert policy.frequency("a") == 2
+
+    def test_tinylfu_rejects_unpopular_candidate(self, monkeypatch):
+        # One counter per single-letter key: str hashes are randomized per process,
+        # and collisions in the 16-wide sketch would make the estimates vary
+        monkeypatch.setattr(
+            CountMinSketch, "_indexes", lambda self, key: [ord(key) & self._mask] * self._depth
+        )
+        policy = TinyLFUEvictionPolicy(10, window_ratio=0.1)
+        for key in "abcdefghij":
+            policy.insert(key)
+        for _ in range(3):
+            for key in "bcdefghij":
+                policy.record_hit(key)
+
+        # "k" pushes "j" out of the window; "j" is popular enough to replace the probation head
+        evicted = policy.insert("k")
+        assert evicted and evicted[0] != "j"
+        # A one-hit wonder leaving the window loses against the popular probation victim
+        assert policy.insert("l") == ["k"]
+        assert policy.metrics.rejections == 1
+
+    def test_evict_spares_excluded_key(self):
+        for policy in (LRUEvictionPolicy(), LFUEvictionPolicy(), FIFOEvictionPolicy(), TinyLFUEvictionPolicy(10)):
+            for key in ("a", "b"):
+                policy.insert(key)
+            victim = policy.victims(1)[0]
+
+            assert policy.evict(exclude=victim) != victim
+            assert victim in policy
+            assert policy.evict(exclude=victim) is None
+
+    @pytest.mark.parametrize("strategy, policy_class", [
+        (CacheStrategy.TTL, FIFOEvictionPolicy),
+        (CacheStrategy.ADAPTIVE, TinyLFUEvictionPolicy),
+    ])
+    def test_policy_mapping(self, strategy, policy_class):
+        assert type(create_eviction_policy(strategy, 10)) is policy_class
+
+
+class TestBoundStrategies:
+    """Strategies sharing state with the backend that evicts."""
+
+    @pytest.mark.parametrize("strategy", list(CacheStrategy))
+    def test_every_strategy_binds_to_its_backend(self, strategy):
+        backend = make_backend(strategy)
+
+        bound = create_strategy(strategy, backend.config, backend=backend)
+
+        assert bound.is_bound
+        assert bound.metrics is backend.eviction_policy.metrics
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", [CacheStrategy.LRU, CacheStrategy.LFU, CacheStrategy.FIFO])
+    async def test_bound_metrics_follow_backend_evictions(self, strategy):
+        backend = make_backend(strategy, max_size=2)
+        bound = create_strategy(strategy, backend.config, backend=backend)
+
+        for key in ("a", "b", "c"):
+            await backend.set(key, key)
+        await backend.get("c")
+        await backend.get("missing")
+
+        metrics = await bound.get_metrics()
+        assert metrics['evictions'] == 1
+        assert metrics['hits'] == 1
+        assert metrics['misses'] == 1
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_bound_candidates_come_from_backend_policy(self):
+        backend = make_backend(CacheStrategy.LRU)
+        bound = create_strategy(CacheStrategy.LRU, backend.config, backend=backend)
+        for key in ("a", "b", "c"):
+            await backend.set(key, key)
+        await backend.get("a")
+
+        candidates = await bound.select_eviction_candidates(backend._cache, 2)
+
+        assert candidates == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_bound_ttl_strategy_uses_insertion_order(self):
+        backend = make_backend(CacheStrategy.TTL)
+        bound = create_strategy(CacheStrategy.TTL, backend.config, backend=backend)
+        for key in ("a", "b", "c"):
+            await backend.set(key, key)
+        await backend.get("a")
+
+        assert isinstance(bound, TTLStrategy)
+        assert await bound.select_eviction_candidates(backend._cache, 2) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_bound_adaptive_strategy_follows_tinylfu(self):
+        backend = make_backend(CacheStrategy.ADAPTIVE)
+        bound = create_strategy(CacheStrategy.ADAPTIVE, backend.config, backend=backend)
+
+        assert isinstance(bound, AdaptiveStrategy)
+        assert (await bound.get_metrics())['current_strategy'] == 'TinyLFU'
+
+
+class StubDatabaseManager:
+    """The part of DatabaseManager the cache manager uses."""
+
+    def list_databases(self):
+        return ["orders"]
+
+
+class TestCacheManagerStrategies:
+    """CacheManager binds a strategy where it builds a backend."""
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_gets_bound_strategy(self):
+        config = CacheConfig(default_backend=CacheBackend.MEMORY, default_strategy=CacheStrategy.LFU)
+        manager = CacheManager(config, StubDatabaseManager())
+        await manager.initialize()
+        try:
+            strategy = manager.get_strategy()
+            assert strategy.is_bound
+            assert strategy.metrics is manager._default_backend.eviction_policy.metrics
+
+            await manager.set("orders", "SELECT 1", [1])
+            await manager.get("orders", "SELECT 1")
+            stats = await manager.get_stats()
+            assert stats['strategy_stats']['default']['hits'] == 1
+        finally:
+            await manager.shutdown()
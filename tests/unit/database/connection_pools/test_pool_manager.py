@@ -0,0 +1,327 @@
+"""
+Unit tests for ConnectionPool and the driver pools behind the adapters.
+"""
+
+import asyncio
+import itertools
+from collections import defaultdict
+
+import pytest
+
+from fastapi_microservices_sdk.database.adapters import mysql, postgresql
+from fastapi_microservices_sdk.database.config import (
+    ConnectionPoolConfig,
+    DatabaseConnectionConfig,
+    DatabaseCredentials,
+    DatabaseEngine,
+)
+from fastapi_microservices_sdk.database.connection_pools.pool_manager import ConnectionPool
+from fastapi_microservices_sdk.database.exceptions import PoolError
+
+
+class FakeConnection:
+    """The members of DatabaseConnection the pool relies on."""
+
+    _ids = itertools.count()
+
+    def __init__(self):
+        self.connection_id = f"conn-{next(self._ids)}"
+        self.age = 0.0
+        self.idle_time = 0.0
+        self.is_active = True
+        self.transaction_count = 0
+        self.closed = False
+
+    def mark_used(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+        self.is_active = False
+
+
+def make_pool(**options):
+    options.setdefault("min_size", 0)
+    options.setdefault("max_size", 1)
+    return ConnectionPool(factory=lambda: asyncio.sleep(0, FakeConnection()), name="test", **options)
+
+
+async def settle():
+    """Let queued tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionPool:
+    """Checkout, waiting and shutdown of the fair pool."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self):
+        pool = make_pool()
+        held = await pool.acquire()
+        served = []
+
+        async def worker(name):
+            connection = await pool.acquire()
+            served.append(name)
+            await pool.release(connection)
+
+        tasks = [asyncio.create_task(worker(name)) for name in ("first", "second", "third")]
+        await settle()
+        assert pool.waiting_count == 3
+
+        await pool.release(held)
+        # A task arriving after the release queues behind the earlier waiters
+        tasks.append(asyncio.create_task(worker("late")))
+        await asyncio.gather(*tasks)
+
+        assert served == ["first", "second", "third", "late"]
+        assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_the_queue(self):
+        pool = make_pool()
+        held = await pool.acquire()
+
+        with pytest.raises(PoolError):
+            await pool.acquire(timeout=0.01)
+
+        assert pool.waiting_count == 0
+        assert not pool._waiters
+        assert pool.metrics.timeouts == 1
+
+        # The released connection goes back to the pool, not to the abandoned waiter
+        await pool.release(held)
+        assert pool.idle_count == 1
+        assert await asyncio.wait_for(pool.acquire(), timeout=1) is held
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_its_slot_on(self):
+        pool = make_pool()
+        held = await pool.acquire()
+        cancelled = asyncio.create_task(pool.acquire())
+        waiting = asyncio.create_task(pool.acquire())
+        await settle()
+
+        cancelled.cancel()
+        await pool.release(held)
+
+        assert await asyncio.wait_for(waiting, timeout=1) is held
+        assert cancelled.cancelled()
+        assert not pool._waiters
+
+    @pytest.mark.asyncio
+    async def test_release_after_close_is_ignored(self):
+        pool = make_pool(max_size=2)
+        connection = await pool.acquire()
+
+        await pool.close()
+        await pool.release(connection)
+
+        assert connection.closed
+        assert pool.idle_count == 0
+        assert pool.size == 0
+        assert pool.metrics.releases == 0
+        with pytest.raises(PoolError):
+            await pool.acquire()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_waiters(self):
+        pool = make_pool()
+        await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await settle()
+
+        await pool.close()
+
+        with pytest.raises(PoolError):
+            await waiter
+
+    @pytest.mark.asyncio
+    async def test_connection_with_open_transaction_is_closed(self):
+        pool = make_pool()
+        connection = await pool.acquire()
+        connection.transaction_count = 1
+
+        await pool.release(connection)
+
+        assert connection.closed
+        assert pool.size == 0
+        assert (await pool.acquire()) is not connection
+
+
+class FakeNativeConnection:
+    """Driver connection answering every query with an empty row."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self.closed = False
+
+    async def execute(self, *args):
+        pass
+
+    async def fetchval(self, *args):
+        return "PostgreSQL 16.0"
+
+    async def fetchrow(self, *args):
+        return defaultdict(int)
+
+    def cursor(self, *args):
+        return FakeCursor()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    """aiomysql cursor stand-in."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, *args):
+        pass
+
+    async def fetchone(self):
+        return defaultdict(int)
+
+    async def fetchall(self):
+        return []
+
+
+class FakeAcquire:
+    """Awaitable and async context manager, like the drivers' pool.acquire()."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+
+    def __await__(self):
+        return self._pool._acquire().__await__()
+
+    async def __aenter__(self):
+        self._connection = await self._pool._acquire()
+        return self._connection
+
+    async def __aexit__(self, *exc_info):
+        self._pool.release(self._connection)
+        return False
+
+
+class FakeDriverPool:
+    """Driver pool that blocks acquire() once ``max_size`` connections are out."""
+
+    def __init__(self, max_size):
+        self.max_size = self.maxsize = max_size
+        self.minsize = 0
+        self.closed = False
+        self._available = asyncio.Semaphore(max_size)
+        self._in_use = 0
+
+    @property
+    def size(self):
+        return self._in_use
+
+    @property
+    def freesize(self):
+        return 0
+
+    def acquire(self):
+        return FakeAcquire(self)
+
+    async def _acquire(self):
+        await self._available.acquire()
+        self._in_use += 1
+        return FakeNativeConnection(self)
+
+    def release(self, connection):
+        self._in_use -= 1
+        self._available.release()
+        done = asyncio.get_running_loop().create_future()
+        done.set_result(None)
+        return done
+
+    # asyncpg pool statistics
+    def get_size(self):
+        return self._in_use
+
+    def get_min_size(self):
+        return self.minsize
+
+    def get_max_size(self):
+        return self.max_size
+
+    def get_idle_size(self):
+        return 0
+
+    def is_closing(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+        done = asyncio.get_running_loop().create_future()
+        done.set_result(None)
+        return done
+
+    async def wait_closed(self):
+        pass
+
+
+class FakeDriver:
+    """asyncpg / aiomysql module stand-in recording the pool it created."""
+
+    DictCursor = FakeCursor
+
+    def __init__(self, size_option):
+        self.size_option = size_option
+        self.pool = None
+
+    async def create_pool(self, **options):
+        self.pool = FakeDriverPool(options[self.size_option])
+        return self.pool
+
+
+ADAPTERS = [
+    pytest.param(postgresql, "PostgreSQLAdapter", "ASYNCPG_AVAILABLE", "asyncpg", "max_size",
+                 DatabaseEngine.POSTGRESQL, id="postgresql"),
+    pytest.param(mysql, "MySQLAdapter", "AIOMYSQL_AVAILABLE", "aiomysql", "maxsize",
+                 DatabaseEngine.MYSQL, id="mysql"),
+]
+
+
+class TestDriverPoolSpare:
+    """Driver pools hold one connection more than the SDK pool, for health checks."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("module, adapter_name, flag, driver_name, size_option, engine", ADAPTERS)
+    async def test_health_check_runs_with_sdk_pool_exhausted(
+        self, monkeypatch, module, adapter_name, flag, driver_name, size_option, engine
+    ):
+        driver = FakeDriver(size_option)
+        monkeypatch.setattr(module, flag, True)
+        monkeypatch.setattr(module, driver_name, driver)
+        config = DatabaseConnectionConfig(
+            engine=engine,
+            database="orders",
+            credentials=DatabaseCredentials(username="orders", password="secret"),
+            pool=ConnectionPoolConfig(min_connections=0, max_connections=2)
+        )
+        adapter = getattr(module, adapter_name)(config)
+        await adapter.initialize()
+        try:
+            assert driver.pool.max_size == 3
+
+            checked_out = [await adapter.connection_pool.acquire() for _ in range(2)]
+            with pytest.raises(PoolError):
+                await adapter.connection_pool.acquire(timeout=0.01)
+
+            health = await asyncio.wait_for(adapter.health_check(), timeout=1)
+            assert health['healthy'], health
+
+            for connection in checked_out:
+                await adapter.connection_pool.release(connection)
+        finally:
+            await adapter.shutdown()
@@ -0,0 +1,156 @@
+"""
+Unit tests for indexed log search against a scan of the same file.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:
+    from fastapi_microservices_sdk.observability.logging.config import LoggingConfig
+    from fastapi_microservices_sdk.observability.logging.index import LogIndex
+    from fastapi_microservices_sdk.observability.logging.search import (
+        LogSearchEngine,
+        SearchCriteria,
+        SearchOperator,
+        SearchQuery,
+    )
+except ImportError as e:
+    pytest.skip(f"logging package unavailable: {e}", allow_module_level=True)
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def log_line(minute, level="ERROR", message="request failed"):
+    """One JSON log line written ``minute`` minutes after BASE_TIME."""
+    timestamp = (BASE_TIME + timedelta(minutes=minute)).isoformat()
+    return json.dumps({"timestamp": timestamp, "level": level, "message": f"{message} {minute}"})
+
+
+def write_log(path, minutes, terminated=True):
+    """Write one ERROR log per minute; optionally leave the last line unterminated."""
+    text = "\n".join(log_line(minute) for minute in minutes)
+    path.write_text(text + "\n" if terminated else text)
+
+
+def make_engine(**options):
+    """Search engine with indexing enabled and a single scan worker."""
+    options = {"search_index_enabled": True, "search_scan_workers": 1, **options}
+    config = LoggingConfig(service_name="orders", **options)
+    return LogSearchEngine(config)
+
+
+def error_query(**options):
+    return SearchQuery(criteria=[SearchCriteria("level", SearchOperator.EQUALS, "ERROR")], sort_by="timestamp", **options)
+
+
+def messages(result):
+    return [log["message"] for log in result.logs]
+
+
+class TestLogIndexIngest:
+    """Lines the index reads from a file."""
+
+    def test_unterminated_last_line_is_indexed(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, range(3), terminated=False)
+        index = LogIndex(segment_minutes=1)
+
+        assert index.ingest_file(str(path)) == 3
+        assert len(index) == 3
+
+        # Completing the line does not index it twice
+        with open(path, "a") as f:
+            f.write("\n" + log_line(3) + "\n")
+        index.ingest_file(str(path))
+        assert len(index) == 4
+        assert index.get_stats()["invalid_lines"] == 0
+
+    def test_partially_written_line_waits_for_the_writer(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text(log_line(0) + "\n" + log_line(1)[:20])
+        index = LogIndex(segment_minutes=1)
+
+        assert index.ingest_file(str(path)) == 1
+        with open(path, "a") as f:
+            f.write(log_line(1)[20:] + "\n")
+        assert index.ingest_file(str(path)) == 1
+        assert len(index) == 2
+        assert index.get_stats()["invalid_lines"] == 0
+
+
+class TestLogIndexCoverage:
+    """Queries reaching into segments the index dropped."""
+
+    def test_dropped_segments_move_the_watermark(self):
+        index = LogIndex(segment_minutes=1, max_segments=2)
+        for minute in range(4):
+            index.add_line(log_line(minute))
+
+        assert len(index) == 2
+        assert not index.covers()
+        assert not index.covers((BASE_TIME, BASE_TIME + timedelta(minutes=3)))
+        assert index.covers((BASE_TIME + timedelta(minutes=2), BASE_TIME + timedelta(minutes=3)))
+        assert index.get_stats()["dropped_before"] == (BASE_TIME + timedelta(minutes=2)).timestamp()
+
+    def test_clear_resets_the_watermark(self):
+        index = LogIndex(segment_minutes=1, max_segments=1)
+        for minute in range(2):
+            index.add_line(log_line(minute))
+
+        index.clear()
+
+        assert index.covers()
+
+    def test_index_source_reports_inexact_total(self):
+        index = LogIndex(segment_minutes=1, max_segments=2)
+        for minute in range(4):
+            index.add_line(log_line(minute))
+
+        result = make_engine().search(error_query(), index)
+
+        assert result.total_count == 2
+        assert not result.total_count_exact
+
+
+class TestIndexedSearchMatchesScan:
+    """An indexed search returns what a scan of the file returns."""
+
+    def test_search_scans_when_index_dropped_logs(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, range(10))
+        bytes_per_log = len(log_line(0)) + 1
+        indexed = make_engine(search_segment_minutes=1, search_index_max_bytes=3 * bytes_per_log)
+        scanned = make_engine(search_index_enabled=False)
+
+        result = indexed.search(error_query(), str(path))
+
+        assert len(indexed.index_file(str(path))) < 10
+        assert result.total_count == 10
+        assert result.total_count_exact
+        assert messages(result) == messages(scanned.search(error_query(), str(path)))
+
+    def test_recent_time_range_is_served_by_the_index(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, range(10))
+        bytes_per_log = len(log_line(0)) + 1
+        engine = make_engine(search_segment_minutes=1, search_index_max_bytes=3 * bytes_per_log)
+        engine.index_file(str(path))
+        engine.scanner.scan = None  # Any fallback to scanning fails the search
+
+        query = error_query(time_range=(BASE_TIME + timedelta(minutes=8), BASE_TIME + timedelta(minutes=9)))
+        result = engine.search(query, str(path))
+
+        assert messages(result) == ["request failed 9", "request failed 8"]
+        assert result.total_count_exact
+
+    def test_unterminated_last_line_matches_scan(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, range(3), terminated=False)
+
+        indexed = make_engine().search(error_query(), str(path))
+        scanned = make_engine(search_index_enabled=False).search(error_query(), str(path))
+
+        assert indexed.total_count == scanned.total_count == 3
+        assert messages(indexed) == messages(scanned)
@@ -0,0 +1,194 @@
+"""
+Unit tests for multiprocess metrics files and their merging.
+"""
+
+import math
+import os
+import subprocess
+import sys
+
+import pytest
+
+from fastapi_microservices_sdk.observability.metrics.exporter import PrometheusExporter
+from fastapi_microservices_sdk.observability.metrics.multiprocess import (
+    FCNTL_AVAILABLE,
+    MmapedValues,
+    MultiProcessCollector,
+    MultiProcessStore,
+    _ARCHIVE_FILE,
+    _INITIAL_SIZE,
+    _process_file_path,
+    read_values,
+)
+from fastapi_microservices_sdk.observability.metrics.registry import MetricRegistry
+from fastapi_microservices_sdk.observability.metrics.types import Counter, Gauge, Summary
+
+
+LIVE_PID = os.getppid()
+
+
+@pytest.fixture(scope="module")
+def dead_pid():
+    """Pid of a process that has exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def write_worker(directory, pid, *metrics):
+    """Snapshot a registry holding ``metrics`` into the values file of ``pid``."""
+    registry = MetricRegistry()
+    for metric in metrics:
+        registry.register(metric)
+    store = MultiProcessStore(str(directory), registry)
+    store.flush()
+    store.close()
+    os.replace(_process_file_path(str(directory), os.getpid()), _process_file_path(str(directory), pid))
+
+
+def counter(value, name="requests_total"):
+    metric = Counter(name, "Requests")
+    metric.inc(value)
+    return metric
+
+
+def gauge(mode, value, name=None):
+    metric = Gauge(name or f"connections_{mode}", "Connections", multiprocess_mode=mode)
+    metric.set(value)
+    return metric
+
+
+def sample_values(metric):
+    """label values -> value of every child of a merged counter or gauge."""
+    return {tuple(sorted(child.label_values.items())): child.get() for child in metric.get_children()}
+
+
+class TestMmapedValues:
+    """The per-process values file."""
+
+    def test_values_round_trip(self, tmp_path):
+        path = str(tmp_path / "values.db")
+        values = MmapedValues(path)
+        values.write("a", 1.5)
+        values.write("ünïcode", -2.0)
+        values.write("a", 3.0)
+        values.close()
+
+        assert read_values(path) == [("a", 3.0), ("ünïcode", -2.0)]
+
+    def test_reopen_updates_in_place(self, tmp_path):
+        path = str(tmp_path / "values.db")
+        values = MmapedValues(path)
+        values.write("a", 1.0)
+        values.close()
+
+        values = MmapedValues(path)
+        values.write("a", 2.0)
+        values.write("b", 4.0)
+        values.close()
+
+        assert read_values(path) == [("a", 2.0), ("b", 4.0)]
+
+    def test_file_grows_past_initial_size(self, tmp_path):
+        path = str(tmp_path / "values.db")
+        values = MmapedValues(path)
+        keys = [f"{index:06d}" + "k" * 1000 for index in range(1500)]
+        for index, key in enumerate(keys):
+            values.write(key, float(index))
+        values.close()
+
+        assert os.path.getsize(path) > _INITIAL_SIZE
+        assert read_values(path) == [(key, float(index)) for index, key in enumerate(keys)]
+
+
+class TestMultiProcessCollector:
+    """Merging the files of several workers."""
+
+    def test_counters_are_summed(self, tmp_path):
+        write_worker(tmp_path, LIVE_PID, counter(2))
+        write_worker(tmp_path, os.getpid(), counter(3))
+
+        merged = MultiProcessCollector(str(tmp_path)).collect()
+
+        assert sample_values(merged.get("requests_total")) == {(): 5.0}
+
+    @pytest.mark.parametrize("mode, expected", [
+        ("sum", {(): 7.0}),
+        ("max", {(): 5.0}),
+        ("min", {(): 2.0}),
+        ("all", {(("pid", str(LIVE_PID)),): 2.0, (("pid", str(os.getpid())),): 5.0}),
+    ])
+    def test_gauge_modes(self, tmp_path, mode, expected):
+        write_worker(tmp_path, LIVE_PID, gauge(mode, 2))
+        write_worker(tmp_path, os.getpid(), gauge(mode, 5))
+
+        merged = MultiProcessCollector(str(tmp_path)).collect()
+
+        assert sample_values(merged.get(f"connections_{mode}")) == expected
+
+    @pytest.mark.parametrize("mode, expected", [
+        ("sum", {(): 7.0}),
+        ("livesum", {(): 5.0}),
+        ("max", {(): 5.0}),
+        ("livemin", {(): 5.0}),
+        ("liveall", {(("pid", str(os.getpid())),): 5.0}),
+    ])
+    def test_live_gauge_modes_ignore_dead_workers(self, tmp_path, dead_pid, mode, expected):
+        write_worker(tmp_path, dead_pid, gauge(mode, 2))
+        write_worker(tmp_path, os.getpid(), gauge(mode, 5))
+
+        merged = MultiProcessCollector(str(tmp_path)).collect()
+
+        assert sample_values(merged.get(f"connections_{mode}")) == expected
+
+
+@pytest.mark.skipif(not FCNTL_AVAILABLE, reason="dead process cleanup needs fcntl")
+class TestDeadProcesses:
+    """Archiving the files of workers that exited."""
+
+    def test_mark_process_dead_archives_cumulative_samples(self, tmp_path, dead_pid):
+        write_worker(tmp_path, dead_pid, counter(2), gauge("sum", 4), gauge("all", 6))
+        collector = MultiProcessCollector(str(tmp_path))
+
+        collector.mark_process_dead(dead_pid)
+
+        assert not os.path.exists(_process_file_path(str(tmp_path), dead_pid))
+        archived = {collector._parse_key(key)[0]: value for key, value in read_values(str(tmp_path / _ARCHIVE_FILE))}
+        assert archived == {"requests_total": 2.0, "connections_sum": 4.0}
+
+    def test_archive_accumulates_across_dead_workers(self, tmp_path, dead_pid):
+        collector = MultiProcessCollector(str(tmp_path))
+        write_worker(tmp_path, dead_pid, counter(2))
+        collector.mark_process_dead(dead_pid)
+        write_worker(tmp_path, dead_pid, counter(3))
+        collector.mark_process_dead(dead_pid)
+        write_worker(tmp_path, os.getpid(), counter(1))
+
+        merged = collector.collect()
+
+        assert sample_values(merged.get("requests_total")) == {(): 6.0}
+
+    def test_collect_cleans_up_dead_workers(self, tmp_path, dead_pid):
+        write_worker(tmp_path, dead_pid, counter(2))
+        collector = MultiProcessCollector(str(tmp_path))
+
+        assert sample_values(collector.collect().get("requests_total")) == {(): 2.0}
+        assert not os.path.exists(_process_file_path(str(tmp_path), dead_pid))
+        assert sample_values(collector.collect().get("requests_total")) == {(): 2.0}
+
+    def test_summary_quantiles_without_live_workers_are_nan(self, tmp_path, dead_pid):
+        summary = Summary("latency_seconds", "Latency", quantiles=[0.5, 0.99])
+        for value in (0.1, 0.2, 0.3):
+            summary.observe(value)
+        write_worker(tmp_path, dead_pid, summary)
+
+        merged = MultiProcessCollector(str(tmp_path)).collect()
+        stats = merged.get("latency_seconds").get_children()[0].get()
+
+        assert stats['count'] == 3
+        assert stats['sum'] == pytest.approx(0.6)
+        assert all(math.isnan(value) for value in stats['quantiles'].values())
+
+        text = PrometheusExporter(registry=merged).export_metrics()
+        assert 'latency_seconds{quantile="0.5"} NaN' in text
+        assert "latency_seconds_count 3" in text
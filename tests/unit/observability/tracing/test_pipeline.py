@@ -0,0 +1,175 @@
+"""
+Unit tests for the span ring buffer and export pipeline.
+"""
+
+from types import SimpleNamespace
+
+from fastapi_microservices_sdk.observability.tracing.pipeline import (
+    PipelineSpanProcessor,
+    SpanExportPipeline,
+    SpanRingBuffer,
+)
+from fastapi_microservices_sdk.observability.tracing.tail_sampling import (
+    TailSamplingPolicy,
+    TailSamplingProcessor,
+)
+
+
+def claim(buffer):
+    """Claim a sequence like ``put`` does, without storing the item yet."""
+    return next(buffer._sequence)
+
+
+def store(buffer, sequence, item):
+    """Finish a claimed ``put``."""
+    buffer._slots[sequence & buffer._mask] = (sequence, item)
+
+
+class TestSpanRingBuffer:
+    """Ordering, overflow and stale slots of the ring buffer."""
+
+    def test_drain_returns_items_in_order(self):
+        buffer = SpanRingBuffer(4)
+        for item in "abc":
+            buffer.put(item)
+
+        assert buffer.drain(2) == ["a", "b"]
+        assert buffer.drain(10) == ["c"]
+        assert buffer.drain(10) == []
+
+    def test_capacity_rounds_up_to_power_of_two(self):
+        assert SpanRingBuffer(5).capacity == 8
+
+    def test_overflow_drops_oldest(self):
+        buffer = SpanRingBuffer(4)
+        for item in "abcdef":
+            buffer.put(item)
+
+        assert buffer.drain(10) == ["c", "d", "e", "f"]
+        assert buffer.dropped == 2
+
+    def test_claimed_slot_waits_for_its_producer(self):
+        buffer = SpanRingBuffer(4, stale_timeout=60)
+        buffer.put("a")
+        sequence = claim(buffer)
+        buffer.put("c")
+
+        assert buffer.drain(10) == ["a"]
+        assert buffer.drain(10) == []
+
+        store(buffer, sequence, "b")
+        assert buffer.drain(10) == ["b", "c"]
+        assert buffer.dropped == 0
+
+    def test_stale_slot_is_skipped_as_dropped(self):
+        buffer = SpanRingBuffer(4, stale_timeout=0)
+        late = claim(buffer)
+        for item in "abcd":
+            buffer.put(item)
+        # The preempted producer overwrites "d" (next lap) with its older entry
+        store(buffer, late, "late")
+
+        assert buffer.drain(10) == ["late", "a", "b", "c"]
+        buffer.put("e")
+
+        # First drain notices the stall, the next one skips the stale slot
+        assert buffer.drain(10) == []
+        assert buffer.drain(10) == ["e"]
+        assert buffer.dropped == 1
+
+    def test_stale_slot_is_kept_until_timeout(self):
+        buffer = SpanRingBuffer(4, stale_timeout=60)
+        late = claim(buffer)
+        for item in "abcd":
+            buffer.put(item)
+        store(buffer, late, "late")
+        buffer.drain(10)
+        buffer.put("e")
+
+        assert buffer.drain(10) == []
+        assert buffer.drain(10) == []
+        assert buffer.dropped == 0
+
+    def test_empty_buffer_is_not_stale(self):
+        buffer = SpanRingBuffer(4, stale_timeout=0)
+        buffer.put("a")
+        buffer.drain(10)
+
+        assert buffer.drain(10) == []
+        assert buffer.drain(10) == []
+        buffer.put("b")
+        assert buffer.drain(10) == ["b"]
+        assert buffer.dropped == 0
+
+
+class KeepAll(TailSamplingPolicy):
+    """Keeps every trace."""
+
+    name = "keep_all"
+
+    def evaluate(self, trace):
+        return True
+
+
+class RecordingExporter:
+    """Collects exported spans."""
+
+    def __init__(self):
+        self.spans = []
+        self.shut_down = False
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+def child_span(trace_id, span_id):
+    """A sampled span whose local parent (the trace root) has not ended."""
+    context = SimpleNamespace(trace_id=trace_id, span_id=span_id, trace_flags=SimpleNamespace(sampled=True))
+    parent = SimpleNamespace(span_id=trace_id, is_remote=False)
+    return SimpleNamespace(
+        context=context, parent=parent, status=None, attributes={},
+        name="query", start_time=0, end_time=1, kind=None
+    )
+
+
+class TestSpanExportPipeline:
+    """Exporting through the background worker."""
+
+    def test_force_flush_exports_queued_spans(self):
+        exporter = RecordingExporter()
+        pipeline = SpanExportPipeline([exporter], schedule_delay_millis=60000)
+        try:
+            for span in range(3):
+                pipeline.submit(span)
+
+            assert pipeline.force_flush(5)
+            assert exporter.spans == [0, 1, 2]
+        finally:
+            pipeline.shutdown(5)
+
+    def test_force_flush_drains_tail_sampler(self):
+        exporter = RecordingExporter()
+        tail = TailSamplingProcessor(exporter, policies=[KeepAll()], decision_wait_seconds=60)
+        processor = PipelineSpanProcessor(tail, schedule_delay_millis=60000)
+        try:
+            processor.on_end(child_span(1, 2))
+
+            assert processor.force_flush(5000)
+            assert len(exporter.spans) == 1
+        finally:
+            processor.shutdown()
+
+    def test_shutdown_drains_tail_sampler(self):
+        exporter = RecordingExporter()
+        tail = TailSamplingProcessor(exporter, policies=[KeepAll()], decision_wait_seconds=60)
+        processor = PipelineSpanProcessor(tail, schedule_delay_millis=60000, export_timeout_millis=5000)
+
+        processor.on_end(child_span(1, 2))
+        processor.shutdown()
+
+        assert len(exporter.spans) == 1
+        assert exporter.shut_down
+        assert not processor.pipeline.get_stats()['running']